@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measures the import time and memory use of the client library.
+
+Each scenario is run in a fresh interpreter, once with eager imports and once
+with lazy imports enabled, and reports the wall time, the peak resident set
+size (RSS) and the number of imported modules after the scenario finishes.
+
+Usage:
+    python benchmarks/import_benchmark.py --version v23 --runs 3
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Dict, List
+
+# Each scenario is a statement that is run after a GoogleAdsClient named
+# "client" has been created.
+_SCENARIOS: Dict[str, str] = {
+    "get_type": 'client.get_type("CampaignOperation")',
+    "get_service": 'client.get_service("GoogleAdsService")',
+    "enums": "client.enums.CampaignStatusEnum",
+}
+
+_SCENARIO_TEMPLATE: str = """
+import json
+import resource
+import sys
+import time
+from unittest import mock
+
+start = time.perf_counter()
+from google.ads.googleads.client import GoogleAdsClient
+client = GoogleAdsClient(
+    mock.Mock(), "developer_token", version="{version}", use_proto_plus=True
+)
+{statement}
+elapsed = time.perf_counter() - start
+print(
+    json.dumps(
+        {{
+            "seconds": elapsed,
+            "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            / 1024,
+            "modules": len(sys.modules),
+        }}
+    )
+)
+"""
+
+
+def _run_scenario(
+    statement: str, version: str, lazy: bool
+) -> Dict[str, float]:
+    """Runs a scenario in a new interpreter and returns its measurements.
+
+    Args:
+        statement: a str of Python code to run after creating a client.
+        version: a str of the API version to use.
+        lazy: a bool of whether to enable lazy imports.
+
+    Returns:
+        A dict with the elapsed seconds, peak RSS in MB and module count.
+    """
+    env: Dict[str, str] = dict(os.environ)
+    env["GOOGLE_ADS_LAZY_IMPORTS"] = "true" if lazy else "false"
+    code: str = _SCENARIO_TEMPLATE.format(version=version, statement=statement)
+    output: bytes = subprocess.check_output(
+        [sys.executable, "-c", code], env=env
+    )
+    return json.loads(output.decode().strip().splitlines()[-1])
+
+
+def main(version: str, runs: int) -> None:
+    """Runs every scenario and prints a table of the median measurements.
+
+    Args:
+        version: a str of the API version to use.
+        runs: an int of how many times to run each scenario.
+    """
+    print(
+        f"{'scenario':<14}{'mode':<7}{'seconds':>10}{'max RSS (MB)':>15}"
+        f"{'modules':>10}"
+    )
+
+    for name, statement in _SCENARIOS.items():
+        for lazy in (False, True):
+            results: List[Dict[str, float]] = [
+                _run_scenario(statement, version, lazy) for _ in range(runs)
+            ]
+            results.sort(key=lambda result: result["seconds"])
+            median: Dict[str, float] = results[len(results) // 2]
+            print(
+                f"{name:<14}{'lazy' if lazy else 'eager':<7}"
+                f"{median['seconds']:>10.2f}{median['max_rss_mb']:>15.1f}"
+                f"{median['modules']:>10}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=(
+            "Measures import time and memory use with eager and lazy imports."
+        )
+    )
+    parser.add_argument(
+        "-v",
+        "--version",
+        type=str,
+        default="v23",
+        help="The Google Ads API version to import.",
+    )
+    parser.add_argument(
+        "-r",
+        "--runs",
+        type=int,
+        default=3,
+        help="The number of times to run each scenario.",
+    )
+    args = parser.parse_args()
+
+    main(args.version, args.runs)
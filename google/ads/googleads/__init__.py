@@ -15,6 +15,11 @@
 import sys
 import warnings
 
+# Lazy imports must be enabled before any API version package is imported.
+from google.ads.googleads import lazy_imports
+
+lazy_imports.enable_from_env()
+
 import google.ads.googleads.client
 import google.ads.googleads.errors
 import google.ads.googleads.util
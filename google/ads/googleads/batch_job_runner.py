@@ -0,0 +1,463 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Runs BatchJobService jobs from start to finish.
+
+A batch job is created with mutate_batch_job, its operations are uploaded
+with add_batch_job_operations, each call passing the sequence token returned
+by the previous one, it's started with run_batch_job, which returns a
+long-running operation to poll until it's done, and its results are listed
+with list_batch_job_results.
+
+The BatchJobRunner class does all of this. Operations are read lazily from
+an iterable and uploaded in requests of a bounded size, so millions of
+operations can be added to a job without holding them in memory. The
+long-running operation is polled with an exponentially increasing, jittered
+delay, and results are read page by page as they're iterated over. Many jobs
+can be run concurrently on a bounded thread pool.
+
+Example:
+    runner = BatchJobRunner(client)
+    for result in runner.run(customer_id, operations):
+        if result.status.code:
+            ...
+
+    for job in runner.run_jobs(
+        (customer_id, operations) for customer_id in customer_ids
+    ):
+        if job.succeeded:
+            for result in job.iter_results():
+                ...
+"""
+
+from concurrent import futures
+import itertools
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from google.ads.googleads.mutate_batcher import chunk_operations
+from google.ads.googleads.retry import get_backoff
+
+# The maximum number of operations in an add_batch_job_operations request.
+_DEFAULT_MAX_OPERATIONS = 10000
+# The maximum size of an add_batch_job_operations request, with room left
+# for its resource name and sequence token.
+_DEFAULT_MAX_REQUEST_BYTES = 10484504 - 1024
+_DEFAULT_MAX_WORKERS = 4
+_DEFAULT_INITIAL_POLL_DELAY = 5.0
+_DEFAULT_MAX_POLL_DELAY = 60.0
+_DEFAULT_PAGE_SIZE = 1000
+BatchJobRequestType = Tuple[str, Iterable[Any]]
+
+
+def wait_for_operation(
+    operation: Any,
+    get_poll_delay: Callable[[int], float],
+    timeout: Optional[float] = None,
+) -> None:
+    """Polls a long-running operation until it's done.
+
+    Args:
+        operation: a google.api_core.operation.Operation, such as the one
+            returned by run_batch_job.
+        get_poll_delay: a callable that returns the float number of seconds
+            to wait before polling the operation again, given the int poll
+            number, starting at 1.
+        timeout: an optional float of the maximum number of seconds to wait
+            for the operation to be done.
+
+    Raises:
+        TimeoutError: If the operation isn't done before the timeout.
+        GoogleAPICallError: If the long-running operation failed.
+    """
+    deadline: Optional[float] = (
+        time.monotonic() + timeout if timeout is not None else None
+    )
+
+    for poll in itertools.count(1):
+        if operation.done():
+            break
+
+        delay: float = get_poll_delay(poll)
+
+        if deadline is not None:
+            remaining: float = deadline - time.monotonic()
+
+            if remaining <= 0:
+                raise TimeoutError(
+                    f"The operation wasn't done after {timeout} seconds."
+                )
+
+            delay = min(delay, remaining)
+
+        time.sleep(delay)
+
+    exception: Optional[Exception] = operation.exception()
+
+    if exception is not None:
+        raise exception
+
+
+class BatchJobUpload:
+    """The state of a batch job's uploaded operations."""
+
+    def __init__(
+        self, resource_name: str, total_operations: int, sequence_token: str
+    ) -> None:
+        """Initializer for the BatchJobUpload class.
+
+        Args:
+            resource_name: a str of the resource name of the batch job.
+            total_operations: an int of the number of operations uploaded to
+                the job so far.
+            sequence_token: a str of the token to pass with the next
+                operations added to the job.
+        """
+        self.resource_name: str = resource_name
+        self.total_operations: int = total_operations
+        self.sequence_token: str = sequence_token
+
+    def __repr__(self) -> str:
+        return (
+            f"BatchJobUpload(resource_name={self.resource_name!r}, "
+            f"total_operations={self.total_operations})"
+        )
+
+
+class BatchJobRun:
+    """The outcome of running a single batch job with run_jobs."""
+
+    def __init__(
+        self,
+        runner: "BatchJobRunner",
+        index: int,
+        customer_id: str,
+        resource_name: Optional[str] = None,
+        total_operations: int = 0,
+        exception: Optional[Exception] = None,
+    ) -> None:
+        """Initializer for the BatchJobRun class.
+
+        Args:
+            runner: the BatchJobRunner that ran the job.
+            index: an int of the position of the job in the order it was
+                submitted.
+            customer_id: a str of the customer ID of the job.
+            resource_name: a str of the resource name of the job, if it was
+                created.
+            total_operations: an int of the number of operations uploaded to
+                the job.
+            exception: the Exception raised while creating, uploading or
+                running the job, if any.
+        """
+        self._runner: BatchJobRunner = runner
+        self.index: int = index
+        self.customer_id: str = customer_id
+        self.resource_name: Optional[str] = resource_name
+        self.total_operations: int = total_operations
+        self.exception: Optional[Exception] = exception
+
+    @property
+    def succeeded(self) -> bool:
+        """Returns whether the job ran until it was done.
+
+        The operations of a job that succeeded can still have failed, which
+        is reported in the status of their results.
+        """
+        return self.exception is None
+
+    def iter_results(self) -> Iterator[Any]:
+        """Yields the BatchJobResult of each of the job's operations.
+
+        Results are requested page by page as they're iterated over.
+        """
+        if self.resource_name is None:
+            return iter(())
+
+        return self._runner.iter_results(self.resource_name)
+
+    def __repr__(self) -> str:
+        return (
+            f"BatchJobRun(index={self.index}, "
+            f"customer_id={self.customer_id!r}, "
+            f"resource_name={self.resource_name!r}, "
+            f"total_operations={self.total_operations}, "
+            f"succeeded={self.succeeded})"
+        )
+
+
+class BatchJobRunner:
+    """Creates, uploads, runs and reads the results of batch jobs."""
+
+    def __init__(
+        self,
+        client: Any,
+        max_operations: int = _DEFAULT_MAX_OPERATIONS,
+        max_request_bytes: int = _DEFAULT_MAX_REQUEST_BYTES,
+        max_workers: int = _DEFAULT_MAX_WORKERS,
+        initial_poll_delay: float = _DEFAULT_INITIAL_POLL_DELAY,
+        max_poll_delay: float = _DEFAULT_MAX_POLL_DELAY,
+        timeout: Optional[float] = None,
+        page_size: int = _DEFAULT_PAGE_SIZE,
+        version: Optional[str] = None,
+    ) -> None:
+        """Initializer for the BatchJobRunner class.
+
+        Args:
+            client: an initialized GoogleAdsClient instance.
+            max_operations: an int of the maximum number of operations in an
+                add_batch_job_operations request.
+            max_request_bytes: an int of the maximum serialized size of the
+                operations in an add_batch_job_operations request.
+            max_workers: an int of the maximum number of jobs run_jobs runs
+                concurrently.
+            initial_poll_delay: a float of the number of seconds to wait
+                after a running job is first polled before polling it again.
+                The delay doubles after every poll.
+            max_poll_delay: a float of the maximum number of seconds to wait
+                between polls.
+            timeout: an optional float of the maximum number of seconds to
+                wait for a job to be done.
+            page_size: an int of the number of results to request per page.
+            version: an optional str of the API version to use.
+
+        Raises:
+            ValueError: If a limit is less than one.
+        """
+        for name, value in (
+            ("max_operations", max_operations),
+            ("max_request_bytes", max_request_bytes),
+            ("max_workers", max_workers),
+            ("page_size", page_size),
+        ):
+            if value < 1:
+                raise ValueError(
+                    f"{name} must be at least 1, but {value} was given."
+                )
+
+        kwargs: Dict[str, str] = {"version": version} if version else {}
+        self._service: Any = client.get_service("BatchJobService", **kwargs)
+        self.max_operations: int = max_operations
+        self.max_request_bytes: int = max_request_bytes
+        self.max_workers: int = max_workers
+        self.initial_poll_delay: float = initial_poll_delay
+        self.max_poll_delay: float = max_poll_delay
+        self.timeout: Optional[float] = timeout
+        self.page_size: int = page_size
+
+    def create_job(self, customer_id: str) -> str:
+        """Creates an empty batch job.
+
+        Args:
+            customer_id: a str of the customer ID to create the job for.
+
+        Returns:
+            A str of the resource name of the job.
+        """
+        response: Any = self._service.mutate_batch_job(
+            request={"customer_id": customer_id, "operation": {"create": {}}}
+        )
+        return response.result.resource_name
+
+    def add_operations(
+        self,
+        resource_name: str,
+        operations: Iterable[Any],
+        sequence_token: Optional[str] = None,
+    ) -> BatchJobUpload:
+        """Uploads operations to a batch job in requests of a bounded size.
+
+        Operations are read lazily, so the iterable can be a generator of a
+        very large number of operations, and only the operations of one
+        request are held in memory at a time.
+
+        Args:
+            resource_name: a str of the resource name of the batch job.
+            operations: an iterable of proto-plus or protobuf MutateOperation
+                messages.
+            sequence_token: an optional str of the sequence token returned
+                when operations were last added to the job, if any were.
+
+        Returns:
+            A BatchJobUpload with the job's total number of operations and the
+            sequence token to pass when adding more of them.
+        """
+        upload: BatchJobUpload = BatchJobUpload(
+            resource_name, 0, sequence_token or ""
+        )
+
+        for chunk in chunk_operations(
+            operations, self.max_operations, self.max_request_bytes
+        ):
+            request: Dict[str, Any] = {
+                "resource_name": resource_name,
+                "mutate_operations": chunk,
+            }
+
+            if upload.sequence_token:
+                request["sequence_token"] = upload.sequence_token
+
+            response: Any = self._service.add_batch_job_operations(
+                request=request
+            )
+            upload.total_operations = response.total_operations
+            upload.sequence_token = response.next_sequence_token
+
+        return upload
+
+    def get_poll_delay(self, poll: int) -> float:
+        """Returns the number of seconds to wait before polling a job.
+
+        Args:
+            poll: an int of the poll number, starting at 1.
+        """
+        return get_backoff(poll, self.initial_poll_delay, self.max_poll_delay)
+
+    def wait(self, operation: Any) -> None:
+        """Polls the long-running operation of a job until it's done.
+
+        Args:
+            operation: the google.api_core.operation.Operation returned by
+                run_batch_job.
+
+        Raises:
+            TimeoutError: If the job isn't done before the runner's timeout.
+            GoogleAPICallError: If the long-running operation failed.
+        """
+        wait_for_operation(operation, self.get_poll_delay, self.timeout)
+
+    def run_job(self, resource_name: str) -> None:
+        """Runs a batch job and waits until it's done.
+
+        Args:
+            resource_name: a str of the resource name of the batch job.
+
+        Raises:
+            TimeoutError: If the job isn't done before the runner's timeout.
+        """
+        self.wait(self._service.run_batch_job(resource_name=resource_name))
+
+    def iter_results(self, resource_name: str) -> Iterator[Any]:
+        """Yields the BatchJobResult of each operation of a finished job.
+
+        Results are requested page by page as they're iterated over.
+
+        Args:
+            resource_name: a str of the resource name of the batch job.
+        """
+        return iter(
+            self._service.list_batch_job_results(
+                request={
+                    "resource_name": resource_name,
+                    "page_size": self.page_size,
+                }
+            )
+        )
+
+    def run(self, customer_id: str, operations: Iterable[Any]) -> Iterator[Any]:
+        """Runs operations in a new batch job and yields its results.
+
+        Args:
+            customer_id: a str of the customer ID to run the job for.
+            operations: an iterable of proto-plus or protobuf MutateOperation
+                messages.
+
+        Returns:
+            An iterator of the BatchJobResult of each operation.
+
+        Raises:
+            TimeoutError: If the job isn't done before the runner's timeout.
+        """
+        resource_name: str = self.create_job(customer_id)
+        self.add_operations(resource_name, operations)
+        self.run_job(resource_name)
+        return self.iter_results(resource_name)
+
+    def _run_request(
+        self, index: int, customer_id: str, operations: Iterable[Any]
+    ) -> BatchJobRun:
+        """Creates, uploads and runs a single job."""
+        job: BatchJobRun = BatchJobRun(self, index, customer_id)
+
+        try:
+            job.resource_name = self.create_job(customer_id)
+            job.total_operations = self.add_operations(
+                job.resource_name, operations
+            ).total_operations
+            self.run_job(job.resource_name)
+        except Exception as ex:
+            job.exception = ex
+
+        return job
+
+    def run_jobs(
+        self, requests: Iterable[BatchJobRequestType]
+    ) -> Iterator[BatchJobRun]:
+        """Runs a batch job for each request and yields them as they finish.
+
+        At most max_workers jobs are created, uploaded and polled at a time,
+        and requests are read from the given iterable lazily. If the caller
+        stops iterating, jobs that haven't started yet are cancelled.
+
+        Args:
+            requests: an iterable of tuples of a str customer ID and an
+                iterable of the MutateOperation messages of a job.
+
+        Yields:
+            BatchJobRun instances in the order the jobs finish. The index of
+            each job is the position of its request in the iterable.
+        """
+        pending_requests: Iterator[Tuple[int, BatchJobRequestType]] = iter(
+            enumerate(requests)
+        )
+        executor: futures.ThreadPoolExecutor = futures.ThreadPoolExecutor(
+            max_workers=self.max_workers
+        )
+        in_flight: Set[futures.Future] = set()
+
+        def submit(count: int) -> None:
+            for index, (customer_id, operations) in itertools.islice(
+                pending_requests, count
+            ):
+                in_flight.add(
+                    executor.submit(
+                        self._run_request, index, customer_id, operations
+                    )
+                )
+
+        try:
+            submit(self.max_workers)
+
+            while in_flight:
+                done, _ = futures.wait(
+                    in_flight, return_when=futures.FIRST_COMPLETED
+                )
+
+                for future in done:
+                    in_flight.remove(future)
+                    submit(1)
+                    yield future.result()
+        finally:
+            for future in in_flight:
+                future.cancel()
+
+            executor.shutdown(wait=False)
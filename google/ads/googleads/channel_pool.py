@@ -0,0 +1,485 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""A pool of gRPC channels shared by the service clients of a GoogleAdsClient.
+
+Every service in the Google Ads API is served from the same endpoint, so
+service clients that are created by the same GoogleAdsClient can safely send
+requests over the same set of HTTP/2 connections. The ChannelPool class stores
+channels keyed by their configuration, and each pooled channel can spread
+requests over a fixed number of subchannels. Each service client gets its own
+handle of a pooled channel, and the pooled channel is closed when the last of
+its handles is closed.
+"""
+
+import itertools
+import threading
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+import grpc
+
+ROUND_ROBIN = "round_robin"
+LEAST_IN_FLIGHT = "least_in_flight"
+_VALID_POLICIES = (ROUND_ROBIN, LEAST_IN_FLIGHT)
+_DEFAULT_POOL_SIZE = 1
+
+# gRPC shares connections between channels that are created with identical
+# arguments. When a pool has more than one subchannel this option is added to
+# each channel so that every subchannel opens its own connection.
+LOCAL_SUBCHANNEL_POOL_OPTION: Tuple[str, int] = (
+    "grpc.use_local_subchannel_pool",
+    1,
+)
+
+ChannelFactoryType = Callable[[], grpc.Channel]
+
+
+class _Subchannel:
+    """A single channel in a pool and a count of its in-flight requests."""
+
+    __slots__ = ("channel", "in_flight")
+
+    def __init__(self, channel: grpc.Channel) -> None:
+        self.channel: grpc.Channel = channel
+        self.in_flight: int = 0
+
+
+class _PooledMultiCallable:
+    """Picks a subchannel for every invocation of a gRPC method.
+
+    Instances of this class are returned by the unary_unary, unary_stream,
+    stream_unary and stream_stream methods of a _PooledChannel. The
+    multicallable of each subchannel is created up front so that picking a
+    subchannel on each request is a list index operation.
+    """
+
+    def __init__(
+        self,
+        pooled_channel: "_PooledChannel",
+        multicallables: List[Any],
+    ) -> None:
+        self._pooled_channel: "_PooledChannel" = pooled_channel
+        self._multicallables: List[Any] = multicallables
+
+    def _call_blocking(self, attr: str, *args: Any, **kwargs: Any) -> Any:
+        index: int = self._pooled_channel._acquire()
+        try:
+            return getattr(self._multicallables[index], attr)(*args, **kwargs)
+        finally:
+            self._pooled_channel._release(index)
+
+    def _call_non_blocking(
+        self, attr: str, *args: Any, **kwargs: Any
+    ) -> Any:
+        index: int = self._pooled_channel._acquire()
+        try:
+            call: Any = getattr(self._multicallables[index], attr)(
+                *args, **kwargs
+            )
+        except BaseException:
+            self._pooled_channel._release(index)
+            raise
+
+        call.add_done_callback(
+            lambda _: self._pooled_channel._release(index)
+        )
+        return call
+
+
+class _PooledUnaryUnaryMultiCallable(
+    _PooledMultiCallable, grpc.UnaryUnaryMultiCallable
+):
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self._call_blocking("__call__", *args, **kwargs)
+
+    def with_call(self, *args: Any, **kwargs: Any) -> Any:
+        return self._call_blocking("with_call", *args, **kwargs)
+
+    def future(self, *args: Any, **kwargs: Any) -> Any:
+        return self._call_non_blocking("future", *args, **kwargs)
+
+
+class _PooledUnaryStreamMultiCallable(
+    _PooledMultiCallable, grpc.UnaryStreamMultiCallable
+):
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self._call_non_blocking("__call__", *args, **kwargs)
+
+
+class _PooledStreamUnaryMultiCallable(
+    _PooledMultiCallable, grpc.StreamUnaryMultiCallable
+):
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self._call_blocking("__call__", *args, **kwargs)
+
+    def with_call(self, *args: Any, **kwargs: Any) -> Any:
+        return self._call_blocking("with_call", *args, **kwargs)
+
+    def future(self, *args: Any, **kwargs: Any) -> Any:
+        return self._call_non_blocking("future", *args, **kwargs)
+
+
+class _PooledStreamStreamMultiCallable(
+    _PooledMultiCallable, grpc.StreamStreamMultiCallable
+):
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self._call_non_blocking("__call__", *args, **kwargs)
+
+
+class _PooledChannel:
+    """Spreads requests across a list of subchannels.
+
+    A pooled channel is shared by every _ChannelHandle of its key, and it's
+    closed when the last of them is closed, or when the pool is closed.
+    """
+
+    def __init__(self, channels: List[grpc.Channel], policy: str) -> None:
+        """Initializer for the _PooledChannel class.
+
+        Args:
+            channels: a list of grpc.Channel instances to send requests over.
+            policy: a str of the policy used to pick a subchannel for each
+                request, either "round_robin" or "least_in_flight".
+        """
+        self._subchannels: List[_Subchannel] = [
+            _Subchannel(channel) for channel in channels
+        ]
+        self._policy: str = policy
+        self._lock: threading.Lock = threading.Lock()
+        self._counter: Iterator[int] = itertools.count()
+        self._closed: bool = False
+        # Set when the last handle is closed while requests are in flight,
+        # which closes the channel when the last of them finishes.
+        self._closing: bool = False
+        # The number of open handles of the channel, which is updated by the
+        # pool while it holds its lock.
+        self._handles: int = 0
+
+    @property
+    def in_flight(self) -> List[int]:
+        """Returns the number of in-flight requests for each subchannel."""
+        return [subchannel.in_flight for subchannel in self._subchannels]
+
+    def _acquire(self) -> int:
+        """Picks a subchannel for a new request and marks it as in-flight.
+
+        Returns:
+            The int index of the chosen subchannel.
+        """
+        size: int = len(self._subchannels)
+
+        with self._lock:
+            if size == 1:
+                index: int = 0
+            elif self._policy == LEAST_IN_FLIGHT:
+                index: int = min(
+                    range(size), key=lambda i: self._subchannels[i].in_flight
+                )
+            else:
+                index: int = next(self._counter) % size
+
+            self._subchannels[index].in_flight += 1
+
+        return index
+
+    def _release(self, index: int) -> None:
+        """Marks a request on the subchannel at the given index as finished.
+
+        Args:
+            index: the int index of the subchannel.
+        """
+        with self._lock:
+            self._subchannels[index].in_flight -= 1
+            idle: bool = self._closing and not any(self.in_flight)
+
+        if idle:
+            self._close()
+
+    def _close_when_idle(self) -> None:
+        """Closes the subchannels once no requests are in flight."""
+        with self._lock:
+            self._closing = True
+            idle: bool = not any(self.in_flight)
+
+        if idle:
+            self._close()
+
+    def _get_multicallables(
+        self, attr: str, method: str, *args: Any, **kwargs: Any
+    ) -> List[Any]:
+        return [
+            getattr(subchannel.channel, attr)(method, *args, **kwargs)
+            for subchannel in self._subchannels
+        ]
+
+    def _close(self) -> None:
+        """Closes all of the subchannels."""
+        with self._lock:
+            closed: bool = self._closed
+            self._closed = True
+
+        if not closed:
+            for subchannel in self._subchannels:
+                subchannel.channel.close()
+
+
+class _ChannelHandle(grpc.Channel):
+    """A grpc.Channel that sends requests over a shared _PooledChannel.
+
+    Every call to ChannelPool.get_channel returns a new handle, so that each
+    service client owns its own. Closing a handle, which happens when a
+    service client or its transport is closed, or when the handle is garbage
+    collected, closes the pooled channel if no other handle is open, as soon
+    as its in-flight requests have finished.
+    """
+
+    def __init__(
+        self, pool: "ChannelPool", key: Hashable, channel: _PooledChannel
+    ) -> None:
+        """Initializer for the _ChannelHandle class.
+
+        Args:
+            pool: the ChannelPool that the channel belongs to.
+            key: the hashable key of the channel in the pool.
+            channel: the _PooledChannel to send requests over.
+        """
+        self._pool: "ChannelPool" = pool
+        self._key: Hashable = key
+        self._channel: _PooledChannel = channel
+        self._closed: bool = False
+
+    @property
+    def closed(self) -> bool:
+        """Whether the handle, or the pooled channel, has been closed."""
+        return self._closed or self._channel._closed
+
+    @property
+    def in_flight(self) -> List[int]:
+        """Returns the number of in-flight requests for each subchannel."""
+        return self._channel.in_flight
+
+    def unary_unary(
+        self, method: str, *args: Any, **kwargs: Any
+    ) -> grpc.UnaryUnaryMultiCallable:
+        return _PooledUnaryUnaryMultiCallable(
+            self._channel,
+            self._channel._get_multicallables(
+                "unary_unary", method, *args, **kwargs
+            ),
+        )
+
+    def unary_stream(
+        self, method: str, *args: Any, **kwargs: Any
+    ) -> grpc.UnaryStreamMultiCallable:
+        return _PooledUnaryStreamMultiCallable(
+            self._channel,
+            self._channel._get_multicallables(
+                "unary_stream", method, *args, **kwargs
+            ),
+        )
+
+    def stream_unary(
+        self, method: str, *args: Any, **kwargs: Any
+    ) -> grpc.StreamUnaryMultiCallable:
+        return _PooledStreamUnaryMultiCallable(
+            self._channel,
+            self._channel._get_multicallables(
+                "stream_unary", method, *args, **kwargs
+            ),
+        )
+
+    def stream_stream(
+        self, method: str, *args: Any, **kwargs: Any
+    ) -> grpc.StreamStreamMultiCallable:
+        return _PooledStreamStreamMultiCallable(
+            self._channel,
+            self._channel._get_multicallables(
+                "stream_stream", method, *args, **kwargs
+            ),
+        )
+
+    def subscribe(
+        self,
+        callback: Callable[[grpc.ChannelConnectivity], None],
+        try_to_connect: bool = False,
+    ) -> None:
+        for subchannel in self._channel._subchannels:
+            subchannel.channel.subscribe(
+                callback, try_to_connect=try_to_connect
+            )
+
+    def unsubscribe(
+        self, callback: Callable[[grpc.ChannelConnectivity], None]
+    ) -> None:
+        for subchannel in self._channel._subchannels:
+            subchannel.channel.unsubscribe(callback)
+
+    def close(self) -> None:
+        """Closes the handle, and the pooled channel if it was the last one."""
+        if not self._closed:
+            self._closed = True
+            self._pool._release(self._key, self._channel)
+
+    def __enter__(self) -> "_ChannelHandle":
+        return self
+
+    def __exit__(self, *args: Any) -> bool:
+        self.close()
+        return False
+
+    def __del__(self) -> None:
+        # Like grpc channels, handles are closed when they're collected, so
+        # that service clients that are discarded without being closed don't
+        # keep the pooled channel open.
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+class ChannelPool:
+    """Stores gRPC channels so that they can be shared by service clients.
+
+    Channels are stored by a hashable key that should describe everything
+    that makes one channel different from another, for example the endpoint,
+    the credentials and the interceptors that are attached to it.
+    """
+
+    def __init__(
+        self, size: int = _DEFAULT_POOL_SIZE, policy: str = ROUND_ROBIN
+    ) -> None:
+        """Initializer for the ChannelPool class.
+
+        Args:
+            size: an int of the number of subchannels that each pooled channel
+                should spread requests across.
+            policy: a str of the policy used to pick a subchannel for each
+                request, either "round_robin" or "least_in_flight".
+
+        Raises:
+            ValueError: If the size is less than one or the policy is invalid.
+        """
+        if size is None:
+            size = _DEFAULT_POOL_SIZE
+
+        if policy is None:
+            policy = ROUND_ROBIN
+
+        if int(size) < 1:
+            raise ValueError(
+                f"The channel pool size must be at least 1, but {size} was "
+                "given."
+            )
+
+        if policy not in _VALID_POLICIES:
+            raise ValueError(
+                f"The channel pool policy '{policy}' is invalid. It must be "
+                f"one of: {', '.join(_VALID_POLICIES)}."
+            )
+
+        self.size: int = int(size)
+        self.policy: str = policy
+        self._channels: Dict[Hashable, _PooledChannel] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._channels)
+
+    def get_channel(
+        self, key: Hashable, channel_factory: ChannelFactoryType
+    ) -> grpc.Channel:
+        """Returns a handle of the pooled channel for the given key.
+
+        The pooled channel is created if there isn't one for the key yet, and
+        it stays open until every handle of it has been closed, or the pool is
+        closed.
+
+        Args:
+            key: a hashable object that identifies the channel configuration.
+            channel_factory: a callable that returns a new grpc.Channel. It is
+                called once for every subchannel when the key is first seen.
+
+        Returns:
+            A new grpc.Channel handle of the channel that is shared by everyone
+            using the same key.
+        """
+        with self._lock:
+            channel: Optional[_PooledChannel] = self._channels.get(key)
+
+            if channel is None:
+                channel = _PooledChannel(
+                    [channel_factory() for _ in range(self.size)], self.policy
+                )
+                self._channels[key] = channel
+
+            channel._handles += 1
+
+        return _ChannelHandle(self, key, channel)
+
+    def _release(self, key: Hashable, channel: _PooledChannel) -> None:
+        """Closes a handle of a pooled channel.
+
+        Args:
+            key: the hashable key of the channel.
+            channel: the _PooledChannel of the handle.
+        """
+        with self._lock:
+            channel._handles -= 1
+
+            if channel._handles > 0:
+                return
+
+            if self._channels.get(key) is channel:
+                del self._channels[key]
+
+        channel._close_when_idle()
+
+    def close(self) -> None:
+        """Closes and removes all of the channels in the pool.
+
+        Handles of the channels can't send requests after they're closed.
+        """
+        with self._lock:
+            channels: List[_PooledChannel] = list(self._channels.values())
+            self._channels.clear()
+
+        for channel in channels:
+            channel._close()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Returns the pool configuration without any of its open channels.
+
+        gRPC channels cannot be pickled, so a GoogleAdsClient that is sent to
+        another process starts with an empty pool of the same configuration.
+
+        Returns:
+            a dict of this object's state
+        """
+        return {"size": self.size, "policy": self.policy}
+
+    def __setstate__(self, d: Dict[str, Any]) -> None:
+        """Deserializes self with the given dictionary.
+
+        Args:
+            d: a dict of this object's state
+        """
+        self.__init__(d["size"], d["policy"])
@@ -13,6 +13,8 @@
 # limitations under the License.
 """A client and common configurations for the Google Ads API."""
 
+import asyncio
+from collections import OrderedDict
 from importlib import import_module, metadata
 import logging.config
 
@@ -25,6 +27,10 @@ from google.protobuf.message import Message as ProtobufMessageType
 from proto import Message as ProtoPlusMessageType
 
 from google.ads.googleads import config, oauth2, util
+from google.ads.googleads.channel_pool import (
+    ChannelPool,
+    LOCAL_SUBCHANNEL_POOL_OPTION,
+)
 from google.ads.googleads.interceptors import (
     MetadataInterceptor,
     AsyncUnaryUnaryMetadataInterceptor,
@@ -35,10 +41,31 @@ from google.ads.googleads.interceptors import (
     LoggingInterceptor,
     AsyncUnaryUnaryLoggingInterceptor,
     AsyncUnaryStreamLoggingInterceptor,
+    MetricsInterceptor,
+    AsyncUnaryUnaryMetricsInterceptor,
+    AsyncUnaryStreamMetricsInterceptor,
+    MetricsRegistry,
+    RetryInterceptor,
+    AsyncUnaryUnaryRetryInterceptor,
+    AsyncUnaryStreamRetryInterceptor,
+    RateLimitInterceptor,
+    AsyncUnaryUnaryRateLimitInterceptor,
+    AsyncUnaryStreamRateLimitInterceptor,
 )
+from google.ads.googleads.rate_limiter import AdaptiveRateLimiter
+from google.ads.googleads.retry import RetryPolicy
 
 from types import ModuleType
-from typing import Any, Dict, List, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Tuple,
+    Union,
+)
 
 _logger = logging.getLogger(__name__)
 
@@ -49,6 +76,27 @@ _VALID_API_VERSIONS = ["v25", "v24", "v23", "v22", "v21"]
 _MESSAGE_TYPES = ["common", "enums", "errors", "resources", "services"]
 _DEFAULT_VERSION = _VALID_API_VERSIONS[0]
 
+# Maps each API version to an index of type names and the dot-delimited path
+# of the package that exports them, i.e. {"Campaign": "resources"}. Each index
+# is built the first time a type is requested for a version.
+_TYPE_INDEXES: Dict[str, Dict[str, str]] = {}
+# Caches the callable that constructs a type, keyed by the API version, type
+# name and whether proto-plus messages are used. The callable is either a
+# proto-plus message class or the protobuf message class that it wraps.
+_TYPE_CONSTRUCTORS: Dict[Tuple[str, str, bool], Callable[[], Any]] = {}
+# Caches the service client class and transport class for each service name,
+# API version and whether the async service client was requested.
+_SERVICE_CLASSES: Dict[Tuple[str, str, bool], Tuple[Any, Any]] = {}
+# Caches the names of the enums of each API version.
+_ENUM_NAMES: Dict[str, FrozenSet[str]] = {}
+# Caches each enum, keyed by the API version, enum name and whether
+# proto-plus messages are used. Enums are the nested proto-plus enum classes,
+# or instances of the protobuf enum messages.
+_ENUMS: Dict[Tuple[str, str, bool], Any] = {}
+# The number of service clients that are cached by each GoogleAdsClient. The
+# least recently used service client is evicted when there are more.
+_SERVICE_CLIENT_CACHE_SIZE = 128
+
 # Retrieve the version of this client library to be sent in the user-agent
 # information of API calls.
 try:
@@ -76,7 +124,8 @@ class _EnumGetter:
     """An intermediate getter for retrieving enums from service clients.
 
     Acts as the "enum" property of a service client and dynamically loads enum
-    class instances when accessed.
+    class instances when accessed. Each enum is resolved once per API version
+    and stored on the instance, so later accesses are plain attribute lookups.
     """
 
     def __init__(self, client: "GoogleAdsClient") -> None:
@@ -104,35 +153,105 @@ class _EnumGetter:
 
         return self._enums
 
+    @classmethod
+    def _get_enum_names(cls, version: str) -> FrozenSet[str]:
+        """Returns the names of the enums of the given API version."""
+        names: Union[FrozenSet[str], None] = _ENUM_NAMES.get(version)
+
+        if names is None:
+            names = frozenset(
+                import_module(f"google.ads.googleads.{version}.enums").__all__
+            )
+            _ENUM_NAMES[version] = names
+
+        return names
+
+    def _get_enum(
+        self, name: str
+    ) -> Union[ProtoEnumMeta, ProtobufMessageType]:
+        """Returns the given enum, resolving it only once per API version.
+
+        Args:
+            name: a str of the name of the enum, i.e. "AdTypeEnum".
+
+        Raises:
+            AttributeError: If there is no enum with the given name.
+        """
+        key: Tuple[str, str, bool] = (
+            self._version,
+            name,
+            bool(self._use_proto_plus),
+        )
+        enum: Any = _ENUMS.get(key)
+
+        if enum is None:
+            if name not in self._get_enum_names(self._version):
+                raise AttributeError(
+                    f"'{type(self).__name__}' object has no attribute '{name}'"
+                )
+
+            message_class: ProtoPlusMessageType = (
+                GoogleAdsClient._get_type_class(name, self._version)
+            )
+
+            if self._use_proto_plus:
+                # Each enum message wraps a single nested enum, e.g.
+                # CampaignStatusEnum.CampaignStatus.
+                enum = getattr(
+                    message_class,
+                    message_class.pb().DESCRIPTOR.enum_types[0].name,
+                )
+            else:
+                enum = message_class.pb()()
+
+            _ENUMS[key] = enum
+
+        return enum
+
     def __getattr__(
         self, name: str
     ) -> Union[ProtoPlusMessageType, ProtobufMessageType]:
         """Dynamically loads the given enum class instance.
 
+        The enum is stored as an attribute of this instance, so that this
+        method is only called the first time it's accessed.
+
         Args:
             name: a str of the name of the enum to load, i.e. "AdTypeEnum."
 
         Returns:
             An instance of the enum proto message class.
         """
-        if name not in self.__dir__():
+        # Private names are never enums, and are looked up while unpickling
+        # before __dict__ is set.
+        if name.startswith("_"):
             raise AttributeError(
                 f"'{type(self).__name__}' object has no attribute '{name}'"
             )
-        try:
-            enum_class = self._client.get_type(name)
 
-            if self._use_proto_plus:
-                for attr in dir(enum_class):
-                    attr_val = getattr(enum_class, attr)
-                    if isinstance(attr_val, ProtoEnumMeta):
-                        return attr_val
-            else:
-                return enum_class
-        except ValueError:
-            raise AttributeError(
-                f"'{type(self).__name__}' object has no attribute '{name}'"
-            )
+        enum: Any = self._get_enum(name)
+        self.__dict__[name] = enum
+        return enum
+
+    def warm_up(self, names: Union[Iterable[str], None] = None) -> None:
+        """Resolves enums ahead of time.
+
+        Accessing an enum for the first time imports its module, so enums
+        that are used in latency-sensitive code, such as loops over the rows
+        of a report, can be resolved when the application starts instead.
+
+        Args:
+            names: an optional iterable of str enum names. All of the enums
+                of the API version are resolved by default.
+
+        Raises:
+            AttributeError: If one of the names isn't an enum.
+        """
+        if names is None:
+            names = self.__dir__()
+
+        for name in names:
+            getattr(self, name)
 
     def __getstate__(self) -> Dict[str, Any]:
         """Returns self serialized as a dict.
@@ -144,7 +263,13 @@ class _EnumGetter:
         Returns:
             a dict of this object's state
         """
-        return self.__dict__.copy()
+        # Resolved enums aren't included, they're resolved again when they're
+        # next accessed.
+        return {
+            key: value
+            for key, value in self.__dict__.items()
+            if key.startswith("_")
+        }
 
     def __setstate__(self, d: Dict[str, Any]) -> None:
         """Deserializes self with the given dictionary.
@@ -181,11 +306,17 @@ class GoogleAdsClient:
         return util.proto_copy_from(destination, origin)
 
     @classmethod
-    def _get_client_kwargs(cls, config_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _get_client_kwargs(
+        cls,
+        config_data: Dict[str, Any],
+        credentials: Union[Credentials, None] = None,
+    ) -> Dict[str, Any]:
         """Converts configuration dict into kwargs required by the client.
 
         Args:
             config_data: a dict containing client configuration.
+            credentials: optional credentials that were already loaded from
+                the configuration. They're loaded by default.
 
         Returns:
             A dict containing kwargs that will be provided to the
@@ -195,7 +326,11 @@ class GoogleAdsClient:
             ValueError: If the configuration lacks a required field.
         """
         return {
-            "credentials": oauth2.get_credentials(config_data),
+            "credentials": (
+                credentials
+                if credentials is not None
+                else oauth2.get_credentials(config_data)
+            ),
             "developer_token": config_data.get("developer_token"),
             "endpoint": config_data.get("endpoint"),
             "login_customer_id": config_data.get("login_customer_id"),
@@ -207,6 +342,16 @@ class GoogleAdsClient:
                 "use_cloud_org_for_api_access"
             ),
             "ads_assistant": config_data.get("ads_assistant"),
+            "channel_pool_size": config_data.get("channel_pool_size"),
+            "channel_pool_policy": config_data.get("channel_pool_policy"),
+            "structured_logging": config_data.get("structured_logging", False),
+            "max_log_message_length": config_data.get(
+                "max_log_message_length"
+            ),
+            "enable_metrics": config_data.get("enable_metrics", False),
+            "retry_policy": config_data.get("retry_policy"),
+            "rate_limiter": config_data.get("rate_limiter"),
+            "token_refresh": config_data.get("token_refresh"),
         }
 
     @classmethod
@@ -321,6 +466,145 @@ class GoogleAdsClient:
         kwargs: Dict[str, Any] = cls._get_client_kwargs(config_data)
         return cls(**dict(version=version, **kwargs))
 
+    @classmethod
+    async def _create_async(
+        cls, config_data: Dict[str, Any], version: Union[str, None]
+    ) -> "GoogleAdsClient":
+        """Creates a GoogleAdsClient without blocking the running event loop.
+
+        The credentials are loaded with oauth2.get_credentials_async, and if
+        the configuration has a "token_refresh" dict, its CredentialManager
+        refreshes the token on a task of the running event loop instead of
+        on a thread.
+
+        Args:
+            config_data: a dict containing client configuration.
+            version: a str indicating the Google Ads API version to be used.
+
+        Returns:
+            A GoogleAdsClient initialized with the given configuration.
+
+        Raises:
+            ValueError: If the configuration lacks a required field.
+        """
+        credentials: Credentials = await oauth2.get_credentials_async(
+            config_data
+        )
+        kwargs: Dict[str, Any] = cls._get_client_kwargs(
+            config_data, credentials=credentials
+        )
+        token_refresh: Any = kwargs["token_refresh"]
+
+        if isinstance(token_refresh, dict):
+            credential_manager: oauth2.CredentialManager = (
+                oauth2.CredentialManager.from_dict(
+                    credentials, token_refresh, http_proxy=kwargs["http_proxy"]
+                )
+            )
+            credential_manager.start_async()
+            kwargs["token_refresh"] = credential_manager
+
+        client: "GoogleAdsClient" = cls(**dict(version=version, **kwargs))
+
+        if isinstance(token_refresh, dict):
+            # The manager was created from the configuration, so it belongs
+            # to the client, which stops it when it's closed.
+            client._owns_credential_manager = True
+
+        return client
+
+    @classmethod
+    async def load_from_env_async(
+        cls, version: Union[str, None] = None
+    ) -> "GoogleAdsClient":
+        """Creates a GoogleAdsClient from env variables without blocking.
+
+        Args:
+            version: a str indicating the Google Ads API version to be used.
+
+        Returns:
+            A GoogleAdsClient initialized with the values specified in the
+            env variables.
+
+        Raises:
+            ValueError: If the configuration lacks a required field.
+        """
+        config_data: Dict[str, Any] = config.load_from_env()
+        return await cls._create_async(config_data, version)
+
+    @classmethod
+    async def load_from_string_async(
+        cls, yaml_str: str, version: Union[str, None] = None
+    ) -> "GoogleAdsClient":
+        """Creates a GoogleAdsClient from a YAML string without blocking.
+
+        Args:
+            yaml_str: a str containing YAML configuration data used to
+              initialize a GoogleAdsClient.
+            version: a str indicating the Google Ads API version to be used.
+
+        Returns:
+            A GoogleAdsClient initialized with the values specified in the
+            string.
+
+        Raises:
+            ValueError: If the configuration lacks a required field.
+        """
+        config_data: Dict[str, Any] = config.parse_yaml_document_to_dict(
+            yaml_str
+        )
+        return await cls._create_async(config_data, version)
+
+    @classmethod
+    async def load_from_dict_async(
+        cls, config_dict: Dict[str, Any], version: Union[str, None] = None
+    ) -> "GoogleAdsClient":
+        """Creates a GoogleAdsClient from a dict without blocking.
+
+        Args:
+            config_dict: a dict consisting of configuration data used to
+              initialize a GoogleAdsClient.
+            version: a str indicating the Google Ads API version to be used.
+
+        Returns:
+            A GoogleAdsClient initialized with the values specified in the
+                dict.
+
+        Raises:
+            ValueError: If the configuration lacks a required field.
+        """
+        config_data: Dict[str, Any] = config.load_from_dict(config_dict)
+        return await cls._create_async(config_data, version)
+
+    @classmethod
+    async def load_from_storage_async(
+        cls, path: Union[str, None] = None, version: Union[str, None] = None
+    ) -> "GoogleAdsClient":
+        """Creates a GoogleAdsClient from a file without blocking.
+
+        The file is read in the running event loop's default executor.
+
+        Args:
+            path: a str indicating the path to a YAML file containing
+              configuration data used to initialize a GoogleAdsClient.
+            version: a str indicating the Google Ads API version to be used.
+
+        Returns:
+            A GoogleAdsClient initialized with the values in the specified file.
+
+        Raises:
+            FileNotFoundError: If the specified configuration file doesn't
+                exist.
+            IOError: If the configuration file can't be loaded.
+            ValueError: If the configuration file lacks a required field.
+        """
+        config_data: Dict[str, Any] = (
+            await asyncio.get_running_loop().run_in_executor(
+                None, config.load_from_yaml_file, path
+            )
+        )
+        return await cls._create_async(config_data, version)
+
     def __init__(
         self,
         credentials: Dict[str, Any],
@@ -334,6 +618,16 @@ class GoogleAdsClient:
         use_proto_plus: bool = False,
         use_cloud_org_for_api_access: Union[str, None] = None,
         ads_assistant: Union[str, None] = None,
+        channel_pool_size: Union[int, None] = None,
+        channel_pool_policy: Union[str, None] = None,
+        structured_logging: bool = False,
+        max_log_message_length: Union[int, None] = None,
+        enable_metrics: bool = False,
+        retry_policy: Union[RetryPolicy, Dict[str, Any], None] = None,
+        rate_limiter: Union[AdaptiveRateLimiter, Dict[str, Any], None] = None,
+        token_refresh: Union[
+            oauth2.CredentialManager, Dict[str, Any], None
+        ] = None,
     ):
         """Initializer for the GoogleAdsClient.
 
@@ -354,6 +648,36 @@ class GoogleAdsClient:
                 levels. Use this flag only if you are enrolled into a limited
                 pilot that supports this configuration.
             ads_assistant: a str specifying the Google Ads API Assistant version.
+            channel_pool_size: an int specifying how many gRPC channels, and
+                therefore connections, requests to an endpoint are spread
+                across. Defaults to 1.
+            channel_pool_policy: a str specifying how a pooled channel is
+                picked for each request, either "round_robin" or
+                "least_in_flight". Defaults to "round_robin".
+            structured_logging: a bool specifying whether requests are logged
+                as structured messages, see the interceptors.log_sink module,
+                instead of formatted text.
+            max_log_message_length: an int specifying the maximum length of
+                the requests and responses in full log lines. Longer messages
+                are truncated. By default they're logged in full.
+            enable_metrics: a bool specifying whether the latency, size and
+                status of requests are recorded in the MetricsRegistry that's
+                available as the metrics attribute.
+            retry_policy: a RetryPolicy, or a dict of its configuration,
+                specifying how failed requests are retried. Requests aren't
+                retried by default.
+            rate_limiter: an AdaptiveRateLimiter, or a dict of its
+                configuration, that paces requests and adapts their rate to
+                the API's rate limits. Requests aren't paced by default.
+            token_refresh: a CredentialManager, or a dict of its
+                configuration, that refreshes the access token of the
+                credentials on a background thread before it expires, and
+                optionally shares it with other processes. If it isn't
+                already running it's started. A manager created from a dict
+                is stopped by close, but a CredentialManager instance belongs
+                to the caller, who must stop it, since it may be shared with
+                other clients. By default the token is refreshed when a
+                request is sent after it expires.
         """
         if logging_config:
             logging.config.dictConfig(logging_config)
@@ -366,11 +690,58 @@ class GoogleAdsClient:
         self.version: Union[str, None] = version
         self.http_proxy: Union[str, None] = http_proxy
         self.use_proto_plus: bool = use_proto_plus
+        self.structured_logging: bool = structured_logging
+        self.max_log_message_length: Union[int, None] = max_log_message_length
+        self.metrics: Union[MetricsRegistry, None] = (
+            MetricsRegistry() if enable_metrics else None
+        )
+        # The policy, and therefore its retry budget, is shared by all of the
+        # service clients created by this instance.
+        self.retry_policy: Union[RetryPolicy, None] = (
+            RetryPolicy.from_dict(retry_policy)
+            if isinstance(retry_policy, dict)
+            else retry_policy
+        )
+        # The rate limiter is shared by all of the service clients created by
+        # this instance, so that they're paced together.
+        self.rate_limiter: Union[AdaptiveRateLimiter, None] = (
+            AdaptiveRateLimiter.from_dict(rate_limiter)
+            if isinstance(rate_limiter, dict)
+            else rate_limiter
+        )
+        self.credential_manager: Union[oauth2.CredentialManager, None] = (
+            oauth2.CredentialManager.from_dict(
+                credentials, token_refresh, http_proxy=http_proxy
+            )
+            if isinstance(token_refresh, dict)
+            else token_refresh
+        )
+
+        # Whether the manager was created by this instance, which stops it
+        # when it's closed.
+        self._owns_credential_manager: bool = isinstance(token_refresh, dict)
+
+        if self.credential_manager and not self.credential_manager.running:
+            self.credential_manager.start()
+
         self.use_cloud_org_for_api_access: Union[str, None] = (
             use_cloud_org_for_api_access
         )
         self.enums: _EnumGetter = _EnumGetter(self)
         self._ads_assistant: Union[str, None] = ads_assistant
+        # Channels are shared by all of the service clients created by this
+        # instance so that they reuse the same connections.
+        self._channel_pool: ChannelPool = ChannelPool(
+            channel_pool_size, channel_pool_policy
+        )
+        # Service clients are cached by name, version, whether they're async,
+        # any additional interceptors, the event loop of async clients and the
+        # settings that their interceptors are built from, along with the
+        # channel handle of synchronous service clients, in the order that
+        # they were last used.
+        self._service_clients: Dict[
+            Tuple[Any, ...], Tuple[Any, Union[grpc.Channel, None]]
+        ] = OrderedDict()
 
         # If given, write the http_proxy channel option for GRPC to use
         if http_proxy:
@@ -385,6 +756,14 @@ class GoogleAdsClient:
     ) -> Any:
         """Returns a service client instance for the specified service_name.
 
+        Service clients are cached, so calling this method again with the same
+        arguments, and the same client settings such as login_customer_id,
+        returns the same service client instance. Async service clients are
+        only cached when they're retrieved in a running event loop, and
+        synchronous service clients are replaced once they have been closed.
+        Only the most recently used service clients are cached. Cached service
+        clients can be removed with evict_service or close.
+
         Args:
             name: a str indicating the name of the service for which a service
               client is being retrieved; e.g. you may specify "CampaignService"
@@ -406,10 +785,183 @@ class GoogleAdsClient:
         # If version is specified when the instance is created,
         # override any version specified as an argument.
         version = self.version if self.version else version
-        # api_module = self._get_api_services_by_version(version)
+        interceptors = interceptors or []
+        # Async channels are bound to the event loop that was running when
+        # they were created, so they can't be reused in a different loop.
+        loop: Union[asyncio.AbstractEventLoop, None] = (
+            self._get_running_loop() if is_async else None
+        )
+
+        if is_async and loop is None:
+            # Without a running loop the channel is bound to whichever loop
+            # first uses it, so the service client isn't cached.
+            return self._create_service_client(
+                name, version, interceptors, is_async
+            )[0]
+
+        key: Tuple[Any, ...] = (
+            name,
+            version,
+            is_async,
+            tuple(interceptors),
+            loop,
+            self._get_header_settings(),
+            self._get_channel_settings(),
+        )
+        cached: Union[Tuple[Any, Union[grpc.Channel, None]], None] = (
+            self._service_clients.get(key)
+        )
+
+        # A synchronous service client that was closed, for example with
+        # "with service:", can't send requests, so it's replaced.
+        if cached is not None and (cached[1] is None or not cached[1].closed):
+            try:
+                self._service_clients.move_to_end(key)
+            except KeyError:
+                # Another thread evicted the service client in the meantime.
+                pass
+
+            return cached[0]
+
+        if is_async:
+            self._evict_closed_loops()
+
+        created: Tuple[Any, Union[grpc.Channel, None]] = (
+            self._create_service_client(name, version, interceptors, is_async)
+        )
+        # If another thread created the same service client in the meantime
+        # then that instance is returned instead.
+        if self._service_clients.get(key, cached) is cached:
+            self._service_clients[key] = created
+
+        cached = self._service_clients.get(key, created)
+
+        # Evicted service clients release their share of the pooled channel
+        # when they're garbage collected.
+        while len(self._service_clients) > _SERVICE_CLIENT_CACHE_SIZE:
+            try:
+                self._service_clients.popitem(last=False)
+            except KeyError:
+                break
+
+        return cached[0]
+
+    def evict_service(
+        self,
+        name: str,
+        version: Union[str, None] = None,
+        is_async: Union[bool, None] = None,
+    ) -> None:
+        """Removes cached service clients for the given service name.
+
+        The next call to get_service for the service will create a new
+        service client. Synchronous service clients share their channels, and
+        an evicted service client releases its share when it's closed, with
+        "service.transport.close()", or garbage collected. Async service
+        clients aren't closed by this method; close them with
+        "await service.transport.close()".
+
+        Args:
+            name: a str indicating the name of the service, i.e.
+              "CampaignService".
+            version: an optional str of the API version to evict. If not given,
+              service clients of every version are evicted.
+            is_async: an optional bool indicating whether only async, or only
+              sync service clients should be evicted. If not given, both are.
+        """
+        for key in list(self._service_clients):
+            key_name, key_version, key_is_async = key[:3]
+
+            if (
+                key_name == name
+                and version in (None, key_version)
+                and is_async in (None, key_is_async)
+            ):
+                self._service_clients.pop(key, None)
+
+    def _get_header_settings(self) -> Tuple[Any, ...]:
+        """Returns the settings that the metadata interceptor is built from.
+
+        Login and linked customer IDs, for example, are commonly changed on a
+        client after it's loaded, so service clients that were created with
+        different settings must not be reused. The headers are added by each
+        service client, so these settings don't affect which channel it uses.
+
+        Returns:
+            A hashable tuple of the settings.
+        """
+        return (
+            self.developer_token,
+            self.login_customer_id,
+            self.linked_customer_id,
+            self.use_cloud_org_for_api_access,
+            self._ads_assistant,
+        )
+
+    def _get_channel_settings(self) -> Tuple[Any, ...]:
+        """Returns the settings that channels and their interceptors use.
+
+        Channels and service clients that were created with different settings
+        must not be reused. Objects are identified by their id, which can't be
+        reused while a cached channel or service client refers to them.
+
+        Returns:
+            A hashable tuple of the settings.
+        """
+        return (
+            self.endpoint,
+            id(self.credentials),
+            id(self.retry_policy),
+            id(self.rate_limiter),
+            id(self.metrics),
+            self.use_proto_plus,
+            self.structured_logging,
+            self.max_log_message_length,
+        )
+
+    @staticmethod
+    def _get_running_loop() -> Union[asyncio.AbstractEventLoop, None]:
+        """Returns the running event loop, or None if there isn't one."""
+        try:
+            return asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+
+    def _evict_closed_loops(self) -> None:
+        """Removes cached async service clients whose event loop is closed."""
+        for key in list(self._service_clients):
+            loop: Union[asyncio.AbstractEventLoop, None] = key[4]
+
+            if loop is not None and loop.is_closed():
+                self._service_clients.pop(key, None)
+
+    @classmethod
+    def _get_service_classes(
+        cls, name: str, version: str, is_async: bool
+    ) -> Tuple[Any, Any]:
+        """Returns the service client and transport classes for a service.
+
+        The classes are cached after the first time they're resolved.
+
+        Args:
+            name: a str indicating the name of the service.
+            version: a str indicating the version of the Google Ads API.
+            is_async: whether or not to resolve the async service client.
+
+        Returns:
+            A tuple of the service client class and its transport class.
+
+        Raises:
+            ValueError: If the specified service doesn't exist.
+        """
+        key: Tuple[str, str, bool] = (name, version, is_async)
+        classes: Union[Tuple[Any, Any], None] = _SERVICE_CLASSES.get(key)
+
+        if classes is not None:
+            return classes
+
         services_path: str = f"google.ads.googleads.{version}.services.services"
         snaked: str = util.convert_upper_case_to_snake_case(name)
-        interceptors = interceptors or []
 
         try:
             service_module: Any = import_module(f"{services_path}.{snaked}")
@@ -432,6 +984,36 @@ class GoogleAdsClient:
             "grpc_asyncio" if is_async else None
         )
 
+        classes = (service_client_class, service_transport_class)
+        _SERVICE_CLASSES[key] = classes
+        return classes
+
+    def _create_service_client(
+        self,
+        name: str,
+        version: str,
+        interceptors: List,
+        is_async: bool,
+    ) -> Tuple[Any, Union[grpc.Channel, None]]:
+        """Creates a new service client instance.
+
+        Args:
+            name: a str indicating the name of the service.
+            version: a str indicating the version of the Google Ads API.
+            interceptors: a list of additional interceptors.
+            is_async: whether or not to create the async service client.
+
+        Returns:
+            A tuple of the new service client instance and, for synchronous
+            service clients, its handle of a pooled channel.
+
+        Raises:
+            ValueError: If the specified service doesn't exist.
+        """
+        service_client_class, service_transport_class = (
+            self._get_service_classes(name, version, is_async)
+        )
+
         endpoint: str = (
             self.endpoint
             if self.endpoint
@@ -442,6 +1024,42 @@ class GoogleAdsClient:
             # In async requests, separate UnaryUnary and UnaryStream
             # interceptors need to be added to the channel.
             interceptors: List = interceptors or []
+            # The retry interceptors are the outermost of the library's
+            # interceptors, so that every attempt passes through the others.
+            # They're added without a policy too, since a policy can be set
+            # for individual requests with retry.use_retry_policy.
+            interceptors = interceptors + [
+                AsyncUnaryUnaryRetryInterceptor(
+                    version, self.retry_policy, self.metrics
+                ),
+                AsyncUnaryStreamRetryInterceptor(
+                    version, self.retry_policy, self.metrics
+                ),
+            ]
+
+            if self.rate_limiter is not None:
+                interceptors = interceptors + [
+                    AsyncUnaryUnaryRateLimitInterceptor(
+                        self.rate_limiter,
+                        self.developer_token,
+                        self.login_customer_id,
+                    ),
+                    AsyncUnaryStreamRateLimitInterceptor(
+                        self.rate_limiter,
+                        self.developer_token,
+                        self.login_customer_id,
+                    ),
+                ]
+
+            if self.metrics is not None:
+                # The metrics interceptors are outside of the remaining
+                # interceptors so that the latency they record includes the
+                # time spent in them.
+                interceptors = interceptors + [
+                    AsyncUnaryUnaryMetricsInterceptor(self.metrics),
+                    AsyncUnaryStreamMetricsInterceptor(self.metrics),
+                ]
+
             interceptors = interceptors + [
                 AsyncUnaryUnaryMetadataInterceptor(
                     self.developer_token,
@@ -457,8 +1075,20 @@ class GoogleAdsClient:
                     self.use_cloud_org_for_api_access,
                     ads_assistant=self._ads_assistant,
                 ),
-                AsyncUnaryUnaryLoggingInterceptor(_logger, version, endpoint),
-                AsyncUnaryStreamLoggingInterceptor(_logger, version, endpoint),
+                AsyncUnaryUnaryLoggingInterceptor(
+                    _logger,
+                    version,
+                    endpoint,
+                    max_message_length=self.max_log_message_length,
+                    structured=self.structured_logging,
+                ),
+                AsyncUnaryStreamLoggingInterceptor(
+                    _logger,
+                    version,
+                    endpoint,
+                    max_message_length=self.max_log_message_length,
+                    structured=self.structured_logging,
+                ),
                 AsyncUnaryUnaryExceptionInterceptor(
                     version, use_proto_plus=self.use_proto_plus
                 ),
@@ -481,29 +1111,86 @@ class GoogleAdsClient:
             if name == "YouTubeVideoUploadService":
                 # YouTubeVideoUploadService uses REST, so we cannot pass the credentials inside the gRPC
                 # channel; we need to pass them explicitly.
-                return service_client_class(
-                    transport=service_transport,
-                    credentials=self.credentials,
-                    developer_token=self.developer_token,
-                    login_customer_id=self.login_customer_id,
-                    linked_customer_id=self.linked_customer_id,
-                    use_cloud_org_for_api_access=self.use_cloud_org_for_api_access,
+                return (
+                    service_client_class(
+                        transport=service_transport,
+                        credentials=self.credentials,
+                        developer_token=self.developer_token,
+                        login_customer_id=self.login_customer_id,
+                        linked_customer_id=self.linked_customer_id,
+                        use_cloud_org_for_api_access=self.use_cloud_org_for_api_access,
+                    ),
+                    None,
                 )
 
-            return service_client_class(transport=service_transport)
+            return service_client_class(transport=service_transport), None
 
-        channel: grpc.Channel = service_transport_class.create_channel(
-            host=endpoint,
-            credentials=self.credentials,
-            options=_GRPC_CHANNEL_OPTIONS,
-        )
+        def create_channel() -> grpc.Channel:
+            """Creates a new channel with the library's interceptors attached."""
+            options: List[Tuple[str, Any]] = _GRPC_CHANNEL_OPTIONS
+
+            if self._channel_pool.size > 1:
+                options = options + [LOCAL_SUBCHANNEL_POOL_OPTION]
+
+            channel: grpc.Channel = service_transport_class.create_channel(
+                host=endpoint,
+                credentials=self.credentials,
+                options=options,
+            )
 
-        interceptors: List[
-            Union[
-                grpc.UnaryUnaryClientInterceptor,
-                grpc.UnaryStreamClientInterceptor,
+            channel_interceptors: List[
+                Union[
+                    grpc.UnaryUnaryClientInterceptor,
+                    grpc.UnaryStreamClientInterceptor,
+                ]
+            ] = list(interceptors)
+            channel_interceptors.append(
+                RetryInterceptor(version, self.retry_policy, self.metrics)
+            )
+
+            if self.rate_limiter is not None:
+                # The developer token and login customer ID are read from the
+                # metadata that's added by each service client.
+                channel_interceptors.append(
+                    RateLimitInterceptor(self.rate_limiter, None)
+                )
+
+            if self.metrics is not None:
+                channel_interceptors.append(MetricsInterceptor(self.metrics))
+
+            channel_interceptors += [
+                LoggingInterceptor(
+                    _logger,
+                    version,
+                    endpoint,
+                    max_message_length=self.max_log_message_length,
+                    structured=self.structured_logging,
+                ),
+                ExceptionInterceptor(
+                    version, use_proto_plus=self.use_proto_plus
+                ),
             ]
-        ] = interceptors + [
+
+            return grpc.intercept_channel(channel, *channel_interceptors)
+
+        # All services share the same scopes and channel options, so a channel
+        # can be reused by any service that is sent to the same endpoint with
+        # the same credentials and interceptors. The library's interceptors
+        # are built from the client's settings when the channel is created, so
+        # a channel is only reused while those settings are unchanged. Headers
+        # such as the login customer ID are added by each service client
+        # instead, so that changing them doesn't open new connections.
+        channel_key: Tuple[Any, ...] = (
+            endpoint,
+            version,
+            tuple(interceptors),
+            self._get_channel_settings(),
+        )
+        channel_handle: grpc.Channel = self._channel_pool.get_channel(
+            channel_key, create_channel
+        )
+        channel: grpc.Channel = grpc.intercept_channel(
+            channel_handle,
             MetadataInterceptor(
                 self.developer_token,
                 self.login_customer_id,
@@ -511,11 +1198,7 @@ class GoogleAdsClient:
                 self.use_cloud_org_for_api_access,
                 ads_assistant=self._ads_assistant,
             ),
-            LoggingInterceptor(_logger, version, endpoint),
-            ExceptionInterceptor(version, use_proto_plus=self.use_proto_plus),
-        ]
-
-        channel: grpc.Channel = grpc.intercept_channel(channel, *interceptors)
+        )
 
         service_transport: Any = service_transport_class(
             channel=channel, client_info=_CLIENT_INFO
@@ -524,16 +1207,60 @@ class GoogleAdsClient:
         if name == "YouTubeVideoUploadService":
             # YouTubeVideoUploadService uses REST, so we cannot pass the credentials inside the gRPC
             # channel; we need to pass them explicitly.
-            return service_client_class(
-                transport=service_transport,
-                credentials=self.credentials,
-                developer_token=self.developer_token,
-                login_customer_id=self.login_customer_id,
-                linked_customer_id=self.linked_customer_id,
-                use_cloud_org_for_api_access=self.use_cloud_org_for_api_access,
+            return (
+                service_client_class(
+                    transport=service_transport,
+                    credentials=self.credentials,
+                    developer_token=self.developer_token,
+                    login_customer_id=self.login_customer_id,
+                    linked_customer_id=self.linked_customer_id,
+                    use_cloud_org_for_api_access=self.use_cloud_org_for_api_access,
+                ),
+                channel_handle,
             )
 
-        return service_client_class(transport=service_transport)
+        return service_client_class(transport=service_transport), channel_handle
+
+    def close(self) -> None:
+        """Closes the gRPC channels shared by this client's service clients.
+
+        All cached service clients are evicted. Synchronous service clients
+        that were retrieved from this client can't make requests after it has
+        been closed, but new ones can be retrieved with get_service, which will
+        open new channels. Async service clients aren't closed by this method;
+        close them with "await service.transport.close()".
+
+        A credential manager that was created from the token_refresh
+        configuration is stopped, and the token is refreshed when a request
+        is sent after it expires. A CredentialManager instance that was given
+        to the client isn't stopped.
+        """
+        self._service_clients.clear()
+        self._channel_pool.close()
+
+        if self.credential_manager and self._owns_credential_manager:
+            self.credential_manager.stop()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Returns self serialized as a dict.
+
+        Cached service clients hold open gRPC channels, which can't be pickled,
+        so they are left out and recreated as needed after unpickling.
+
+        Returns:
+            a dict of this object's state
+        """
+        state: Dict[str, Any] = self.__dict__.copy()
+        state["_service_clients"] = OrderedDict()
+        return state
+
+    def __setstate__(self, d: Dict[str, Any]) -> None:
+        """Deserializes self with the given dictionary.
+
+        Args:
+            d: a dict of this object's state
+        """
+        self.__dict__.update(d)
 
     def get_type(
         self, name: str, version: str = _DEFAULT_VERSION
@@ -549,6 +1276,90 @@ class GoogleAdsClient:
         Returns:
             A Message instance representing the desired type.
 
+        Raises:
+            ValueError: If the type for the specified name doesn't exist
+                in the given version.
+        """
+        # If version is specified when the instance is created,
+        # override any version specified as an argument.
+        version: str = self.version if self.version else version
+        key: Tuple[str, str, bool] = (version, name, bool(self.use_proto_plus))
+        constructor: Union[Callable[[], Any], None] = _TYPE_CONSTRUCTORS.get(
+            key
+        )
+
+        if constructor is None:
+            message_class: ProtoPlusMessageType = self._get_type_class(
+                name, version
+            )
+
+            if self.use_proto_plus or not issubclass(
+                message_class, ProtoPlusMessageType
+            ):
+                constructor = message_class
+            else:
+                # Instantiating the underlying protobuf class directly avoids
+                # creating a proto-plus wrapper only to unwrap it.
+                constructor = message_class.pb()
+
+            _TYPE_CONSTRUCTORS[key] = constructor
+
+        return constructor()
+
+    @classmethod
+    def _get_type_index(cls, version: str) -> Dict[str, str]:
+        """Returns an index of type names for the given API version.
+
+        The index is built from the __all__ attribute of each type package,
+        which doesn't require importing the modules that define the types
+        when lazy imports are enabled.
+
+        Args:
+            version: a str indicating the Google Ads API version.
+
+        Returns:
+            A dict mapping type names to the path of the package that
+            exports them, relative to the version package.
+
+        Raises:
+            ValueError: If the given version is invalid.
+        """
+        index: Union[Dict[str, str], None] = _TYPE_INDEXES.get(version)
+
+        if index is None:
+            version_module: ModuleType = cls._get_api_services_by_version(
+                version
+            )
+            index = {}
+
+            for type_name in _MESSAGE_TYPES:
+                if type_name == "services":
+                    path: str = f"{type_name}.types"
+                else:
+                    path: str = type_name
+
+                package: ModuleType = util.get_nested_attr(version_module, path)
+
+                # Earlier packages in _MESSAGE_TYPES take precedence if a name
+                # is exported by more than one package.
+                for name in package.__all__:
+                    index.setdefault(name, path)
+
+            _TYPE_INDEXES[version] = index
+
+        return index
+
+    @classmethod
+    def _get_type_class(cls, name: str, version: str) -> ProtoPlusMessageType:
+        """Returns the message class for the given type name and version.
+
+        Args:
+            name: a str indicating the name of the type.
+            version: a str indicating the Google Ads API version.
+
+        Returns:
+            The message class of the given type.
+
         Raises:
             ValueError: If the type for the specified name doesn't exist
                 in the given version.
@@ -569,28 +1380,13 @@ class GoogleAdsClient:
                 "or transport class."
             )
 
-        # If version is specified when the instance is created,
-        # override any version specified as an argument.
-        version: str = self.version if self.version else version
-        type_classes: ModuleType = self._get_api_services_by_version(version)
-
-        for type_name in _MESSAGE_TYPES:
-            if type_name == "services":
-                path: str = f"{type_name}.types.{name}"
-            else:
-                path: str = f"{type_name}.{name}"
-
-            try:
-                message_class: Union[ProtoPlusMessageType, ProtobufMessageType] = util.get_nested_attr(type_classes, path)  # type: ignore[no-untyped-call]
+        path: Union[str, None] = cls._get_type_index(version).get(name)
 
-                if self.use_proto_plus:
-                    return message_class()
-                else:
-                    return util.convert_proto_plus_to_protobuf(message_class())  # type: ignore[no-untyped-call]
-            except AttributeError:
-                pass
+        if path is None:
+            raise ValueError(
+                f"Specified type '{name}' does not exist in "
+                f"Google Ads API {version}"
+            )
 
-        raise ValueError(
-            f"Specified type '{name}' does not exist in "
-            f"Google Ads API {version}"
-        )
+        type_classes: ModuleType = cls._get_api_services_by_version(version)
+        return util.get_nested_attr(type_classes, f"{path}.{name}")
@@ -35,6 +35,14 @@ _OPTIONAL_KEYS = (
     "use_cloud_org_for_api_access",
     "use_application_default_credentials",
     "ads_assistant",
+    "channel_pool_size",
+    "channel_pool_policy",
+    "structured_logging",
+    "max_log_message_length",
+    "enable_metrics",
+    "retry_policy",
+    "rate_limiter",
+    "token_refresh",
 )
 _CONFIG_FILE_PATH_KEY = ("configuration_file_path",)
 _OAUTH2_INSTALLED_APP_KEYS = ("client_id", "client_secret", "refresh_token")
@@ -122,6 +130,24 @@ def _config_parser_decorator(func: F) -> F:
                         "The configuration value should be a valid JSON string."
                     )
 
+        for key in ("retry_policy", "rate_limiter", "token_refresh"):
+            if key not in config_keys:
+                continue
+
+            value: Any = parsed_config[key]
+            # If it's loaded from an environment variable the configuration
+            # is a JSON string, so it's converted to a dict here.
+            if type(value) is not dict:
+                try:
+                    parsed_config[key]: dict[str, Any] = json.loads(value)
+                except json.JSONDecodeError:
+                    raise ValueError(
+                        "Could not configure the client because the "
+                        f"configuration defined in the '{key}' key or "
+                        f"'GOOGLE_ADS_{key.upper()}' environment variable is "
+                        "invalid. The value should be a valid JSON string."
+                    )
+
         if "path_to_private_key_file" in config_keys:
             _logger.warning(
                 "The 'path_to_private_key_file' configuration key and "
@@ -180,6 +206,30 @@ def _config_parser_decorator(func: F) -> F:
                 disambiguate_string_bool(value)
             )
 
+        for key in ("structured_logging", "enable_metrics"):
+            if key in config_keys:
+                # If it's loaded from an environment variable this value is
+                # evaluated as a string, so it's converted to a bool here.
+                value: Union[str, bool] = parsed_config.get(key, False)
+                parsed_config[key]: bool = disambiguate_string_bool(value)
+
+        for key in ("channel_pool_size", "max_log_message_length"):
+            if key not in config_keys:
+                continue
+
+            # If it's loaded from an environment variable this value is
+            # evaluated as a string, so it's converted to an int here.
+            value: Union[str, int, None] = parsed_config[key]
+
+            if value is not None:
+                try:
+                    parsed_config[key]: int = int(value)
+                except ValueError:
+                    raise ValueError(
+                        f"The '{key}' configuration key must be an integer, "
+                        f"but '{value}' was given."
+                    )
+
         return parsed_config
 
     return parser_wrapper
@@ -0,0 +1,801 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Uploads Customer Match user lists with OfflineUserDataJobService.
+
+Members are added to, or removed from, a Customer Match user list by
+creating an offline user data job, adding operations with the UserData of
+each member to it with add_offline_user_data_job_operations, and running it.
+The emails, phone numbers and names in the UserData messages are normalized
+and hashed with SHA-256.
+
+The CustomerMatchUploader class does all of this. Members are read lazily
+from an iterable of records, such as the rows of a CSV file read with
+read_csv_records, each of which is a mapping with any of the keys "email",
+"phone", "first_name", "last_name", "country_code" and "postal_code". Batches
+of records are normalized, hashed and serialized into requests of a bounded
+size on a pool of processes, and the requests are sent concurrently on a
+pool of threads, so that lists of tens of millions of members aren't
+bottlenecked on a single core:
+
+    uploader = CustomerMatchUploader(client)
+    upload = uploader.upload(
+        customer_id,
+        user_list_resource_name,
+        read_csv_records("members.csv"),
+        ad_user_data_consent="GRANTED",
+    )
+    print(upload.operation_count, upload.failed_record_indexes)
+
+The processes are spawned rather than forked, since forking a process that
+runs gRPC threads isn't safe, so like with multiprocessing, the code of
+scripts that upload must be guarded by if __name__ == "__main__".
+"""
+
+from array import array
+from collections import deque
+from concurrent import futures
+import csv
+import functools
+import hashlib
+from importlib import import_module
+import itertools
+import multiprocessing
+import os
+import re
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
+
+from google.ads.googleads.batch_job_runner import wait_for_operation
+from google.ads.googleads.client import _DEFAULT_VERSION
+from google.ads.googleads.mutate_batcher import (
+    _DEFAULT_MAX_REQUEST_BYTES,
+    _REQUEST_OVERHEAD_BYTES,
+    get_operation_size,
+)
+from google.ads.googleads.partial_failure import (
+    PartialFailureResult,
+    decode_partial_failure,
+)
+from google.ads.googleads.retry import get_backoff
+from google.ads.googleads.util import convert_proto_plus_to_protobuf
+
+# Requests are limited to 100,000 user identifiers, and members usually have
+# one to three of them.
+_DEFAULT_MAX_OPERATIONS = 10000
+_DEFAULT_MAX_WORKERS = 4
+_DEFAULT_BATCH_SIZE = 5000
+# Jobs usually take hours to run, so they're polled infrequently.
+_DEFAULT_INITIAL_POLL_DELAY = 30.0
+_DEFAULT_MAX_POLL_DELAY = 600.0
+_ADDRESS_KEYS = ("first_name", "last_name", "country_code", "postal_code")
+_PHONE_NUMBER_PATTERN = re.compile(r"[^0-9+]")
+
+# A chunk of encoded records: the index of the record of each operation, the
+# serialized request with the operations, and the size of the operations.
+EncodedChunkType = Tuple[array, bytes, int]
+
+
+def normalize_email(email: str) -> str:
+    """Returns an email address without whitespace, in lowercase."""
+    return "".join(email.split()).lower()
+
+
+def normalize_phone_number(phone_number: str) -> str:
+    """Returns a phone number without anything but digits and plus signs.
+
+    Phone numbers must be in the E.164 format, such as "+18005550101", for
+    members to be matched, so they must include the country calling code.
+    """
+    return _PHONE_NUMBER_PATTERN.sub("", phone_number)
+
+
+def normalize_name(name: str) -> str:
+    """Returns a name without surrounding whitespace, in lowercase."""
+    return name.strip().lower()
+
+
+def hash_value(value: str) -> str:
+    """Returns the hex digest of the SHA-256 hash of a normalized value."""
+    return hashlib.sha256(value.encode()).hexdigest()
+
+
+def read_csv_records(
+    path: str, encoding: str = "utf-8", **reader_kwargs: Any
+) -> Iterator[Dict[str, str]]:
+    """Yields the rows of a CSV file as records of members.
+
+    The file is read lazily, and its header row names the keys of the
+    records, such as "email" or "phone". Other columns are ignored by the
+    uploader.
+
+    Args:
+        path: a str of the path of the CSV file.
+        encoding: a str of the encoding of the file.
+        **reader_kwargs: keyword arguments of csv.DictReader, such as
+            delimiter.
+
+    Yields:
+        A dict of each row's values by column name.
+    """
+    with open(path, newline="", encoding=encoding) as file:
+        yield from csv.DictReader(file, **reader_kwargs)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_types_module(version: str) -> Any:
+    """Returns the types module of OfflineUserDataJobService of a version."""
+    return import_module(
+        f"google.ads.googleads.{version}.services.types."
+        "offline_user_data_job_service"
+    )
+
+
+def _add_user_identifiers(
+    user_data: Any, record: Mapping[str, Optional[str]]
+) -> None:
+    """Adds the normalized and hashed identifiers of a record to UserData.
+
+    Each of the email, phone number and address of the record is added as a
+    separate UserIdentifier, since they're fields of a oneof. Empty values
+    and incomplete addresses are left out.
+
+    Args:
+        user_data: a UserData protobuf message.
+        record: a mapping of the str values of a member by key.
+    """
+    email: str = normalize_email(record.get("email") or "")
+
+    if email:
+        user_data.user_identifiers.add().hashed_email = hash_value(email)
+
+    phone_number: str = normalize_phone_number(record.get("phone") or "")
+
+    if phone_number:
+        user_data.user_identifiers.add().hashed_phone_number = hash_value(
+            phone_number
+        )
+
+    first_name, last_name, country_code, postal_code = (
+        (record.get(key) or "").strip() for key in _ADDRESS_KEYS
+    )
+
+    if first_name and last_name and country_code and postal_code:
+        address_info: Any = user_data.user_identifiers.add().address_info
+        address_info.hashed_first_name = hash_value(normalize_name(first_name))
+        address_info.hashed_last_name = hash_value(normalize_name(last_name))
+        address_info.country_code = country_code.upper()
+        address_info.postal_code = postal_code
+
+
+def _encode_records(
+    version: str,
+    start: int,
+    records: List[Mapping[str, Optional[str]]],
+    remove: bool,
+    max_operations: int,
+    max_operation_bytes: int,
+) -> List[EncodedChunkType]:
+    """Encodes records into serialized requests of a bounded size.
+
+    This runs on the uploader's process pool, so it only takes and returns
+    values that can be pickled cheaply.
+
+    Args:
+        version: a str of the API version of the requests.
+        start: an int of the index of the first record among all records.
+        records: a list of the records to encode.
+        remove: a bool of whether the members are removed from the user
+            list instead of added to it.
+        max_operations: an int of the maximum number of operations in a
+            request.
+        max_operation_bytes: an int of the maximum serialized size of the
+            operations in a request.
+
+    Returns:
+        A list of chunks of the records, each of them the index of the
+        record of each operation, an AddOfflineUserDataJobOperationsRequest
+        serialized with only its operations, and the size of the operations.
+        Records without any identifiers are left out.
+    """
+    types_module: Any = _get_types_module(version)
+    request_class: Any = (
+        types_module.AddOfflineUserDataJobOperationsRequest.pb()
+    )
+    operation_class: Any = types_module.OfflineUserDataJobOperation.pb()
+    chunks: List[EncodedChunkType] = []
+    request: Any = request_class()
+    record_indexes: array = array("q")
+    request_bytes: int = 0
+
+    for index, record in enumerate(records, start):
+        operation: Any = operation_class()
+        _add_user_identifiers(
+            operation.remove if remove else operation.create, record
+        )
+
+        if not operation.ListFields():
+            continue
+
+        size: int = get_operation_size(operation)
+
+        if record_indexes and (
+            len(record_indexes) >= max_operations
+            or request_bytes + size > max_operation_bytes
+        ):
+            chunks.append(
+                (record_indexes, request.SerializeToString(), request_bytes)
+            )
+            request = request_class()
+            record_indexes = array("q")
+            request_bytes = 0
+
+        request.operations.append(operation)
+        record_indexes.append(index)
+        request_bytes += size
+
+    if record_indexes:
+        chunks.append(
+            (record_indexes, request.SerializeToString(), request_bytes)
+        )
+
+    return chunks
+
+
+def _map_in_order(
+    executor: futures.Executor,
+    function: Callable[..., Any],
+    arguments: Iterator[Tuple[Any, ...]],
+    max_in_flight: int,
+) -> Iterator[Any]:
+    """Yields the results of a function called on an executor, in order.
+
+    Arguments are read lazily, and at most max_in_flight calls are pending
+    at a time. If the caller stops iterating, calls that haven't started yet
+    are cancelled.
+
+    Args:
+        executor: the futures.Executor to call the function on.
+        function: the callable to call.
+        arguments: an iterator of tuples of the arguments of each call.
+        max_in_flight: an int of the maximum number of pending calls.
+
+    Yields:
+        The result of each call, in the order of the arguments.
+    """
+    in_flight: Deque[futures.Future] = deque()
+
+    def submit() -> bool:
+        call_arguments: Optional[Tuple[Any, ...]] = next(arguments, None)
+
+        if call_arguments is None:
+            return False
+
+        in_flight.append(executor.submit(function, *call_arguments))
+        return True
+
+    try:
+        while len(in_flight) < max_in_flight and submit():
+            pass
+
+        while in_flight:
+            result: Any = in_flight.popleft().result()
+            submit()
+            yield result
+    finally:
+        for future in in_flight:
+            future.cancel()
+
+
+class UserDataRequestResult:
+    """The outcome of a single add_offline_user_data_job_operations request."""
+
+    def __init__(
+        self,
+        index: int,
+        record_indexes: array,
+        request_bytes: int,
+        response: Optional[Any] = None,
+        exception: Optional[Exception] = None,
+    ) -> None:
+        """Initializer for the UserDataRequestResult class.
+
+        Args:
+            index: an int of the position of the request in the order it
+                was sent.
+            record_indexes: an array of the index of the record of each of
+                the request's operations, among all of the records.
+            request_bytes: an int of the serialized size of the operations.
+            response: the response message if the request succeeded.
+            exception: the Exception raised by the request if it failed.
+        """
+        self.index: int = index
+        self.record_indexes: array = record_indexes
+        self.request_bytes: int = request_bytes
+        self.response: Optional[Any] = response
+        self.exception: Optional[Exception] = exception
+
+    @property
+    def succeeded(self) -> bool:
+        """Returns whether the request was processed by the API.
+
+        Requests sent with partial failure enabled succeed even when some of
+        their operations failed, see has_partial_failure.
+        """
+        return self.exception is None
+
+    @property
+    def has_partial_failure(self) -> bool:
+        """Returns whether some of the request's operations failed."""
+        if self.response is None:
+            return False
+
+        response_pb: Any = convert_proto_plus_to_protobuf(self.response)
+        return bool(response_pb.partial_failure_error.details)
+
+    def get_partial_failure(self) -> Optional[PartialFailureResult]:
+        """Returns the outcome of each of the request's operations.
+
+        The operation indexes of the result are relative to the request, see
+        record_indexes.
+
+        Returns:
+            A PartialFailureResult, or None if the request failed.
+        """
+        if self.response is None:
+            return None
+
+        return decode_partial_failure(self.response)
+
+    def get_failed_record_indexes(self) -> array:
+        """Returns the indexes of the records whose operations failed.
+
+        Returns:
+            An array of the indexes of the records among all of the records,
+            which are all of the request's records if it failed.
+        """
+        if self.exception is not None:
+            return self.record_indexes
+
+        if not self.has_partial_failure:
+            return array("q")
+
+        partial_failure: PartialFailureResult = self.get_partial_failure()
+        return array(
+            "q",
+            (
+                self.record_indexes[index]
+                for index in partial_failure.failed_operation_indexes
+                if index < len(self.record_indexes)
+            ),
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"UserDataRequestResult(index={self.index}, "
+            f"operations={len(self.record_indexes)}, "
+            f"succeeded={self.succeeded})"
+        )
+
+
+class CustomerMatchUpload:
+    """The outcome of an upload of records to an offline user data job."""
+
+    def __init__(
+        self,
+        resource_name: str,
+        request_count: int = 0,
+        operation_count: int = 0,
+        failed_record_indexes: Optional[array] = None,
+    ) -> None:
+        """Initializer for the CustomerMatchUpload class.
+
+        Args:
+            resource_name: a str of the resource name of the job.
+            request_count: an int of the number of requests sent.
+            operation_count: an int of the number of operations sent, which
+                is the number of records with identifiers.
+            failed_record_indexes: an array of the indexes of the records
+                whose operations failed.
+        """
+        self.resource_name: str = resource_name
+        self.request_count: int = request_count
+        self.operation_count: int = operation_count
+        self.failed_record_indexes: array = (
+            failed_record_indexes
+            if failed_record_indexes is not None
+            else array("q")
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"CustomerMatchUpload(resource_name={self.resource_name!r}, "
+            f"requests={self.request_count}, "
+            f"operations={self.operation_count}, "
+            f"failed_records={len(self.failed_record_indexes)})"
+        )
+
+
+class CustomerMatchUploader:
+    """Normalizes, hashes and uploads members of Customer Match lists."""
+
+    def __init__(
+        self,
+        client: Any,
+        max_operations: int = _DEFAULT_MAX_OPERATIONS,
+        max_request_bytes: int = _DEFAULT_MAX_REQUEST_BYTES,
+        max_workers: int = _DEFAULT_MAX_WORKERS,
+        max_processes: Optional[int] = None,
+        batch_size: int = _DEFAULT_BATCH_SIZE,
+        enable_partial_failure: bool = True,
+        initial_poll_delay: float = _DEFAULT_INITIAL_POLL_DELAY,
+        max_poll_delay: float = _DEFAULT_MAX_POLL_DELAY,
+        timeout: Optional[float] = None,
+        version: Optional[str] = None,
+    ) -> None:
+        """Initializer for the CustomerMatchUploader class.
+
+        Args:
+            client: an initialized GoogleAdsClient instance.
+            max_operations: an int of the maximum number of operations in an
+                add_offline_user_data_job_operations request.
+            max_request_bytes: an int of the maximum serialized size of a
+                request.
+            max_workers: an int of the maximum number of requests sent
+                concurrently.
+            max_processes: an optional int of the number of processes that
+                records are encoded on. By default it's one less than the
+                number of CPUs, leaving one for the thread that reads records
+                and sends requests. With 0, records are encoded on that
+                thread.
+            batch_size: an int of the number of records encoded by each task
+                of the process pool.
+            enable_partial_failure: a bool of whether the operations of a
+                request that are valid are added to the job when others
+                fail.
+            initial_poll_delay: a float of the number of seconds to wait
+                after a running job is first polled before polling it again.
+                The delay doubles after every poll.
+            max_poll_delay: a float of the maximum number of seconds to wait
+                between polls.
+            timeout: an optional float of the maximum number of seconds to
+                wait for a job to be done.
+            version: an optional str of the API version to use.
+
+        Raises:
+            ValueError: If a limit is less than one, or max_processes is
+                negative.
+        """
+        for name, value in (
+            ("max_operations", max_operations),
+            ("max_request_bytes", max_request_bytes),
+            ("max_workers", max_workers),
+            ("batch_size", batch_size),
+        ):
+            if value < 1:
+                raise ValueError(
+                    f"{name} must be at least 1, but {value} was given."
+                )
+
+        if max_processes is not None and max_processes < 0:
+            raise ValueError(
+                "max_processes must not be negative, but "
+                f"{max_processes} was given."
+            )
+
+        self.version: str = version or _DEFAULT_VERSION
+        self._service: Any = client.get_service(
+            "OfflineUserDataJobService", version=self.version
+        )
+        self._request_class: Any = _get_types_module(
+            self.version
+        ).AddOfflineUserDataJobOperationsRequest
+        self.max_operations: int = max_operations
+        self.max_request_bytes: int = max_request_bytes
+        self.max_workers: int = max_workers
+        self.max_processes: int = (
+            max_processes
+            if max_processes is not None
+            else (os.cpu_count() or 1) - 1
+        )
+        self.batch_size: int = batch_size
+        self.enable_partial_failure: bool = enable_partial_failure
+        self.initial_poll_delay: float = initial_poll_delay
+        self.max_poll_delay: float = max_poll_delay
+        self.timeout: Optional[float] = timeout
+
+    def create_job(
+        self,
+        customer_id: str,
+        user_list: str,
+        ad_user_data_consent: Optional[str] = None,
+        ad_personalization_consent: Optional[str] = None,
+    ) -> str:
+        """Creates an offline user data job for a Customer Match user list.
+
+        Args:
+            customer_id: a str of the customer ID that owns the user list.
+            user_list: a str of the resource name of the user list.
+            ad_user_data_consent: an optional str of the ConsentStatus name
+                of the consent for ad user data of all of the members, such as
+                "GRANTED".
+            ad_personalization_consent: an optional str of the ConsentStatus
+                name of the consent for ad personalization of all of the
+                members.
+
+        Returns:
+            A str of the resource name of the job.
+        """
+        metadata: Dict[str, Any] = {"user_list": user_list}
+        consent: Dict[str, str] = {}
+
+        if ad_user_data_consent:
+            consent["ad_user_data"] = ad_user_data_consent
+
+        if ad_personalization_consent:
+            consent["ad_personalization"] = ad_personalization_consent
+
+        if consent:
+            metadata["consent"] = consent
+
+        response: Any = self._service.create_offline_user_data_job(
+            request={
+                "customer_id": customer_id,
+                "job": {
+                    "type_": "CUSTOMER_MATCH_USER_LIST",
+                    "customer_match_user_list_metadata": metadata,
+                },
+            }
+        )
+        return response.resource_name
+
+    def _iter_encoded_chunks(
+        self, records: Iterable[Mapping[str, Optional[str]]], remove: bool
+    ) -> Iterator[EncodedChunkType]:
+        """Yields the records encoded into requests, in order.
+
+        Args:
+            records: an iterable of the records of members.
+            remove: a bool of whether the members are removed from the user
+                list instead of added to it.
+        """
+        record_iterator: Iterator[Mapping[str, Optional[str]]] = iter(records)
+        max_operation_bytes: int = max(
+            1, self.max_request_bytes - _REQUEST_OVERHEAD_BYTES
+        )
+
+        def iter_arguments() -> Iterator[Tuple[Any, ...]]:
+            for start in itertools.count(0, self.batch_size):
+                batch: List[Mapping[str, Optional[str]]] = list(
+                    itertools.islice(record_iterator, self.batch_size)
+                )
+
+                if not batch:
+                    return
+
+                yield (
+                    self.version,
+                    start,
+                    batch,
+                    remove,
+                    self.max_operations,
+                    max_operation_bytes,
+                )
+
+        if self.max_processes == 0:
+            for arguments in iter_arguments():
+                yield from _encode_records(*arguments)
+
+            return
+
+        executor: futures.ProcessPoolExecutor = futures.ProcessPoolExecutor(
+            max_workers=self.max_processes,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+        try:
+            # Encoded batches wait until the batches before them have been
+            # encoded too, so twice as many batches as processes are kept.
+            for chunks in _map_in_order(
+                executor,
+                _encode_records,
+                iter_arguments(),
+                2 * self.max_processes,
+            ):
+                yield from chunks
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _send_request(
+        self,
+        index: int,
+        resource_name: str,
+        record_indexes: array,
+        serialized_request: bytes,
+        request_bytes: int,
+    ) -> UserDataRequestResult:
+        """Sends an encoded request, capturing its response or exception."""
+        result: UserDataRequestResult = UserDataRequestResult(
+            index, record_indexes, request_bytes
+        )
+
+        try:
+            request: Any = self._request_class.deserialize(serialized_request)
+            request.resource_name = resource_name
+            request.enable_partial_failure = self.enable_partial_failure
+            result.response = (
+                self._service.add_offline_user_data_job_operations(
+                    request=request
+                )
+            )
+        except Exception as ex:
+            result.exception = ex
+
+        return result
+
+    def add_records(
+        self,
+        resource_name: str,
+        records: Iterable[Mapping[str, Optional[str]]],
+        remove: bool = False,
+    ) -> Iterator[UserDataRequestResult]:
+        """Adds records to a job and yields the result of each request.
+
+        Records are read lazily in batches, which are normalized, hashed and
+        encoded into requests on the process pool, and at most max_workers
+        requests are sent at a time. Only a bounded number of batches and
+        requests are held in memory, so the iterable can be a generator of a
+        very large number of records. If the caller stops iterating, requests
+        that haven't been sent yet are cancelled.
+
+        Args:
+            resource_name: a str of the resource name of the job.
+            records: an iterable of mappings of the str values of each member
+                by key, such as "email" or "phone".
+            remove: a bool of whether the members are removed from the user
+                list instead of added to it.
+
+        Yields:
+            UserDataRequestResult instances in the order of their records.
+        """
+        arguments: Iterator[Tuple[Any, ...]] = (
+            (index, resource_name, *chunk)
+            for index, chunk in enumerate(
+                self._iter_encoded_chunks(records, remove)
+            )
+        )
+        executor: futures.ThreadPoolExecutor = futures.ThreadPoolExecutor(
+            max_workers=self.max_workers
+        )
+
+        try:
+            # Completed requests wait here until the requests before them
+            # have completed too, so twice as many requests as workers are
+            # kept.
+            yield from _map_in_order(
+                executor,
+                self._send_request,
+                arguments,
+                2 * self.max_workers,
+            )
+        finally:
+            executor.shutdown(wait=False)
+
+    def get_poll_delay(self, poll: int) -> float:
+        """Returns the number of seconds to wait before polling a job.
+
+        Args:
+            poll: an int of the poll number, starting at 1.
+        """
+        return get_backoff(poll, self.initial_poll_delay, self.max_poll_delay)
+
+    def run_job(self, resource_name: str, wait: bool = True) -> Any:
+        """Runs a job, and optionally waits until it's done.
+
+        Args:
+            resource_name: a str of the resource name of the job.
+            wait: a bool of whether to poll the job until it's done.
+
+        Returns:
+            The google.api_core.operation.Operation of the job.
+
+        Raises:
+            TimeoutError: If the job isn't done before the uploader's
+                timeout.
+            GoogleAPICallError: If the long-running operation failed.
+        """
+        operation: Any = self._service.run_offline_user_data_job(
+            resource_name=resource_name
+        )
+
+        if wait:
+            wait_for_operation(operation, self.get_poll_delay, self.timeout)
+
+        return operation
+
+    def upload(
+        self,
+        customer_id: str,
+        user_list: str,
+        records: Iterable[Mapping[str, Optional[str]]],
+        remove: bool = False,
+        ad_user_data_consent: Optional[str] = None,
+        ad_personalization_consent: Optional[str] = None,
+        run: bool = True,
+        wait: bool = False,
+    ) -> CustomerMatchUpload:
+        """Uploads records to a new job, and runs it.
+
+        Args:
+            customer_id: a str of the customer ID that owns the user list.
+            user_list: a str of the resource name of the user list.
+            records: an iterable of mappings of the str values of each member
+                by key, such as "email" or "phone".
+            remove: a bool of whether the members are removed from the user
+                list instead of added to it.
+            ad_user_data_consent: an optional str of the ConsentStatus name
+                of the consent for ad user data of all of the members.
+            ad_personalization_consent: an optional str of the ConsentStatus
+                name of the consent for ad personalization of all of the
+                members.
+            run: a bool of whether to run the job once the records are added.
+            wait: a bool of whether to poll the job until it's done.
+
+        Returns:
+            A CustomerMatchUpload of the job.
+
+        Raises:
+            Exception: The exception of the first request that failed, after
+                which no more requests are sent and the job isn't run.
+            TimeoutError: If the job isn't done before the uploader's
+                timeout.
+        """
+        upload: CustomerMatchUpload = CustomerMatchUpload(
+            self.create_job(
+                customer_id,
+                user_list,
+                ad_user_data_consent,
+                ad_personalization_consent,
+            )
+        )
+        results: Iterator[UserDataRequestResult] = self.add_records(
+            upload.resource_name, records, remove
+        )
+
+        try:
+            for result in results:
+                if result.exception is not None:
+                    raise result.exception
+
+                upload.request_count += 1
+                upload.operation_count += len(result.record_indexes)
+                upload.failed_record_indexes.extend(
+                    result.get_failed_record_indexes()
+                )
+        finally:
+            results.close()
+
+        if run:
+            self.run_job(upload.resource_name, wait)
+
+        return upload
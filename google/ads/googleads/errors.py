@@ -13,24 +13,80 @@
 # limitations under the License.
 """Errors used by the Google Ads API library."""
 
+import functools
 import importlib
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import grpc
 import requests
 from google.api_core import exceptions as core_exceptions
+from google.protobuf.message import DecodeError
+from google.protobuf.message import Message as ProtobufMessage
 from proto import Message as ProtobufMessageType
 
+from google.ads.googleads.util import convert_proto_plus_to_protobuf
+
+
+@functools.lru_cache(maxsize=None)
+def _get_failure_class(version: str) -> type:
+    """Returns the GoogleAdsFailure proto-plus class of an API version.
+
+    Args:
+        version: a str of the API version, e.g. "v25".
+    """
+    return importlib.import_module(
+        f"google.ads.googleads.{version}.errors.types.errors"
+    ).GoogleAdsFailure
+
+
+def _get_error_code(
+    error_code: Any, enum_values: Dict[str, Any]
+) -> Optional[Tuple[str, str]]:
+    """Returns the names of the field and value of an ErrorCode.
+
+    Args:
+        error_code: an ErrorCode protobuf message.
+        enum_values: a dict of the enum values of each error code field, by
+            field name, which is filled in as fields are found so that they're
+            only looked up once across calls.
+
+    Returns:
+        A tuple of the str name of the error code field that's set and the
+        str name of its value, or None if no error code is set.
+    """
+    field_name: Optional[str] = error_code.WhichOneof("error_code")
+
+    if field_name is None:
+        return None
+
+    if field_name not in enum_values:
+        enum_values[field_name] = error_code.DESCRIPTOR.fields_by_name[
+            field_name
+        ].enum_type.values_by_number
+
+    value: int = getattr(error_code, field_name)
+    enum_value: Any = enum_values[field_name].get(value)
+    return field_name, enum_value.name if enum_value else str(value)
+
 
 class GoogleAdsException(Exception):
-    """Exception thrown in response to an API error from GoogleAds servers."""
+    """Exception thrown in response to an API error from GoogleAds servers.
+
+    Exceptions raised by the library's interceptors keep the serialized
+    GoogleAdsFailure they were returned with, and only decode it the first
+    time the failure attribute is read. Applications that only need to know
+    which errors occurred can use get_error_codes, which reads them without
+    creating proto-plus messages for the errors.
+    """
 
     def __init__(
         self,
         error: grpc.RpcError,
         call: grpc.Call,
-        failure: ProtobufMessageType,
-        request_id: str,
+        failure: Optional[ProtobufMessageType],
+        request_id: Optional[str],
+        serialized_failure: Optional[bytes] = None,
+        api_version: Optional[str] = None,
     ) -> None:
         """Initializer.
 
@@ -38,13 +94,116 @@ class GoogleAdsException(Exception):
             error: the grpc.RpcError raised by an rpc call.
             call: the grpc.Call object containing the details of the rpc call.
             failure: the GoogleAdsFailure instance describing how the
-                GoogleAds API call failed.
+                GoogleAds API call failed, or None if it's decoded from
+                serialized_failure.
             request_id: a str request ID associated with the GoogleAds API call.
+            serialized_failure: optional bytes of the serialized
+                GoogleAdsFailure, which is decoded when the failure is first
+                read.
+            api_version: a str of the API version of the call, which is
+                required to decode serialized_failure.
+
+        Raises:
+            ValueError: If serialized_failure is given without api_version.
         """
+        if serialized_failure is not None and api_version is None:
+            raise ValueError(
+                "An api_version is required to decode a serialized failure."
+            )
+
         self.error: grpc.RpcError = error
         self.call: grpc.Call = call
-        self.failure: ProtobufMessageType = failure
-        self.request_id: str = request_id
+        self.request_id: Optional[str] = request_id
+        self._failure: Optional[ProtobufMessageType] = failure
+        self._serialized_failure: Optional[bytes] = serialized_failure
+        self._api_version: Optional[str] = api_version
+        self._failure_pb: Optional[ProtobufMessage] = None
+
+    @property
+    def failure(self) -> Optional[ProtobufMessageType]:
+        """The GoogleAdsFailure describing how the API call failed.
+
+        It's decoded from the serialized failure the first time it's read,
+        and is None if that fails.
+        """
+        if self._failure is None and self._serialized_failure is not None:
+            try:
+                failure_pb: ProtobufMessage = self._get_failure_pb()
+            except DecodeError:
+                return None
+
+            self._failure = _get_failure_class(self._api_version).wrap(
+                failure_pb
+            )
+
+        return self._failure
+
+    @failure.setter
+    def failure(self, failure: Optional[ProtobufMessageType]) -> None:
+        self._failure = failure
+        self._failure_pb = None
+        self._serialized_failure = None
+
+    @property
+    def serialized_failure(self) -> Optional[bytes]:
+        """The GoogleAdsFailure serialized as bytes, if there is one."""
+        if self._serialized_failure is None and self._failure is not None:
+            return convert_proto_plus_to_protobuf(
+                self._failure
+            ).SerializeToString()
+
+        return self._serialized_failure
+
+    def _get_failure_pb(self) -> ProtobufMessage:
+        """Returns the failure as a protobuf message, parsing it only once.
+
+        Raises:
+            DecodeError: If the serialized failure is invalid.
+        """
+        if self._failure_pb is None:
+            self._failure_pb = (
+                _get_failure_class(self._api_version)
+                .pb()
+                .FromString(self._serialized_failure)
+            )
+
+        return self._failure_pb
+
+    def get_error_codes(self) -> List[Tuple[str, str]]:
+        """Returns the error codes of the errors in the failure.
+
+        The codes are read from the protobuf message of the failure, without
+        creating proto-plus wrappers for its errors, which is much faster
+        than reading them from the failure attribute when there are many
+        errors, such as in partial failures.
+
+        Returns:
+            A list of tuples of the str name of the error code field and the
+            str name of its value, such as
+            ("quota_error", "RESOURCE_TEMPORARILY_EXHAUSTED"), for each error
+            that has an error code.
+
+        Raises:
+            DecodeError: If the serialized failure is invalid.
+        """
+        if self._failure is not None:
+            failure_pb: Any = convert_proto_plus_to_protobuf(self._failure)
+        elif self._serialized_failure is not None:
+            failure_pb = self._get_failure_pb()
+        else:
+            return []
+
+        error_codes: List[Tuple[str, str]] = []
+        enum_values: Dict[str, Any] = {}
+
+        for error in failure_pb.errors:
+            error_code: Optional[Tuple[str, str]] = _get_error_code(
+                error.error_code, enum_values
+            )
+            if error_code is not None:
+                error_codes.append(error_code)
+
+        return error_codes
 
 
 class ResumableUploadErrorAdapter(grpc.RpcError, grpc.Call):
@@ -0,0 +1,389 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Columnar export of GoogleAdsService search results.
+
+The ReportExporter class consumes the responses of a search_stream request, or
+the rows of a search request, and converts them into column-major batches
+without wrapping each row in a proto-plus message. Each batch can be written
+to a CSV file, or converted to an Arrow RecordBatch and written to a Parquet
+file. Only one batch is held in memory at a time, so the memory used is
+bounded by the batch size regardless of the size of the report.
+
+Arrow and Parquet output require the optional "pyarrow" dependency, which can
+be installed with "pip install google-ads[export]".
+"""
+
+import csv
+import json
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    TextIO,
+    Tuple,
+)
+
+from google.protobuf import json_format
+from google.protobuf.message import Message as ProtobufMessageType
+
+from google.ads.googleads import gaql
+from google.ads.googleads import util
+from google.ads.googleads.client import _DEFAULT_VERSION
+
+# The maximum number of rows in a batch. This matches the number of rows in
+# each response of a search_stream request.
+_DEFAULT_MAX_BATCH_ROWS = 10000
+_ROW_MESSAGE_NAME = "GoogleAdsRow"
+
+ColumnBatchType = Dict[str, List[Any]]
+
+
+def _import_pyarrow() -> Any:
+    """Imports and returns the optional pyarrow module.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+    """
+    try:
+        import pyarrow
+    except ImportError as ex:
+        raise ImportError(
+            "Exporting to Arrow or Parquet requires the pyarrow package. It "
+            'can be installed with "pip install google-ads[export]".'
+        ) from ex
+
+    return pyarrow
+
+
+def _message_to_json(message: ProtobufMessageType) -> str:
+    return json_format.MessageToJson(
+        message, indent=None, preserving_proto_field_name=True
+    )
+
+
+def _message_to_dict(message: ProtobufMessageType) -> Dict[str, Any]:
+    return json_format.MessageToDict(
+        message, preserving_proto_field_name=True
+    )
+
+
+class ReportExporter:
+    """Converts GAQL query results into column-major batches.
+
+    Example:
+        exporter = ReportExporter(query, version="v23")
+        stream = googleads_service.search_stream(
+            customer_id=customer_id, query=query
+        )
+        with open("report.csv", "w", newline="") as f:
+            exporter.write_csv(stream, f)
+    """
+
+    def __init__(
+        self,
+        query: str,
+        version: str = _DEFAULT_VERSION,
+        data_types: Optional[Dict[str, str]] = None,
+        max_batch_rows: int = _DEFAULT_MAX_BATCH_ROWS,
+    ) -> None:
+        """Initializer for the ReportExporter class.
+
+        Args:
+            query: a str of the GAQL query whose results are exported.
+            version: a str of the API version the query is sent to.
+            data_types: an optional dict mapping str field names to str
+                GoogleAdsFieldDataType names, as returned by
+                gaql.get_field_data_types. Without it column types are
+                derived from the GoogleAdsRow field descriptors, so for
+                example "segments.date" is exported as a string instead of a
+                date.
+            max_batch_rows: an int of the maximum number of rows per batch.
+
+        Raises:
+            ValueError: If a selected field doesn't exist or max_batch_rows is
+                less than one.
+        """
+        if max_batch_rows < 1:
+            raise ValueError(
+                "max_batch_rows must be at least 1, but "
+                f"{max_batch_rows} was given."
+            )
+
+        self.columns: Tuple[gaql.Column, ...] = gaql.compile_columns(
+            query, version, data_types
+        )
+        self.max_batch_rows: int = max_batch_rows
+
+    @property
+    def column_names(self) -> List[str]:
+        """Returns the str names of the columns in the order selected."""
+        return [column.name for column in self.columns]
+
+    def _iter_row_chunks(
+        self, results: Iterable[Any]
+    ) -> Iterator[Sequence[ProtobufMessageType]]:
+        """Groups raw protobuf GoogleAdsRow messages into bounded chunks.
+
+        Args:
+            results: an iterable of search_stream responses or GoogleAdsRow
+                messages, as either protobuf or proto-plus messages.
+
+        Yields:
+            Sequences of raw protobuf GoogleAdsRow messages.
+        """
+        max_rows: int = self.max_batch_rows
+        pending: List[ProtobufMessageType] = []
+
+        for item in results:
+            message: ProtobufMessageType = util.convert_proto_plus_to_protobuf(
+                item
+            )
+
+            if message.DESCRIPTOR.name == _ROW_MESSAGE_NAME:
+                pending.append(message)
+                if len(pending) >= max_rows:
+                    yield pending
+                    pending = []
+                continue
+
+            if pending:
+                yield pending
+                pending = []
+
+            rows: Sequence[ProtobufMessageType] = message.results
+            if len(rows) <= max_rows:
+                if len(rows):
+                    yield rows
+            else:
+                for start in range(0, len(rows), max_rows):
+                    yield rows[start : start + max_rows]
+
+        if pending:
+            yield pending
+
+    def iter_batches(self, results: Iterable[Any]) -> Iterator[ColumnBatchType]:
+        """Converts results into batches of column values.
+
+        Enum values are converted to their str names and repeated fields to
+        lists. Message values are left as raw protobuf messages.
+
+        Args:
+            results: an iterable of search_stream responses, i.e. the stream
+                returned by GoogleAdsService.search_stream, or an iterable of
+                GoogleAdsRow messages, i.e. the pager returned by
+                GoogleAdsService.search.
+
+        Yields:
+            dicts that map each str column name to a list of values.
+        """
+        for rows in self._iter_row_chunks(results):
+            yield {
+                column.name: column.get_values(rows) for column in self.columns
+            }
+
+    def _get_csv_converter(
+        self, column: gaql.Column
+    ) -> Optional[Callable[[Any], Any]]:
+        """Returns a function that converts a value into a CSV cell, if any.
+
+        Scalar values are written as-is by the csv module, so only message and
+        repeated values need to be converted, which is done with JSON.
+        """
+        if column.data_type == gaql.MESSAGE:
+            if column.is_repeated:
+                return lambda value: json.dumps(
+                    [_message_to_dict(item) for item in value]
+                )
+            return _message_to_json
+
+        if column.is_repeated:
+            return json.dumps
+
+        return None
+
+    def write_csv(
+        self,
+        results: Iterable[Any],
+        file: TextIO,
+        write_headers: bool = True,
+        headers: Optional[Sequence[str]] = None,
+    ) -> int:
+        """Writes results to a CSV file.
+
+        Args:
+            results: an iterable of search_stream responses or GoogleAdsRow
+                messages.
+            file: a file object opened in text mode with newline="".
+            write_headers: a bool of whether to write a header row.
+            headers: an optional sequence of str headers. Defaults to the GAQL
+                field names.
+
+        Returns:
+            An int of the number of rows written, excluding the header row.
+        """
+        writer: Any = csv.writer(file)
+        converters: List[Tuple[str, Callable[[Any], Any]]] = []
+        row_count: int = 0
+
+        for column in self.columns:
+            converter: Optional[Callable[[Any], Any]] = (
+                self._get_csv_converter(column)
+            )
+            if converter is not None:
+                converters.append((column.name, converter))
+
+        if write_headers:
+            writer.writerow(headers or self.column_names)
+
+        for batch in self.iter_batches(results):
+            for name, converter in converters:
+                batch[name] = list(map(converter, batch[name]))
+
+            writer.writerows(zip(*batch.values()))
+            row_count += len(batch[self.columns[0].name])
+
+        return row_count
+
+    def get_arrow_schema(self) -> Any:
+        """Returns the pyarrow.Schema of the exported record batches.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+        """
+        pa: Any = _import_pyarrow()
+        return pa.schema(
+            [
+                pa.field(column.name, self._get_arrow_type(pa, column))
+                for column in self.columns
+            ]
+        )
+
+    @staticmethod
+    def _get_arrow_type(pa: Any, column: gaql.Column) -> Any:
+        arrow_types: Dict[str, Any] = {
+            gaql.BOOLEAN: pa.bool_(),
+            gaql.BYTES: pa.binary(),
+            gaql.DATE: pa.date32(),
+            gaql.DOUBLE: pa.float64(),
+            gaql.FLOAT: pa.float32(),
+            gaql.INT32: pa.int32(),
+            gaql.INT64: pa.int64(),
+            gaql.UINT64: pa.uint64(),
+        }
+        # Enums are exported as names, resource names as strings and messages
+        # as JSON strings.
+        arrow_type: Any = arrow_types.get(column.data_type, pa.string())
+        return pa.list_(arrow_type) if column.is_repeated else arrow_type
+
+    def _to_arrow_array(
+        self, pa: Any, column: gaql.Column, values: List[Any]
+    ) -> Any:
+        arrow_type: Any = self._get_arrow_type(pa, column)
+
+        if column.data_type == gaql.MESSAGE:
+            if column.is_repeated:
+                values = [list(map(_message_to_json, item)) for item in values]
+            else:
+                values = list(map(_message_to_json, values))
+        elif column.data_type == gaql.DATE:
+            # Dates are returned as "YYYY-MM-DD" strings, which Arrow parses
+            # natively when casting.
+            string_type: Any = (
+                pa.list_(pa.string()) if column.is_repeated else pa.string()
+            )
+            return pa.array(values, type=string_type).cast(arrow_type)
+
+        return pa.array(values, type=arrow_type)
+
+    def iter_record_batches(self, results: Iterable[Any]) -> Iterator[Any]:
+        """Converts results into Arrow record batches.
+
+        Args:
+            results: an iterable of search_stream responses or GoogleAdsRow
+                messages.
+
+        Yields:
+            pyarrow.RecordBatch instances with the schema returned by
+            get_arrow_schema.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+        """
+        pa: Any = _import_pyarrow()
+        schema: Any = self.get_arrow_schema()
+
+        for batch in self.iter_batches(results):
+            yield pa.RecordBatch.from_arrays(
+                [
+                    self._to_arrow_array(pa, column, batch[column.name])
+                    for column in self.columns
+                ],
+                schema=schema,
+            )
+
+    def to_arrow_table(self, results: Iterable[Any]) -> Any:
+        """Converts all results into a single Arrow table.
+
+        Unlike the other methods this holds every row in memory.
+
+        Args:
+            results: an iterable of search_stream responses or GoogleAdsRow
+                messages.
+
+        Returns:
+            A pyarrow.Table.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+        """
+        pa: Any = _import_pyarrow()
+        return pa.Table.from_batches(
+            list(self.iter_record_batches(results)),
+            schema=self.get_arrow_schema(),
+        )
+
+    def write_parquet(
+        self, results: Iterable[Any], where: Any, **kwargs: Any
+    ) -> int:
+        """Writes results to a Parquet file one record batch at a time.
+
+        Args:
+            results: an iterable of search_stream responses or GoogleAdsRow
+                messages.
+            where: a str path or file object to write the Parquet file to.
+            kwargs: additional keyword arguments for pyarrow's ParquetWriter,
+                for example compression="zstd".
+
+        Returns:
+            An int of the number of rows written.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+        """
+        _import_pyarrow()
+        import pyarrow.parquet as pq
+
+        row_count: int = 0
+
+        with pq.ParquetWriter(where, self.get_arrow_schema(), **kwargs) as writer:
+            for record_batch in self.iter_record_batches(results):
+                writer.write_batch(record_batch)
+                row_count += record_batch.num_rows
+
+        return row_count
@@ -0,0 +1,429 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Helpers for reading the fields of GAQL query results.
+
+A Google Ads Query Language (GAQL) query names the fields it selects, for
+example "campaign.name" or "metrics.clicks", and every GoogleAdsRow returned
+for the query has the same fields set. The helpers in this module parse the
+SELECT clause of a query and compile each selected field into a Column that
+reads the field directly from raw protobuf GoogleAdsRow messages, so that
+results can be read without wrapping each row in a proto-plus message.
+"""
+
+import functools
+from importlib import import_module
+from operator import attrgetter
+import re
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from google.protobuf.descriptor import (
+    Descriptor,
+    EnumDescriptor,
+    FieldDescriptor,
+)
+from google.protobuf.message import Message as ProtobufMessageType
+
+from google.ads.googleads.util import is_repeated_field
+
+# Matches the fields between the SELECT and FROM keywords of a query.
+_SELECT_CLAUSE_PATTERN: re.Pattern = re.compile(
+    r"^\s*SELECT\s+(?P<fields>.+?)\s+FROM\s", re.IGNORECASE | re.DOTALL
+)
+# Matches string literals, which are quoted with single or double quotes and
+# can contain quotes escaped with backslashes, or line comments, which GAQL
+# allows to start with "#" or "--". Literals are matched first, so that
+# comment markers and keywords inside of them are skipped.
+_LEXICAL_PATTERN: re.Pattern = re.compile(
+    r"""(?P<literal>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")"""
+    r"|(?P<comment>(?:#|--)[^\n]*)",
+    re.DOTALL,
+)
+# Matches the keywords of the clauses that can follow a WHERE clause. The
+# lookbehind prevents matches inside field names such as "x.limit".
+_TRAILING_CLAUSE_PATTERN: re.Pattern = re.compile(
+    r"(?<![.\w])(ORDER\s+BY|LIMIT|PARAMETERS)\b", re.IGNORECASE
+)
+_WHERE_PATTERN: re.Pattern = re.compile(r"(?<![.\w])WHERE\b", re.IGNORECASE)
+_LIMIT_PATTERN: re.Pattern = re.compile(r"(?<![.\w])LIMIT\b", re.IGNORECASE)
+
+# Names of the value types of a Column. They mirror the names of the
+# GoogleAdsFieldDataType enum that the GoogleAdsFieldService returns.
+BOOLEAN = "BOOLEAN"
+BYTES = "BYTES"
+DATE = "DATE"
+DOUBLE = "DOUBLE"
+ENUM = "ENUM"
+FLOAT = "FLOAT"
+INT32 = "INT32"
+INT64 = "INT64"
+MESSAGE = "MESSAGE"
+RESOURCE_NAME = "RESOURCE_NAME"
+STRING = "STRING"
+UINT64 = "UINT64"
+
+_DATA_TYPES = frozenset(
+    (
+        BOOLEAN,
+        BYTES,
+        DATE,
+        DOUBLE,
+        ENUM,
+        FLOAT,
+        INT32,
+        INT64,
+        MESSAGE,
+        RESOURCE_NAME,
+        STRING,
+        UINT64,
+    )
+)
+
+_DATA_TYPES_BY_FIELD_TYPE: Dict[int, str] = {
+    FieldDescriptor.TYPE_BOOL: BOOLEAN,
+    FieldDescriptor.TYPE_BYTES: BYTES,
+    FieldDescriptor.TYPE_DOUBLE: DOUBLE,
+    FieldDescriptor.TYPE_ENUM: ENUM,
+    FieldDescriptor.TYPE_FIXED32: INT64,
+    FieldDescriptor.TYPE_FIXED64: UINT64,
+    FieldDescriptor.TYPE_FLOAT: FLOAT,
+    FieldDescriptor.TYPE_INT32: INT32,
+    FieldDescriptor.TYPE_INT64: INT64,
+    FieldDescriptor.TYPE_MESSAGE: MESSAGE,
+    FieldDescriptor.TYPE_SFIXED32: INT32,
+    FieldDescriptor.TYPE_SFIXED64: INT64,
+    FieldDescriptor.TYPE_SINT32: INT32,
+    FieldDescriptor.TYPE_SINT64: INT64,
+    FieldDescriptor.TYPE_STRING: STRING,
+    FieldDescriptor.TYPE_UINT32: INT64,
+    FieldDescriptor.TYPE_UINT64: UINT64,
+}
+
+
+def _remove_comments(query: str) -> str:
+    """Returns a GAQL query without its comments."""
+    return _LEXICAL_PATTERN.sub(
+        lambda match: match.group("literal") or "", query
+    )
+
+
+def _blank_literals(query: str, blank_comments: bool = False) -> str:
+    """Returns a GAQL query with the text of its string literals blanked.
+
+    The text between the quotes of each literal is replaced by spaces, so
+    that keywords can be searched for in the returned str, and the positions
+    of matches used to slice the original query.
+
+    Args:
+        query: a str GAQL query without comments, unless blank_comments is
+            True.
+        blank_comments: a bool of whether comments are replaced by spaces.
+
+    Returns:
+        A str of the same length as the query.
+    """
+
+    def blank(match: re.Match) -> str:
+        token: str = match.group()
+
+        if match.group("comment"):
+            return " " * len(token) if blank_comments else token
+
+        return token[0] + " " * (len(token) - 2) + token[-1]
+
+    return _LEXICAL_PATTERN.sub(blank, query)
+
+
+def parse_select_fields(query: str) -> Tuple[str, ...]:
+    """Returns the names of the fields in the SELECT clause of a GAQL query.
+
+    Args:
+        query: a str GAQL query.
+
+    Returns:
+        A tuple of str field names, i.e. ("campaign.id", "metrics.clicks"),
+        in the order they appear in the query.
+
+    Raises:
+        ValueError: If the query doesn't have a SELECT and FROM clause.
+    """
+    match: Optional[re.Match] = _SELECT_CLAUSE_PATTERN.match(
+        _remove_comments(query)
+    )
+
+    if not match:
+        raise ValueError(
+            "Could not find a SELECT and FROM clause in the query: "
+            f"'{query}'"
+        )
+
+    return tuple(
+        field.strip()
+        for field in match.group("fields").split(",")
+        if field.strip()
+    )
+
+
+def add_condition(query: str, condition: str) -> str:
+    """Adds a condition to the WHERE clause of a GAQL query.
+
+    If the query has no WHERE clause one is added before any ORDER BY, LIMIT
+    or PARAMETERS clause, otherwise the condition is joined to the existing
+    conditions with AND.
+
+    Args:
+        query: a str GAQL query.
+        condition: a str GAQL condition, i.e. "campaign.id IN (1, 2)".
+
+    Returns:
+        A new str GAQL query.
+    """
+    query = _remove_comments(query).strip()
+    # Keywords are searched for outside of string literals, such as
+    # "campaign.name LIKE '%limit%'".
+    code: str = _blank_literals(query)
+    match: Optional[re.Match] = _TRAILING_CLAUSE_PATTERN.search(code)
+    index: int = match.start() if match else len(query)
+    head: str = query[:index]
+    tail: str = query[index:]
+    keyword: str = "AND" if _WHERE_PATTERN.search(code, 0, index) else "WHERE"
+
+    return f"{head.rstrip()} {keyword} {condition} {tail}".strip()
+
+
+def has_limit(query: str) -> bool:
+    """Returns whether a GAQL query has a LIMIT clause.
+
+    Args:
+        query: a str GAQL query.
+    """
+    return bool(
+        _LIMIT_PATTERN.search(_blank_literals(_remove_comments(query)))
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def get_row_descriptor(version: str) -> Descriptor:
+    """Returns the protobuf descriptor of the GoogleAdsRow for a version.
+
+    Args:
+        version: a str of the API version, i.e. "v23".
+
+    Returns:
+        The google.protobuf.descriptor.Descriptor of the GoogleAdsRow message.
+    """
+    module: Any = import_module(
+        f"google.ads.googleads.{version}.services.types.google_ads_service"
+    )
+    return module.GoogleAdsRow.pb().DESCRIPTOR
+
+
+def _get_field(descriptor: Descriptor, name: str) -> FieldDescriptor:
+    """Returns the descriptor of a field on a message descriptor.
+
+    Fields whose names are Python keywords, such as "type", have a trailing
+    underscore added to their names in the generated messages.
+
+    Args:
+        descriptor: a message Descriptor.
+        name: a str field name as it's written in a GAQL query.
+
+    Returns:
+        The FieldDescriptor for the given name.
+
+    Raises:
+        ValueError: If the message has no field with the given name.
+    """
+    fields: Dict[str, FieldDescriptor] = descriptor.fields_by_name
+    field: Optional[FieldDescriptor] = fields.get(name) or fields.get(
+        f"{name}_"
+    )
+
+    if field is None:
+        raise ValueError(
+            f"The message '{descriptor.full_name}' has no field '{name}'."
+        )
+
+    return field
+
+
+class Column:
+    """A field selected in a GAQL query, compiled into a fast accessor.
+
+    Each Column reads the value of its field from raw protobuf GoogleAdsRow
+    messages with a single operator.attrgetter call, which walks the nested
+    path in C instead of Python. Enum values are converted to their names,
+    the same way as accessing the "name" attribute of a proto-plus enum.
+    """
+
+    def __init__(
+        self, name: str, row_descriptor: Descriptor, data_type: str = None
+    ) -> None:
+        """Initializer for the Column class.
+
+        Args:
+            name: a str of the GAQL field name, i.e. "campaign.name".
+            row_descriptor: the Descriptor of the GoogleAdsRow message.
+            data_type: an optional str of the GoogleAdsFieldDataType of the
+                field, i.e. "DATE". If it's not given, or isn't one of the
+                types defined in this module, it's derived from the field's
+                protobuf type.
+
+        Raises:
+            ValueError: If the field doesn't exist on the GoogleAdsRow.
+        """
+        path: List[str] = []
+        descriptor: Descriptor = row_descriptor
+        field: Optional[FieldDescriptor] = None
+
+        for part in name.split("."):
+            if field is not None:
+                if field.message_type is None:
+                    raise ValueError(
+                        f"Field '{field.full_name}' in '{name}' is not a "
+                        "message and has no subfields."
+                    )
+                descriptor = field.message_type
+
+            field = _get_field(descriptor, part)
+            path.append(field.name)
+
+        self.name: str = name
+        self.field: FieldDescriptor = field
+        self.is_repeated: bool = is_repeated_field(field)
+        self.data_type: str = (
+            data_type
+            if data_type in _DATA_TYPES
+            else _DATA_TYPES_BY_FIELD_TYPE[field.type]
+        )
+        self._getter: Callable[[ProtobufMessageType], Any] = attrgetter(
+            ".".join(path)
+        )
+        self._enum_names: Optional[Dict[int, str]] = None
+
+        if field.type == FieldDescriptor.TYPE_ENUM:
+            enum_type: EnumDescriptor = field.enum_type
+            self._enum_names = {
+                value.number: value.name for value in enum_type.values
+            }
+
+    def __repr__(self) -> str:
+        return f"Column({self.name!r}, data_type={self.data_type!r})"
+
+    def get(self, row: ProtobufMessageType) -> Any:
+        """Returns the value of this column from a single row.
+
+        Args:
+            row: a raw protobuf GoogleAdsRow message.
+
+        Returns:
+            The field value. Enum values are returned as str names and
+            repeated fields are returned as lists.
+        """
+        value: Any = self._getter(row)
+
+        if self._enum_names is not None:
+            names: Dict[int, str] = self._enum_names
+            if self.is_repeated:
+                return [names.get(item, str(item)) for item in value]
+            return names.get(value, str(value))
+
+        if self.is_repeated:
+            return list(value)
+
+        return value
+
+    def get_values(self, rows: Iterable[ProtobufMessageType]) -> List[Any]:
+        """Returns the values of this column from a sequence of rows.
+
+        Args:
+            rows: an iterable of raw protobuf GoogleAdsRow messages.
+
+        Returns:
+            A list with one value for each row.
+        """
+        getter: Callable[[ProtobufMessageType], Any] = self._getter
+
+        if self._enum_names is None and not self.is_repeated:
+            return list(map(getter, rows))
+
+        return [self.get(row) for row in rows]
+
+
+def compile_columns(
+    query: str,
+    version: str,
+    data_types: Optional[Dict[str, str]] = None,
+) -> Tuple[Column, ...]:
+    """Compiles a Column for each field in the SELECT clause of a query.
+
+    Args:
+        query: a str GAQL query.
+        version: a str of the API version the query is sent to, i.e. "v23".
+        data_types: an optional dict mapping str field names to str
+            GoogleAdsFieldDataType names, as returned by the
+            get_field_data_types function, which override the types derived
+            from the field descriptors.
+
+    Returns:
+        A tuple of Column instances in the order they're selected.
+    """
+    row_descriptor: Descriptor = get_row_descriptor(version)
+    data_types = data_types or {}
+
+    return tuple(
+        Column(name, row_descriptor, data_types.get(name))
+        for name in parse_select_fields(query)
+    )
+
+
+def get_field_data_types(
+    client: Any, field_names: Iterable[str], version: Optional[str] = None
+) -> Dict[str, str]:
+    """Retrieves the data types of fields from the GoogleAdsFieldService.
+
+    The field descriptors of the GoogleAdsRow message describe how values are
+    encoded, but the GoogleAdsFieldService also knows which string fields
+    hold dates and resource names. The returned dict can be passed to the
+    compile_columns function.
+
+    Args:
+        client: an initialized GoogleAdsClient instance.
+        field_names: an iterable of str GAQL field names.
+        version: an optional str of the API version to use.
+
+    Returns:
+        A dict mapping each str field name to its str GoogleAdsFieldDataType
+        name, i.e. {"segments.date": "DATE"}.
+    """
+    kwargs: Dict[str, str] = {"version": version} if version else {}
+    service: Any = client.get_service("GoogleAdsFieldService", **kwargs)
+    quoted: str = ", ".join(f"'{name}'" for name in field_names)
+    query: str = f"SELECT name, data_type WHERE name IN ({quoted})"
+    data_types: Dict[str, str] = {}
+
+    for field in service.search_google_ads_fields(query=query):
+        data_type: Any = field.data_type
+        # Protobuf messages return enum values as ints while proto-plus
+        # messages return enum members.
+        if isinstance(data_type, int) and not hasattr(data_type, "name"):
+            enum_type: EnumDescriptor = field.DESCRIPTOR.fields_by_name[
+                "data_type"
+            ].enum_type
+            data_types[field.name] = enum_type.values_by_number[
+                data_type
+            ].name
+        else:
+            data_types[field.name] = data_type.name
+
+    return data_types
@@ -17,6 +17,11 @@ from .interceptor import Interceptor, MetadataType, ContinuationType
 from .metadata_interceptor import MetadataInterceptor, AsyncUnaryUnaryMetadataInterceptor, AsyncUnaryStreamMetadataInterceptor
 from .exception_interceptor import ExceptionInterceptor, AsyncUnaryUnaryExceptionInterceptor, AsyncUnaryStreamExceptionInterceptor
 from .logging_interceptor import LoggingInterceptor, AsyncUnaryUnaryLoggingInterceptor, AsyncUnaryStreamLoggingInterceptor
+from .log_sink import BoundedQueueHandler, StructuredLogMessage
+from .metrics import MetricsExporter, MetricsRegistry, OpenTelemetryExporter
+from .metrics_interceptor import MetricsInterceptor, AsyncUnaryUnaryMetricsInterceptor, AsyncUnaryStreamMetricsInterceptor
+from .retry_interceptor import RetryInterceptor, AsyncUnaryUnaryRetryInterceptor, AsyncUnaryStreamRetryInterceptor
+from .rate_limit_interceptor import RateLimitInterceptor, AsyncUnaryUnaryRateLimitInterceptor, AsyncUnaryStreamRateLimitInterceptor
 
 __all__ = [
     "AsyncLoggingInterceptor",
@@ -33,4 +38,18 @@ __all__ = [
     "LoggingInterceptor",
     "AsyncUnaryUnaryLoggingInterceptor",
     "AsyncUnaryStreamLoggingInterceptor",
+    "BoundedQueueHandler",
+    "StructuredLogMessage",
+    "MetricsExporter",
+    "MetricsRegistry",
+    "OpenTelemetryExporter",
+    "MetricsInterceptor",
+    "AsyncUnaryUnaryMetricsInterceptor",
+    "AsyncUnaryStreamMetricsInterceptor",
+    "RetryInterceptor",
+    "AsyncUnaryUnaryRetryInterceptor",
+    "AsyncUnaryStreamRetryInterceptor",
+    "RateLimitInterceptor",
+    "AsyncUnaryUnaryRateLimitInterceptor",
+    "AsyncUnaryStreamRateLimitInterceptor",
 ]
\ No newline at end of file
@@ -24,10 +24,12 @@ from typing import Optional, Union
 from google.protobuf.message import Message
 import grpc
 
-from google.ads.googleads import util
-from google.ads.googleads.errors import GoogleAdsException
 from google.ads.googleads.interceptors import Interceptor, ContinuationType
-from google.ads.googleads.interceptors.response_wrappers import _UnaryStreamWrapper, _UnaryUnaryWrapper
+from google.ads.googleads.interceptors.response_wrappers import (
+    _convert_response,
+    _UnaryStreamWrapper,
+    _UnaryUnaryWrapper,
+)
 
 
 class ExceptionInterceptor(
@@ -153,12 +155,7 @@ class _AsyncUnaryUnaryCallWrapper(grpc.aio.UnaryUnaryCall):
     def __await__(self):
         try:
             response = yield from self._call.__await__()
-
-            if self._use_proto_plus is True:
-                # By default this message is wrapped by proto-plus
-                return response
-            else:
-                return util.convert_proto_plus_to_protobuf(response)
+            return _convert_response(response, self._use_proto_plus)
         except grpc.RpcError as exception:
             yield from self._interceptor._handle_grpc_failure_async(self._call, exception).__await__()
             raise
@@ -204,11 +201,7 @@ class _AsyncUnaryStreamCallWrapper(grpc.aio.UnaryStreamCall):
         async def _wrapped_aiter():
             try:
                 async for response in self._call:
-                    if self._use_proto_plus is True:
-                        # By default this message is wrapped by proto-plus
-                        yield response
-                    else:
-                        yield util.convert_proto_plus_to_protobuf(response)
+                    yield _convert_response(response, self._use_proto_plus)
             except grpc.RpcError as exception:
                 await self._interceptor._handle_grpc_failure_async(self._call, exception)
                 raise
@@ -247,11 +240,7 @@ class _AsyncUnaryStreamCallWrapper(grpc.aio.UnaryStreamCall):
     async def read(self):
         try:
             response =  await self._call.read()
-            if self._use_proto_plus is True:
-                # By default this message is wrapped by proto-plus
-                return response
-            else:
-                return util.convert_proto_plus_to_protobuf(response)
+            return _convert_response(response, self._use_proto_plus)
         except grpc.RpcError as exception:
             await self._interceptor._handle_grpc_failure_async(self._call, exception)
             raise
@@ -298,12 +287,13 @@ class _AsyncExceptionInterceptor(Interceptor, grpc.aio.UnaryUnaryClientIntercept
 
         if status_code not in RETRY_STATUS_CODES:
             trailing_metadata = await response.trailing_metadata()
-            google_ads_failure = self._get_google_ads_failure(trailing_metadata)
+            serialized_failure, request_id = self._get_failure_metadata(
+                trailing_metadata
+            )
 
-            if google_ads_failure and response_exception:
-                request_id = self.get_request_id_from_metadata(trailing_metadata)
-                raise GoogleAdsException(
-                    response_exception, response, google_ads_failure, request_id
+            if serialized_failure and response_exception:
+                raise self._create_google_ads_exception(
+                    response_exception, response, serialized_failure, request_id
                 )
             elif response_exception:
                 raise response_exception
@@ -13,9 +13,12 @@
 # limitations under the License.
 
 from copy import deepcopy
-from typing import Any, Dict, List, Tuple, Union
+import functools
+import io
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
-from google.protobuf.descriptor import FieldDescriptor
+from google.protobuf import text_format
+from google.protobuf.descriptor import Descriptor, FieldDescriptor
 from google.protobuf.message import Message as ProtobufMessage
 from proto import Message as ProtoPlusMessage
 
@@ -23,6 +26,7 @@ from google.ads.googleads.util import (
     set_nested_message_field,
     get_nested_attr,
     convert_proto_plus_to_protobuf,
+    is_repeated_field,
     proto_copy_from,
 )
 
@@ -66,6 +70,11 @@ _SEARCH_RESPONSE_MESSAGE_NAMES: List[str] = [
     "SearchGoogleAdsStreamResponse",
 ]
 
+# Appended to masked message text that was truncated to a maximum length.
+_TRUNCATION_SUFFIX: str = "... (truncated)"
+
+SensitiveFieldPathsType = Tuple[Tuple[str, ...], ...]
+
 
 def _copy_message(
     message: Union[ProtobufMessage, ProtoPlusMessage],
@@ -203,3 +212,302 @@ def mask_message(
         return _mask_message_fields(sensitive_fields, message, mask)
     else:
         return message
+
+
+@functools.lru_cache(maxsize=None)
+def _get_sensitive_field_paths(descriptor: Descriptor) -> SensitiveFieldPathsType:
+    """Returns the paths of the sensitive fields of a message type.
+
+    The dot-delimited paths in _MESSAGES_WITH_SENSITIVE_FIELDS are resolved
+    against the message descriptor once, and paths that don't exist in the
+    descriptor's API version are dropped. Since every API version has its own
+    descriptors, the result is cached once per version.
+
+    Args:
+        descriptor: a protobuf Descriptor of a message type.
+
+    Returns:
+        A tuple of tuples of str field names, one for each sensitive field.
+    """
+    paths: List[Tuple[str, ...]] = []
+
+    for field_path in _MESSAGES_WITH_SENSITIVE_FIELDS.get(descriptor.name, ()):
+        names: Tuple[str, ...] = tuple(field_path.split("."))
+        message_descriptor: Optional[Descriptor] = descriptor
+
+        for name in names:
+            field: Optional[FieldDescriptor] = (
+                message_descriptor.fields_by_name.get(name)
+                if message_descriptor is not None
+                else None
+            )
+            if field is None:
+                break
+            message_descriptor = field.message_type
+        else:
+            paths.append(names)
+
+    return tuple(paths)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_sensitive_message_fields(
+    descriptor: Descriptor,
+) -> Tuple[Tuple[str, bool], ...]:
+    """Returns the message fields that can lead to sensitive fields.
+
+    A field is included if its message type, or any message type nested in
+    it, has sensitive fields. The result is cached once per API version.
+
+    Args:
+        descriptor: a protobuf Descriptor of a message type.
+
+    Returns:
+        A tuple of tuples of a str field name and a bool of whether the field
+        is repeated.
+    """
+    return tuple(
+        (field.name, is_repeated_field(field))
+        for field in descriptor.fields
+        if field.message_type is not None
+        and _can_contain_sensitive_fields(field.message_type)
+    )
+
+
+def _can_contain_sensitive_fields(
+    descriptor: Descriptor, visited: Optional[Set[str]] = None
+) -> bool:
+    """Returns whether a message type or a nested type has sensitive fields.
+
+    Args:
+        descriptor: a protobuf Descriptor of a message type.
+        visited: a set of the str full names of the message types already
+            being checked, to stop at recursive message types.
+    """
+    if _get_sensitive_field_paths(descriptor):
+        return True
+
+    visited = visited if visited is not None else set()
+
+    if descriptor.full_name in visited:
+        return False
+
+    visited.add(descriptor.full_name)
+
+    return any(
+        _can_contain_sensitive_fields(field.message_type, visited)
+        for field in descriptor.fields
+        if field.message_type is not None
+    )
+
+
+def _mask_field_paths(
+    message: ProtobufMessage,
+    paths: SensitiveFieldPathsType,
+    mask: str,
+) -> Optional[ProtobufMessage]:
+    """Returns a masked copy of a message if any sensitive field is set.
+
+    Only the given message is copied, and only if one of its sensitive
+    fields has a value.
+
+    Args:
+        message: a protobuf message instance.
+        paths: the sensitive field paths of the message type.
+        mask: a str that replaces the sensitive values.
+
+    Returns:
+        A masked copy of the message, or None if no sensitive field is set.
+    """
+    copy: Optional[ProtobufMessage] = None
+
+    for names in paths:
+        parent: ProtobufMessage = message
+
+        # Walks the path without creating any unset nested messages.
+        for name in names[:-1]:
+            if not parent.HasField(name):
+                break
+            parent = getattr(parent, name)
+        else:
+            if not getattr(parent, names[-1]):
+                continue
+
+            if copy is None:
+                copy = type(message)()
+                copy.CopyFrom(message)
+
+            target: ProtobufMessage = copy
+            for name in names[:-1]:
+                target = getattr(target, name)
+            setattr(target, names[-1], mask)
+
+    return copy
+
+
+def _get_masking_formatter(
+    mask: str,
+) -> Callable[[ProtobufMessage, int, bool], Optional[str]]:
+    """Returns a text_format message formatter that masks sensitive fields.
+
+    The formatter is called for every message that is printed. It returns
+    None, so the message is printed normally, unless the message has a
+    sensitive field with a value, in which case it prints a masked copy of
+    that message alone.
+    """
+    # The IDs of the masked copies being printed, which are printed normally.
+    masked_copy_ids: Set[int] = set()
+
+    def formatter(
+        message: ProtobufMessage, indent: int, as_one_line: bool
+    ) -> Optional[str]:
+        if id(message) in masked_copy_ids:
+            return None
+
+        paths: SensitiveFieldPathsType = _get_sensitive_field_paths(
+            message.DESCRIPTOR
+        )
+
+        if not paths:
+            return None
+
+        copy: Optional[ProtobufMessage] = _mask_field_paths(
+            message, paths, mask
+        )
+
+        if copy is None:
+            return None
+
+        masked_copy_ids.add(id(copy))
+        try:
+            text: str = text_format.MessageToString(
+                copy,
+                indent=indent,
+                as_one_line=as_one_line,
+                message_formatter=formatter,
+            )
+        finally:
+            masked_copy_ids.discard(id(copy))
+
+        # The printer writes the indentation before, and the line break
+        # after, the returned text.
+        return text[indent:].rstrip("\n")
+
+    return formatter
+
+
+def _may_contain_sensitive_data(message: ProtobufMessage) -> bool:
+    """Returns whether a message may have a sensitive field with a value.
+
+    Only the fields of the message itself are checked, so this may return
+    True for messages that turn out to have no sensitive values.
+    """
+    descriptor: Descriptor = message.DESCRIPTOR
+
+    if _get_sensitive_field_paths(descriptor):
+        return True
+
+    for name, is_repeated in _get_sensitive_message_fields(descriptor):
+        if len(getattr(message, name)) if is_repeated else message.HasField(
+            name
+        ):
+            return True
+
+    return False
+
+
+def _indent_text(text: str) -> str:
+    """Indents each line of a message's text format by two spaces."""
+    if not text:
+        return text
+
+    return "  " + text[:-1].replace("\n", "\n  ") + "\n"
+
+
+def mask_message_text(
+    message: Any, mask: str, max_length: Optional[int] = None
+) -> str:
+    """Returns the text format of a message with sensitive fields masked.
+
+    Unlike mask_message, the message isn't copied. Each top-level field is
+    converted to text natively, unless its message type can contain
+    sensitive fields that have values, in which case sensitive fields are
+    masked while it's converted, by copying only the nested messages that
+    have them. The text is the same as str() of the message returned by
+    mask_message.
+
+    Args:
+        message: an object containing information from an API request or
+            response. Serialized messages, which are the responses of raw
+            requests, are replaced by their size, since they can't be masked
+            without being parsed. Other objects that aren't messages are
+            converted with str().
+        mask: a str that should replace the sensitive information in the
+            message.
+        max_length: an optional int of the maximum length of the text. If
+            given, top-level fields after that length is reached, such as the
+            remaining rows of a search response, are neither masked nor
+            converted, and the text is truncated.
+
+    Returns:
+        A str of the masked message in protobuf text format.
+    """
+    if isinstance(message, ProtoPlusMessage):
+        message = convert_proto_plus_to_protobuf(message)
+    elif isinstance(message, (bytes, bytearray, memoryview)):
+        return f"<{len(message)} bytes>"
+    elif not isinstance(message, ProtobufMessage):
+        return str(message)
+
+    formatter: Callable[[ProtobufMessage, int, bool], Optional[str]] = (
+        _get_masking_formatter(mask)
+    )
+
+    if not _may_contain_sensitive_data(message):
+        text: str = str(message)
+    elif _get_sensitive_field_paths(message.DESCRIPTOR) or any(
+        field.message_type is not None
+        and field.message_type.GetOptions().map_entry
+        for field, _ in message.ListFields()
+    ):
+        # Messages that are sensitive themselves, or have map fields, are
+        # converted whole.
+        text = text_format.MessageToString(
+            message, message_formatter=formatter
+        )
+    else:
+        parts: List[str] = []
+        length: int = 0
+        out: io.StringIO = io.StringIO()
+
+        for field, value in message.ListFields():
+            if max_length is not None and length > max_length:
+                break
+
+            for element in value if is_repeated_field(field) else (value,):
+                if field.message_type is None or _may_contain_sensitive_data(
+                    element
+                ):
+                    out.seek(0)
+                    out.truncate()
+                    text_format.PrintField(
+                        field, element, out, message_formatter=formatter
+                    )
+                    part: str = out.getvalue()
+                else:
+                    part = (
+                        f"{field.name} {{\n{_indent_text(str(element))}}}\n"
+                    )
+
+                parts.append(part)
+                length += len(part)
+
+                if max_length is not None and length > max_length:
+                    break
+
+        text = "".join(parts)
+
+    if max_length is not None and len(text) > max_length:
+        return text[:max_length] + _TRUNCATION_SUFFIX
+
+    return text
@@ -33,10 +33,12 @@ from typing import (
 )
 
 from google.protobuf.message import DecodeError, Message
+from proto import Message as ProtoPlusMessageType
 import grpc
 # from grpc import Call, ClientCallDetails, StatusCode, CallCredentials, RpcError
 
 from google.ads.googleads.errors import GoogleAdsException
+from google.ads.googleads.util import convert_proto_plus_to_protobuf
 
 
 _REQUEST_ID_KEY: str = "request-id"
@@ -78,6 +80,58 @@ class Interceptor:
 
         return None
 
+    @classmethod
+    def _get_customer_id(cls, request: Message) -> Optional[str]:
+        """Retrieves the customer_id from the grpc request.
+
+        Returns None if a customer_id is not present on the request object.
+
+        Returns:
+            A str with the customer id from the request or None if it isn't
+            present.
+
+        Args:
+            request: An instance of a request proto message.
+        """
+        if hasattr(request, "customer_id"):
+            return getattr(request, "customer_id")
+        elif hasattr(request, "resource_name"):
+            resource_name: str = getattr(request, "resource_name")
+            segments: str = resource_name.split("/")
+            if segments[0] == "customers":
+                return segments[1]
+        else:
+            return None
+
+    @staticmethod
+    def _get_message_size(message: Any) -> Optional[int]:
+        """Returns the serialized size in bytes of a message, if it is one."""
+        if isinstance(message, ProtoPlusMessageType):
+            message = convert_proto_plus_to_protobuf(message)
+
+        if isinstance(message, Message):
+            return message.ByteSize()
+
+        if isinstance(message, bytes):
+            # The serialized response of a raw request.
+            return len(message)
+
+        return None
+
+    @staticmethod
+    def _get_status_name(exception: Any) -> str:
+        """Returns the str name of the status code of a failed request."""
+        # GoogleAdsException instances wrap the grpc.RpcError.
+        error: Any = getattr(exception, "error", exception)
+
+        if isinstance(error, grpc.StatusCode):
+            return error.name
+
+        try:
+            return error.code().name
+        except AttributeError:
+            return grpc.StatusCode.UNKNOWN.name
+
     @classmethod
     def parse_metadata_to_json(cls, metadata: Optional[MetadataType]) -> str:
         """Parses metadata from gRPC request and response messages to a JSON str.
@@ -223,21 +277,17 @@ class Interceptor:
 
         if status_code not in _RETRY_STATUS_CODES:
             trailing_metadata: MetadataType = response.trailing_metadata()
-            google_ads_failure: Optional[Message] = self._get_google_ads_failure(
+            serialized_failure, request_id = self._get_failure_metadata(
                 trailing_metadata
             )
 
-            if google_ads_failure and response_exception:
-                request_id: Optional[str] = self.get_request_id_from_metadata(
-                    trailing_metadata
-                )
-
+            if serialized_failure and response_exception:
                 # If exception is a GoogleAdsFailure then it gets wrapped in a
                 # library-specific Error type for easy handling. These errors
                 # originate from the Google Ads API and are often caused by
                 # invalid requests.
-                return GoogleAdsException(
-                    response_exception, response, google_ads_failure, request_id
+                return self._create_google_ads_exception(
+                    response_exception, response, serialized_failure, request_id
                 )
             elif response_exception:
                 # Raise the original exception if not a GoogleAdsFailure. This
@@ -250,6 +300,71 @@ class Interceptor:
             return response_exception
         raise response.exception()
 
+    def _get_failure_metadata(
+        self, trailing_metadata: Optional[MetadataType]
+    ) -> Tuple[Optional[bytes], Optional[str]]:
+        """Gets the serialized failure and request ID from trailing metadata.
+
+        Both are read in a single pass over the metadata, and the failure
+        isn't decoded.
+
+        Args:
+            trailing_metadata: a tuple of metadatum from the service response.
+
+        Returns:
+            A tuple of the bytes of the serialized GoogleAdsFailure and the str
+            request ID, either of which is None if it isn't in the metadata.
+        """
+        serialized_failure: Optional[bytes] = None
+        request_id: Optional[str] = None
+
+        for kv in trailing_metadata or ():
+            if kv[0] == self._failure_key:
+                serialized_failure = kv[1]
+            elif kv[0] == _REQUEST_ID_KEY:
+                request_id = kv[1]
+
+        return serialized_failure, request_id
+
+    def _create_google_ads_exception(
+        self,
+        exception: grpc.RpcError,
+        call: grpc.Call,
+        serialized_failure: bytes,
+        request_id: Optional[str],
+    ) -> Exception:
+        """Creates a GoogleAdsException that wraps its failure lazily.
+
+        The failure is parsed as a protobuf message, which is cheap, so that
+        a failure that can't be decoded is reported with the original error.
+        Wrapping it in proto-plus messages is deferred until it's first read.
+
+        Args:
+            exception: the grpc.RpcError the request failed with.
+            call: the grpc.Call of the request.
+            serialized_failure: the bytes of the serialized GoogleAdsFailure.
+            request_id: the str request ID of the request.
+
+        Returns:
+            A GoogleAdsException instance, or the given grpc.RpcError if the
+            failure can't be decoded.
+        """
+        google_ads_exception: GoogleAdsException = GoogleAdsException(
+            exception,
+            call,
+            None,
+            request_id,
+            serialized_failure=serialized_failure,
+            api_version=self._api_version,
+        )
+
+        try:
+            google_ads_exception._get_failure_pb()
+        except DecodeError:
+            return exception
+
+        return google_ads_exception
+
     def _get_google_ads_failure(self, trailing_metadata: MetadataType) -> Optional[Message]:
         """Gets the Google Ads failure details if they exist.
 
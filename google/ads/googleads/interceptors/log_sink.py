@@ -0,0 +1,154 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Structured log records and a bounded, asynchronous log handler.
+
+When the client is configured with "structured_logging", the logging
+interceptor logs a StructuredLogMessage for each request instead of
+formatted text. It's a dict of fields such as the method, customer ID,
+request ID, latency and status, and is only converted to JSON when a handler
+formats it.
+
+The BoundedQueueHandler class moves formatting and I/O off the thread that
+sent the request. It puts log records on a bounded queue, which a background
+thread drains into the wrapped handlers. When the queue is full, records are
+either dropped and counted, or the logging thread waits for space.
+
+Example:
+    handler = BoundedQueueHandler(
+        logging.FileHandler("google-ads.log"), maxsize=10000, policy=DROP
+    )
+    logging.getLogger("google.ads.googleads.client").addHandler(handler)
+"""
+
+import json
+import logging
+import logging.handlers
+import queue
+import threading
+from typing import Any, Optional
+
+# Records are dropped when the queue is full.
+DROP = "drop"
+# The logging thread waits for space when the queue is full.
+BLOCK = "block"
+_POLICIES = (DROP, BLOCK)
+_DEFAULT_MAXSIZE = 10000
+
+
+class StructuredLogMessage(dict):
+    """A dict of request fields that's logged as a JSON object.
+
+    Handlers can read the fields from the record's msg attribute, and the
+    default formatting of the record is the fields as a JSON str.
+    """
+
+    def __str__(self) -> str:
+        return json.dumps(self, default=str, sort_keys=True)
+
+
+class _QueueListener(logging.handlers.QueueListener):
+    """A QueueListener that can be stopped when its queue is full."""
+
+    def enqueue_sentinel(self) -> None:
+        # The default implementation doesn't wait for space, which raises
+        # queue.Full on a full bounded queue.
+        self.queue.put(self._sentinel)
+
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """A handler that passes records to other handlers on a background thread.
+
+    Unlike logging.handlers.QueueHandler, records aren't formatted before
+    they're queued, so all formatting happens on the background thread.
+    """
+
+    def __init__(
+        self,
+        *handlers: logging.Handler,
+        maxsize: int = _DEFAULT_MAXSIZE,
+        policy: str = DROP,
+        block_timeout: Optional[float] = None,
+        respect_handler_level: bool = True,
+    ) -> None:
+        """Initializer for the BoundedQueueHandler class.
+
+        Args:
+            handlers: the logging.Handler instances that records are passed
+                to on the background thread.
+            maxsize: an int of the maximum number of queued records.
+            policy: a str of what happens when the queue is full, either
+                "drop" to drop the record or "block" to wait for space.
+            block_timeout: an optional float of the maximum number of seconds
+                to wait for space with the "block" policy, after which the
+                record is dropped. Waits indefinitely by default.
+            respect_handler_level: a bool of whether the level of each
+                handler is checked before passing a record to it.
+
+        Raises:
+            ValueError: If the policy isn't recognized or maxsize is less
+                than one.
+        """
+        if policy not in _POLICIES:
+            raise ValueError(
+                f"Unknown queue policy '{policy}', the policy must be one of "
+                f"{_POLICIES}."
+            )
+
+        if maxsize < 1:
+            raise ValueError(
+                f"maxsize must be at least 1, but {maxsize} was given."
+            )
+
+        super().__init__(queue.Queue(maxsize=maxsize))
+        self.policy: str = policy
+        self.block_timeout: Optional[float] = block_timeout
+        self.dropped_records: int = 0
+        self._dropped_lock: threading.Lock = threading.Lock()
+        self.listener: logging.handlers.QueueListener = _QueueListener(
+            self.queue, *handlers, respect_handler_level=respect_handler_level
+        )
+        self.listener.start()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Returns the record unchanged.
+
+        Records are only handled in this process, so unlike the parent class
+        they don't need to be formatted before being queued.
+        """
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Queues a record, applying the policy if the queue is full."""
+        try:
+            if self.policy == BLOCK:
+                self.queue.put(record, timeout=self.block_timeout)
+            else:
+                self.queue.put_nowait(record)
+        except queue.Full:
+            with self._dropped_lock:
+                self.dropped_records += 1
+
+    def close(self) -> None:
+        """Handles all queued records and stops the background thread."""
+        self.acquire()
+        try:
+            listener: Any = self.listener
+            self.listener = None
+        finally:
+            self.release()
+
+        if listener is not None:
+            listener.stop()
+
+        super().close()
@@ -17,11 +17,22 @@ This class is initialized in the GoogleAdsClient and passed into a grpc
 intercept_channel whenever a new service is initialized. It intercepts requests
 and responses, parses them into a human readable structure and logs them using
 the passed in logger instance.
+
+Serializing metadata to JSON and masking request and response messages is
+expensive for large messages, so it's deferred until a log line that includes
+them is actually formatted, and skipped entirely when that level is disabled.
+
+In structured mode a StructuredLogMessage, a dict of request fields such as
+the latency and status, is logged instead of formatted text, at INFO level
+for successful requests and WARNING level for failed requests. Converting it
+to JSON is left to the handler, which can be a BoundedQueueHandler that does
+so on a background thread.
 """
 
 import json
 import logging
-from typing import Optional, Union
+import time
+from typing import Any, Callable, Optional, Tuple, Union
 
 from google.protobuf.message import Message as ProtobufMessageType
 import grpc
@@ -29,6 +40,41 @@ import grpc
 from google.ads.googleads.interceptors import (
     Interceptor, MetadataType, ContinuationType, mask_message
 )
+from google.ads.googleads.interceptors.helpers import mask_message_text
+from google.ads.googleads.interceptors.log_sink import StructuredLogMessage
+
+
+class _LazyLogValue:
+    """A log line value that is computed when it's first formatted.
+
+    Instances are passed to the log_successful_request and log_failed_request
+    methods in place of JSON metadata strs and masked request messages, and
+    format as the value returned by the given function.
+    """
+
+    def __init__(self, compute: Callable[[], Any]):
+        """Initializer for the _LazyLogValue class.
+
+        Args:
+            compute: a function that takes no arguments and returns the value.
+        """
+        self._compute: Optional[Callable[[], Any]] = compute
+        self._value: Any = None
+
+    @property
+    def value(self) -> Any:
+        """Returns the value, computing it on first access."""
+        if self._compute is not None:
+            self._value = self._compute()
+            self._compute = None
+
+        return self._value
+
+    def __str__(self) -> str:
+        return str(self.value)
+
+    def __format__(self, format_spec: str) -> str:
+        return format(self.value, format_spec)
 
 
 class LoggingInterceptor(
@@ -59,6 +105,8 @@ class LoggingInterceptor(
         logger: logging.Logger,
         api_version: str,
         endpoint: Optional[str] = None,
+        max_message_length: Optional[int] = None,
+        structured: bool = False,
     ):
         """Initializer for the LoggingInterceptor.
 
@@ -66,10 +114,18 @@ class LoggingInterceptor(
             logger: An instance of logging.Logger.
             api_version: a str of the API version of the request.
             endpoint: a str specifying the endpoint for requests.
+            max_message_length: an optional int of the maximum length of the
+                request and response messages in full log lines. Longer
+                messages are truncated, and only the logged part of them is
+                masked and converted to text.
+            structured: a bool of whether a StructuredLogMessage is logged
+                for each request instead of formatted log lines.
         """
         super().__init__(api_version)
         self.endpoint = endpoint
         self.logger = logger
+        self.max_message_length = max_message_length
+        self.structured = structured
         self._cache = None
 
     def _get_trailing_metadata(self, response: Union[grpc.Call, grpc.Future]):
@@ -130,28 +186,6 @@ class LoggingInterceptor(
         """
         return getattr(client_call_details, "method", None)
 
-    def _get_customer_id(self, request: ProtobufMessageType) -> Optional[str]:
-        """Retrieves the customer_id from the grpc request.
-
-        Returns None if a customer_id is not present on the request object.
-
-        Returns:
-            A str with the customer id from the request or None if it isn't
-            present.
-
-        Args:
-            request: An instance of a request proto message.
-        """
-        if hasattr(request, "customer_id"):
-            return getattr(request, "customer_id")
-        elif hasattr(request, "resource_name"):
-            resource_name: str = getattr(request, "resource_name")
-            segments: str = resource_name.split("/")
-            if segments[0] == "customers":
-                return segments[1]
-        else:
-            return None
-
     def _parse_exception_to_str(self, exception: grpc.Call) -> str:
         """Parses response exception object to str for logging.
 
@@ -221,10 +255,10 @@ class LoggingInterceptor(
             trailing_metadata_json: A JSON str of trailing_metadata.
             response: A grpc.Call/grpc.Future instance.
         """
-        result: ProtobufMessageType = self.retrieve_and_mask_result(response)
-
-        # Check log level here to avoid calling .format() unless necessary.
+        # Check log level here to avoid retrieving and masking the result, and
+        # calling .format(), unless necessary.
         if self.logger.isEnabledFor(logging.DEBUG):
+            result: Any = self._retrieve_and_mask_result_text(response)
             self.logger.debug(
                 self._FULL_REQUEST_LOG_LINE.format(
                     method,
@@ -265,10 +299,10 @@ class LoggingInterceptor(
             response: A JSON str of the response message.
         """
         exception: grpc.Call = self._get_error_from_response(response)
-        exception_str: str = self._parse_exception_to_str(exception)
         fault_message: str = self._get_fault_message(exception)
 
         if self.logger.isEnabledFor(logging.INFO):
+            exception_str: str = self._parse_exception_to_str(exception)
             self.logger.info(
                 self._FULL_FAULT_LOG_LINE.format(
                     method,
@@ -291,11 +325,154 @@ class LoggingInterceptor(
             )
         )
 
+    def _overrides_log_methods(self) -> bool:
+        """Returns whether a subclass overrides the request logging methods.
+
+        Subclasses may use the metadata and request arguments of
+        log_successful_request and log_failed_request as plain strs and
+        messages, so they are computed eagerly for them.
+        """
+        cls: type = type(self)
+        return (
+            cls.log_successful_request
+            is not LoggingInterceptor.log_successful_request
+            or cls.log_failed_request
+            is not LoggingInterceptor.log_failed_request
+        )
+
+    def _get_lazy_log_values(
+        self,
+        client_call_details: grpc.ClientCallDetails,
+        request: ProtobufMessageType,
+        trailing_metadata: MetadataType,
+    ) -> Tuple[Any, Any, Any]:
+        """Returns the expensive values of a full log line.
+
+        The values are _LazyLogValue instances, so metadata is only
+        serialized and the request only masked if a full log line is
+        formatted.
+
+        Args:
+            client_call_details: An instance of grpc.ClientCallDetails.
+            request: An instance of a request proto message.
+            trailing_metadata: A tuple of response metadatum.
+
+        Returns:
+            A tuple of the initial metadata JSON, the masked request and the
+            trailing metadata JSON.
+        """
+        return (
+            _LazyLogValue(
+                lambda: self.parse_metadata_to_json(
+                    self._get_initial_metadata(client_call_details)
+                )
+            ),
+            _LazyLogValue(
+                lambda: mask_message_text(
+                    request,
+                    self._SENSITIVE_INFO_MASK,
+                    self.max_message_length,
+                )
+            ),
+            _LazyLogValue(
+                lambda: self.parse_metadata_to_json(trailing_metadata)
+            ),
+        )
+
+    def _get_structured_message(
+        self,
+        client_call_details: grpc.ClientCallDetails,
+        request: ProtobufMessageType,
+        trailing_metadata: MetadataType,
+        latency: Optional[float],
+        exception: Any = None,
+        result: Any = None,
+    ) -> StructuredLogMessage:
+        """Returns the structured log message of a request.
+
+        Args:
+            client_call_details: An instance of grpc.ClientCallDetails.
+            request: An instance of a request proto message.
+            trailing_metadata: A tuple of response metadatum.
+            latency: An optional float of the seconds the request took.
+            exception: The exception raised by the request, if it failed.
+            result: The response message of a successful unary request.
+        """
+        message: StructuredLogMessage = StructuredLogMessage(
+            api_version=self._api_version,
+            endpoint=self.endpoint,
+            method=self._get_call_method(client_call_details),
+            customer_id=self._get_customer_id(request),
+            request_id=self.get_request_id_from_metadata(trailing_metadata),
+            latency_ms=(
+                round(latency * 1000, 3) if latency is not None else None
+            ),
+            is_fault=exception is not None,
+            status=(
+                self._get_status_name(exception)
+                if exception is not None
+                else grpc.StatusCode.OK.name
+            ),
+            request_bytes=self._get_message_size(request),
+        )
+
+        if exception is not None:
+            message["fault_message"] = self._get_fault_message(exception)
+        elif result is not None:
+            message["response_bytes"] = self._get_message_size(result)
+
+        return message
+
+    def _log_structured_request(
+        self,
+        client_call_details: grpc.ClientCallDetails,
+        request: ProtobufMessageType,
+        response: Union[grpc.Call, grpc.Future],
+        latency: Optional[float],
+        is_stream: bool,
+    ) -> None:
+        """Logs a structured message for a request, if its level is enabled.
+
+        Args:
+            client_call_details: An instance of grpc.ClientCallDetails.
+            request: An instance of a request proto message.
+            response: A grpc.Call/grpc.Future instance.
+            latency: An optional float of the seconds the request took.
+            is_stream: A bool of whether the request is a unary-stream
+                request.
+        """
+        exception: Any = None
+        level: int = logging.INFO
+
+        if response.exception():
+            exception = self._get_error_from_response(response)
+            level = logging.WARNING
+
+        if not self.logger.isEnabledFor(level):
+            return
+
+        result: Any = (
+            response.result() if exception is None and not is_stream else None
+        )
+        self.logger.log(
+            level,
+            self._get_structured_message(
+                client_call_details,
+                request,
+                self._get_trailing_metadata(response),
+                latency,
+                exception,
+                result,
+            ),
+        )
+
     def log_request(
         self,
         client_call_details: grpc.ClientCallDetails,
         request: ProtobufMessageType,
         response: Union[grpc.Call, grpc.Future],
+        latency: Optional[float] = None,
+        is_stream: bool = False,
     ) -> None:
         """Handles logging all requests.
 
@@ -303,19 +480,36 @@ class LoggingInterceptor(
             client_call_details: An instance of grpc.ClientCallDetails.
             request: An instance of a request proto message.
             response: A grpc.Call/grpc.Future instance.
+            latency: An optional float of the seconds the request took, which
+                is only logged in structured mode.
+            is_stream: A bool of whether the request is a unary-stream
+                request.
         """
+        if self.structured:
+            self._log_structured_request(
+                client_call_details, request, response, latency, is_stream
+            )
+            return
+
         method: str = self._get_call_method(client_call_details)
         customer_id: str = self._get_customer_id(request)
-        initial_metadata: MetadataType = self._get_initial_metadata(
-            client_call_details
-        )
-        initial_metadata_json: str = self.parse_metadata_to_json(initial_metadata)
         trailing_metadata: MetadataType = self._get_trailing_metadata(response)
         request_id: str = self.get_request_id_from_metadata(
             trailing_metadata
         )
-        trailing_metadata_json: str = self.parse_metadata_to_json(trailing_metadata)
-        request: ProtobufMessageType = mask_message(request, self._SENSITIVE_INFO_MASK)
+        initial_metadata_json: Any
+        trailing_metadata_json: Any
+        logged_request: Any
+        initial_metadata_json, logged_request, trailing_metadata_json = (
+            self._get_lazy_log_values(
+                client_call_details, request, trailing_metadata
+            )
+        )
+
+        if self._overrides_log_methods():
+            initial_metadata_json = initial_metadata_json.value
+            logged_request = mask_message(request, self._SENSITIVE_INFO_MASK)
+            trailing_metadata_json = trailing_metadata_json.value
 
         if response.exception():
             self.log_failed_request(
@@ -323,7 +517,7 @@ class LoggingInterceptor(
                 customer_id,
                 initial_metadata_json,
                 request_id,
-                request,
+                logged_request,
                 trailing_metadata_json,
                 response,
             )
@@ -333,7 +527,7 @@ class LoggingInterceptor(
                 customer_id,
                 initial_metadata_json,
                 request_id,
-                request,
+                logged_request,
                 trailing_metadata_json,
                 response,
             )
@@ -358,10 +552,16 @@ class LoggingInterceptor(
         Returns:
             A grpc.Call/grpc.Future instance representing a service response.
         """
+        start: float = time.perf_counter()
         response: grpc.Call = continuation(client_call_details, request)
 
         if self.logger.isEnabledFor(logging.WARNING):
-            self.log_request(client_call_details, request, response)
+            self.log_request(
+                client_call_details,
+                request,
+                response,
+                latency=time.perf_counter() - start,
+            )
 
         return response
 
@@ -387,14 +587,64 @@ class LoggingInterceptor(
         """
         def on_rpc_complete(response_future: grpc.Future) -> None:
             if self.logger.isEnabledFor(logging.WARNING):
-                self.log_request(client_call_details, request, response_future)
+                self.log_request(
+                    client_call_details,
+                    request,
+                    response_future,
+                    latency=time.perf_counter() - start,
+                    is_stream=True,
+                )
 
+        start: float = time.perf_counter()
         response: grpc.Call = continuation(client_call_details, request)
 
         response.add_done_callback(on_rpc_complete)
         self._cache = response.get_cache()
         return response
 
+    def _retrieve_result(
+        self, response: Union[grpc.Call, grpc.Future]
+    ) -> ProtobufMessageType:
+        """Returns the cached stream response object, if the cache is
+        populated, or otherwise the non-streaming response result.
+
+        Args:
+            response: A grpc.Call/grpc.Future instance.
+        """
+        if self._cache and self._cache.initial_response_object is not None:
+            # Get the first streaming response object from the cache.
+            return self._cache.initial_response_object
+
+        return response.result()
+
+    def _mask_result_text(self, result: Any) -> Any:
+        """Returns the masked text of a response message.
+
+        Results are only masked if the logger is a logging.Logger, otherwise
+        they're returned as-is.
+
+        Args:
+            result: A response message.
+        """
+        if type(self.logger) is logging.Logger:
+            return mask_message_text(
+                result, self._SENSITIVE_INFO_MASK, self.max_message_length
+            )
+
+        return result
+
+    def _retrieve_and_mask_result_text(
+        self, response: Union[grpc.Call, grpc.Future]
+    ) -> Any:
+        """Returns the masked text of the result for a full log line.
+
+        Unlike retrieve_and_mask_result this doesn't copy the result.
+
+        Args:
+            response: A grpc.Call/grpc.Future instance.
+        """
+        return self._mask_result_text(self._retrieve_result(response))
+
     def retrieve_and_mask_result(
         self, response: Union[grpc.Call, grpc.Future]
     ) -> ProtobufMessageType:
@@ -407,11 +657,7 @@ class LoggingInterceptor(
         Returns:
             A masked response message.
         """
-        if self._cache and self._cache.initial_response_object is not None:
-            # Get the first streaming response object from the cache.
-            result: ProtobufMessageType = self._cache.initial_response_object
-        else:
-            result: ProtobufMessageType = response.result()
+        result: ProtobufMessageType = self._retrieve_result(response)
         # Mask the response object if debug level logging is enabled.
         if type(self.logger) is logging.Logger and self.logger.isEnabledFor(
             logging.DEBUG
@@ -433,6 +679,7 @@ class _AsyncLoggingInterceptor(
         client_call_details: grpc.ClientCallDetails,
         request: ProtobufMessageType,
         response: grpc.aio.Call,
+        latency: Optional[float] = None,
     ) -> None:
         """Handles logging all requests asynchronously.
 
@@ -440,27 +687,30 @@ class _AsyncLoggingInterceptor(
             client_call_details: An instance of grpc.ClientCallDetails.
             request: An instance of a request proto message.
             response: A grpc.aio.Call instance.
+            latency: An optional float of the seconds the request took, which
+                is only logged in structured mode.
         """
         method: str = self._get_call_method(client_call_details)
         customer_id: str = self._get_customer_id(request)
-        initial_metadata: MetadataType = self._get_initial_metadata(
-            client_call_details
-        )
-        initial_metadata_json: str = self.parse_metadata_to_json(
-            initial_metadata
-        )
 
         # Await metadata
         trailing_metadata = await response.trailing_metadata()
 
         request_id: str = self.get_request_id_from_metadata(trailing_metadata)
-        trailing_metadata_json: str = self.parse_metadata_to_json(
-            trailing_metadata
-        )
-        request: ProtobufMessageType = mask_message(
-            request, self._SENSITIVE_INFO_MASK
+        initial_metadata_json: Any
+        trailing_metadata_json: Any
+        logged_request: Any
+        initial_metadata_json, logged_request, trailing_metadata_json = (
+            self._get_lazy_log_values(
+                client_call_details, request, trailing_metadata
+            )
         )
 
+        if self._overrides_log_methods():
+            initial_metadata_json = initial_metadata_json.value
+            logged_request = mask_message(request, self._SENSITIVE_INFO_MASK)
+            trailing_metadata_json = trailing_metadata_json.value
+
         # Check for exception
         # response is a Call object (future).
         # We can check if it has exception.
@@ -476,6 +726,27 @@ class _AsyncLoggingInterceptor(
         except Exception as ex:
              exception = ex
 
+        if self.structured:
+            level: int = logging.WARNING if exception else logging.INFO
+
+            if self.logger.isEnabledFor(level):
+                result: Any = None
+                if not exception and not hasattr(response, "read"):
+                    result = await response
+
+                self.logger.log(
+                    level,
+                    self._get_structured_message(
+                        client_call_details,
+                        request,
+                        trailing_metadata,
+                        latency,
+                        exception or None,
+                        result,
+                    ),
+                )
+            return
+
         if exception:
             # We need to adapt exception logging for async exception?
             # _parse_exception_to_str expects grpc.Call (sync).
@@ -497,7 +768,7 @@ class _AsyncLoggingInterceptor(
                 customer_id,
                 initial_metadata_json,
                 request_id,
-                request,
+                logged_request,
                 trailing_metadata_json,
                 response, # Pass the call object
                 exception
@@ -512,12 +783,27 @@ class _AsyncLoggingInterceptor(
                 customer_id,
                 initial_metadata_json,
                 request_id,
-                request,
+                logged_request,
                 trailing_metadata_json,
                 response,
                 result,
             )
 
+    def _overrides_log_methods(self) -> bool:
+        """Returns whether a subclass overrides the request logging methods.
+
+        Subclasses may use the metadata and request arguments of
+        log_successful_request_async and log_failed_request_async as plain
+        strs and messages, so they are computed eagerly for them.
+        """
+        cls: type = type(self)
+        return (
+            cls.log_successful_request_async
+            is not _AsyncLoggingInterceptor.log_successful_request_async
+            or cls.log_failed_request_async
+            is not _AsyncLoggingInterceptor.log_failed_request_async
+        )
+
     def log_failed_request_async(
         self,
         method: str,
@@ -536,10 +822,10 @@ class _AsyncLoggingInterceptor(
         # But here we have exception.
         # We can just use the exception directly.
 
-        exception_str: str = self._parse_exception_to_str_async(exception)
         fault_message: str = self._get_fault_message_async(exception)
 
         if self.logger.isEnabledFor(logging.INFO):
+            exception_str: str = self._parse_exception_to_str_async(exception)
             self.logger.info(
                 self._FULL_FAULT_LOG_LINE.format(
                     method,
@@ -595,16 +881,13 @@ class _AsyncLoggingInterceptor(
         response: grpc.aio.Call,
         result: ProtobufMessageType = None,
     ) -> None:
-        # Result is already available
-        if result is None and hasattr(response, "result"):
-             result = response.result()
+        if self.logger.isEnabledFor(logging.DEBUG):
+            # Result is already available
+            if result is None and hasattr(response, "result"):
+                result = response.result()
 
-        if type(self.logger) is logging.Logger and self.logger.isEnabledFor(
-            logging.DEBUG
-        ):
-            result = mask_message(result, self._SENSITIVE_INFO_MASK)
+            result = self._mask_result_text(result)
 
-        if self.logger.isEnabledFor(logging.DEBUG):
             self.logger.debug(
                 self._FULL_REQUEST_LOG_LINE.format(
                     method,
@@ -629,6 +912,7 @@ class _AsyncLoggingInterceptor(
         client_call_details: grpc.ClientCallDetails,
         request: ProtobufMessageType,
     ) -> Union[grpc.Call, grpc.Future]:
+        start: float = time.perf_counter()
         call = await continuation(client_call_details, request)
 
         def on_done(future):
@@ -637,7 +921,14 @@ class _AsyncLoggingInterceptor(
                 # We need a running loop.
                 try:
                     loop = asyncio.get_running_loop()
-                    loop.create_task(self._log_request_async(client_call_details, request, future))
+                    loop.create_task(
+                        self._log_request_async(
+                            client_call_details,
+                            request,
+                            future,
+                            latency=time.perf_counter() - start,
+                        )
+                    )
                 except RuntimeError:
                     pass
 
@@ -654,6 +945,7 @@ class _AsyncLoggingInterceptor(
         # But we can log request.
         # And log failure/completion.
 
+        start: float = time.perf_counter()
         call = await continuation(client_call_details, request)
 
         # We can add done callback to the call object?
@@ -664,7 +956,14 @@ class _AsyncLoggingInterceptor(
                 import asyncio
                 try:
                     loop = asyncio.get_running_loop()
-                    loop.create_task(self._log_request_async(client_call_details, request, future))
+                    loop.create_task(
+                        self._log_request_async(
+                            client_call_details,
+                            request,
+                            future,
+                            latency=time.perf_counter() - start,
+                        )
+                    )
                 except RuntimeError:
                     pass
 
@@ -0,0 +1,565 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Per-method request metrics and the exporters they're passed to.
+
+When the client is configured with "enable_metrics", the metrics interceptor
+records a RequestSample for each request, which holds its latency, status,
+request and response sizes and the number of rows returned. The
+client's MetricsRegistry, available as GoogleAdsClient.metrics, aggregates
+the samples per service, method and customer ID, and passes each of them to
+its exporters.
+
+The aggregated metrics can be read in-process with MetricsRegistry.snapshot,
+or rendered in the Prometheus text exposition format with
+MetricsRegistry.to_prometheus_text. The OpenTelemetryExporter records the
+samples as OpenTelemetry instruments, which requires the optional
+"opentelemetry-api" dependency.
+
+Example:
+    client = GoogleAdsClient.load_from_storage(...)
+    client.metrics.add_exporter(OpenTelemetryExporter())
+    ...
+    for method_metrics in client.metrics.snapshot():
+        print(method_metrics.method, method_metrics.latency.mean)
+"""
+
+import bisect
+import copy
+from dataclasses import dataclass, field
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+_logger = logging.getLogger(__name__)
+
+# Upper bounds, in seconds, of the latency histogram buckets. The last,
+# implicit, bucket holds every latency above the largest bound.
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+    300.0,
+)
+_PROMETHEUS_PREFIX = "google_ads"
+
+MetricsKey = Tuple[str, str, Optional[str]]
+
+
+@dataclass
+class RequestSample:
+    """The measurements of a single request.
+
+    Attributes:
+        service: a str of the service name, e.g. "GoogleAdsService".
+        method: a str of the method name, e.g. "SearchStream".
+        customer_id: an optional str of the customer ID of the request.
+        status: a str of the name of the gRPC status code of the request.
+        latency: a float of the seconds from sending the request until its
+            response, or for streams its last response, was received.
+        request_bytes: an optional int of the serialized request size.
+        response_bytes: an optional int of the serialized size of all of the
+            response messages.
+        rows: an int of the number of rows in the responses.
+    """
+
+    service: str
+    method: str
+    customer_id: Optional[str]
+    status: str
+    latency: float
+    request_bytes: Optional[int] = None
+    response_bytes: Optional[int] = None
+    rows: int = 0
+
+
+class Histogram:
+    """A histogram of values with fixed bucket boundaries."""
+
+    def __init__(self, boundaries: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        """Initializer for the Histogram class.
+
+        Args:
+            boundaries: a sorted sequence of floats of the inclusive upper
+                bounds of the buckets.
+        """
+        self.boundaries: Tuple[float, ...] = tuple(
+            float(boundary) for boundary in boundaries
+        )
+        # One more count than boundaries for values above the last one.
+        self.bucket_counts: List[int] = [0] * (len(self.boundaries) + 1)
+        self.count: int = 0
+        self.sum: float = 0.0
+
+    def observe(self, value: float) -> None:
+        """Adds a value to the histogram.
+
+        Args:
+            value: a float to add.
+        """
+        self.bucket_counts[bisect.bisect_left(self.boundaries, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    @property
+    def mean(self) -> Optional[float]:
+        """The mean of the observed values, or None if there are none."""
+        return self.sum / self.count if self.count else None
+
+    def cumulative_counts(self) -> List[int]:
+        """Returns the number of values at or below each boundary.
+
+        Returns:
+            A list of ints, one for each boundary followed by the total count,
+            in the form used by Prometheus histogram buckets.
+        """
+        counts: List[int] = []
+        total: int = 0
+
+        for bucket_count in self.bucket_counts:
+            total += bucket_count
+            counts.append(total)
+
+        return counts
+
+
+@dataclass
+class MethodMetrics:
+    """The aggregated metrics of requests to a method by one customer.
+
+    Attributes:
+        service: a str of the service name.
+        method: a str of the method name.
+        customer_id: an optional str of the customer ID of the requests.
+        latency: a Histogram of request latencies in seconds.
+        status_counts: a dict of status code names to request counts.
+        request_bytes: an int of the total serialized size of the requests.
+        response_bytes: an int of the total serialized size of the responses.
+        rows: an int of the total number of rows in the responses.
+        retries: an int of the number of times requests were retried.
+    """
+
+    service: str
+    method: str
+    customer_id: Optional[str]
+    latency: Histogram = field(default_factory=Histogram)
+    status_counts: Dict[str, int] = field(default_factory=dict)
+    request_bytes: int = 0
+    response_bytes: int = 0
+    rows: int = 0
+    retries: int = 0
+
+    @property
+    def request_count(self) -> int:
+        """The number of requests that were recorded."""
+        return self.latency.count
+
+
+class MetricsExporter:
+    """The interface of the exporters that request metrics are passed to.
+
+    Subclasses override the methods for the measurements they export. They
+    are called on the thread that completed the request, so they should
+    return quickly.
+    """
+
+    def record(self, sample: RequestSample) -> None:
+        """Records the measurements of a completed request.
+
+        Args:
+            sample: a RequestSample of the request.
+        """
+
+    def record_retry(
+        self, service: str, method: str, customer_id: Optional[str]
+    ) -> None:
+        """Records that a request is about to be retried.
+
+        Args:
+            service: a str of the service name.
+            method: a str of the method name.
+            customer_id: an optional str of the customer ID of the request.
+        """
+
+
+class MetricsRegistry(MetricsExporter):
+    """Aggregates request metrics in-process and passes them to exporters."""
+
+    def __init__(
+        self,
+        exporters: Sequence[MetricsExporter] = (),
+        latency_buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ):
+        """Initializer for the MetricsRegistry class.
+
+        Args:
+            exporters: a sequence of MetricsExporter instances that every
+                measurement is passed to.
+            latency_buckets: a sorted sequence of floats of the upper bounds,
+                in seconds, of the latency histogram buckets.
+        """
+        self.exporters: List[MetricsExporter] = list(exporters)
+        self.latency_buckets: Tuple[float, ...] = tuple(latency_buckets)
+        self._metrics: Dict[MetricsKey, MethodMetrics] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def add_exporter(self, exporter: MetricsExporter) -> None:
+        """Adds an exporter that subsequent measurements are passed to.
+
+        Args:
+            exporter: a MetricsExporter instance.
+        """
+        self.exporters.append(exporter)
+
+    def _get_method_metrics(
+        self, service: str, method: str, customer_id: Optional[str]
+    ) -> MethodMetrics:
+        """Returns the metrics of a method, adding them if they don't exist.
+
+        Must be called while holding the lock.
+        """
+        key: MetricsKey = (service, method, customer_id)
+        method_metrics: Optional[MethodMetrics] = self._metrics.get(key)
+
+        if method_metrics is None:
+            method_metrics = MethodMetrics(
+                service,
+                method,
+                customer_id,
+                latency=Histogram(self.latency_buckets),
+            )
+            self._metrics[key] = method_metrics
+
+        return method_metrics
+
+    def _export(self, method_name: str, *args: Any) -> None:
+        """Passes a measurement to every exporter.
+
+        Exporter failures are logged rather than raised so that they can't
+        fail the request that was measured.
+        """
+        for exporter in self.exporters:
+            try:
+                getattr(exporter, method_name)(*args)
+            except Exception:
+                _logger.warning(
+                    "Metrics exporter %r failed.", exporter, exc_info=True
+                )
+
+    def record(self, sample: RequestSample) -> None:
+        """Aggregates the measurements of a completed request.
+
+        Args:
+            sample: a RequestSample of the request.
+        """
+        with self._lock:
+            method_metrics: MethodMetrics = self._get_method_metrics(
+                sample.service, sample.method, sample.customer_id
+            )
+            method_metrics.latency.observe(sample.latency)
+            method_metrics.status_counts[sample.status] = (
+                method_metrics.status_counts.get(sample.status, 0) + 1
+            )
+            method_metrics.request_bytes += sample.request_bytes or 0
+            method_metrics.response_bytes += sample.response_bytes or 0
+            method_metrics.rows += sample.rows
+
+        self._export("record", sample)
+
+    def record_retry(
+        self, service: str, method: str, customer_id: Optional[str]
+    ) -> None:
+        """Counts a retry of a request.
+
+        Args:
+            service: a str of the service name.
+            method: a str of the method name.
+            customer_id: an optional str of the customer ID of the request.
+        """
+        with self._lock:
+            self._get_method_metrics(service, method, customer_id).retries += 1
+
+        self._export("record_retry", service, method, customer_id)
+
+    def snapshot(self) -> List[MethodMetrics]:
+        """Returns a copy of the current metrics.
+
+        Returns:
+            A list of MethodMetrics sorted by service, method and customer ID,
+            which aren't changed by subsequent requests.
+        """
+        with self._lock:
+            metrics: List[MethodMetrics] = copy.deepcopy(
+                list(self._metrics.values())
+            )
+
+        return sorted(
+            metrics,
+            key=lambda m: (m.service, m.method, m.customer_id or ""),
+        )
+
+    def reset(self) -> None:
+        """Clears all of the aggregated metrics."""
+        with self._lock:
+            self._metrics.clear()
+
+    def to_prometheus_text(self) -> str:
+        """Returns the current metrics in the Prometheus text format.
+
+        Returns:
+            A str of the metrics in the Prometheus text exposition format,
+            which can be served from a /metrics endpoint.
+        """
+        return format_prometheus_text(self.snapshot())
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Returns self serialized as a dict, without the unpicklable lock."""
+        with self._lock:
+            state: Dict[str, Any] = self.__dict__.copy()
+            state["_metrics"] = copy.deepcopy(self._metrics)
+
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, d: Dict[str, Any]) -> None:
+        """Deserializes self with the given dictionary."""
+        self.__dict__.update(d)
+        self._lock = threading.Lock()
+
+
+def _escape_label_value(value: str) -> str:
+    """Escapes a str for use as a Prometheus label value."""
+    return (
+        value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+    )
+
+
+def _format_labels(labels: Dict[str, Optional[str]]) -> str:
+    """Formats a dict of labels as a Prometheus label set."""
+    return ",".join(
+        f'{name}="{_escape_label_value(value or "")}"'
+        for name, value in labels.items()
+    )
+
+
+def _format_number(value: float) -> str:
+    """Formats a number the way Prometheus expects it."""
+    if value == float("inf"):
+        return "+Inf"
+
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def format_prometheus_text(metrics: Sequence[MethodMetrics]) -> str:
+    """Formats method metrics in the Prometheus text exposition format.
+
+    Args:
+        metrics: a sequence of MethodMetrics, such as a registry snapshot.
+
+    Returns:
+        A str of the metrics in the Prometheus text exposition format.
+    """
+    prefix: str = _PROMETHEUS_PREFIX
+    families: Dict[str, Tuple[str, str, List[str]]] = {
+        "latency": (
+            f"{prefix}_request_latency_seconds",
+            "histogram",
+            [],
+        ),
+        "requests": (f"{prefix}_requests_total", "counter", []),
+        "request_bytes": (f"{prefix}_request_bytes_total", "counter", []),
+        "response_bytes": (f"{prefix}_response_bytes_total", "counter", []),
+        "rows": (f"{prefix}_rows_total", "counter", []),
+        "retries": (f"{prefix}_retries_total", "counter", []),
+    }
+    descriptions: Dict[str, str] = {
+        "latency": "Latency of Google Ads API requests.",
+        "requests": "Google Ads API requests by status code.",
+        "request_bytes": "Serialized size of Google Ads API requests.",
+        "response_bytes": "Serialized size of Google Ads API responses.",
+        "rows": "Rows returned by Google Ads API requests.",
+        "retries": "Retries of Google Ads API requests.",
+    }
+
+    for method_metrics in metrics:
+        labels: Dict[str, Optional[str]] = {
+            "service": method_metrics.service,
+            "method": method_metrics.method,
+            "customer_id": method_metrics.customer_id,
+        }
+        label_str: str = _format_labels(labels)
+        name, _, lines = families["latency"]
+        histogram: Histogram = method_metrics.latency
+        bounds: Tuple[float, ...] = histogram.boundaries + (float("inf"),)
+
+        for bound, count in zip(bounds, histogram.cumulative_counts()):
+            lines.append(
+                f'{name}_bucket{{{label_str},le="{_format_number(bound)}"}} '
+                f"{count}"
+            )
+
+        lines.append(f"{name}_sum{{{label_str}}} {histogram.sum!r}")
+        lines.append(f"{name}_count{{{label_str}}} {histogram.count}")
+
+        name, _, lines = families["requests"]
+        for status, count in sorted(method_metrics.status_counts.items()):
+            status_labels: str = _format_labels(dict(labels, status=status))
+            lines.append(f"{name}{{{status_labels}}} {count}")
+
+        for key in ("request_bytes", "response_bytes", "rows", "retries"):
+            name, _, lines = families[key]
+            lines.append(
+                f"{name}{{{label_str}}} {getattr(method_metrics, key)}"
+            )
+
+    output: List[str] = []
+
+    for key, (name, metric_type, lines) in families.items():
+        output.append(f"# HELP {name} {descriptions[key]}")
+        output.append(f"# TYPE {name} {metric_type}")
+        output.extend(lines)
+
+    return "\n".join(output) + "\n"
+
+
+def _import_opentelemetry_metrics() -> Any:
+    """Imports and returns the optional opentelemetry.metrics module.
+
+    Raises:
+        ImportError: If opentelemetry-api is not installed.
+    """
+    try:
+        from opentelemetry import metrics
+    except ImportError as ex:
+        raise ImportError(
+            "Exporting to OpenTelemetry requires the opentelemetry-api "
+            'package. It can be installed with "pip install opentelemetry-api".'
+        ) from ex
+
+    return metrics
+
+
+class OpenTelemetryExporter(MetricsExporter):
+    """Records request metrics as OpenTelemetry instruments."""
+
+    def __init__(self, meter: Any = None):
+        """Initializer for the OpenTelemetryExporter class.
+
+        Args:
+            meter: an optional opentelemetry.metrics.Meter that the
+                instruments are created with. By default a meter is retrieved
+                from the global MeterProvider.
+
+        Raises:
+            ImportError: If opentelemetry-api is not installed.
+        """
+        if meter is None:
+            meter = _import_opentelemetry_metrics().get_meter(
+                "google.ads.googleads"
+            )
+
+        self.meter: Any = meter
+        self._latency: Any = meter.create_histogram(
+            "google_ads.request.duration",
+            unit="s",
+            description="Latency of Google Ads API requests.",
+        )
+        self._request_bytes: Any = meter.create_counter(
+            "google_ads.request.size",
+            unit="By",
+            description="Serialized size of Google Ads API requests.",
+        )
+        self._response_bytes: Any = meter.create_counter(
+            "google_ads.response.size",
+            unit="By",
+            description="Serialized size of Google Ads API responses.",
+        )
+        self._rows: Any = meter.create_counter(
+            "google_ads.response.rows",
+            description="Rows returned by Google Ads API requests.",
+        )
+        self._retries: Any = meter.create_counter(
+            "google_ads.request.retries",
+            description="Retries of Google Ads API requests.",
+        )
+
+    @staticmethod
+    def _get_attributes(
+        service: str, method: str, customer_id: Optional[str]
+    ) -> Dict[str, str]:
+        """Returns the OpenTelemetry attributes of a request."""
+        attributes: Dict[str, str] = {"service": service, "method": method}
+
+        if customer_id:
+            attributes["customer_id"] = customer_id
+
+        return attributes
+
+    def record(self, sample: RequestSample) -> None:
+        """Records the measurements of a completed request.
+
+        Args:
+            sample: a RequestSample of the request.
+        """
+        attributes: Dict[str, str] = self._get_attributes(
+            sample.service, sample.method, sample.customer_id
+        )
+        self._latency.record(
+            sample.latency, dict(attributes, status=sample.status)
+        )
+
+        if sample.request_bytes is not None:
+            self._request_bytes.add(sample.request_bytes, attributes)
+
+        if sample.response_bytes is not None:
+            self._response_bytes.add(sample.response_bytes, attributes)
+
+        if sample.rows:
+            self._rows.add(sample.rows, attributes)
+
+    def record_retry(
+        self, service: str, method: str, customer_id: Optional[str]
+    ) -> None:
+        """Records that a request is about to be retried.
+
+        Args:
+            service: a str of the service name.
+            method: a str of the method name.
+            customer_id: an optional str of the customer ID of the request.
+        """
+        self._retries.add(
+            1, self._get_attributes(service, method, customer_id)
+        )
+
+
+__all__ = [
+    "DEFAULT_LATENCY_BUCKETS",
+    "Histogram",
+    "MethodMetrics",
+    "MetricsExporter",
+    "MetricsRegistry",
+    "OpenTelemetryExporter",
+    "RequestSample",
+    "format_prometheus_text",
+]
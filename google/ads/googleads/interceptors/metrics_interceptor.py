@@ -0,0 +1,474 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""A gRPC Interceptor that records the latency, size and status of requests.
+
+This class is initialized in the GoogleAdsClient and passed into a grpc
+intercept_channel whenever a new service is initialized, when the client is
+configured with "enable_metrics". It's the outermost of the library's
+interceptors, so the recorded latency includes the time spent in the others.
+
+Unary requests are recorded when they complete. Streams are recorded when
+their last response has been read or they fail, so that the latency and the
+number of rows cover the whole stream; streams that are abandoned before
+they're read to the end aren't recorded.
+"""
+
+import functools
+import time
+from typing import Any, Optional, Tuple, Union
+
+from google.protobuf.message import Message as ProtobufMessageType
+import grpc
+
+from google.ads.googleads.interceptors import (
+    Interceptor,
+    ContinuationType,
+)
+from google.ads.googleads.interceptors.metrics import (
+    MetricsExporter,
+    RequestSample,
+)
+from google.ads.googleads.interceptors.response_wrappers import (
+    _UnaryStreamCallProxy,
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_method(method: Union[str, bytes]) -> Tuple[str, str]:
+    """Splits a gRPC method path into a service name and method name.
+
+    Args:
+        method: a str of the method path, e.g.
+            "/google.ads.googleads.v21.services.GoogleAdsService/Search", or
+            the same path as bytes, which is how grpc.aio passes it.
+
+    Returns:
+        A tuple of the str service name, e.g. "GoogleAdsService", and the str
+        method name, e.g. "Search".
+    """
+    if isinstance(method, bytes):
+        method = method.decode()
+
+    service_path, _, method_name = method.rpartition("/")
+    return service_path.rpartition(".")[2], method_name
+
+
+class _RequestMeasurement:
+    """Accumulates the measurements of a request until it completes."""
+
+    def __init__(
+        self,
+        interceptor: "MetricsInterceptor",
+        client_call_details: grpc.ClientCallDetails,
+        request: ProtobufMessageType,
+    ):
+        self._interceptor: "MetricsInterceptor" = interceptor
+        self._client_call_details: grpc.ClientCallDetails = client_call_details
+        self._request: ProtobufMessageType = request
+        self._start: float = time.perf_counter()
+        self._response_bytes: Optional[int] = None
+        self._rows: int = 0
+        self._completed: bool = False
+
+    def add_response(self, message: Any) -> None:
+        """Adds the size and row count of a response message.
+
+        Args:
+            message: a response proto message.
+        """
+        if self._interceptor.measure_sizes:
+            size: Optional[int] = self._interceptor._get_message_size(message)
+            if size is not None:
+                self._response_bytes = (self._response_bytes or 0) + size
+
+        results: Any = getattr(message, "results", None)
+        if results is not None:
+            self._rows += len(results)
+
+    def complete(self, exception: Optional[BaseException] = None) -> None:
+        """Records the request, unless it has already been recorded.
+
+        Args:
+            exception: the exception that the request failed with, if any.
+        """
+        if self._completed:
+            return
+
+        self._completed = True
+        latency: float = time.perf_counter() - self._start
+        self._interceptor.record(
+            self._client_call_details,
+            self._request,
+            latency,
+            exception=exception,
+            response_bytes=self._response_bytes,
+            rows=self._rows,
+        )
+
+
+class _MetricsUnaryStreamWrapper(_UnaryStreamCallProxy):
+    """Wraps a stream to measure its responses as they're read."""
+
+    def __init__(
+        self,
+        underlay_call: Union[grpc.Call, grpc.Future],
+        measurement: _RequestMeasurement,
+    ):
+        super().__init__(underlay_call)
+        self._measurement: _RequestMeasurement = measurement
+
+    def __next__(self) -> Any:
+        try:
+            message: Any = next(self._underlay_call)
+        except StopIteration:
+            self._measurement.complete()
+            raise
+        except Exception as exception:
+            self._measurement.complete(exception)
+            raise
+
+        self._measurement.add_response(message)
+        return message
+
+
+class MetricsInterceptor(
+    Interceptor,
+    grpc.UnaryUnaryClientInterceptor,
+    grpc.UnaryStreamClientInterceptor,
+):
+    """An interceptor that records metrics of API requests."""
+
+    def __init__(self, exporter: MetricsExporter, measure_sizes: bool = True):
+        """Initializer for the MetricsInterceptor class.
+
+        Args:
+            exporter: a MetricsExporter, usually a MetricsRegistry, that the
+                measurements of each request are passed to.
+            measure_sizes: a bool of whether the serialized sizes of requests
+                and responses are measured. Measuring them requires
+                serializing the messages again, which can be disabled for
+                large responses where that time matters.
+        """
+        self.exporter: MetricsExporter = exporter
+        self.measure_sizes: bool = measure_sizes
+
+    def record(
+        self,
+        client_call_details: grpc.ClientCallDetails,
+        request: ProtobufMessageType,
+        latency: float,
+        exception: Optional[BaseException] = None,
+        response_bytes: Optional[int] = None,
+        rows: int = 0,
+    ) -> None:
+        """Passes the measurements of a completed request to the exporter.
+
+        Args:
+            client_call_details: An instance of grpc.ClientCallDetails.
+            request: An instance of a request proto message.
+            latency: a float of the seconds the request took.
+            exception: the exception that the request failed with, if any.
+            response_bytes: an optional int of the total serialized size of
+                the response messages.
+            rows: an int of the number of rows in the responses.
+        """
+        service, method = _parse_method(client_call_details.method)
+        self.exporter.record(
+            RequestSample(
+                service=service,
+                method=method,
+                customer_id=self._get_customer_id(request) or None,
+                status=(
+                    self._get_status_name(exception)
+                    if exception is not None
+                    else grpc.StatusCode.OK.name
+                ),
+                latency=latency,
+                request_bytes=(
+                    self._get_message_size(request)
+                    if self.measure_sizes
+                    else None
+                ),
+                response_bytes=response_bytes,
+                rows=rows,
+            )
+        )
+
+    def intercept_unary_unary(
+        self,
+        continuation: ContinuationType,
+        client_call_details: grpc.ClientCallDetails,
+        request: ProtobufMessageType,
+    ) -> Union[grpc.Call, grpc.Future]:
+        """Intercepts and records metrics of Unary-Unary requests.
+
+        Overrides abstract method defined in grpc.UnaryUnaryClientInterceptor.
+
+        Args:
+            continuation: a function to continue the request process.
+            client_call_details: a grpc._interceptor._ClientCallDetails
+                instance containing request metadata.
+            request: a SearchGoogleAdsRequest or SearchGoogleAdsStreamRequest
+                message class instance.
+
+        Returns:
+            A grpc.Call/grpc.Future instance representing a service response.
+        """
+        measurement: _RequestMeasurement = _RequestMeasurement(
+            self, client_call_details, request
+        )
+
+        try:
+            response: grpc.Call = continuation(client_call_details, request)
+        except Exception as exception:
+            # The exception interceptor raises failures as exceptions.
+            measurement.complete(exception)
+            raise
+
+        def on_done(response_future: grpc.Future) -> None:
+            exception: Optional[BaseException] = response_future.exception()
+
+            if exception is None:
+                measurement.add_response(response_future.result())
+
+            measurement.complete(exception)
+
+        response.add_done_callback(on_done)
+        return response
+
+    def intercept_unary_stream(
+        self,
+        continuation: ContinuationType,
+        client_call_details: grpc.ClientCallDetails,
+        request: ProtobufMessageType,
+    ) -> Union[grpc.Call, grpc.Future]:
+        """Intercepts and records metrics of Unary-Stream requests.
+
+        Overrides abstract method defined in grpc.UnaryStreamClientInterceptor.
+
+        Args:
+            continuation: a function to continue the request process.
+            client_call_details: a grpc._interceptor._ClientCallDetails
+                instance containing request metadata.
+            request: a SearchGoogleAdsRequest or SearchGoogleAdsStreamRequest
+                message class instance.
+
+        Returns:
+            A grpc.Call/grpc.Future instance representing a service response.
+        """
+        measurement: _RequestMeasurement = _RequestMeasurement(
+            self, client_call_details, request
+        )
+
+        try:
+            response: grpc.Call = continuation(client_call_details, request)
+        except Exception as exception:
+            measurement.complete(exception)
+            raise
+
+        return _MetricsUnaryStreamWrapper(response, measurement)
+
+
+class _AsyncMetricsUnaryUnaryCall(grpc.aio.UnaryUnaryCall):
+    """Wraps an async call to record it when its response is awaited."""
+
+    def __init__(self, call: grpc.aio.Call, measurement: _RequestMeasurement):
+        self._call: grpc.aio.Call = call
+        self._measurement: _RequestMeasurement = measurement
+
+    def __await__(self):
+        try:
+            response = yield from self._call.__await__()
+        except Exception as exception:
+            self._measurement.complete(exception)
+            raise
+
+        self._measurement.add_response(response)
+        self._measurement.complete()
+        return response
+
+    def cancel(self):
+        return self._call.cancel()
+
+    def cancelled(self):
+        return self._call.cancelled()
+
+    def done(self):
+        return self._call.done()
+
+    def add_done_callback(self, callback):
+        return self._call.add_done_callback(callback)
+
+    def code(self):
+        return self._call.code()
+
+    def details(self):
+        return self._call.details()
+
+    def initial_metadata(self):
+        return self._call.initial_metadata()
+
+    def trailing_metadata(self):
+        return self._call.trailing_metadata()
+
+    def time_remaining(self):
+        return self._call.time_remaining()
+
+    async def wait_for_connection(self):
+        return await self._call.wait_for_connection()
+
+
+class _AsyncMetricsUnaryStreamCall(grpc.aio.UnaryStreamCall):
+    """Wraps an async stream to measure its responses as they're read."""
+
+    def __init__(self, call: grpc.aio.Call, measurement: _RequestMeasurement):
+        self._call: grpc.aio.Call = call
+        self._measurement: _RequestMeasurement = measurement
+
+    def __aiter__(self):
+        async def _wrapped_aiter():
+            try:
+                async for message in self._call:
+                    self._measurement.add_response(message)
+                    yield message
+            except Exception as exception:
+                self._measurement.complete(exception)
+                raise
+
+            self._measurement.complete()
+
+        return _wrapped_aiter()
+
+    async def read(self):
+        try:
+            message = await self._call.read()
+        except Exception as exception:
+            self._measurement.complete(exception)
+            raise
+
+        if message is grpc.aio.EOF:
+            self._measurement.complete()
+        else:
+            self._measurement.add_response(message)
+
+        return message
+
+    def cancel(self):
+        return self._call.cancel()
+
+    def cancelled(self):
+        return self._call.cancelled()
+
+    def done(self):
+        return self._call.done()
+
+    def add_done_callback(self, callback):
+        return self._call.add_done_callback(callback)
+
+    def code(self):
+        return self._call.code()
+
+    def details(self):
+        return self._call.details()
+
+    def initial_metadata(self):
+        return self._call.initial_metadata()
+
+    def trailing_metadata(self):
+        return self._call.trailing_metadata()
+
+    def time_remaining(self):
+        return self._call.time_remaining()
+
+    async def wait_for_connection(self):
+        return await self._call.wait_for_connection()
+
+
+class _AsyncMetricsInterceptor(MetricsInterceptor):
+    """An interceptor that records metrics of async API requests."""
+
+    async def intercept_unary_unary(
+        self,
+        continuation: ContinuationType,
+        client_call_details: grpc.ClientCallDetails,
+        request: ProtobufMessageType,
+    ) -> grpc.aio.UnaryUnaryCall:
+        """Intercepts and records metrics of Unary-Unary requests.
+
+        Overrides abstract method defined in
+        grpc.aio.UnaryUnaryClientInterceptor.
+
+        Args:
+            continuation: a function to continue the request process.
+            client_call_details: a grpc.aio.ClientCallDetails instance
+                containing request metadata.
+            request: a request proto message class instance.
+
+        Returns:
+            A grpc.aio.UnaryUnaryCall that records the request when its
+            response is awaited.
+        """
+        measurement: _RequestMeasurement = _RequestMeasurement(
+            self, client_call_details, request
+        )
+        call = await continuation(client_call_details, request)
+        return _AsyncMetricsUnaryUnaryCall(call, measurement)
+
+    async def intercept_unary_stream(
+        self,
+        continuation: ContinuationType,
+        client_call_details: grpc.ClientCallDetails,
+        request: ProtobufMessageType,
+    ) -> grpc.aio.UnaryStreamCall:
+        """Intercepts and records metrics of Unary-Stream requests.
+
+        Overrides abstract method defined in
+        grpc.aio.UnaryStreamClientInterceptor.
+
+        Args:
+            continuation: a function to continue the request process.
+            client_call_details: a grpc.aio.ClientCallDetails instance
+                containing request metadata.
+            request: a request proto message class instance.
+
+        Returns:
+            A grpc.aio.UnaryStreamCall that records the request when its last
+            response has been read.
+        """
+        measurement: _RequestMeasurement = _RequestMeasurement(
+            self, client_call_details, request
+        )
+        call = await continuation(client_call_details, request)
+        return _AsyncMetricsUnaryStreamCall(call, measurement)
+
+
+class AsyncUnaryUnaryMetricsInterceptor(
+    _AsyncMetricsInterceptor,
+    grpc.aio.UnaryUnaryClientInterceptor,
+):
+    """An interceptor that records metrics of Unary-Unary requests."""
+
+
+class AsyncUnaryStreamMetricsInterceptor(
+    _AsyncMetricsInterceptor,
+    grpc.aio.UnaryStreamClientInterceptor,
+):
+    """An interceptor that records metrics of Unary-Stream requests."""
+
+
+__all__ = [
+    "MetricsInterceptor",
+    "AsyncUnaryUnaryMetricsInterceptor",
+    "AsyncUnaryStreamMetricsInterceptor",
+]
@@ -0,0 +1,353 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""A gRPC Interceptor that paces requests with an adaptive rate limiter.
+
+This class is initialized in the GoogleAdsClient and passed into a grpc
+intercept_channel whenever a new service is initialized, when the client is
+configured with a "rate_limiter". It's inside of the retry interceptor, so
+every attempt of a request is paced, and outside of the others, so the time
+spent waiting isn't included in the latency of requests.
+
+Before a request is sent, the interceptor waits until its bucket, see
+google.ads.googleads.rate_limiter, lets it through. When the request
+completes, its outcome adapts the bucket's rate. The developer token and login
+customer ID of the bucket are read from the request's metadata when it has
+them, so that a channel can be shared by service clients with different
+values.
+"""
+
+import asyncio
+import time
+from typing import Any, Callable, Optional, Set, TypeVar, Union
+
+from google.protobuf.message import Message as ProtobufMessageType
+import grpc
+
+from google.ads.googleads.interceptors import (
+    Interceptor,
+    ContinuationType,
+)
+from google.ads.googleads.rate_limiter import (
+    AdaptiveRateLimiter,
+    get_bucket_key,
+)
+
+_DEVELOPER_TOKEN_KEY = "developer-token"
+_LOGIN_CUSTOMER_ID_KEY = "login-customer-id"
+
+T = TypeVar("T")
+
+
+class RateLimitInterceptor(
+    Interceptor,
+    grpc.UnaryUnaryClientInterceptor,
+    grpc.UnaryStreamClientInterceptor,
+):
+    """An interceptor that paces API requests."""
+
+    def __init__(
+        self,
+        rate_limiter: AdaptiveRateLimiter,
+        developer_token: Optional[str],
+        login_customer_id: Optional[str] = None,
+    ):
+        """Initializer for the RateLimitInterceptor class.
+
+        Args:
+            rate_limiter: the AdaptiveRateLimiter that paces the requests.
+            developer_token: a str of the developer token of the requests
+                that don't have one in their metadata.
+            login_customer_id: an optional str of the login customer ID of
+                the requests that don't have one in their metadata.
+        """
+        self.rate_limiter: AdaptiveRateLimiter = rate_limiter
+        self.developer_token: Optional[str] = developer_token
+        self.login_customer_id: Optional[str] = login_customer_id
+
+    def _get_bucket_key(
+        self,
+        client_call_details: grpc.ClientCallDetails,
+        request: ProtobufMessageType,
+    ) -> str:
+        """Returns the key of the bucket that paces a request.
+
+        Args:
+            client_call_details: a grpc.ClientCallDetails instance containing
+                request metadata.
+            request: An instance of a request proto message.
+        """
+        developer_token: Optional[str] = self.developer_token
+        login_customer_id: Optional[str] = self.login_customer_id
+
+        for key, value in client_call_details.metadata or ():
+            if key == _DEVELOPER_TOKEN_KEY:
+                developer_token = value
+            elif key == _LOGIN_CUSTOMER_ID_KEY:
+                login_customer_id = value
+
+        return get_bucket_key(
+            developer_token,
+            login_customer_id,
+            self._get_customer_id(request),
+        )
+
+    def _record_when_done(
+        self, response: Union[grpc.Call, grpc.Future], key: str
+    ) -> None:
+        """Adapts the rate of a bucket to a response when it completes.
+
+        Args:
+            response: a grpc.Call/grpc.Future instance representing a service
+                response.
+            key: a str of the bucket's key.
+        """
+
+        def on_done(response_future: grpc.Future) -> None:
+            if not response_future.cancelled():
+                self.rate_limiter.record(key, response_future.exception())
+
+        response.add_done_callback(on_done)
+
+    def _intercept(
+        self,
+        continuation: ContinuationType,
+        client_call_details: grpc.ClientCallDetails,
+        request: ProtobufMessageType,
+    ) -> Union[grpc.Call, grpc.Future]:
+        """Waits for a request's turn and sends it.
+
+        Args:
+            continuation: a function to continue the request process.
+            client_call_details: a grpc._interceptor._ClientCallDetails
+                instance containing request metadata.
+            request: a request proto message class instance.
+
+        Returns:
+            A grpc.Call/grpc.Future instance representing a service response.
+        """
+        key: str = self._get_bucket_key(client_call_details, request)
+        delay: float = self.rate_limiter.acquire(key)
+
+        if delay > 0:
+            time.sleep(delay)
+
+        try:
+            response: grpc.Call = continuation(client_call_details, request)
+        except Exception as exception:
+            # The exception interceptor raises failures as exceptions.
+            self.rate_limiter.record(key, exception)
+            raise
+
+        self._record_when_done(response, key)
+        return response
+
+    def intercept_unary_unary(
+        self,
+        continuation: ContinuationType,
+        client_call_details: grpc.ClientCallDetails,
+        request: ProtobufMessageType,
+    ) -> Union[grpc.Call, grpc.Future]:
+        """Intercepts and paces Unary-Unary requests.
+
+        Overrides abstract method defined in grpc.UnaryUnaryClientInterceptor.
+
+        Args:
+            continuation: a function to continue the request process.
+            client_call_details: a grpc._interceptor._ClientCallDetails
+                instance containing request metadata.
+            request: a SearchGoogleAdsRequest or SearchGoogleAdsStreamRequest
+                message class instance.
+
+        Returns:
+            A grpc.Call/grpc.Future instance representing a service response.
+        """
+        return self._intercept(continuation, client_call_details, request)
+
+    def intercept_unary_stream(
+        self,
+        continuation: ContinuationType,
+        client_call_details: grpc.ClientCallDetails,
+        request: ProtobufMessageType,
+    ) -> Union[grpc.Call, grpc.Future]:
+        """Intercepts and paces Unary-Stream requests.
+
+        Overrides abstract method defined in grpc.UnaryStreamClientInterceptor.
+
+        Args:
+            continuation: a function to continue the request process.
+            client_call_details: a grpc._interceptor._ClientCallDetails
+                instance containing request metadata.
+            request: a SearchGoogleAdsRequest or SearchGoogleAdsStreamRequest
+                message class instance.
+
+        Returns:
+            A grpc.Call/grpc.Future instance representing a service response.
+        """
+        return self._intercept(continuation, client_call_details, request)
+
+
+class _AsyncRateLimitInterceptor(RateLimitInterceptor):
+    """An interceptor that paces async API requests."""
+
+    def __init__(
+        self,
+        rate_limiter: AdaptiveRateLimiter,
+        developer_token: Optional[str],
+        login_customer_id: Optional[str] = None,
+    ):
+        """Initializer for the _AsyncRateLimitInterceptor class.
+
+        Args:
+            rate_limiter: the AdaptiveRateLimiter that paces the requests.
+            developer_token: a str of the developer token of the requests
+                that don't have one in their metadata.
+            login_customer_id: an optional str of the login customer ID of
+                the requests that don't have one in their metadata.
+        """
+        super().__init__(rate_limiter, developer_token, login_customer_id)
+        self._pending_tasks: Set[asyncio.Task] = set()
+
+    async def _call_rate_limiter(
+        self, method: Callable[..., T], *args: Any
+    ) -> T:
+        """Calls a method of the rate limiter without blocking the loop.
+
+        Backends that can block, such as the FileLockBackend, which waits for
+        other processes to unlock its file, are called in the event loop's
+        default executor.
+
+        Args:
+            method: a method of the AdaptiveRateLimiter.
+            *args: the arguments of the method.
+
+        Returns:
+            The result of the method.
+        """
+        if not self.rate_limiter.backend.is_blocking:
+            return method(*args)
+
+        return await asyncio.get_running_loop().run_in_executor(
+            None, method, *args
+        )
+
+    async def _intercept(
+        self,
+        continuation: ContinuationType,
+        client_call_details: grpc.ClientCallDetails,
+        request: ProtobufMessageType,
+    ) -> grpc.aio.Call:
+        """Waits for a request's turn and sends it.
+
+        Args:
+            continuation: a function to continue the request process.
+            client_call_details: a grpc.aio.ClientCallDetails instance
+                containing request metadata.
+            request: a request proto message class instance.
+
+        Returns:
+            The grpc.aio.Call of the request.
+        """
+        key: str = self._get_bucket_key(client_call_details, request)
+        delay: float = await self._call_rate_limiter(
+            self.rate_limiter.acquire, key
+        )
+
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        call = await continuation(client_call_details, request)
+
+        async def record(done_call: grpc.aio.Call) -> None:
+            await self._call_rate_limiter(
+                self.rate_limiter.record_status, key, await done_call.code()
+            )
+
+        def on_done(done_call: grpc.aio.Call) -> None:
+            if done_call.cancelled():
+                return
+
+            # The status of async calls is read with a coroutine, which
+            # returns immediately once the call is done.
+            task: asyncio.Task = asyncio.ensure_future(record(done_call))
+            # The event loop only keeps weak references to tasks.
+            self._pending_tasks.add(task)
+            task.add_done_callback(self._pending_tasks.discard)
+
+        call.add_done_callback(on_done)
+        return call
+
+    async def intercept_unary_unary(
+        self,
+        continuation: ContinuationType,
+        client_call_details: grpc.ClientCallDetails,
+        request: ProtobufMessageType,
+    ) -> grpc.aio.UnaryUnaryCall:
+        """Intercepts and paces Unary-Unary requests.
+
+        Overrides abstract method defined in
+        grpc.aio.UnaryUnaryClientInterceptor.
+
+        Args:
+            continuation: a function to continue the request process.
+            client_call_details: a grpc.aio.ClientCallDetails instance
+                containing request metadata.
+            request: a request proto message class instance.
+
+        Returns:
+            The grpc.aio.UnaryUnaryCall of the request.
+        """
+        return await self._intercept(continuation, client_call_details, request)
+
+    async def intercept_unary_stream(
+        self,
+        continuation: ContinuationType,
+        client_call_details: grpc.ClientCallDetails,
+        request: ProtobufMessageType,
+    ) -> grpc.aio.UnaryStreamCall:
+        """Intercepts and paces Unary-Stream requests.
+
+        Overrides abstract method defined in
+        grpc.aio.UnaryStreamClientInterceptor.
+
+        Args:
+            continuation: a function to continue the request process.
+            client_call_details: a grpc.aio.ClientCallDetails instance
+                containing request metadata.
+            request: a request proto message class instance.
+
+        Returns:
+            The grpc.aio.UnaryStreamCall of the request.
+        """
+        return await self._intercept(continuation, client_call_details, request)
+
+
+class AsyncUnaryUnaryRateLimitInterceptor(
+    _AsyncRateLimitInterceptor,
+    grpc.aio.UnaryUnaryClientInterceptor,
+):
+    """An interceptor that paces Unary-Unary requests."""
+
+
+class AsyncUnaryStreamRateLimitInterceptor(
+    _AsyncRateLimitInterceptor,
+    grpc.aio.UnaryStreamClientInterceptor,
+):
+    """An interceptor that paces Unary-Stream requests."""
+
+
+__all__ = [
+    "RateLimitInterceptor",
+    "AsyncUnaryUnaryRateLimitInterceptor",
+    "AsyncUnaryStreamRateLimitInterceptor",
+]
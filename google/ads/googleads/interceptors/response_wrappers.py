@@ -22,6 +22,22 @@ from google.ads.googleads.interceptors import MetadataType
 from google.protobuf.message import Message as ProtobufMessageType
 
 
+def _convert_response(
+    message: Union[ProtobufMessageType, bytes], use_proto_plus: bool
+) -> Union[ProtobufMessageType, bytes]:
+    """Converts a response message to the type the client is configured for.
+
+    Responses of methods that are called without a response deserializer,
+    such as the raw search methods in the raw_search module, are bytes and
+    are returned as-is.
+    """
+    if use_proto_plus is True or isinstance(message, bytes):
+        # By default this message is wrapped by proto-plus
+        return message
+    else:
+        return util.convert_proto_plus_to_protobuf(message)
+
+
 class _UnaryStreamWrapper(grpc.Call, grpc.Future):
     def __init__(
         self,
@@ -104,11 +120,7 @@ class _UnaryStreamWrapper(grpc.Call, grpc.Future):
             # as only [part of] 1 will get logged.
             if self._cache.initial_response_object is None:
                 self._cache.initial_response_object = message
-            if self._use_proto_plus is True:
-                # By default this message is wrapped by proto-plus
-                return message
-            else:
-                return util.convert_proto_plus_to_protobuf(message)
+            return _convert_response(message, self._use_proto_plus)
         except StopIteration:
             raise
         except Exception as e:
@@ -159,10 +171,7 @@ class _UnaryUnaryWrapper(grpc.Call, grpc.Future):
 
     def result(self, timeout: Optional[float] = None) -> ProtobufMessageType:
         message: ProtobufMessageType = self._underlay_call.result()
-        if self._use_proto_plus is True:
-            return message
-        else:
-            return util.convert_proto_plus_to_protobuf(message)
+        return _convert_response(message, self._use_proto_plus)
 
     def exception(self, timeout: Optional[float] = None) -> Optional[grpc.RpcError]:
         if self._exception:
@@ -196,3 +205,72 @@ class _UnaryUnaryWrapper(grpc.Call, grpc.Future):
 
     def __next__(self) -> ProtobufMessageType:
         return next(self._underlay_call)
+
+
+class _UnaryStreamCallProxy(grpc.Call, grpc.Future):
+    """Passes calls through to a stream, for wrappers that change iteration."""
+
+    def __init__(self, underlay_call: Union[grpc.Call, grpc.Future]):
+        super().__init__()
+        self._underlay_call: Union[grpc.Call, grpc.Future] = underlay_call
+
+    def initial_metadata(self) -> MetadataType:
+        return self._underlay_call.initial_metadata()
+
+    def trailing_metadata(self) -> MetadataType:
+        return self._underlay_call.trailing_metadata()
+
+    def code(self) -> grpc.StatusCode:
+        return self._underlay_call.code()
+
+    def details(self) -> str:
+        return self._underlay_call.details()
+
+    def debug_error_string(self) -> str:
+        return self._underlay_call.debug_error_string()
+
+    def cancelled(self) -> bool:
+        return self._underlay_call.cancelled()
+
+    def running(self) -> bool:
+        return self._underlay_call.running()
+
+    def done(self) -> bool:
+        return self._underlay_call.done()
+
+    def result(self, timeout: Optional[float] = None) -> Any:
+        return self._underlay_call.result(timeout=timeout)
+
+    def exception(
+        self, timeout: Optional[float] = None
+    ) -> Optional[grpc.RpcError]:
+        return self._underlay_call.exception(timeout=timeout)
+
+    def traceback(self, timeout: Optional[float] = None) -> Any:
+        return self._underlay_call.traceback(timeout=timeout)
+
+    def add_done_callback(self, fn: Callable[[grpc.Future], Any]) -> None:
+        return self._underlay_call.add_done_callback(fn)
+
+    def add_callback(self, callback: Callable[[], Any]) -> None:
+        return self._underlay_call.add_callback(callback)
+
+    def is_active(self) -> bool:
+        return self._underlay_call.is_active()
+
+    def time_remaining(self) -> Optional[float]:
+        return self._underlay_call.time_remaining()
+
+    def cancel(self) -> bool:
+        return self._underlay_call.cancel()
+
+    def __getattr__(self, name: str) -> Any:
+        # Exposes additional attributes of the wrapped response, such as the
+        # cache of the _UnaryStreamWrapper used by the logging interceptor.
+        return getattr(self._underlay_call, name)
+
+    def __iter__(self) -> Iterator[Any]:
+        return self
+
+    def __next__(self) -> Any:
+        return next(self._underlay_call)
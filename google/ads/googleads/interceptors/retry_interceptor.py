@@ -0,0 +1,539 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""A gRPC Interceptor that retries failed requests.
+
+This class is initialized in the GoogleAdsClient and passed into a grpc
+intercept_channel whenever a new service is initialized. It's the outermost of
+the library's interceptors, so every attempt of a request passes through the
+others, and is logged and measured separately.
+
+Which requests are retried, and how long to wait before each retry, is
+decided by the RetryPolicy of the client, or the one set for the current
+context with google.ads.googleads.retry.use_retry_policy. The request's
+timeout covers all of its attempts, and a request isn't retried if the delay
+would take it past its deadline.
+
+Streams are only retried if they fail before their first response is
+received, since retrying them later would return rows that have already been
+read. To tell whether they failed, the first response is read by the
+interceptor.
+"""
+
+import asyncio
+import time
+from typing import Any, Optional, Union
+
+from google.protobuf.message import Message as ProtobufMessageType
+import grpc
+
+from google.ads.googleads.errors import GoogleAdsException
+from google.ads.googleads.interceptors import (
+    Interceptor,
+    ContinuationType,
+)
+from google.ads.googleads.interceptors.metrics import MetricsExporter
+from google.ads.googleads.interceptors.metrics_interceptor import (
+    _parse_method,
+)
+from google.ads.googleads.interceptors.response_wrappers import (
+    _UnaryStreamCallProxy,
+)
+from google.ads.googleads.retry import (
+    RetryPolicy,
+    get_retry_policy_override,
+    is_retryable,
+)
+
+# Indicates that the first response of a stream has already been returned.
+_NO_MESSAGE = object()
+
+
+class _PrefetchedUnaryStreamWrapper(_UnaryStreamCallProxy):
+    """Returns the prefetched first response of a stream before the rest."""
+
+    def __init__(
+        self,
+        underlay_call: Union[grpc.Call, grpc.Future],
+        first_message: Any,
+    ):
+        """Initializer for the _PrefetchedUnaryStreamWrapper class.
+
+        Args:
+            underlay_call: the stream the first response was read from.
+            first_message: the first response, or _NO_MESSAGE if the stream
+                was empty.
+        """
+        super().__init__(underlay_call)
+        self._first_message: Any = first_message
+
+    def __next__(self) -> Any:
+        if self._first_message is not _NO_MESSAGE:
+            message: Any = self._first_message
+            self._first_message = _NO_MESSAGE
+            return message
+
+        return next(self._underlay_call)
+
+
+class RetryInterceptor(
+    Interceptor,
+    grpc.UnaryUnaryClientInterceptor,
+    grpc.UnaryStreamClientInterceptor,
+):
+    """An interceptor that retries failed requests."""
+
+    def __init__(
+        self,
+        api_version: str,
+        retry_policy: Optional[RetryPolicy] = None,
+        metrics: Optional[MetricsExporter] = None,
+    ):
+        """Initializer for the RetryInterceptor class.
+
+        Args:
+            api_version: a str of the API version of the request.
+            retry_policy: an optional RetryPolicy of the requests. Requests
+                are only retried if it's given, or if a policy is set with
+                use_retry_policy.
+            metrics: an optional MetricsExporter that retries are recorded
+                with.
+        """
+        super().__init__(api_version)
+        self.retry_policy: Optional[RetryPolicy] = retry_policy
+        self.metrics: Optional[MetricsExporter] = metrics
+
+    def _get_retry_policy(self) -> Optional[RetryPolicy]:
+        """Returns the policy of the current request.
+
+        Returns:
+            The RetryPolicy set with use_retry_policy, or the interceptor's
+            policy if none was set, or None if requests aren't retried.
+        """
+        policy: Optional[RetryPolicy] = get_retry_policy_override()
+        policy = policy if policy is not None else self.retry_policy
+
+        if policy is None or policy.max_attempts < 2:
+            return None
+
+        return policy
+
+    @staticmethod
+    def _get_deadline(
+        client_call_details: grpc.ClientCallDetails,
+    ) -> Optional[float]:
+        """Returns the time.monotonic() deadline of all attempts, if any."""
+        timeout: Optional[float] = client_call_details.timeout
+        return time.monotonic() + timeout if timeout is not None else None
+
+    def _get_attempt_call_details(
+        self,
+        client_call_details: grpc.ClientCallDetails,
+        deadline: Optional[float],
+    ) -> grpc.ClientCallDetails:
+        """Returns the call details of an attempt with its remaining timeout.
+
+        Args:
+            client_call_details: An instance of grpc.ClientCallDetails.
+            deadline: an optional float of the time.monotonic() deadline of
+                all attempts.
+        """
+        if deadline is None:
+            return client_call_details
+
+        return self.get_client_call_details_instance(
+            client_call_details.method,
+            max(0.0, deadline - time.monotonic()),
+            client_call_details.metadata,
+            client_call_details.credentials,
+            getattr(client_call_details, "wait_for_ready", None),
+        )
+
+    def _get_failure(self, exception: Exception) -> Any:
+        """Returns the GoogleAdsFailure of a failed attempt, if it has one.
+
+        Failures with retryable statuses aren't converted to
+        GoogleAdsException instances by the exception interceptor, so their
+        GoogleAdsFailure is read from the trailing metadata here.
+        """
+        if isinstance(exception, GoogleAdsException):
+            return exception.failure
+
+        return self._get_google_ads_failure(
+            self.get_trailing_metadata_from_interceptor_exception(exception)
+        )
+
+    def _get_retry_delay(
+        self,
+        policy: RetryPolicy,
+        client_call_details: grpc.ClientCallDetails,
+        request: ProtobufMessageType,
+        exception: Exception,
+        attempt: int,
+        deadline: Optional[float],
+    ) -> Optional[float]:
+        """Returns how long to wait before retrying a failed attempt.
+
+        Args:
+            policy: the RetryPolicy of the request.
+            client_call_details: An instance of grpc.ClientCallDetails.
+            request: An instance of a request proto message.
+            exception: the Exception raised by the failed attempt.
+            attempt: an int of the number of times the request has been sent.
+            deadline: an optional float of the time.monotonic() deadline of
+                all attempts.
+
+        Returns:
+            A float of the seconds to wait before the next attempt, or None if
+            the request shouldn't be retried.
+        """
+        if not is_retryable(exception, policy.retryable_status_codes):
+            return None
+
+        service, method = _parse_method(client_call_details.method)
+        delay: Optional[float] = policy.get_retry_delay(
+            exception, attempt, method, self._get_failure(exception)
+        )
+
+        if delay is None or (
+            deadline is not None and time.monotonic() + delay >= deadline
+        ):
+            return None
+
+        if self.metrics is not None:
+            self.metrics.record_retry(
+                service, method, self._get_customer_id(request) or None
+            )
+
+        return delay
+
+    def intercept_unary_unary(
+        self,
+        continuation: ContinuationType,
+        client_call_details: grpc.ClientCallDetails,
+        request: ProtobufMessageType,
+    ) -> Union[grpc.Call, grpc.Future]:
+        """Intercepts and retries failed Unary-Unary requests.
+
+        Overrides abstract method defined in grpc.UnaryUnaryClientInterceptor.
+
+        Args:
+            continuation: a function to continue the request process.
+            client_call_details: a grpc._interceptor._ClientCallDetails
+                instance containing request metadata.
+            request: a SearchGoogleAdsRequest or SearchGoogleAdsStreamRequest
+                message class instance.
+
+        Returns:
+            A grpc.Call/grpc.Future instance representing a service response.
+        """
+        policy: Optional[RetryPolicy] = self._get_retry_policy()
+
+        if policy is None:
+            return continuation(client_call_details, request)
+
+        deadline: Optional[float] = self._get_deadline(client_call_details)
+        attempt: int = 0
+
+        while True:
+            attempt += 1
+            attempt_call_details: grpc.ClientCallDetails = (
+                self._get_attempt_call_details(client_call_details, deadline)
+            )
+
+            try:
+                response: grpc.Call = continuation(
+                    attempt_call_details, request
+                )
+            except Exception as exception:
+                # The exception interceptor raises failures as exceptions.
+                delay: Optional[float] = self._get_retry_delay(
+                    policy,
+                    client_call_details,
+                    request,
+                    exception,
+                    attempt,
+                    deadline,
+                )
+                if delay is None:
+                    raise
+            else:
+                response_exception: Optional[Exception] = response.exception()
+                if response_exception is None:
+                    policy.budget.record_success()
+                    return response
+
+                delay = self._get_retry_delay(
+                    policy,
+                    client_call_details,
+                    request,
+                    response_exception,
+                    attempt,
+                    deadline,
+                )
+                if delay is None:
+                    return response
+
+            time.sleep(delay)
+
+    def intercept_unary_stream(
+        self,
+        continuation: ContinuationType,
+        client_call_details: grpc.ClientCallDetails,
+        request: ProtobufMessageType,
+    ) -> Union[grpc.Call, grpc.Future]:
+        """Intercepts and retries Unary-Stream requests that fail to start.
+
+        Overrides abstract method defined in grpc.UnaryStreamClientInterceptor.
+
+        Args:
+            continuation: a function to continue the request process.
+            client_call_details: a grpc._interceptor._ClientCallDetails
+                instance containing request metadata.
+            request: a SearchGoogleAdsRequest or SearchGoogleAdsStreamRequest
+                message class instance.
+
+        Returns:
+            A grpc.Call/grpc.Future instance representing a service response.
+        """
+        policy: Optional[RetryPolicy] = self._get_retry_policy()
+
+        if policy is None:
+            return continuation(client_call_details, request)
+
+        deadline: Optional[float] = self._get_deadline(client_call_details)
+        attempt: int = 0
+
+        while True:
+            attempt += 1
+            attempt_call_details: grpc.ClientCallDetails = (
+                self._get_attempt_call_details(client_call_details, deadline)
+            )
+
+            try:
+                response: grpc.Call = continuation(
+                    attempt_call_details, request
+                )
+                first_message: Any = next(response, _NO_MESSAGE)
+            except Exception as exception:
+                delay: Optional[float] = self._get_retry_delay(
+                    policy,
+                    client_call_details,
+                    request,
+                    exception,
+                    attempt,
+                    deadline,
+                )
+                if delay is None:
+                    raise
+            else:
+                policy.budget.record_success()
+                return _PrefetchedUnaryStreamWrapper(response, first_message)
+
+            time.sleep(delay)
+
+
+class _AsyncPrefetchedUnaryStreamCall(grpc.aio.UnaryStreamCall):
+    """Returns the prefetched first response of a stream before the rest."""
+
+    def __init__(self, call: grpc.aio.Call, first_message: Any):
+        """Initializer for the _AsyncPrefetchedUnaryStreamCall class.
+
+        Args:
+            call: the stream the first response was read from.
+            first_message: the first response, or grpc.aio.EOF if the stream
+                was empty.
+        """
+        self._call: grpc.aio.Call = call
+        self._first_message: Any = first_message
+
+    def __aiter__(self):
+        async def _wrapped_aiter():
+            message = await self.read()
+            while message is not grpc.aio.EOF:
+                yield message
+                message = await self.read()
+
+        return _wrapped_aiter()
+
+    async def read(self):
+        if self._first_message is not _NO_MESSAGE:
+            message = self._first_message
+            self._first_message = _NO_MESSAGE
+            return message
+
+        return await self._call.read()
+
+    def cancel(self):
+        return self._call.cancel()
+
+    def cancelled(self):
+        return self._call.cancelled()
+
+    def done(self):
+        return self._call.done()
+
+    def add_done_callback(self, callback):
+        return self._call.add_done_callback(callback)
+
+    def code(self):
+        return self._call.code()
+
+    def details(self):
+        return self._call.details()
+
+    def initial_metadata(self):
+        return self._call.initial_metadata()
+
+    def trailing_metadata(self):
+        return self._call.trailing_metadata()
+
+    def time_remaining(self):
+        return self._call.time_remaining()
+
+    async def wait_for_connection(self):
+        return await self._call.wait_for_connection()
+
+
+class _AsyncRetryInterceptor(RetryInterceptor):
+    """An interceptor that retries failed async requests."""
+
+    async def intercept_unary_unary(
+        self,
+        continuation: ContinuationType,
+        client_call_details: grpc.ClientCallDetails,
+        request: ProtobufMessageType,
+    ) -> grpc.aio.UnaryUnaryCall:
+        """Intercepts and retries failed Unary-Unary requests.
+
+        Overrides abstract method defined in
+        grpc.aio.UnaryUnaryClientInterceptor.
+
+        Args:
+            continuation: a function to continue the request process.
+            client_call_details: a grpc.aio.ClientCallDetails instance
+                containing request metadata.
+            request: a request proto message class instance.
+
+        Returns:
+            The grpc.aio.UnaryUnaryCall of the last attempt.
+        """
+        policy: Optional[RetryPolicy] = self._get_retry_policy()
+
+        if policy is None:
+            return await continuation(client_call_details, request)
+
+        deadline: Optional[float] = self._get_deadline(client_call_details)
+        attempt: int = 0
+
+        while True:
+            attempt += 1
+            call = await continuation(
+                self._get_attempt_call_details(client_call_details, deadline),
+                request,
+            )
+
+            try:
+                await call
+            except Exception as exception:
+                delay: Optional[float] = self._get_retry_delay(
+                    policy,
+                    client_call_details,
+                    request,
+                    exception,
+                    attempt,
+                    deadline,
+                )
+                if delay is None:
+                    # Awaiting the call again raises the exception.
+                    return call
+            else:
+                policy.budget.record_success()
+                return call
+
+            await asyncio.sleep(delay)
+
+    async def intercept_unary_stream(
+        self,
+        continuation: ContinuationType,
+        client_call_details: grpc.ClientCallDetails,
+        request: ProtobufMessageType,
+    ) -> grpc.aio.UnaryStreamCall:
+        """Intercepts and retries Unary-Stream requests that fail to start.
+
+        Overrides abstract method defined in
+        grpc.aio.UnaryStreamClientInterceptor.
+
+        Args:
+            continuation: a function to continue the request process.
+            client_call_details: a grpc.aio.ClientCallDetails instance
+                containing request metadata.
+            request: a request proto message class instance.
+
+        Returns:
+            A grpc.aio.UnaryStreamCall of the last attempt.
+        """
+        policy: Optional[RetryPolicy] = self._get_retry_policy()
+
+        if policy is None:
+            return await continuation(client_call_details, request)
+
+        deadline: Optional[float] = self._get_deadline(client_call_details)
+        attempt: int = 0
+
+        while True:
+            attempt += 1
+            call = await continuation(
+                self._get_attempt_call_details(client_call_details, deadline),
+                request,
+            )
+
+            try:
+                first_message: Any = await call.read()
+            except Exception as exception:
+                delay: Optional[float] = self._get_retry_delay(
+                    policy,
+                    client_call_details,
+                    request,
+                    exception,
+                    attempt,
+                    deadline,
+                )
+                if delay is None:
+                    raise
+            else:
+                policy.budget.record_success()
+                return _AsyncPrefetchedUnaryStreamCall(call, first_message)
+
+            await asyncio.sleep(delay)
+
+
+class AsyncUnaryUnaryRetryInterceptor(
+    _AsyncRetryInterceptor,
+    grpc.aio.UnaryUnaryClientInterceptor,
+):
+    """An interceptor that retries failed Unary-Unary requests."""
+
+
+class AsyncUnaryStreamRetryInterceptor(
+    _AsyncRetryInterceptor,
+    grpc.aio.UnaryStreamClientInterceptor,
+):
+    """An interceptor that retries Unary-Stream requests that fail to start."""
+
+
+__all__ = [
+    "RetryInterceptor",
+    "AsyncUnaryUnaryRetryInterceptor",
+    "AsyncUnaryStreamRetryInterceptor",
+]
@@ -0,0 +1,217 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Lazy, on-demand importing of Google Ads API version packages.
+
+The __init__.py files of each API version package, i.e. "v23", and of its
+"actions", "common", "enums", "errors", "resources" and "services" packages and
+their "types" subpackages re-export every generated class. Importing any
+module inside a version therefore imports thousands of generated modules.
+
+When lazy imports are enabled these packages are created without running
+their __init__.py files. Instead each package gets a name-to-module index,
+generated from the relative imports in its __init__.py file, and a module
+level __getattr__ that imports the module that defines a name the first time
+that name is accessed. Lazy imports must be enabled before any API version
+package is imported, either by calling enable() or by setting the
+GOOGLE_ADS_LAZY_IMPORTS environment variable to "true".
+"""
+
+import ast
+import functools
+from importlib import import_module
+from importlib.abc import Loader, MetaPathFinder
+from importlib.machinery import ModuleSpec, PathFinder
+import os
+import re
+import sys
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+ENV_VARIABLE = "GOOGLE_ADS_LAZY_IMPORTS"
+_TRUE_EQUIVALENTS = ("y", "yes", "t", "true", "on", "1")
+
+# Matches the names of the packages that are loaded lazily, for example
+# "google.ads.googleads.v23", "google.ads.googleads.v23.enums" and
+# "google.ads.googleads.v23.resources.types".
+_LAZY_PACKAGE_PATTERN: re.Pattern = re.compile(
+    r"^google\.ads\.googleads\.(?P<version>v\d+)"
+    r"(\.(actions|common|enums|errors|resources|services)(\.types)?)?$"
+)
+
+# Maps an exported name to a tuple of the relative module that defines it and
+# the name of the attribute on that module. If the attribute is None then the
+# name refers to the module itself.
+IndexType = Dict[str, Tuple[str, Optional[str]]]
+
+
+@functools.lru_cache(maxsize=None)
+def build_index(init_path: str) -> Tuple[IndexType, Tuple[str, ...]]:
+    """Generates a name-to-module index from a package's __init__.py file.
+
+    Only relative imports are indexed, since those are what the generated
+    __init__.py files use to re-export names. For example the statement
+    "from .types.campaign import Campaign" is indexed as
+    {"Campaign": ("types.campaign", "Campaign"), "types": ("types", None)}.
+
+    Args:
+        init_path: a str path to the __init__.py file of a package.
+
+    Returns:
+        A tuple of the index and a tuple of the names in the package's
+        __all__ attribute.
+    """
+    with open(init_path, "rb") as handle:
+        tree: ast.Module = ast.parse(handle.read(), filename=init_path)
+
+    index: IndexType = {}
+    all_names: Tuple[str, ...] = ()
+
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom) and node.level == 1:
+            if node.module:
+                # The first part of the module path is a subpackage or module
+                # of this package, i.e. "types" in "types.campaign".
+                submodule: str = node.module.split(".")[0]
+                index.setdefault(submodule, (submodule, None))
+
+                for alias in node.names:
+                    index[alias.asname or alias.name] = (node.module, alias.name)
+            else:
+                # Statements like "from . import enums".
+                for alias in node.names:
+                    index[alias.asname or alias.name] = (alias.name, None)
+        elif isinstance(node, ast.Assign):
+            targets: List[str] = [
+                target.id
+                for target in node.targets
+                if isinstance(target, ast.Name)
+            ]
+            if "__all__" in targets:
+                all_names = tuple(ast.literal_eval(node.value))
+
+    return index, all_names
+
+
+def _make_getattr(module: ModuleType, index: IndexType) -> Callable[[str], Any]:
+    """Returns a module level __getattr__ function for a lazy package.
+
+    Args:
+        module: the lazy package module.
+        index: the name-to-module index of the package.
+
+    Returns:
+        A function that imports and returns the value of an exported name.
+    """
+    package_name: str = module.__name__
+    version: str = _LAZY_PACKAGE_PATTERN.match(package_name).group("version")
+
+    def __getattr__(name: str) -> Any:
+        if name == "__version__":
+            value: Any = import_module(
+                f"google.ads.googleads.{version}.gapic_version"
+            ).__version__
+        elif name in index:
+            module_path, attr = index[name]
+            imported: ModuleType = import_module(
+                f"{package_name}.{module_path}"
+            )
+            value: Any = imported if attr is None else getattr(imported, attr)
+        else:
+            # Raising AttributeError here lets statements such as
+            # "from package import submodule" fall back to a regular import
+            # of the submodule.
+            raise AttributeError(
+                f"module '{package_name}' has no attribute '{name}'"
+            )
+
+        # Caches the value on the module so this function is only called the
+        # first time a name is accessed.
+        setattr(module, name, value)
+        return value
+
+    return __getattr__
+
+
+class _LazyPackageLoader(Loader):
+    """Loads a package by indexing its __init__.py instead of running it."""
+
+    def __init__(self, origin: str) -> None:
+        self._origin: str = origin
+
+    def create_module(self, spec: ModuleSpec) -> Optional[ModuleType]:
+        # Returning None uses the default module creation semantics.
+        return None
+
+    def exec_module(self, module: ModuleType) -> None:
+        index, all_names = build_index(self._origin)
+        exported: List[str] = sorted(set(index) | set(all_names))
+
+        module.__all__ = all_names
+        module.__getattr__ = _make_getattr(module, index)
+        module.__dir__ = lambda: exported
+
+
+class _LazyPackageFinder(MetaPathFinder):
+    """Finds API version packages and gives them a lazy loader."""
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: Optional[Sequence[str]],
+        target: Optional[ModuleType] = None,
+    ) -> Optional[ModuleSpec]:
+        if not _LAZY_PACKAGE_PATTERN.match(fullname):
+            return None
+
+        spec: Optional[ModuleSpec] = PathFinder.find_spec(fullname, path)
+
+        if (
+            spec is None
+            or spec.origin is None
+            or spec.submodule_search_locations is None
+        ):
+            return None
+
+        spec.loader = _LazyPackageLoader(spec.origin)
+        return spec
+
+
+_finder: _LazyPackageFinder = _LazyPackageFinder()
+
+
+def enable() -> None:
+    """Enables lazy importing of API version packages.
+
+    Only packages that are imported after this function is called are loaded
+    lazily, so it should be called before a GoogleAdsClient is used.
+    """
+    if _finder not in sys.meta_path:
+        sys.meta_path.insert(0, _finder)
+
+
+def disable() -> None:
+    """Disables lazy importing for packages that haven't been imported yet."""
+    if _finder in sys.meta_path:
+        sys.meta_path.remove(_finder)
+
+
+def is_enabled() -> bool:
+    """Returns whether lazy importing of API version packages is enabled."""
+    return _finder in sys.meta_path
+
+
+def enable_from_env() -> None:
+    """Enables lazy imports if the GOOGLE_ADS_LAZY_IMPORTS env var is true."""
+    if os.environ.get(ENV_VARIABLE, "").lower() in _TRUE_EQUIVALENTS:
+        enable()
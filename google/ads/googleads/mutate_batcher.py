@@ -0,0 +1,568 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Sends an unbounded number of mutate operations in batched requests.
+
+The MutateBatcher class reads operations for a service's mutate method, such
+as CampaignService.mutate_campaigns or GoogleAdsService.mutate, from an
+iterable and packs them into requests that stay within a maximum number of
+operations and a maximum serialized size. The requests are sent concurrently
+on a bounded thread pool through the same service client, and therefore over
+the same pooled gRPC channels.
+
+When a request fails with a retryable status, all workers pause for an
+exponentially increasing, jittered delay, and the failed request is retried.
+By default only RESOURCE_EXHAUSTED requests are retried, since they weren't
+processed, so that operations are never applied twice. Results are yielded in
+the order of the operations, and only a bounded number of requests are held
+in memory at a time.
+
+Example:
+    batcher = MutateBatcher(client, "CampaignService", max_workers=8)
+    for result in batcher.mutate(customer_id, operations, partial_failure=True):
+        if not result.succeeded:
+            ...
+        elif result.has_partial_failure:
+            failures = result.get_partial_failure()
+            ...
+
+    print(batcher.stats.operations_per_second)
+"""
+
+from collections import deque
+from concurrent import futures
+from dataclasses import dataclass
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import grpc
+
+from google.ads.googleads.partial_failure import (
+    PartialFailureResult,
+    decode_partial_failure,
+)
+from google.ads.googleads.retry import (
+    Throttle,
+    get_backoff,
+    has_retry_policy,
+    is_retryable,
+)
+from google.ads.googleads.util import convert_proto_plus_to_protobuf
+
+# Well below the API's limit on the number of operations per request.
+_DEFAULT_MAX_OPERATIONS = 5000
+# The default maximum size of the messages gRPC servers receive.
+_DEFAULT_MAX_REQUEST_BYTES = 4 * 1024 * 1024
+# Room left for the fields of a request other than its operations.
+_REQUEST_OVERHEAD_BYTES = 1024
+_DEFAULT_MAX_WORKERS = 4
+_DEFAULT_MAX_RETRIES = 5
+_DEFAULT_INITIAL_BACKOFF = 1.0
+_DEFAULT_MAX_BACKOFF = 60.0
+# Statuses of mutate requests that weren't processed, so they're retried
+# without applying their operations twice.
+_DEFAULT_RETRYABLE_STATUS_CODES: Tuple[grpc.StatusCode, ...] = (
+    grpc.StatusCode.RESOURCE_EXHAUSTED,
+)
+# The operations of mutate requests are in an "operations" field, except for
+# the services listed here.
+_OPERATIONS_FIELDS: Dict[str, str] = {"GoogleAdsService": "mutate_operations"}
+
+
+def _get_varint_size(value: int) -> int:
+    """Returns the number of bytes of a value encoded as a protobuf varint."""
+    size: int = 1
+
+    while value > 0x7F:
+        value >>= 7
+        size += 1
+
+    return size
+
+
+def get_operation_size(operation: Any) -> int:
+    """Returns the number of bytes an operation adds to a serialized request.
+
+    Args:
+        operation: a proto-plus or protobuf operation message.
+    """
+    size: int = convert_proto_plus_to_protobuf(operation).ByteSize()
+    # The operations field has a single byte tag and a varint length.
+    return 1 + _get_varint_size(size) + size
+
+
+def _iter_chunks(
+    operations: Iterable[Any], max_operations: int, max_request_bytes: int
+) -> Iterator[Tuple[List[Any], int]]:
+    """Yields lists of operations along with their total serialized size."""
+    chunk: List[Any] = []
+    chunk_bytes: int = 0
+
+    for operation in operations:
+        size: int = get_operation_size(operation)
+
+        if chunk and (
+            len(chunk) >= max_operations
+            or chunk_bytes + size > max_request_bytes
+        ):
+            yield chunk, chunk_bytes
+            chunk = []
+            chunk_bytes = 0
+
+        chunk.append(operation)
+        chunk_bytes += size
+
+    if chunk:
+        yield chunk, chunk_bytes
+
+
+def chunk_operations(
+    operations: Iterable[Any],
+    max_operations: int = _DEFAULT_MAX_OPERATIONS,
+    max_request_bytes: int = _DEFAULT_MAX_REQUEST_BYTES,
+) -> Iterator[List[Any]]:
+    """Splits operations into lists that fit in a single mutate request.
+
+    Operations are read lazily, so the iterable can be a generator of an
+    unbounded number of operations. An operation that's larger than
+    max_request_bytes by itself is yielded in a list of its own, and will be
+    rejected by the API.
+
+    Args:
+        operations: an iterable of proto-plus or protobuf operation messages.
+        max_operations: an int of the maximum number of operations in a list.
+        max_request_bytes: an int of the maximum total serialized size of the
+            operations in a list.
+
+    Yields:
+        Lists of operations, in the order they were read.
+    """
+    for chunk, _ in _iter_chunks(
+        operations, max_operations, max_request_bytes
+    ):
+        yield chunk
+
+
+class MutateChunkResult:
+    """The outcome of a single batched mutate request."""
+
+    def __init__(
+        self,
+        index: int,
+        start: int,
+        operations: List[Any],
+        request_bytes: int,
+        response: Optional[Any] = None,
+        exception: Optional[Exception] = None,
+        attempts: int = 1,
+    ) -> None:
+        """Initializer for the MutateChunkResult class.
+
+        Args:
+            index: an int of the position of the request in the order it
+                was submitted.
+            start: an int of the position of the request's first operation
+                among all of the operations.
+            operations: a list of the operations of the request.
+            request_bytes: an int of the serialized size of the operations.
+            response: the mutate response message if the request succeeded.
+            exception: the Exception raised by the last attempt if the
+                request failed.
+            attempts: an int of the number of times the request was sent.
+        """
+        self.index: int = index
+        self.start: int = start
+        self.operations: List[Any] = operations
+        self.request_bytes: int = request_bytes
+        self.response: Optional[Any] = response
+        self.exception: Optional[Exception] = exception
+        self.attempts: int = attempts
+
+    @property
+    def succeeded(self) -> bool:
+        """Returns whether the request was processed by the API.
+
+        Requests sent with partial_failure=True succeed even when some of
+        their operations failed, see has_partial_failure.
+        """
+        return self.exception is None
+
+    @property
+    def has_partial_failure(self) -> bool:
+        """Returns whether some of the request's operations failed."""
+        if self.response is None:
+            return False
+
+        response_pb: Any = convert_proto_plus_to_protobuf(self.response)
+        return bool(response_pb.partial_failure_error.details)
+
+    def get_partial_failure(self) -> Optional[PartialFailureResult]:
+        """Returns the outcome of each of the request's operations.
+
+        The operation indexes of the result are relative to the request, so
+        the position of an operation among all of the operations is its
+        index plus start.
+
+        Returns:
+            A PartialFailureResult, or None if the request failed.
+        """
+        if self.response is None:
+            return None
+
+        return decode_partial_failure(self.response)
+
+    def __repr__(self) -> str:
+        return (
+            f"MutateChunkResult(index={self.index}, start={self.start}, "
+            f"operations={len(self.operations)}, "
+            f"succeeded={self.succeeded}, attempts={self.attempts})"
+        )
+
+
+@dataclass
+class MutateBatchStats:
+    """The throughput of a MutateBatcher.
+
+    Attributes:
+        requests: an int of the number of requests that completed.
+        failed_requests: an int of the number of requests that failed after
+            their last attempt.
+        retries: an int of the number of times requests were retried.
+        operations: an int of the number of operations in the requests that
+            completed.
+        failed_operations: an int of the number of operations in the
+            requests that failed. Operations that failed in requests that
+            succeeded with a partial failure aren't included.
+        request_bytes: an int of the serialized size of the operations in the
+            requests that completed.
+        elapsed: a float of the seconds spent in calls to mutate.
+    """
+
+    requests: int = 0
+    failed_requests: int = 0
+    retries: int = 0
+    operations: int = 0
+    failed_operations: int = 0
+    request_bytes: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def operations_per_second(self) -> float:
+        """The number of operations completed per second."""
+        return self.operations / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        """The number of serialized operation bytes sent per second."""
+        return self.request_bytes / self.elapsed if self.elapsed else 0.0
+
+
+class MutateBatcher:
+    """Sends batched mutate requests concurrently on a bounded thread pool."""
+
+    def __init__(
+        self,
+        client: Any,
+        service_name: str,
+        method_name: Optional[str] = None,
+        operations_field: Optional[str] = None,
+        max_operations: int = _DEFAULT_MAX_OPERATIONS,
+        max_request_bytes: int = _DEFAULT_MAX_REQUEST_BYTES,
+        max_workers: int = _DEFAULT_MAX_WORKERS,
+        max_retries: Optional[int] = None,
+        initial_backoff: float = _DEFAULT_INITIAL_BACKOFF,
+        max_backoff: float = _DEFAULT_MAX_BACKOFF,
+        version: Optional[str] = None,
+        retryable_status_codes: Sequence[
+            grpc.StatusCode
+        ] = _DEFAULT_RETRYABLE_STATUS_CODES,
+    ) -> None:
+        """Initializer for the MutateBatcher class.
+
+        Args:
+            client: an initialized GoogleAdsClient instance.
+            service_name: a str of the name of the service, e.g.
+                "CampaignService".
+            method_name: an optional str of the name of the service's mutate
+                method, e.g. "mutate_campaigns". By default it's the only
+                method of the service whose name starts with "mutate".
+            operations_field: an optional str of the name of the request's
+                field of operations. By default it's "mutate_operations" for
+                GoogleAdsService and "operations" for other services.
+            max_operations: an int of the maximum number of operations in a
+                request.
+            max_request_bytes: an int of the maximum serialized size of a
+                request.
+            max_workers: an int of the maximum number of concurrent requests.
+            max_retries: an optional int of the maximum number of times a
+                request that failed with a retryable status is retried.
+                Defaults to 5, or to 0 if the client has a retry_policy,
+                since its retry interceptor already retries failed requests,
+                and retrying them here too would multiply the attempts.
+            initial_backoff: a float of the number of seconds to wait after
+                the first retryable failure. The delay doubles with every
+                further retry of the same request.
+            max_backoff: a float of the maximum number of seconds to wait.
+            version: an optional str of the API version to use.
+            retryable_status_codes: a sequence of grpc.StatusCode values that
+                cause a request to be retried.
+
+        Raises:
+            ValueError: If a limit is less than one, max_retries is negative,
+                or the service doesn't have a single mutate method.
+        """
+        for name, value in (
+            ("max_operations", max_operations),
+            ("max_request_bytes", max_request_bytes),
+            ("max_workers", max_workers),
+        ):
+            if value < 1:
+                raise ValueError(
+                    f"{name} must be at least 1, but {value} was given."
+                )
+
+        if max_retries is None:
+            max_retries = (
+                0 if has_retry_policy(client) else _DEFAULT_MAX_RETRIES
+            )
+
+        if max_retries < 0:
+            raise ValueError(
+                f"max_retries must not be negative, but {max_retries} was "
+                "given."
+            )
+
+        kwargs: Dict[str, str] = {"version": version} if version else {}
+        self._service: Any = client.get_service(service_name, **kwargs)
+        self.method_name: str = method_name or self._get_mutate_method_name(
+            service_name
+        )
+        self._method: Callable[..., Any] = getattr(
+            self._service, self.method_name
+        )
+        self.operations_field: str = operations_field or (
+            _OPERATIONS_FIELDS.get(service_name, "operations")
+        )
+        self.max_operations: int = max_operations
+        self.max_request_bytes: int = max_request_bytes
+        self.max_workers: int = max_workers
+        self.max_retries: int = max_retries
+        self.initial_backoff: float = initial_backoff
+        self.max_backoff: float = max_backoff
+        self.retryable_status_codes: Tuple[grpc.StatusCode, ...] = tuple(
+            retryable_status_codes
+        )
+        self._throttle: Throttle = Throttle()
+        self._stats_lock: threading.Lock = threading.Lock()
+        self._stats: MutateBatchStats = MutateBatchStats()
+
+    def _get_mutate_method_name(self, service_name: str) -> str:
+        """Returns the name of the only mutate method of the service.
+
+        Raises:
+            ValueError: If the service doesn't have exactly one.
+        """
+        method_names: List[str] = [
+            name
+            for name in dir(type(self._service))
+            if name.startswith("mutate")
+        ]
+
+        if len(method_names) != 1:
+            raise ValueError(
+                f"{service_name} doesn't have a single mutate method, so a "
+                "method_name must be given."
+            )
+
+        return method_names[0]
+
+    @property
+    def stats(self) -> MutateBatchStats:
+        """A copy of the throughput of the requests sent so far."""
+        with self._stats_lock:
+            return MutateBatchStats(**self._stats.__dict__)
+
+    def reset_stats(self) -> None:
+        """Discards the throughput of the requests sent so far."""
+        with self._stats_lock:
+            self._stats = MutateBatchStats()
+
+    def is_retryable(self, exception: Exception) -> bool:
+        """Returns whether a request that raised an exception can be retried.
+
+        Args:
+            exception: the Exception raised by a request.
+        """
+        return is_retryable(exception, self.retryable_status_codes)
+
+    def get_backoff(self, retry: int) -> float:
+        """Returns the number of seconds to wait before a retry.
+
+        Args:
+            retry: an int of the retry number, starting at 1.
+        """
+        return get_backoff(retry, self.initial_backoff, self.max_backoff)
+
+    def _record(self, result: MutateChunkResult) -> None:
+        """Adds a completed request to the throughput stats."""
+        with self._stats_lock:
+            self._stats.requests += 1
+            self._stats.retries += result.attempts - 1
+            self._stats.operations += len(result.operations)
+            self._stats.request_bytes += result.request_bytes
+
+            if not result.succeeded:
+                self._stats.failed_requests += 1
+                self._stats.failed_operations += len(result.operations)
+
+    def _run_request(
+        self,
+        index: int,
+        start: int,
+        operations: List[Any],
+        request_bytes: int,
+        request: Dict[str, Any],
+    ) -> MutateChunkResult:
+        """Sends a single request, retrying it after retryable failures."""
+        attempts: int = 0
+
+        while True:
+            self._throttle.wait()
+            attempts += 1
+
+            try:
+                response: Any = self._method(
+                    request={**request, self.operations_field: operations}
+                )
+            except Exception as ex:
+                if attempts > self.max_retries or not self.is_retryable(ex):
+                    result: MutateChunkResult = MutateChunkResult(
+                        index,
+                        start,
+                        operations,
+                        request_bytes,
+                        exception=ex,
+                        attempts=attempts,
+                    )
+                    break
+
+                self._throttle.pause(self.get_backoff(attempts))
+                continue
+
+            result = MutateChunkResult(
+                index,
+                start,
+                operations,
+                request_bytes,
+                response=response,
+                attempts=attempts,
+            )
+            break
+
+        self._record(result)
+        return result
+
+    def mutate(
+        self,
+        customer_id: str,
+        operations: Iterable[Any],
+        **request_fields: Any,
+    ) -> Iterator[MutateChunkResult]:
+        """Sends operations in batched requests and yields results in order.
+
+        At most max_workers requests are in flight, and operations are read
+        from the given iterable lazily, so it can be a generator of a very
+        large number of operations. A result is only yielded once the
+        results of all of the requests before it have been, so a slow
+        request holds back the results after it, up to a bounded number of
+        requests. If the caller stops iterating, requests that haven't
+        started yet are cancelled.
+
+        Args:
+            customer_id: a str of the customer ID to send the requests for.
+            operations: an iterable of proto-plus or protobuf operation
+                messages of the service's mutate method.
+            **request_fields: other fields of the requests, such as
+                partial_failure, validate_only or response_content_type.
+
+        Yields:
+            MutateChunkResult instances in the order of their operations.
+        """
+        request: Dict[str, Any] = {"customer_id": customer_id, **request_fields}
+        max_operation_bytes: int = max(
+            1, self.max_request_bytes - _REQUEST_OVERHEAD_BYTES
+        )
+        chunks: Iterator[Tuple[int, Tuple[List[Any], int]]] = enumerate(
+            _iter_chunks(operations, self.max_operations, max_operation_bytes)
+        )
+        executor: futures.ThreadPoolExecutor = futures.ThreadPoolExecutor(
+            max_workers=self.max_workers
+        )
+        # Completed requests wait here until the requests before them have
+        # completed too, so twice as many requests as workers are kept.
+        in_flight: Deque[futures.Future] = deque()
+        max_in_flight: int = 2 * self.max_workers
+        next_start: int = 0
+        started_at: float = time.monotonic()
+
+        def submit() -> bool:
+            nonlocal next_start
+            chunk: Optional[Tuple[int, Tuple[List[Any], int]]] = next(
+                chunks, None
+            )
+
+            if chunk is None:
+                return False
+
+            index, (request_operations, request_bytes) = chunk
+            in_flight.append(
+                executor.submit(
+                    self._run_request,
+                    index,
+                    next_start,
+                    request_operations,
+                    request_bytes,
+                    request,
+                )
+            )
+            next_start += len(request_operations)
+            return True
+
+        try:
+            while len(in_flight) < max_in_flight and submit():
+                pass
+
+            while in_flight:
+                result: MutateChunkResult = in_flight.popleft().result()
+                submit()
+                yield result
+        finally:
+            for future in in_flight:
+                future.cancel()
+
+            executor.shutdown(wait=False)
+
+            with self._stats_lock:
+                self._stats.elapsed += time.monotonic() - started_at
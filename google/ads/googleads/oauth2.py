@@ -11,10 +11,34 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-"""A set of functions to help initialize OAuth2 credentials."""
+"""A set of functions to help initialize OAuth2 credentials.
 
+Access tokens are refreshed when credentials are initialized, and again by
+google-auth when they're about to expire, which blocks the request that's
+being sent at the time. A CredentialManager, which the client creates when
+it's configured with "token_refresh", refreshes them on a background thread
+or asyncio task before that happens.
 
+If a token cache path is configured, access tokens are also shared through
+a locked file by every process that uses the same credentials, so that only
+one of them requests a new token from the token endpoint when it expires.
+
+Refreshing a token sends a blocking HTTP request, so asyncio applications
+load credentials with get_credentials_async, which refreshes them in the
+event loop's default executor. Concurrent refreshes of the same credentials
+on an event loop share a single request.
+"""
+
+import asyncio
+import calendar
+import datetime
 import functools
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
 from requests import Session
 
 from google.oauth2.service_account import Credentials as ServiceAccountCreds
@@ -24,17 +48,488 @@ from google.auth.credentials import Credentials as CredentialsBaseClass
 from google.auth.transport.requests import Request
 
 from google.ads.googleads import config
+from google.ads.googleads.retry import get_backoff
+from google.ads.googleads.util import file_lock
+
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar, Union
 
-from typing import Any, Callable, TypeVar, Union
+_logger = logging.getLogger(__name__)
 
 _SERVICE_ACCOUNT_SCOPES: list[str] = [
     "https://www.googleapis.com/auth/adwords"
 ]
 _DEFAULT_TOKEN_URI: str = "https://accounts.google.com/o/oauth2/token"
+# google-auth refreshes tokens while sending a request once they expire in
+# less than about four minutes, so they're refreshed before that.
+_DEFAULT_REFRESH_MARGIN: float = 300.0
+_MIN_REFRESH_DELAY: float = 1.0
+_INITIAL_RETRY_DELAY: float = 1.0
+_MAX_RETRY_DELAY: float = 60.0
+
+# The refreshes in progress in refresh_async, by event loop and cache key.
+_PENDING_REFRESHES: Dict[
+    Tuple[asyncio.AbstractEventLoop, str], "asyncio.Future[Any]"
+] = {}
 
 F = TypeVar("F", bound=Callable[..., Any])
 
 
+def _get_request(http_proxy: Union[str, None] = None) -> Request:
+    """Returns a transport request used to refresh credentials.
+
+    Args:
+        http_proxy: An optional str of the http proxy to refresh through.
+    """
+    # If the configs contain an http_proxy, refresh credentials through the
+    # proxy URI
+    if http_proxy:
+        session: Session = Session()
+        session.proxies.update({"http": http_proxy, "https": http_proxy})
+        return Request(session=session)
+
+    return Request()
+
+
+def get_cache_key(credentials: CredentialsBaseClass) -> Optional[str]:
+    """Returns the key that identifies the tokens of credentials in a cache.
+
+    The key is a hash, so that secrets aren't stored in the cache.
+
+    Args:
+        credentials: An instance of auth.credentials.Credentials.
+
+    Returns:
+        A str of the key, or None if the credentials' tokens can't be shared.
+    """
+    if isinstance(credentials, InstalledAppCredentials):
+        identity: str = (
+            f"{credentials.client_id}:{credentials.refresh_token}:"
+            f"{credentials.token_uri}"
+        )
+    elif isinstance(credentials, ServiceAccountCreds):
+        identity = (
+            f"{credentials.service_account_email}:"
+            f"{getattr(credentials, '_subject', None)}:"
+            f"{sorted(credentials.scopes or [])}"
+        )
+    else:
+        return None
+
+    return hashlib.sha256(identity.encode()).hexdigest()
+
+
+def _refresh(
+    credentials: CredentialsBaseClass,
+    http_proxy: Union[str, None] = None,
+    token_cache_path: Union[str, None] = None,
+) -> None:
+    """Refreshes credentials, or reads a token from a token cache.
+
+    Args:
+        credentials: An instance of auth.credentials.Credentials.
+        http_proxy: An optional str of the http proxy to refresh through.
+        token_cache_path: An optional str of the path of a TokenCache file.
+    """
+    request: Request = _get_request(http_proxy)
+
+    # If the configs contain a token cache, a token cached by another
+    # process is used instead of requesting a new one.
+    if token_cache_path:
+        TokenCache(token_cache_path).refresh(credentials, request)
+    else:
+        credentials.refresh(request)
+
+
+async def refresh_async(
+    credentials: CredentialsBaseClass,
+    http_proxy: Union[str, None] = None,
+    token_cache_path: Union[str, None] = None,
+) -> None:
+    """Refreshes credentials without blocking the running event loop.
+
+    The credentials are refreshed in the loop's default executor. While
+    credentials are being refreshed, other credentials with the same cache
+    key, see get_cache_key, wait for that refresh and are given its token
+    instead of sending their own request.
+
+    Args:
+        credentials: An instance of auth.credentials.Credentials.
+        http_proxy: An optional str of the http proxy to refresh through.
+        token_cache_path: An optional str of the path of a TokenCache file.
+    """
+    loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+    key: Optional[str] = get_cache_key(credentials)
+    pending: Optional[asyncio.Future] = (
+        _PENDING_REFRESHES.get((loop, key)) if key else None
+    )
+
+    if pending is not None:
+        # The refresh is shielded so that cancelling one of the callers
+        # doesn't cancel it for the others.
+        token, expiry = await asyncio.shield(pending)
+        credentials.token = token
+        credentials.expiry = expiry
+        return
+
+    async def run() -> Tuple[Any, Optional[datetime.datetime]]:
+        await loop.run_in_executor(
+            None,
+            functools.partial(
+                _refresh, credentials, http_proxy, token_cache_path
+            ),
+        )
+        return credentials.token, credentials.expiry
+
+    future: asyncio.Future = asyncio.ensure_future(run())
+
+    if key:
+        _PENDING_REFRESHES[(loop, key)] = future
+        future.add_done_callback(
+            lambda _: _PENDING_REFRESHES.pop((loop, key), None)
+        )
+
+    await asyncio.shield(future)
+
+
+def _get_expiry_timestamp(expiry: datetime.datetime) -> float:
+    """Returns the timestamp of the naive UTC expiry of a token."""
+    return calendar.timegm(expiry.utctimetuple()) + expiry.microsecond / 1e6
+
+
+class TokenCache:
+    """Shares access tokens between processes through a locked JSON file.
+
+    The file is locked while a token is read and refreshed, so when the
+    token of credentials that several processes share expires, the first
+    process refreshes it and the others read the new token from the file.
+    """
+
+    def __init__(self, path: str):
+        """Initializer for the TokenCache class.
+
+        Args:
+            path: A str of the path of the file. It's created, readable only
+                by its owner, if it doesn't exist.
+        """
+        self.path: str = os.path.expanduser(path)
+
+    def refresh(
+        self,
+        credentials: CredentialsBaseClass,
+        request: Request,
+        refresh_margin: float = _DEFAULT_REFRESH_MARGIN,
+    ) -> None:
+        """Sets a token on credentials that won't expire for a while.
+
+        The cached token is used if it expires in more than refresh_margin
+        seconds. Otherwise the credentials are refreshed and their new token
+        is cached.
+
+        Args:
+            credentials: An instance of auth.credentials.Credentials.
+            request: A transport request used to refresh the credentials.
+            refresh_margin: A float of the minimum number of seconds until
+                a cached token expires for it to be used.
+        """
+        key: Optional[str] = get_cache_key(credentials)
+
+        if key is None:
+            credentials.refresh(request)
+            return
+
+        file_descriptor: int = os.open(
+            self.path, os.O_RDWR | os.O_CREAT, 0o600
+        )
+
+        with os.fdopen(file_descriptor, "r+") as file, file_lock(file):
+            file.seek(0)
+            contents: str = file.read()
+
+            try:
+                tokens: Dict[str, Dict[str, Any]] = (
+                    json.loads(contents) if contents else {}
+                )
+            except json.JSONDecodeError:
+                # A process stopped while writing the file, so the tokens are
+                # refreshed again.
+                tokens = {}
+
+            now: float = time.time()
+            entry: Optional[Dict[str, Any]] = tokens.get(key)
+
+            if entry and entry["expiry"] - now > refresh_margin:
+                credentials.token = entry["token"]
+                credentials.expiry = datetime.datetime.fromtimestamp(
+                    entry["expiry"], datetime.timezone.utc
+                ).replace(tzinfo=None)
+                return
+
+            credentials.refresh(request)
+            tokens = {
+                token_key: token
+                for token_key, token in tokens.items()
+                if token["expiry"] > now
+            }
+
+            if credentials.expiry is not None:
+                tokens[key] = {
+                    "token": credentials.token,
+                    "expiry": _get_expiry_timestamp(credentials.expiry),
+                }
+
+            file.seek(0)
+            file.truncate()
+            json.dump(tokens, file)
+            file.flush()
+
+
+class CredentialManager:
+    """Refreshes the access token of credentials before it expires."""
+
+    def __init__(
+        self,
+        credentials: CredentialsBaseClass,
+        refresh_margin: float = _DEFAULT_REFRESH_MARGIN,
+        cache_path: Union[str, None] = None,
+        http_proxy: Union[str, None] = None,
+    ):
+        """Initializer for the CredentialManager class.
+
+        Args:
+            credentials: An instance of auth.credentials.Credentials.
+            refresh_margin: A float of the number of seconds before the token
+                expires that it's refreshed.
+            cache_path: An optional str of the path of a TokenCache file
+                shared with other processes.
+            http_proxy: An optional str of the http proxy to refresh through.
+
+        Raises:
+            ValueError: If refresh_margin is negative.
+        """
+        if refresh_margin < 0:
+            raise ValueError(
+                "refresh_margin must not be negative, but "
+                f"{refresh_margin} was given."
+            )
+
+        self.credentials: CredentialsBaseClass = credentials
+        self.refresh_margin: float = refresh_margin
+        self.token_cache: Optional[TokenCache] = (
+            TokenCache(cache_path) if cache_path else None
+        )
+        self.http_proxy: Union[str, None] = http_proxy
+        self._init_state()
+
+    def _init_state(self) -> None:
+        """Initializes the state that isn't pickled."""
+        self._lock: threading.Lock = threading.Lock()
+        self._stopped: threading.Event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def from_dict(
+        cls,
+        credentials: CredentialsBaseClass,
+        config: Dict[str, Any],
+        http_proxy: Union[str, None] = None,
+    ) -> "CredentialManager":
+        """Creates a CredentialManager from a configuration dict.
+
+        Args:
+            credentials: An instance of auth.credentials.Credentials.
+            config: A dict with the optional "refresh_margin" and
+                "cache_path" keys.
+            http_proxy: An optional str of the http proxy to refresh through.
+
+        Raises:
+            ValueError: If the configuration is invalid.
+        """
+        unknown_keys: set = set(config) - {"refresh_margin", "cache_path"}
+
+        if unknown_keys:
+            raise ValueError(
+                "The token_refresh configuration has unknown keys: "
+                f"{sorted(unknown_keys)}."
+            )
+
+        try:
+            refresh_margin: float = float(
+                config.get("refresh_margin", _DEFAULT_REFRESH_MARGIN)
+            )
+        except (TypeError, ValueError):
+            raise ValueError(
+                "The token_refresh configuration's refresh_margin must be a "
+                f"number, but {config['refresh_margin']!r} was given."
+            )
+
+        return cls(
+            credentials,
+            refresh_margin=refresh_margin,
+            cache_path=config.get("cache_path"),
+            http_proxy=http_proxy,
+        )
+
+    @property
+    def running(self) -> bool:
+        """Whether the token is being refreshed in the background."""
+        return (self._thread is not None and self._thread.is_alive()) or (
+            self._task is not None and not self._task.done()
+        )
+
+    def get_refresh_delay(self) -> float:
+        """Returns the number of seconds until the token should be refreshed."""
+        expiry: Optional[datetime.datetime] = self.credentials.expiry
+
+        if expiry is None:
+            # Tokens without an expiry don't need to be refreshed, unless
+            # there isn't one yet.
+            return self.refresh_margin if self.credentials.token else 0.0
+
+        return max(
+            _MIN_REFRESH_DELAY,
+            _get_expiry_timestamp(expiry) - time.time() - self.refresh_margin,
+        )
+
+    def refresh(self) -> None:
+        """Refreshes the token, or reads a newer one from the token cache."""
+        with self._lock:
+            request: Request = _get_request(self.http_proxy)
+
+            if self.token_cache is not None:
+                self.token_cache.refresh(
+                    self.credentials, request, self.refresh_margin
+                )
+            else:
+                self.credentials.refresh(request)
+
+    def _refresh_in_background(self) -> bool:
+        """Refreshes the token, logging instead of raising failures.
+
+        Returns:
+            A bool of whether the token was refreshed.
+        """
+        try:
+            self.refresh()
+        except Exception:
+            # The token is refreshed again after a delay, or by google-auth
+            # when a request is sent if it expires first.
+            _logger.warning(
+                "Failed to refresh the OAuth2 access token.", exc_info=True
+            )
+            return False
+
+        return True
+
+    def _get_next_delay(self, failures: int) -> float:
+        """Returns the seconds to wait before the next refresh."""
+        if failures:
+            return get_backoff(failures, _INITIAL_RETRY_DELAY, _MAX_RETRY_DELAY)
+
+        return self.get_refresh_delay()
+
+    def _run(self) -> None:
+        """Refreshes the token before it expires until stopped."""
+        failures: int = 0
+
+        while not self._stopped.wait(self._get_next_delay(failures)):
+            failures = 0 if self._refresh_in_background() else failures + 1
+
+    async def _run_async(self) -> None:
+        """Refreshes the token before it expires until cancelled."""
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        failures: int = 0
+
+        while not self._stopped.is_set():
+            await asyncio.sleep(self._get_next_delay(failures))
+            # Refreshing sends a blocking HTTP request, so it's run in the
+            # loop's default executor.
+            refreshed: bool = await loop.run_in_executor(
+                None, self._refresh_in_background
+            )
+            failures = 0 if refreshed else failures + 1
+
+    def start(self) -> None:
+        """Starts refreshing the token on a background daemon thread.
+
+        Raises:
+            RuntimeError: If the token is already being refreshed.
+        """
+        if self.running:
+            raise RuntimeError("The credential manager is already running.")
+
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="google-ads-credential-manager",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def start_async(self) -> asyncio.Task:
+        """Starts refreshing the token on a task of the running event loop.
+
+        Returns:
+            The asyncio.Task that refreshes the token, which is cancelled by
+            stop.
+
+        Raises:
+            RuntimeError: If the token is already being refreshed, or there's
+                no running event loop.
+        """
+        if self.running:
+            raise RuntimeError("The credential manager is already running.")
+
+        self._stopped.clear()
+        self._task = asyncio.get_running_loop().create_task(
+            self._run_async()
+        )
+        return self._task
+
+    def stop(self) -> None:
+        """Stops refreshing the token in the background."""
+        self._stopped.set()
+
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+        self._thread = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Returns self serialized as a dict.
+
+        Threads, tasks and locks can't be pickled, so they're left out. A
+        manager that was refreshing on a thread starts a new one when it's
+        unpickled.
+
+        Returns:
+            a dict of this object's state
+        """
+        state: Dict[str, Any] = {
+            key: value
+            for key, value in self.__dict__.items()
+            if key not in ("_lock", "_stopped", "_thread", "_task")
+        }
+        state["_restart"] = (
+            self._thread is not None and self._thread.is_alive()
+        )
+        return state
+
+    def __setstate__(self, d: Dict[str, Any]) -> None:
+        """Deserializes self with the given dictionary.
+
+        Args:
+            d: a dict of this object's state
+        """
+        restart: bool = d.pop("_restart", False)
+        self.__dict__.update(d)
+        self._init_state()
+
+        if restart:
+            self.start()
+
+
 def _initialize_credentials_decorator(func: F) -> F:
     """A decorator used to easily initialize credentials objects.
 
@@ -44,16 +539,17 @@ def _initialize_credentials_decorator(func: F) -> F:
 
     @functools.wraps(func)
     def initialize_credentials_wrapper(*args: Any, **kwargs: Any) -> Any:
+        # Credentials that are refreshed later, such as by
+        # get_credentials_async, are created with refresh=False.
+        refresh: bool = kwargs.pop("refresh", True)
         credentials: Union[InstalledAppCredentials, ServiceAccountCreds] = func(*args, **kwargs)
-        # If the configs contain an http_proxy, refresh credentials through the
-        # proxy URI
-        proxy: Union[str, None] = kwargs.get("http_proxy")
-        if proxy:
-            session: Session = Session()
-            session.proxies.update({"http": proxy, "https": proxy})
-            credentials.refresh(Request(session=session))
-        else:
-            credentials.refresh(Request())
+
+        if refresh:
+            _refresh(
+                credentials,
+                kwargs.get("http_proxy"),
+                kwargs.get("token_cache_path"),
+            )
         return credentials
 
     return initialize_credentials_wrapper
@@ -66,6 +562,7 @@ def get_installed_app_credentials(
     refresh_token: str,
     http_proxy: Union[str, None] = None,
     token_uri: str = _DEFAULT_TOKEN_URI,
+    token_cache_path: Union[str, None] = None,
 ) -> InstalledAppCredentials:
     """Creates and returns an instance of oauth2.credentials.Credentials.
 
@@ -75,6 +572,7 @@ def get_installed_app_credentials(
         refresh_token: A str of the oauth2 refresh_token from configuration.
         http_proxy: An optional str of the http proxy.
         token_uri: An optional str of the token URI.
+        token_cache_path: An optional str of the path of a TokenCache file.
 
     Returns:
         An instance of oauth2.credentials.Credentials
@@ -94,6 +592,7 @@ def get_service_account_credentials(
     subject: str,
     http_proxy: Union[str, None] = None,
     scopes: list[str] = _SERVICE_ACCOUNT_SCOPES,
+    token_cache_path: Union[str, None] = None,
 ) -> ServiceAccountCreds:
     """Creates and returns an instance of oauth2.service_account.Credentials.
 
@@ -102,6 +601,7 @@ def get_service_account_credentials(
         subject: A str of the email address of the delegated account.
         http_proxy: An optional str of the http proxy.
         scopes: A list of additional scopes.
+        token_cache_path: An optional str of the path of a TokenCache file.
 
     Returns:
         An instance of oauth2.credentials.Credentials
@@ -127,11 +627,20 @@ def get_application_default_credentials(
     return credentials
 
 
-def get_credentials(config_data: dict[str, Any]) -> CredentialsBaseClass:
+def _get_token_cache_path(config_data: dict[str, Any]) -> Union[str, None]:
+    """Returns the path of the token cache of a configuration, if any."""
+    return (config_data.get("token_refresh") or {}).get("cache_path")
+
+
+def get_credentials(
+    config_data: dict[str, Any], refresh: bool = True
+) -> CredentialsBaseClass:
     """Decides which type of credentials to return based on the given config.
 
     Args:
         config_data: a dict containing client configuration.
+        refresh: a bool of whether the credentials are refreshed before
+            they're returned.
 
     Returns:
         An initialized credentials instance.
@@ -143,9 +652,19 @@ def get_credentials(config_data: dict[str, Any]) -> CredentialsBaseClass:
         str, ...
     ] = config.get_oauth2_required_service_account_keys()
 
+    # A token cached by other processes is used instead of requesting a new
+    # one, see TokenCache.
+    cache_kwargs: dict[str, Any] = {}
+    token_cache_path: Union[str, None] = _get_token_cache_path(config_data)
+
+    if token_cache_path:
+        cache_kwargs["token_cache_path"] = token_cache_path
+
+    refresh_kwargs: dict[str, Any] = {} if refresh else {"refresh": False}
+
     if config_data.get("use_application_default_credentials"):
         # Using Application Default Credentials
-        return get_application_default_credentials()
+        return get_application_default_credentials(**refresh_kwargs)
     if all(key in config_data for key in required_installed_app_keys):
         # Using the Installed App Flow
         return get_installed_app_credentials(
@@ -153,6 +672,8 @@ def get_credentials(config_data: dict[str, Any]) -> CredentialsBaseClass:
             config_data.get("client_secret"),
             config_data.get("refresh_token"),
             http_proxy=config_data.get("http_proxy"),
+            **cache_kwargs,
+            **refresh_kwargs,
         )
     elif all(key in config_data for key in required_service_account_keys):
         # Using the Service Account Flow
@@ -160,6 +681,8 @@ def get_credentials(config_data: dict[str, Any]) -> CredentialsBaseClass:
             config_data.get("json_key_file_path"),
             config_data.get("impersonated_email"),
             http_proxy=config_data.get("http_proxy"),
+            **cache_kwargs,
+            **refresh_kwargs,
         )
     else:
         raise ValueError(
@@ -170,3 +693,35 @@ def get_credentials(config_data: dict[str, Any]) -> CredentialsBaseClass:
                 required_installed_app_keys, required_service_account_keys
             )
         )
+
+
+async def get_credentials_async(
+    config_data: dict[str, Any]
+) -> CredentialsBaseClass:
+    """Returns credentials without blocking the running event loop.
+
+    The credentials are created, which reads key files, in the loop's
+    default executor, and are then refreshed with refresh_async.
+
+    Args:
+        config_data: a dict containing client configuration.
+
+    Returns:
+        An initialized credentials instance.
+    """
+    loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+    credentials: CredentialsBaseClass = await loop.run_in_executor(
+        None, functools.partial(get_credentials, config_data, refresh=False)
+    )
+    # Like in get_credentials, Application Default Credentials aren't
+    # refreshed through the proxy or shared through the token cache.
+    if config_data.get("use_application_default_credentials"):
+        await refresh_async(credentials)
+    else:
+        await refresh_async(
+            credentials,
+            http_proxy=config_data.get("http_proxy"),
+            token_cache_path=_get_token_cache_path(config_data),
+        )
+
+    return credentials
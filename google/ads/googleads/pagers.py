@@ -0,0 +1,554 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Pagers that make GoogleAdsService search requests resilient and faster.
+
+The SearchPager classes generated for each API version request the next page
+of results in a plain loop, so an error on any page ends the iteration and
+all progress is lost. The CheckpointedSearchPager class in this module records
+a Checkpoint of its progress, the page token of the current page and the
+number of rows consumed from it, retries transient page failures in place,
+and can save the checkpoint to a local file so that a long export can be
+resumed after a restart without downloading the pages it already has.
+
+The generated pagers also only request the next page once the caller has
+consumed the current one, so the time spent waiting for the network and the
+time spent processing rows add up. The PrefetchingSearchPager and
+PrefetchingSearchAsyncPager classes wrap a generated pager and request the
+following pages on a background thread or task while the caller processes
+the current page.
+"""
+
+import asyncio
+import json
+import os
+import queue
+import threading
+import time
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import grpc
+
+from google.ads.googleads import retry
+
+_DEFAULT_MAX_RETRIES = 5
+_DEFAULT_INITIAL_BACKOFF = 1.0
+_DEFAULT_MAX_BACKOFF = 60.0
+_DEFAULT_PREFETCH_DEPTH = 1
+# The number of seconds the prefetch thread waits for space in its queue
+# before checking whether the caller stopped iterating.
+_PREFETCH_POLL_INTERVAL = 0.1
+# Marks the end of the pages in a prefetch queue.
+_END_OF_PAGES = object()
+
+
+class Checkpoint:
+    """The position of a paged search in its results.
+
+    Page tokens returned by the API expire after a while, so a checkpoint can
+    only be resumed for a limited time after it was saved.
+    """
+
+    def __init__(
+        self,
+        customer_id: str,
+        query: str,
+        page_token: str = "",
+        page_row_offset: int = 0,
+        rows_consumed: int = 0,
+        completed: bool = False,
+    ) -> None:
+        """Initializer for the Checkpoint class.
+
+        Args:
+            customer_id: a str of the customer ID of the search.
+            query: a str of the GAQL query of the search.
+            page_token: a str of the token of the page currently being
+                consumed, or an empty str for the first page.
+            page_row_offset: an int of the number of rows of the current page
+                that were consumed.
+            rows_consumed: an int of the total number of rows consumed.
+            completed: a bool of whether every row was consumed.
+        """
+        self.customer_id: str = customer_id
+        self.query: str = query
+        self.page_token: str = page_token
+        self.page_row_offset: int = page_row_offset
+        self.rows_consumed: int = rows_consumed
+        self.completed: bool = completed
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Checkpoint):
+            return NotImplemented
+
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        return f"Checkpoint({self.to_dict()!r})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns a JSON serializable dict of the checkpoint."""
+        return {
+            "customer_id": self.customer_id,
+            "query": self.query,
+            "page_token": self.page_token,
+            "page_row_offset": self.page_row_offset,
+            "rows_consumed": self.rows_consumed,
+            "completed": self.completed,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Checkpoint":
+        """Creates a checkpoint from a dict returned by to_dict.
+
+        Args:
+            data: a dict of checkpoint fields.
+
+        Returns:
+            A new Checkpoint instance.
+        """
+        return cls(**data)
+
+    def save(self, path: str) -> None:
+        """Writes the checkpoint to a JSON file.
+
+        The file is written to a temporary path and then renamed, so an
+        existing checkpoint is never left partially written.
+
+        Args:
+            path: a str path of the checkpoint file.
+        """
+        temporary_path: str = f"{path}.tmp"
+
+        with open(temporary_path, "w") as handle:
+            json.dump(self.to_dict(), handle)
+
+        os.replace(temporary_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> Optional["Checkpoint"]:
+        """Reads a checkpoint from a JSON file.
+
+        Args:
+            path: a str path of the checkpoint file.
+
+        Returns:
+            A Checkpoint instance, or None if the file doesn't exist.
+        """
+        if not os.path.exists(path):
+            return None
+
+        with open(path, "r") as handle:
+            return cls.from_dict(json.load(handle))
+
+
+class CheckpointedSearchPager:
+    """Iterates over the rows of a paged search, recording its progress.
+
+    A row is counted as consumed once the next row has been requested, so a
+    row that was being processed when the program stopped is yielded again
+    when the search is resumed.
+
+    Example:
+        pager = CheckpointedSearchPager(
+            googleads_service,
+            customer_id,
+            query,
+            checkpoint_path="export.checkpoint",
+        )
+        for row in pager:
+            ...
+    """
+
+    def __init__(
+        self,
+        service: Any,
+        customer_id: Optional[str] = None,
+        query: Optional[str] = None,
+        checkpoint: Optional[Checkpoint] = None,
+        checkpoint_path: Optional[str] = None,
+        max_retries: int = _DEFAULT_MAX_RETRIES,
+        initial_backoff: float = _DEFAULT_INITIAL_BACKOFF,
+        max_backoff: float = _DEFAULT_MAX_BACKOFF,
+        retryable_status_codes: Sequence[
+            grpc.StatusCode
+        ] = retry.RETRYABLE_STATUS_CODES,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """Initializer for the CheckpointedSearchPager class.
+
+        Args:
+            service: a GoogleAdsServiceClient instance.
+            customer_id: a str customer ID. Optional if a checkpoint is given
+                or loaded from checkpoint_path.
+            query: a str GAQL query. Optional if a checkpoint is given or
+                loaded from checkpoint_path.
+            checkpoint: an optional Checkpoint to resume from.
+            checkpoint_path: an optional str path of a file that the
+                checkpoint is saved to after every page. If the file exists
+                and no checkpoint is given, the search resumes from it.
+            max_retries: an int of the maximum number of times a page request
+                that failed with a retryable status is retried.
+            initial_backoff: a float of the number of seconds to wait before
+                the first retry of a page. The delay doubles with every
+                further retry.
+            max_backoff: a float of the maximum number of seconds to wait.
+            retryable_status_codes: a sequence of grpc.StatusCode values that
+                cause a page request to be retried.
+            timeout: an optional float of the timeout of each page request.
+
+        Raises:
+            ValueError: If there's no checkpoint and no customer ID or query,
+                or the checkpoint is for a different search.
+        """
+        if checkpoint is None and checkpoint_path is not None:
+            checkpoint = Checkpoint.load(checkpoint_path)
+
+        if checkpoint is None:
+            if not customer_id or not query:
+                raise ValueError(
+                    "A customer_id and query are required when not resuming "
+                    "from a checkpoint."
+                )
+            checkpoint = Checkpoint(customer_id, query)
+        elif (customer_id and customer_id != checkpoint.customer_id) or (
+            query and query != checkpoint.query
+        ):
+            raise ValueError(
+                "The checkpoint is for a different customer ID or query."
+            )
+
+        self._service: Any = service
+        self.checkpoint: Checkpoint = checkpoint
+        self.checkpoint_path: Optional[str] = checkpoint_path
+        self.max_retries: int = max_retries
+        self.initial_backoff: float = initial_backoff
+        self.max_backoff: float = max_backoff
+        self.retryable_status_codes: Sequence[grpc.StatusCode] = (
+            retryable_status_codes
+        )
+        self._timeout: Optional[float] = timeout
+
+    def save_checkpoint(self) -> None:
+        """Saves the current checkpoint to checkpoint_path, if it's set."""
+        if self.checkpoint_path is not None:
+            self.checkpoint.save(self.checkpoint_path)
+
+    def _fetch_page(self, page_token: str) -> Any:
+        """Requests a single page of results, retrying transient failures.
+
+        Args:
+            page_token: a str of the page token, or "" for the first page.
+
+        Returns:
+            A SearchGoogleAdsResponse message.
+        """
+        request: Dict[str, str] = {
+            "customer_id": self.checkpoint.customer_id,
+            "query": self.checkpoint.query,
+            "page_token": page_token,
+        }
+        kwargs: Dict[str, Any] = (
+            {"timeout": self._timeout} if self._timeout is not None else {}
+        )
+        retries: int = 0
+
+        while True:
+            try:
+                # The generated pager returned by search holds the first page
+                # it requested and only sends further requests if iterated.
+                return next(
+                    iter(self._service.search(request=request, **kwargs).pages)
+                )
+            except Exception as ex:
+                if retries >= self.max_retries or not retry.is_retryable(
+                    ex, self.retryable_status_codes
+                ):
+                    raise
+
+                retries += 1
+                time.sleep(
+                    retry.get_backoff(
+                        retries, self.initial_backoff, self.max_backoff
+                    )
+                )
+
+    @property
+    def pages(self) -> Iterator[Any]:
+        """Yields each remaining page of results.
+
+        The checkpoint is advanced to the next page, and saved, when the next
+        page is requested. Pages are yielded whole, including rows consumed
+        before the checkpoint was saved.
+        """
+        checkpoint: Checkpoint = self.checkpoint
+
+        while not checkpoint.completed:
+            page: Any = self._fetch_page(checkpoint.page_token)
+            yield page
+            self._advance(page, len(page.results))
+
+    def _advance(self, page: Any, row_count: int) -> None:
+        """Moves the checkpoint past a fully consumed page and saves it."""
+        checkpoint: Checkpoint = self.checkpoint
+        checkpoint.rows_consumed += row_count - checkpoint.page_row_offset
+        checkpoint.page_row_offset = 0
+
+        if page.next_page_token:
+            checkpoint.page_token = page.next_page_token
+        else:
+            checkpoint.completed = True
+
+        self.save_checkpoint()
+
+    def __iter__(self) -> Iterator[Any]:
+        checkpoint: Checkpoint = self.checkpoint
+
+        try:
+            while not checkpoint.completed:
+                page: Any = self._fetch_page(checkpoint.page_token)
+                rows: Sequence[Any] = page.results
+
+                for index in range(checkpoint.page_row_offset, len(rows)):
+                    yield rows[index]
+                    # The caller asked for the next row, so this one is done.
+                    checkpoint.page_row_offset = index + 1
+                    checkpoint.rows_consumed += 1
+
+                self._advance(page, len(rows))
+        finally:
+            # Records the rows consumed from a partially read page if the
+            # iteration stops early or a page request fails.
+            if not checkpoint.completed:
+                self.save_checkpoint()
+
+
+def _check_depth(depth: int) -> None:
+    if depth < 1:
+        raise ValueError(f"depth must be at least 1, but {depth} was given.")
+
+
+class PrefetchingSearchPager:
+    """Wraps a SearchPager to request pages ahead of the caller.
+
+    A background thread requests up to depth pages beyond the page the
+    caller is processing, so at most depth + 1 pages are held in memory.
+    Errors raised while requesting a page are raised to the caller when it
+    reaches that page. The wrapped pager is iterated by the thread, so it
+    shouldn't also be iterated directly.
+
+    Example:
+        pager = PrefetchingSearchPager(
+            googleads_service.search(customer_id=customer_id, query=query),
+            depth=2,
+        )
+        for row in pager:
+            ...
+    """
+
+    def __init__(self, pager: Any, depth: int = _DEFAULT_PREFETCH_DEPTH) -> None:
+        """Initializer for the PrefetchingSearchPager class.
+
+        Args:
+            pager: a SearchPager returned by GoogleAdsService.search.
+            depth: an int of the maximum number of pages requested ahead of
+                the page being processed.
+
+        Raises:
+            ValueError: If depth is less than one.
+        """
+        _check_depth(depth)
+        self._pager: Any = pager
+        self.depth: int = depth
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._pager, name)
+
+    def _prefetch(
+        self,
+        pages: "queue.Queue[Tuple[Any, Optional[Exception]]]",
+        slots: threading.Semaphore,
+        stopped: threading.Event,
+    ) -> None:
+        """Requests pages and adds them to the queue until none are left.
+
+        A slot is taken before each request and given back when the caller
+        takes the page from the queue, so no more than depth pages are
+        requested ahead of the caller.
+        """
+        iterator: Iterator[Any] = iter(self._pager.pages)
+
+        while True:
+            while not slots.acquire(timeout=_PREFETCH_POLL_INTERVAL):
+                if stopped.is_set():
+                    return
+
+            if stopped.is_set():
+                return
+
+            try:
+                page: Any = next(iterator, _END_OF_PAGES)
+            except Exception as ex:
+                pages.put((None, ex))
+                return
+
+            pages.put((page, None))
+
+            if page is _END_OF_PAGES:
+                return
+
+    @property
+    def pages(self) -> Iterator[Any]:
+        """Yields each page of results, requesting later pages in advance."""
+        pages: "queue.Queue[Tuple[Any, Optional[Exception]]]" = queue.Queue()
+        slots: threading.Semaphore = threading.Semaphore(self.depth)
+        stopped: threading.Event = threading.Event()
+        thread: threading.Thread = threading.Thread(
+            target=self._prefetch, args=(pages, slots, stopped), daemon=True
+        )
+        thread.start()
+
+        try:
+            while True:
+                page, exception = pages.get()
+
+                if exception is not None:
+                    raise exception
+
+                if page is _END_OF_PAGES:
+                    return
+
+                slots.release()
+                yield page
+        finally:
+            # Stops the thread if the caller stopped iterating early.
+            stopped.set()
+
+    def __iter__(self) -> Iterator[Any]:
+        for page in self.pages:
+            yield from page.results
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}<{self._pager!r}>"
+
+
+class PrefetchingSearchAsyncPager:
+    """Wraps a SearchAsyncPager to request pages ahead of the caller.
+
+    A background task requests up to depth pages beyond the page the caller
+    is processing, so at most depth + 1 pages are held in memory. Errors
+    raised while requesting a page are raised to the caller when it reaches
+    that page.
+
+    Example:
+        pager = PrefetchingSearchAsyncPager(
+            await googleads_service.search(
+                customer_id=customer_id, query=query
+            ),
+            depth=2,
+        )
+        async for row in pager:
+            ...
+    """
+
+    def __init__(self, pager: Any, depth: int = _DEFAULT_PREFETCH_DEPTH) -> None:
+        """Initializer for the PrefetchingSearchAsyncPager class.
+
+        Args:
+            pager: a SearchAsyncPager returned by the async
+                GoogleAdsService.search.
+            depth: an int of the maximum number of pages requested ahead of
+                the page being processed.
+
+        Raises:
+            ValueError: If depth is less than one.
+        """
+        _check_depth(depth)
+        self._pager: Any = pager
+        self.depth: int = depth
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._pager, name)
+
+    async def _prefetch(
+        self,
+        pages: "asyncio.Queue[Tuple[Any, Optional[Exception]]]",
+        slots: asyncio.Semaphore,
+    ) -> None:
+        """Requests pages and adds them to the queue until none are left.
+
+        A slot is taken before each request and given back when the caller
+        takes the page from the queue, so no more than depth pages are
+        requested ahead of the caller.
+        """
+        iterator: AsyncIterator[Any] = self._pager.pages.__aiter__()
+
+        while True:
+            await slots.acquire()
+
+            try:
+                page: Any = await iterator.__anext__()
+            except StopAsyncIteration:
+                pages.put_nowait((_END_OF_PAGES, None))
+                return
+            except Exception as ex:
+                pages.put_nowait((None, ex))
+                return
+
+            pages.put_nowait((page, None))
+
+    @property
+    async def pages(self) -> AsyncIterator[Any]:
+        """Yields each page of results, requesting later pages in advance."""
+        pages: "asyncio.Queue[Tuple[Any, Optional[Exception]]]" = (
+            asyncio.Queue()
+        )
+        slots: asyncio.Semaphore = asyncio.Semaphore(self.depth)
+        task: asyncio.Task = asyncio.ensure_future(
+            self._prefetch(pages, slots)
+        )
+
+        try:
+            while True:
+                page, exception = await pages.get()
+
+                if exception is not None:
+                    raise exception
+
+                if page is _END_OF_PAGES:
+                    return
+
+                slots.release()
+                yield page
+        finally:
+            # Stops the task if the caller stopped iterating early.
+            task.cancel()
+
+    def __aiter__(self) -> AsyncIterator[Any]:
+        async def async_generator():
+            async for page in self.pages:
+                for row in page.results:
+                    yield row
+
+        return async_generator()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}<{self._pager!r}>"
@@ -0,0 +1,295 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Decodes the partial failures of mutate responses in bulk.
+
+When a mutate request is sent with partial_failure=True, the operations that
+failed are described by GoogleAdsFailure messages that are serialized in the
+details of the response's partial_failure_error, and each error refers to the
+operation it belongs to through its location. decode_partial_failure decodes
+all of them in a single pass and returns a PartialFailureResult, which maps
+each operation to its outcome:
+
+    response = ad_group_service.mutate_ad_groups(request=request)
+    result = decode_partial_failure(response)
+
+    for index in result.failed_operation_indexes:
+        print(index, result.get_error_code(index))
+
+    print(result.succeeded_resource_names)
+
+The failures are decoded as protobuf messages, without creating proto-plus
+messages for each error, and the outcome of each operation is stored in
+arrays, so that responses of requests with many thousands of operations can
+be mapped cheaply.
+"""
+
+from array import array
+from typing import Any, Dict, List, Optional, Tuple
+
+from google.protobuf.message import Message as ProtobufMessageType
+
+from google.ads.googleads.errors import _get_error_code, _get_failure_class
+from google.ads.googleads.util import convert_proto_plus_to_protobuf
+
+# The error code of errors that don't have one.
+NO_ERROR_CODE: Tuple[str, str] = ("", "")
+# The operation index of errors that don't refer to an operation.
+NO_OPERATION: int = -1
+
+
+class PartialFailureResult:
+    """The outcome of each operation of a mutate request.
+
+    Attributes:
+        resource_names: a list of the str resource name of the result of each
+            operation, which is empty for operations that failed.
+        error_codes: a list of the distinct error codes in the response, as
+            tuples of the str name of the error code field and of its value,
+            e.g. ("range_error", "TOO_LOW").
+        error_code_table: an array of the index in error_codes of the first
+            error of each operation, or -1 for operations that succeeded.
+        error_operation_indexes: an array of the operation index of each
+            error in the response, or NO_OPERATION for errors that don't
+            refer to an operation.
+        error_code_ids: an array of the index in error_codes of the error
+            code of each error in the response.
+    """
+
+    def __init__(
+        self,
+        resource_names: List[str],
+        error_codes: List[Tuple[str, str]],
+        error_code_table: array,
+        error_operation_indexes: array,
+        error_code_ids: array,
+    ):
+        """Initializer for the PartialFailureResult class.
+
+        Args:
+            resource_names: a list of the resource name of each operation.
+            error_codes: a list of the distinct error codes.
+            error_code_table: an array of the error code index of the first
+                error of each operation.
+            error_operation_indexes: an array of the operation index of each
+                error.
+            error_code_ids: an array of the error code index of each error.
+        """
+        self.resource_names: List[str] = resource_names
+        self.error_codes: List[Tuple[str, str]] = error_codes
+        self.error_code_table: array = error_code_table
+        self.error_operation_indexes: array = error_operation_indexes
+        self.error_code_ids: array = error_code_ids
+
+    @property
+    def operation_count(self) -> int:
+        """The number of operations in the request."""
+        return len(self.error_code_table)
+
+    @property
+    def error_count(self) -> int:
+        """The number of errors in the response."""
+        return len(self.error_code_ids)
+
+    @property
+    def failed_operation_indexes(self) -> List[int]:
+        """The sorted indexes of the operations that failed."""
+        return [
+            index
+            for index, code_id in enumerate(self.error_code_table)
+            if code_id >= 0
+        ]
+
+    @property
+    def succeeded_resource_names(self) -> List[str]:
+        """The resource names of the results of the operations that succeeded.
+
+        Operations that don't return a resource name, such as those of
+        validate_only requests, are left out.
+        """
+        return [
+            resource_name
+            for resource_name, code_id in zip(
+                self.resource_names, self.error_code_table
+            )
+            if code_id < 0 and resource_name
+        ]
+
+    def is_failed(self, operation_index: int) -> bool:
+        """Returns whether an operation failed.
+
+        Args:
+            operation_index: an int of the index of the operation in the
+                request.
+        """
+        return self.error_code_table[operation_index] >= 0
+
+    def get_error_code(self, operation_index: int) -> Optional[Tuple[str, str]]:
+        """Returns the error code of the first error of an operation.
+
+        Args:
+            operation_index: an int of the index of the operation in the
+                request.
+
+        Returns:
+            A tuple of the str names of the error code field and its value, or
+            None if the operation succeeded.
+        """
+        code_id: int = self.error_code_table[operation_index]
+        return self.error_codes[code_id] if code_id >= 0 else None
+
+    def get_error_codes(self, operation_index: int) -> List[Tuple[str, str]]:
+        """Returns the error codes of all of the errors of an operation.
+
+        Most operations fail with a single error, which get_error_code
+        returns in constant time. This method scans all of the errors of the
+        response.
+
+        Args:
+            operation_index: an int of the index of the operation in the
+                request, or NO_OPERATION for the errors that don't refer to an
+                operation.
+
+        Returns:
+            A list of tuples of the str names of the error code fields and
+            their values, which is empty if the operation succeeded.
+        """
+        return [
+            self.error_codes[code_id]
+            for index, code_id in zip(
+                self.error_operation_indexes, self.error_code_ids
+            )
+            if index == operation_index
+        ]
+
+
+def _get_operation_index(error: Any) -> int:
+    """Returns the index of the operation that an error refers to.
+
+    The index is that of the first element of the error's location that has
+    one, which is the operation in the request's list of operations.
+
+    Args:
+        error: a GoogleAdsError protobuf message.
+
+    Returns:
+        The int index of the operation, or NO_OPERATION if the error doesn't
+        refer to one.
+    """
+    for element in error.location.field_path_elements:
+        if element.HasField("index"):
+            return element.index
+
+    return NO_OPERATION
+
+
+def _get_resource_names(response: ProtobufMessageType) -> List[str]:
+    """Returns the resource name of the result of each operation.
+
+    Args:
+        response: a mutate response protobuf message.
+    """
+    fields: Any = response.DESCRIPTOR.fields_by_name
+
+    if "results" in fields:
+        return [
+            getattr(result, "resource_name", "") for result in response.results
+        ]
+
+    if "mutate_operation_responses" in fields:
+        # The results of GoogleAdsService.Mutate are in a oneof of results
+        # of each resource type.
+        resource_names: List[str] = []
+
+        for operation_response in response.mutate_operation_responses:
+            field_name: Optional[str] = operation_response.WhichOneof(
+                "response"
+            )
+            resource_names.append(
+                getattr(operation_response, field_name).resource_name
+                if field_name
+                else ""
+            )
+
+        return resource_names
+
+    return []
+
+
+def decode_partial_failure(
+    response: Any, version: Optional[str] = None
+) -> PartialFailureResult:
+    """Decodes the partial failure and results of a mutate response.
+
+    Args:
+        response: a proto-plus or protobuf mutate response message, of a
+            request that was sent with partial_failure=True.
+        version: an optional str of the API version of the response. It's
+            read from the response's type by default.
+
+    Returns:
+        A PartialFailureResult of the response.
+    """
+    response_pb: ProtobufMessageType = convert_proto_plus_to_protobuf(response)
+
+    if version is None:
+        # The full names of response types are e.g.
+        # "google.ads.googleads.v25.services.MutateAdGroupsResponse".
+        version = response_pb.DESCRIPTOR.full_name.split(".")[3]
+
+    resource_names: List[str] = _get_resource_names(response_pb)
+    failure_class: Any = _get_failure_class(version).pb()
+    error_codes: List[Tuple[str, str]] = []
+    code_ids: Dict[Tuple[str, str], int] = {}
+    enum_values: Dict[str, Any] = {}
+    error_operation_indexes: array = array("q")
+    error_code_ids: array = array("i")
+
+    for detail in response_pb.partial_failure_error.details:
+        if not detail.type_url.endswith(".GoogleAdsFailure"):
+            continue
+
+        for error in failure_class.FromString(detail.value).errors:
+            error_code: Tuple[str, str] = (
+                _get_error_code(error.error_code, enum_values) or NO_ERROR_CODE
+            )
+            code_id: Optional[int] = code_ids.get(error_code)
+
+            if code_id is None:
+                code_id = code_ids[error_code] = len(error_codes)
+                error_codes.append(error_code)
+
+            error_operation_indexes.append(_get_operation_index(error))
+            error_code_ids.append(code_id)
+
+    operation_count: int = max(
+        len(resource_names),
+        max(error_operation_indexes, default=NO_OPERATION) + 1,
+    )
+    error_code_table: array = array("i", [-1]) * operation_count
+
+    # Iterating in reverse leaves the first error of each operation in the
+    # table.
+    for index, code_id in zip(
+        reversed(error_operation_indexes), reversed(error_code_ids)
+    ):
+        if index != NO_OPERATION:
+            error_code_table[index] = code_id
+
+    return PartialFailureResult(
+        resource_names,
+        error_codes,
+        error_code_table,
+        error_operation_indexes,
+        error_code_ids,
+    )
@@ -0,0 +1,368 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Splits large GAQL report queries into shards that run concurrently.
+
+A report over a long date range, or over every campaign of a large account,
+is normally downloaded with a single search_stream request. If that stream
+fails it must be restarted from the beginning, and it only uses a single
+connection. The QueryPlanner class splits such a query into shards, either by
+ranges of segments.date or by groups of campaign.id values, runs the shards
+concurrently with a ReportRunner, retries only the shards that fail, and
+yields their results in shard order.
+
+Example:
+    planner = QueryPlanner(client, max_workers=8)
+    shards = planner.split_by_date(query, days_per_shard=7)
+    for row in planner.iter_rows(customer_id, shards):
+        ...
+"""
+
+import datetime
+import re
+from typing import (
+    Any,
+    Generator,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from google.ads.googleads import gaql
+from google.ads.googleads.report_runner import ReportResult, ReportRunner
+
+_DATE_FORMAT = "%Y-%m-%d"
+_DEFAULT_DAYS_PER_SHARD = 7
+_DEFAULT_CAMPAIGNS_PER_SHARD = 100
+_CAMPAIGN_IDS_QUERY = "SELECT campaign.id FROM campaign"
+
+# Matches a "segments.date BETWEEN 'start' AND 'end'" condition in a query
+# whose literals and comments are blanked, see gaql._blank_literals, so that
+# conditions inside of comments and literals aren't matched.
+_DATE_RANGE_PATTERN: re.Pattern = re.compile(
+    r"(?<![.\w])segments\.date\s+BETWEEN\s+(?P<start>'[^']*'|\"[^\"]*\")\s+"
+    r"AND\s+(?P<end>'[^']*'|\"[^\"]*\")",
+    re.IGNORECASE,
+)
+_DATE_PATTERN: re.Pattern = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+class ShardFailedError(Exception):
+    """Raised when a shard of a report fails after all of its retries.
+
+    No more shards are run after the failure. The queries of the failed shard
+    and of every later shard are available, so that the report can be
+    resumed from the failed shard without downloading earlier shards again.
+    """
+
+    def __init__(
+        self, result: ReportResult, pending_queries: Sequence[str]
+    ) -> None:
+        """Initializer for the ShardFailedError class.
+
+        Args:
+            result: the ReportResult of the failed shard.
+            pending_queries: a sequence of the str queries of the failed shard
+                and of every shard after it, whose rows weren't yielded.
+        """
+        super().__init__(
+            f"Shard {result.index} failed after {result.attempts} attempts: "
+            f"{result.exception!r}"
+        )
+        self.result: ReportResult = result
+        self.pending_queries: List[str] = list(pending_queries)
+
+
+def _parse_date(value: Any) -> datetime.date:
+    if isinstance(value, datetime.date):
+        return value
+
+    return datetime.datetime.strptime(value, _DATE_FORMAT).date()
+
+
+def split_date_range(
+    start_date: datetime.date, end_date: datetime.date, days_per_shard: int
+) -> List[Tuple[datetime.date, datetime.date]]:
+    """Splits an inclusive date range into consecutive ranges.
+
+    Args:
+        start_date: the first datetime.date of the range.
+        end_date: the last datetime.date of the range.
+        days_per_shard: an int of the maximum number of days in each range.
+
+    Returns:
+        A list of tuples of the inclusive start and end dates of each range.
+
+    Raises:
+        ValueError: If the end date is before the start date or
+            days_per_shard is less than one.
+    """
+    if end_date < start_date:
+        raise ValueError(
+            f"The end date {end_date} is before the start date {start_date}."
+        )
+
+    if days_per_shard < 1:
+        raise ValueError(
+            f"days_per_shard must be at least 1, but {days_per_shard} was "
+            "given."
+        )
+
+    ranges: List[Tuple[datetime.date, datetime.date]] = []
+    step: datetime.timedelta = datetime.timedelta(days=days_per_shard)
+    one_day: datetime.timedelta = datetime.timedelta(days=1)
+
+    while start_date <= end_date:
+        shard_end: datetime.date = min(end_date, start_date + step - one_day)
+        ranges.append((start_date, shard_end))
+        start_date = shard_end + one_day
+
+    return ranges
+
+
+def _find_date_range(query: str) -> Optional[Tuple[int, int, str, str]]:
+    """Finds the "segments.date BETWEEN" condition of a query.
+
+    Args:
+        query: a str GAQL query.
+
+    Returns:
+        A tuple of the int start and end offsets of the condition in the
+        query, and the str start and end dates of its range, or None if the
+        query has no such condition.
+    """
+    match: Optional[re.Match] = _DATE_RANGE_PATTERN.search(
+        gaql._blank_literals(query, blank_comments=True)
+    )
+
+    if match is None:
+        return None
+
+    # The literals are blanked in the searched str, so their text is read
+    # from the query at the same offsets.
+    start_date: str = query[match.start("start") + 1 : match.end("start") - 1]
+    end_date: str = query[match.start("end") + 1 : match.end("end") - 1]
+
+    if not (
+        _DATE_PATTERN.fullmatch(start_date) and _DATE_PATTERN.fullmatch(end_date)
+    ):
+        return None
+
+    return match.start(), match.end(), start_date, end_date
+
+
+def _check_shardable(query: str) -> None:
+    if gaql.has_limit(query):
+        raise ValueError(
+            "Queries with a LIMIT clause can't be split into shards, since "
+            "the limit would apply to each shard."
+        )
+
+
+class QueryPlanner:
+    """Splits report queries into shards and runs them concurrently."""
+
+    def __init__(self, client: Any, **runner_kwargs: Any) -> None:
+        """Initializer for the QueryPlanner class.
+
+        Args:
+            client: an initialized GoogleAdsClient instance.
+            runner_kwargs: keyword arguments for the ReportRunner that runs
+                the shards, for example max_workers or max_retries.
+        """
+        self.runner: ReportRunner = ReportRunner(client, **runner_kwargs)
+
+    def split_by_date(
+        self,
+        query: str,
+        start_date: Optional[Any] = None,
+        end_date: Optional[Any] = None,
+        days_per_shard: int = _DEFAULT_DAYS_PER_SHARD,
+    ) -> List[str]:
+        """Splits a query into one query for each range of dates.
+
+        The date range is read from a "segments.date BETWEEN 'start' AND
+        'end'" condition in the query, which is replaced in each shard, or
+        given with the start_date and end_date arguments. Rows in every shard
+        are ordered the way the query orders them, and shards are in date
+        order.
+
+        Args:
+            query: a str GAQL query.
+            start_date: an optional datetime.date or "YYYY-MM-DD" str of the
+                first date of the report.
+            end_date: an optional datetime.date or "YYYY-MM-DD" str of the
+                last date of the report.
+            days_per_shard: an int of the maximum number of days per shard.
+
+        Returns:
+            A list of str GAQL queries.
+
+        Raises:
+            ValueError: If the date range can't be determined or the query
+                has a LIMIT clause.
+        """
+        _check_shardable(query)
+        date_range: Optional[Tuple[int, int, str, str]] = _find_date_range(
+            query
+        )
+
+        if date_range:
+            start_date = start_date or date_range[2]
+            end_date = end_date or date_range[3]
+        elif start_date is None or end_date is None:
+            raise ValueError(
+                "The query has no \"segments.date BETWEEN\" condition, so "
+                "start_date and end_date must be given."
+            )
+
+        queries: List[str] = []
+
+        for shard_start, shard_end in split_date_range(
+            _parse_date(start_date), _parse_date(end_date), days_per_shard
+        ):
+            condition: str = (
+                f"segments.date BETWEEN '{shard_start:{_DATE_FORMAT}}' "
+                f"AND '{shard_end:{_DATE_FORMAT}}'"
+            )
+            if date_range:
+                # Replaces the original date range with the shard's range.
+                queries.append(
+                    f"{query[: date_range[0]]}{condition}"
+                    f"{query[date_range[1] :]}"
+                )
+            else:
+                queries.append(gaql.add_condition(query, condition))
+
+        return queries
+
+    def split_by_campaign_ids(
+        self,
+        query: str,
+        campaign_ids: Sequence[Any],
+        campaigns_per_shard: int = _DEFAULT_CAMPAIGNS_PER_SHARD,
+    ) -> List[str]:
+        """Splits a query into one query for each group of campaigns.
+
+        Args:
+            query: a str GAQL query.
+            campaign_ids: a sequence of int or str campaign IDs, for example
+                as returned by the get_campaign_ids method.
+            campaigns_per_shard: an int of the maximum number of campaigns in
+                each shard.
+
+        Returns:
+            A list of str GAQL queries.
+
+        Raises:
+            ValueError: If campaigns_per_shard is less than one or the query
+                has a LIMIT clause.
+        """
+        _check_shardable(query)
+
+        if campaigns_per_shard < 1:
+            raise ValueError(
+                "campaigns_per_shard must be at least 1, but "
+                f"{campaigns_per_shard} was given."
+            )
+
+        return [
+            gaql.add_condition(
+                query,
+                "campaign.id IN ({})".format(
+                    ", ".join(
+                        str(campaign_id)
+                        for campaign_id in campaign_ids[
+                            start : start + campaigns_per_shard
+                        ]
+                    )
+                ),
+            )
+            for start in range(0, len(campaign_ids), campaigns_per_shard)
+        ]
+
+    def get_campaign_ids(self, customer_id: str) -> List[int]:
+        """Returns the IDs of every campaign of a customer.
+
+        Args:
+            customer_id: a str customer ID.
+
+        Returns:
+            A sorted list of int campaign IDs.
+
+        Raises:
+            Exception: The exception raised by the request, if it failed.
+        """
+        [result] = self.runner.run([customer_id], _CAMPAIGN_IDS_QUERY)
+
+        if not result.succeeded:
+            raise result.exception
+
+        return sorted(row.campaign.id for row in result.rows)
+
+    def run(
+        self, customer_id: str, queries: Sequence[str]
+    ) -> Iterator[ReportResult]:
+        """Runs shard queries concurrently and yields results in shard order.
+
+        Each shard is retried independently by the ReportRunner, so a
+        transient failure only repeats the download of a single shard.
+        Results that finish out of order are held until every earlier shard
+        has been yielded, and at most twice as many shards as the runner has
+        workers are started ahead of the next shard to be yielded, so a slow
+        shard doesn't cause the rows of every other shard to be held.
+
+        Args:
+            customer_id: a str customer ID.
+            queries: a sequence of str GAQL queries, as returned by the
+                split_by_date or split_by_campaign_ids methods.
+
+        Yields:
+            A ReportResult for each shard, in the order of the queries,
+            including shards that failed.
+        """
+        return self.runner.run_requests_in_order(
+            (customer_id, query) for query in queries
+        )
+
+    def iter_rows(self, customer_id: str, queries: Sequence[str]) -> Iterator[Any]:
+        """Runs shard queries concurrently and yields their rows in order.
+
+        Args:
+            customer_id: a str customer ID.
+            queries: a sequence of str GAQL queries, as returned by the
+                split_by_date or split_by_campaign_ids methods.
+
+        Yields:
+            The GoogleAdsRow messages of every shard, in shard order.
+
+        Raises:
+            ShardFailedError: If a shard failed after all of its retries. No
+                more shards are started, and the rows of later shards that
+                already finished are discarded, so they aren't held in memory.
+        """
+        results: Generator[ReportResult, None, None] = self.run(
+            customer_id, queries
+        )
+
+        try:
+            for result in results:
+                if not result.succeeded:
+                    raise ShardFailedError(result, queries[result.index :])
+
+                yield from result.rows
+        finally:
+            # Cancels the shards that haven't started yet.
+            results.close()
@@ -0,0 +1,467 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""An adaptive rate limiter that paces requests to the Google Ads API.
+
+The API enforces rate limits per developer token and per customer. When the
+client is configured with a "rate_limiter", requests are paced by a token
+bucket for each developer token, login customer ID and customer ID, which
+lets short bursts through and then sends requests at the bucket's rate.
+
+The rate adapts to the API's responses with additive increase and
+multiplicative decrease (AIMD): each successful request increases it a
+little, and each request that's rejected because of a rate limit, i.e. with a
+RESOURCE_EXHAUSTED status or a QuotaError, cuts it by a factor. This keeps the
+rate close to the highest one the API accepts.
+
+The buckets are kept in memory by default, so they're shared by all of the
+services of a client. With a "lock_file_path", they're kept in a file that's
+locked while it's updated, so that they're also shared by every process that
+uses the same file.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+from google.protobuf.message import DecodeError
+import grpc
+
+from google.ads.googleads.errors import GoogleAdsException
+from google.ads.googleads.retry import get_status_code
+from google.ads.googleads.util import file_lock
+
+T = TypeVar("T")
+# The state of a bucket, with the keys "rate", "tokens", "updated" and
+# "decreased". It's a dict of floats so that it can be stored as JSON.
+BucketState = Dict[str, float]
+
+_DEFAULT_INITIAL_RATE = 5.0
+_DEFAULT_MIN_RATE = 0.5
+_DEFAULT_MAX_RATE = 50.0
+_DEFAULT_BURST = 5.0
+_DEFAULT_ADDITIVE_INCREASE = 1.0
+_DEFAULT_MULTIPLICATIVE_DECREASE = 0.5
+# The rate is only decreased once per interval, since the requests that were
+# already sent at the previous rate are likely to be rejected too.
+_DECREASE_INTERVAL = 1.0
+# Buckets that haven't been used for this many seconds are removed from
+# lock files so that they don't grow indefinitely.
+_LOCK_FILE_BUCKET_EXPIRY = 3600.0
+
+
+def get_bucket_key(
+    developer_token: Optional[str],
+    login_customer_id: Optional[str],
+    customer_id: Optional[str],
+) -> str:
+    """Returns the key of the bucket that paces a request.
+
+    The developer token is hashed so that it isn't stored in lock files.
+
+    Args:
+        developer_token: a str of the developer token of the request.
+        login_customer_id: an optional str of the login customer ID.
+        customer_id: an optional str of the customer ID of the request.
+
+    Returns:
+        A str key.
+    """
+    token_hash: str = hashlib.sha256(
+        (developer_token or "").encode()
+    ).hexdigest()[:16]
+    return f"{token_hash}:{login_customer_id or ''}:{customer_id or ''}"
+
+
+def is_throttled(exception: Optional[BaseException]) -> bool:
+    """Returns whether a request was rejected because of a rate limit.
+
+    Args:
+        exception: the exception a request failed with, or None if it
+            succeeded.
+
+    Returns:
+        True if the request failed with a RESOURCE_EXHAUSTED status, or with
+        a GoogleAdsFailure that includes a QuotaError.
+    """
+    if exception is None:
+        return False
+
+    if get_status_code(exception) == grpc.StatusCode.RESOURCE_EXHAUSTED:
+        return True
+
+    if isinstance(exception, GoogleAdsException):
+        try:
+            return any(
+                field_name == "quota_error"
+                for field_name, _ in exception.get_error_codes()
+            )
+        except DecodeError:
+            return False
+
+    return False
+
+
+class RateLimiterBackend:
+    """Stores the buckets of a rate limiter.
+
+    Subclasses implement update, which changes a bucket atomically, and can
+    override time to change the clock the buckets are measured with.
+    """
+
+    # Whether update can block, for example while another process holds a
+    # lock, in which case async interceptors call it in the event loop's
+    # executor instead of on the loop itself.
+    is_blocking: bool = True
+
+    def time(self) -> float:
+        """Returns the current time in seconds."""
+        return time.monotonic()
+
+    def update(
+        self,
+        key: str,
+        update: Callable[[Optional[BucketState], float], Tuple[BucketState, T]],
+    ) -> T:
+        """Replaces the state of a bucket atomically.
+
+        Args:
+            key: a str of the bucket's key.
+            update: a function that's called with the current state of the
+                bucket, or None if it doesn't exist yet, and the current time.
+                It returns the new state and a result.
+
+        Returns:
+            The result returned by update.
+        """
+        raise NotImplementedError
+
+
+class InMemoryBackend(RateLimiterBackend):
+    """Stores buckets in memory, shared by the threads of a process."""
+
+    # The lock is only held while a bucket is updated in memory.
+    is_blocking: bool = False
+
+    def __init__(self):
+        self._buckets: Dict[str, BucketState] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def update(
+        self,
+        key: str,
+        update: Callable[[Optional[BucketState], float], Tuple[BucketState, T]],
+    ) -> T:
+        with self._lock:
+            state, result = update(self._buckets.get(key), self.time())
+            self._buckets[key] = state
+            return result
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Returns self serialized as a dict, without the unpicklable lock."""
+        state: Dict[str, Any] = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, d: Dict[str, Any]) -> None:
+        """Deserializes self with the given dictionary."""
+        self.__dict__.update(d)
+        self._lock = threading.Lock()
+
+
+class FileLockBackend(RateLimiterBackend):
+    """Stores buckets in a JSON file shared by several processes.
+
+    The file is locked while a bucket is updated, so the processes take turns
+    and pace their requests together. Since the processes don't share a
+    monotonic clock, the buckets are measured with the system time.
+    """
+
+    def __init__(self, path: str):
+        """Initializer for the FileLockBackend class.
+
+        Args:
+            path: a str of the path of the file. It's created if it doesn't
+                exist.
+        """
+        self.path: str = os.path.expanduser(path)
+
+    def time(self) -> float:
+        return time.time()
+
+    def update(
+        self,
+        key: str,
+        update: Callable[[Optional[BucketState], float], Tuple[BucketState, T]],
+    ) -> T:
+        with open(self.path, "a+") as file, file_lock(file):
+            file.seek(0)
+            contents: str = file.read()
+
+            try:
+                buckets: Dict[str, BucketState] = (
+                    json.loads(contents) if contents else {}
+                )
+            except json.JSONDecodeError:
+                # A process stopped while writing the file, so the buckets
+                # are started again.
+                buckets = {}
+
+            now: float = self.time()
+            state, result = update(buckets.get(key), now)
+            buckets = {
+                bucket_key: bucket
+                for bucket_key, bucket in buckets.items()
+                if now - bucket["updated"] < _LOCK_FILE_BUCKET_EXPIRY
+            }
+            buckets[key] = state
+
+            file.seek(0)
+            file.truncate()
+            json.dump(buckets, file)
+            file.flush()
+
+        return result
+
+
+class AdaptiveRateLimiter:
+    """Paces requests with token buckets whose rates adapt to rate limits."""
+
+    def __init__(
+        self,
+        initial_rate: float = _DEFAULT_INITIAL_RATE,
+        min_rate: float = _DEFAULT_MIN_RATE,
+        max_rate: float = _DEFAULT_MAX_RATE,
+        burst: float = _DEFAULT_BURST,
+        additive_increase: float = _DEFAULT_ADDITIVE_INCREASE,
+        multiplicative_decrease: float = _DEFAULT_MULTIPLICATIVE_DECREASE,
+        backend: Optional[RateLimiterBackend] = None,
+    ):
+        """Initializer for the AdaptiveRateLimiter class.
+
+        Args:
+            initial_rate: a float of the requests per second of a new bucket.
+            min_rate: a float of the lowest rate a bucket is decreased to.
+            max_rate: a float of the highest rate a bucket is increased to.
+            burst: a float of the number of requests a bucket lets through
+                at once after it hasn't been used for a while.
+            additive_increase: a float of the requests per second the rate
+                increases by over a second of successful requests.
+            multiplicative_decrease: a float between 0 and 1 that the rate
+                is multiplied by when a request is rejected.
+            backend: an optional RateLimiterBackend that stores the buckets.
+                They're kept in memory by default.
+
+        Raises:
+            ValueError: If the rates or burst aren't positive, min_rate is
+                greater than max_rate, or multiplicative_decrease isn't
+                between 0 and 1.
+        """
+        if min(initial_rate, min_rate, max_rate, burst) <= 0:
+            raise ValueError(
+                "The rates and burst of a rate limiter must be positive."
+            )
+
+        if min_rate > max_rate:
+            raise ValueError(
+                f"min_rate {min_rate} is greater than max_rate {max_rate}."
+            )
+
+        if not 0 < multiplicative_decrease < 1:
+            raise ValueError(
+                "multiplicative_decrease must be between 0 and 1, but "
+                f"{multiplicative_decrease} was given."
+            )
+
+        self.initial_rate: float = min(max(initial_rate, min_rate), max_rate)
+        self.min_rate: float = min_rate
+        self.max_rate: float = max_rate
+        self.burst: float = burst
+        self.additive_increase: float = additive_increase
+        self.multiplicative_decrease: float = multiplicative_decrease
+        self.backend: RateLimiterBackend = (
+            backend if backend is not None else InMemoryBackend()
+        )
+
+    @classmethod
+    def from_dict(cls, config: Dict[str, Any]) -> "AdaptiveRateLimiter":
+        """Creates a rate limiter from the "rate_limiter" configuration.
+
+        Args:
+            config: a dict with any of the keys "initial_rate", "min_rate",
+                "max_rate", "burst", "additive_increase",
+                "multiplicative_decrease" and "lock_file_path", which is the
+                path of a file that shares the buckets between processes.
+
+        Returns:
+            A new AdaptiveRateLimiter instance.
+
+        Raises:
+            ValueError: If the configuration has unknown keys.
+        """
+        config = dict(config)
+        kwargs: Dict[str, Any] = {
+            key: float(config.pop(key))
+            for key in (
+                "initial_rate",
+                "min_rate",
+                "max_rate",
+                "burst",
+                "additive_increase",
+                "multiplicative_decrease",
+            )
+            if key in config
+        }
+
+        if "lock_file_path" in config:
+            kwargs["backend"] = FileLockBackend(config.pop("lock_file_path"))
+
+        if config:
+            raise ValueError(
+                "The rate limiter configuration has unknown keys: "
+                f"{', '.join(sorted(config))}."
+            )
+
+        return cls(**kwargs)
+
+    def _refill(self, state: Optional[BucketState], now: float) -> BucketState:
+        """Returns a copy of a bucket with the tokens it has gained."""
+        if state is None:
+            return {
+                "rate": self.initial_rate,
+                "tokens": self.burst,
+                "updated": now,
+                "decreased": 0.0,
+            }
+
+        state = dict(state)
+        # The clock of a lock file can go back if the system time changes.
+        elapsed: float = max(0.0, now - state["updated"])
+        state["tokens"] = min(
+            self.burst, state["tokens"] + elapsed * state["rate"]
+        )
+        state["updated"] = now
+        return state
+
+    def acquire(self, key: str) -> float:
+        """Reserves a request in a bucket.
+
+        The bucket's tokens can go below zero, which reserves the time when
+        the request can be sent. Requests are therefore sent in the order
+        they were reserved in.
+
+        Args:
+            key: a str of the bucket's key, see get_bucket_key.
+
+        Returns:
+            A float of the seconds to wait before sending the request.
+        """
+
+        def update(
+            state: Optional[BucketState], now: float
+        ) -> Tuple[BucketState, float]:
+            state = self._refill(state, now)
+            state["tokens"] -= 1
+            return state, max(0.0, -state["tokens"] / state["rate"])
+
+        return self.backend.update(key, update)
+
+    def record_success(self, key: str) -> None:
+        """Increases the rate of a bucket after a successful request.
+
+        Args:
+            key: a str of the bucket's key.
+        """
+
+        def update(
+            state: Optional[BucketState], now: float
+        ) -> Tuple[BucketState, None]:
+            state = self._refill(state, now)
+            # Dividing by the rate makes the rate increase by
+            # additive_increase over a second of requests, however high the
+            # rate is.
+            state["rate"] = min(
+                self.max_rate,
+                state["rate"] + self.additive_increase / state["rate"],
+            )
+            return state, None
+
+        self.backend.update(key, update)
+
+    def record_throttle(self, key: str) -> None:
+        """Decreases the rate of a bucket after a request was rate limited.
+
+        Args:
+            key: a str of the bucket's key.
+        """
+
+        def update(
+            state: Optional[BucketState], now: float
+        ) -> Tuple[BucketState, None]:
+            state = self._refill(state, now)
+
+            if now - state["decreased"] >= _DECREASE_INTERVAL:
+                state["rate"] = max(
+                    self.min_rate, state["rate"] * self.multiplicative_decrease
+                )
+                state["decreased"] = now
+                # The burst is used up so that the next requests are paced.
+                state["tokens"] = min(state["tokens"], 0.0)
+
+            return state, None
+
+        self.backend.update(key, update)
+
+    def record(self, key: str, exception: Optional[BaseException]) -> None:
+        """Adapts the rate of a bucket to the outcome of a request.
+
+        Args:
+            key: a str of the bucket's key.
+            exception: the exception the request failed with, or None if it
+                succeeded. Failures that aren't caused by rate limits don't
+                change the rate.
+        """
+        if exception is None:
+            self.record_success(key)
+        elif is_throttled(exception):
+            self.record_throttle(key)
+
+    def record_status(self, key: str, status_code: grpc.StatusCode) -> None:
+        """Adapts the rate of a bucket to the status of a request.
+
+        Args:
+            key: a str of the bucket's key.
+            status_code: the grpc.StatusCode the request completed with.
+        """
+        if status_code == grpc.StatusCode.OK:
+            self.record_success(key)
+        elif status_code == grpc.StatusCode.RESOURCE_EXHAUSTED:
+            self.record_throttle(key)
+
+    def get_rate(self, key: str) -> float:
+        """Returns the current requests per second of a bucket.
+
+        Args:
+            key: a str of the bucket's key.
+        """
+
+        def update(
+            state: Optional[BucketState], now: float
+        ) -> Tuple[BucketState, float]:
+            state = self._refill(state, now)
+            return state, state["rate"]
+
+        return self.backend.update(key, update)
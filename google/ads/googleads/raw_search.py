@@ -0,0 +1,396 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Raw protobuf and bytes access to GoogleAdsService search results.
+
+The generated GoogleAdsService client deserializes every response into a
+proto-plus message, and when use_proto_plus is True every field that is read
+from a row is marshalled into a new Python object. For large reports this is
+the dominant cost of reading results.
+
+The RawGoogleAdsService class sends search and search_stream requests over
+the same channel, and through the same interceptors, as a generated service
+client, but returns raw protobuf responses, or the undeserialized bytes of
+each response, regardless of the client's use_proto_plus setting. Results
+come with a tuple of gaql.Column instances compiled from the query, which
+read each selected field directly from raw GoogleAdsRow messages.
+
+Example:
+    googleads_service = client.get_service("GoogleAdsService")
+    raw_service = RawGoogleAdsService(googleads_service)
+    stream = raw_service.search_stream(customer_id=customer_id, query=query)
+    for values in stream.iter_values():
+        ...
+"""
+
+from importlib import import_module
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import grpc
+from google.protobuf.message import Message as ProtobufMessageType
+
+from google.ads.googleads import gaql
+from google.ads.googleads import util
+from google.ads.googleads.client import _CLIENT_INFO
+from google.ads.googleads.interceptors import MetadataType
+
+_SERVICE_PATH = "/google.ads.googleads.{}.services.GoogleAdsService/{}"
+_ROUTING_HEADER_KEY = "x-goog-request-params"
+# The number of the next_page_token field in SearchGoogleAdsResponse.
+_NEXT_PAGE_TOKEN_FIELD_NUMBER = 2
+
+RequestType = Union[ProtobufMessageType, Dict[str, Any], Any]
+ResponseType = Union[ProtobufMessageType, bytes]
+
+
+def _get_version(service_client: Any) -> str:
+    """Returns the API version of a generated service client.
+
+    Args:
+        service_client: an instance of a generated service client, i.e. a
+            GoogleAdsServiceClient.
+
+    Returns:
+        A str of the API version, i.e. "v23".
+    """
+    # Modules of generated clients are named like
+    # "google.ads.googleads.v23.services.services.google_ads_service.client".
+    return type(service_client).__module__.split(".")[3]
+
+
+class RawSearchResults:
+    """The raw responses of a search or search_stream request.
+
+    Iterating over an instance yields each response either as a raw protobuf
+    message or as bytes. Responses can only be iterated over once.
+    """
+
+    def __init__(
+        self,
+        responses: Iterator[ResponseType],
+        columns: Tuple[gaql.Column, ...],
+        response_class: Any,
+        call: Optional[grpc.Call] = None,
+    ) -> None:
+        """Initializer for the RawSearchResults class.
+
+        Args:
+            responses: an iterator of raw protobuf responses or bytes.
+            columns: a tuple of gaql.Column instances for the selected fields.
+            response_class: the raw protobuf class of the responses.
+            call: an optional grpc.Call of a search_stream request.
+        """
+        self._responses: Iterator[ResponseType] = responses
+        self.columns: Tuple[gaql.Column, ...] = columns
+        self.response_class: Any = response_class
+        self.call: Optional[grpc.Call] = call
+
+    def __iter__(self) -> Iterator[ResponseType]:
+        return self._responses
+
+    def iter_messages(self) -> Iterator[ProtobufMessageType]:
+        """Yields each response as a raw protobuf message.
+
+        Responses that were returned as bytes are deserialized here.
+        """
+        from_string: Any = self.response_class.FromString
+
+        for response in self._responses:
+            if isinstance(response, bytes):
+                yield from_string(response)
+            else:
+                yield response
+
+    def iter_rows(self) -> Iterator[ProtobufMessageType]:
+        """Yields the raw protobuf GoogleAdsRow messages of every response."""
+        for message in self.iter_messages():
+            yield from message.results
+
+    def iter_values(self) -> Iterator[Tuple[Any, ...]]:
+        """Yields a tuple of the selected field values for every row.
+
+        Values are in the order the fields are selected in the query, and are
+        read with the compiled columns, so enum values are str names and
+        repeated fields are lists.
+        """
+        columns: Tuple[gaql.Column, ...] = self.columns
+
+        for message in self.iter_messages():
+            rows: Sequence[ProtobufMessageType] = message.results
+            yield from zip(*[column.get_values(rows) for column in columns])
+
+    def cancel(self) -> bool:
+        """Cancels a search_stream request.
+
+        Returns:
+            A bool of whether the request was cancelled.
+        """
+        return self.call.cancel() if self.call is not None else False
+
+
+class RawGoogleAdsService:
+    """Sends GoogleAdsService search requests without proto-plus wrapping."""
+
+    def __init__(self, service_client: Any) -> None:
+        """Initializer for the RawGoogleAdsService class.
+
+        Args:
+            service_client: a GoogleAdsServiceClient, as returned by
+                GoogleAdsClient.get_service("GoogleAdsService"). Requests are
+                sent over its channel so they use the same credentials,
+                endpoint and interceptors.
+
+        Raises:
+            TypeError: If the service client uses an async transport.
+        """
+        transport: Any = service_client.transport
+        # Generated transports add their own logging interceptor to the
+        # channel, which is stored separately from the channel itself.
+        channel: Any = getattr(
+            transport, "_logged_channel", transport.grpc_channel
+        )
+
+        if not isinstance(channel, grpc.Channel):
+            raise TypeError(
+                "RawGoogleAdsService requires a GoogleAdsServiceClient with a "
+                "synchronous transport."
+            )
+
+        self.version: str = _get_version(service_client)
+        self._channel: grpc.Channel = channel
+        self._types: Any = import_module(
+            f"google.ads.googleads.{self.version}.services.types."
+            "google_ads_service"
+        )
+        self._multicallables: Dict[Tuple[str, bool], Any] = {}
+
+    def _get_multicallable(
+        self, method: str, response_class: Any, as_bytes: bool
+    ) -> Any:
+        """Returns a cached multicallable for a GoogleAdsService method.
+
+        Args:
+            method: a str of the method name, either "Search" or
+                "SearchStream".
+            response_class: the raw protobuf class of the response.
+            as_bytes: a bool of whether responses should be left serialized.
+
+        Returns:
+            A grpc.UnaryUnaryMultiCallable or grpc.UnaryStreamMultiCallable.
+        """
+        key: Tuple[str, bool] = (method, as_bytes)
+        multicallable: Any = self._multicallables.get(key)
+
+        if multicallable is None:
+            factory: Any = (
+                self._channel.unary_stream
+                if method == "SearchStream"
+                else self._channel.unary_unary
+            )
+            # Without a response deserializer gRPC returns the bytes of each
+            # response.
+            multicallable = factory(
+                _SERVICE_PATH.format(self.version, method),
+                request_serializer=lambda request: request.SerializeToString(),
+                response_deserializer=(
+                    None if as_bytes else response_class.FromString
+                ),
+            )
+            self._multicallables[key] = multicallable
+
+        return multicallable
+
+    def _build_request(
+        self,
+        request_class: Any,
+        request: Optional[RequestType],
+        fields: Dict[str, Any],
+    ) -> ProtobufMessageType:
+        """Builds a raw protobuf request message.
+
+        Args:
+            request_class: the raw protobuf class of the request.
+            request: an optional request as a protobuf message, a proto-plus
+                message or a dict.
+            fields: a dict of field values that override those in request.
+
+        Returns:
+            A new raw protobuf request message.
+
+        Raises:
+            ValueError: If the request has no customer_id or query.
+        """
+        if request is None:
+            message: ProtobufMessageType = request_class()
+        elif isinstance(request, dict):
+            message = request_class(**request)
+        else:
+            message = request_class()
+            message.CopyFrom(util.convert_proto_plus_to_protobuf(request))
+
+        for name, value in fields.items():
+            if value is not None:
+                setattr(message, name, value)
+
+        if not message.customer_id or not message.query:
+            raise ValueError("A customer_id and a query must be provided.")
+
+        return message
+
+    def _get_metadata(
+        self, request: ProtobufMessageType, metadata: MetadataType
+    ) -> MetadataType:
+        """Adds the headers that generated clients add to every request."""
+        return tuple(metadata) + (
+            _CLIENT_INFO.to_grpc_metadata(),
+            (_ROUTING_HEADER_KEY, f"customer_id={request.customer_id}"),
+        )
+
+    def search_stream(
+        self,
+        request: Optional[RequestType] = None,
+        *,
+        customer_id: Optional[str] = None,
+        query: Optional[str] = None,
+        as_bytes: bool = False,
+        timeout: Optional[float] = None,
+        metadata: MetadataType = (),
+    ) -> RawSearchResults:
+        """Issues a SearchStream request and returns its raw responses.
+
+        Args:
+            request: an optional SearchGoogleAdsStreamRequest as a protobuf
+                message, a proto-plus message or a dict.
+            customer_id: an optional str customer ID, overriding the request.
+            query: an optional str GAQL query, overriding the request.
+            as_bytes: a bool of whether to yield the serialized bytes of each
+                response instead of deserializing it.
+            timeout: an optional float of the request timeout in seconds.
+            metadata: an optional sequence of additional metadata tuples.
+
+        Returns:
+            A RawSearchResults instance that yields SearchStream responses.
+
+        Raises:
+            ValueError: If no customer_id or query is given, or the query
+                selects a field that doesn't exist.
+        """
+        request_class: Any = self._types.SearchGoogleAdsStreamRequest.pb()
+        response_class: Any = self._types.SearchGoogleAdsStreamResponse.pb()
+        message: ProtobufMessageType = self._build_request(
+            request_class, request, {"customer_id": customer_id, "query": query}
+        )
+        columns: Tuple[gaql.Column, ...] = gaql.compile_columns(
+            message.query, self.version
+        )
+        call: Any = self._get_multicallable(
+            "SearchStream", response_class, as_bytes
+        )(
+            message,
+            timeout=timeout,
+            metadata=self._get_metadata(message, metadata),
+        )
+
+        return RawSearchResults(iter(call), columns, response_class, call)
+
+    def _iter_pages(
+        self,
+        multicallable: Any,
+        request: ProtobufMessageType,
+        timeout: Optional[float],
+        metadata: MetadataType,
+    ) -> Iterator[ResponseType]:
+        """Yields every page of a Search request, following page tokens."""
+        while True:
+            response: ResponseType = multicallable(
+                request, timeout=timeout, metadata=metadata
+            )
+            yield response
+
+            if isinstance(response, bytes):
+                token: Optional[bytes] = util.get_serialized_field(
+                    response, _NEXT_PAGE_TOKEN_FIELD_NUMBER
+                )
+                next_page_token: str = token.decode() if token else ""
+            else:
+                next_page_token = response.next_page_token
+
+            if not next_page_token:
+                return
+
+            next_request: ProtobufMessageType = type(request)()
+            next_request.CopyFrom(request)
+            next_request.page_token = next_page_token
+            request = next_request
+
+    def search(
+        self,
+        request: Optional[RequestType] = None,
+        *,
+        customer_id: Optional[str] = None,
+        query: Optional[str] = None,
+        as_bytes: bool = False,
+        timeout: Optional[float] = None,
+        metadata: MetadataType = (),
+    ) -> RawSearchResults:
+        """Issues Search requests for every page and returns raw responses.
+
+        Pages are requested lazily, one at a time, as the results are
+        iterated over.
+
+        Args:
+            request: an optional SearchGoogleAdsRequest as a protobuf message,
+                a proto-plus message or a dict.
+            customer_id: an optional str customer ID, overriding the request.
+            query: an optional str GAQL query, overriding the request.
+            as_bytes: a bool of whether to yield the serialized bytes of each
+                page instead of deserializing it. The next page token is read
+                from the bytes without deserializing the rest of the page.
+            timeout: an optional float of the timeout in seconds of each page
+                request.
+            metadata: an optional sequence of additional metadata tuples.
+
+        Returns:
+            A RawSearchResults instance that yields Search responses.
+
+        Raises:
+            ValueError: If no customer_id or query is given, or the query
+                selects a field that doesn't exist.
+        """
+        request_class: Any = self._types.SearchGoogleAdsRequest.pb()
+        response_class: Any = self._types.SearchGoogleAdsResponse.pb()
+        message: ProtobufMessageType = self._build_request(
+            request_class, request, {"customer_id": customer_id, "query": query}
+        )
+        columns: Tuple[gaql.Column, ...] = gaql.compile_columns(
+            message.query, self.version
+        )
+        multicallable: Any = self._get_multicallable(
+            "Search", response_class, as_bytes
+        )
+        pages: Iterator[ResponseType] = self._iter_pages(
+            multicallable,
+            message,
+            timeout,
+            self._get_metadata(message, metadata),
+        )
+
+        return RawSearchResults(pages, columns, response_class)
@@ -0,0 +1,366 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Runs GAQL reports for many customers concurrently.
+
+The ReportRunner class issues a search_stream request for every combination
+of customer ID and query on a bounded thread pool. Every worker sends its
+requests through the same GoogleAdsService client, and therefore over the
+same pooled gRPC channels, so concurrency is limited by the API quota rather
+than by the number of processes or connections.
+
+When a request fails with a retryable status, such as RESOURCE_EXHAUSTED, all
+workers pause for an exponentially increasing, jittered delay before sending
+further requests, and the failed request is retried. Results are yielded as
+soon as each report finishes, and only a bounded number of reports are held
+in memory at a time.
+
+Example:
+    runner = ReportRunner(client, max_workers=16)
+    for result in runner.run(customer_ids, [campaign_query, ad_group_query]):
+        if result.succeeded:
+            ...
+"""
+
+from collections import deque
+from concurrent import futures
+import itertools
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+import grpc
+
+from google.ads.googleads.raw_search import RawGoogleAdsService
+from google.ads.googleads.retry import (
+    RETRYABLE_STATUS_CODES,
+    Throttle,
+    get_backoff,
+    has_retry_policy,
+    is_retryable,
+)
+
+_DEFAULT_MAX_WORKERS = 8
+_DEFAULT_MAX_RETRIES = 5
+_DEFAULT_INITIAL_BACKOFF = 1.0
+_DEFAULT_MAX_BACKOFF = 60.0
+ReportRequestType = Tuple[str, str]
+
+
+class ReportResult:
+    """The outcome of running a single query for a single customer."""
+
+    def __init__(
+        self,
+        index: int,
+        customer_id: str,
+        query: str,
+        rows: Optional[List[Any]] = None,
+        exception: Optional[Exception] = None,
+        attempts: int = 1,
+    ) -> None:
+        """Initializer for the ReportResult class.
+
+        Args:
+            index: an int of the position of the request in the order it
+                was submitted.
+            customer_id: a str of the customer ID the query was run for.
+            query: a str of the GAQL query.
+            rows: a list of GoogleAdsRow messages if the request succeeded.
+            exception: the Exception raised by the last attempt if the
+                request failed.
+            attempts: an int of the number of times the request was sent.
+        """
+        self.index: int = index
+        self.customer_id: str = customer_id
+        self.query: str = query
+        self.rows: List[Any] = rows if rows is not None else []
+        self.exception: Optional[Exception] = exception
+        self.attempts: int = attempts
+
+    @property
+    def succeeded(self) -> bool:
+        """Returns whether the report was downloaded successfully."""
+        return self.exception is None
+
+    def __repr__(self) -> str:
+        return (
+            f"ReportResult(index={self.index}, "
+            f"customer_id={self.customer_id!r}, rows={len(self.rows)}, "
+            f"succeeded={self.succeeded}, attempts={self.attempts})"
+        )
+
+
+class ReportRunner:
+    """Runs search_stream requests concurrently on a bounded thread pool."""
+
+    def __init__(
+        self,
+        client: Any,
+        max_workers: int = _DEFAULT_MAX_WORKERS,
+        max_retries: Optional[int] = None,
+        initial_backoff: float = _DEFAULT_INITIAL_BACKOFF,
+        max_backoff: float = _DEFAULT_MAX_BACKOFF,
+        version: Optional[str] = None,
+        raw: bool = False,
+        retryable_status_codes: Sequence[
+            grpc.StatusCode
+        ] = RETRYABLE_STATUS_CODES,
+    ) -> None:
+        """Initializer for the ReportRunner class.
+
+        Args:
+            client: an initialized GoogleAdsClient instance.
+            max_workers: an int of the maximum number of concurrent requests.
+            max_retries: an optional int of the maximum number of times a
+                request that failed with a retryable status is retried.
+                Defaults to 5, or to 0 if the client has a retry_policy,
+                since its retry interceptor already retries failed requests,
+                and retrying them here too would multiply the attempts.
+            initial_backoff: a float of the number of seconds to wait after
+                the first retryable failure. The delay doubles with every
+                further retry of the same request.
+            max_backoff: a float of the maximum number of seconds to wait.
+            version: an optional str of the API version to use.
+            raw: a bool of whether rows should be returned as raw protobuf
+                messages, regardless of the client's use_proto_plus setting.
+                See the raw_search module.
+            retryable_status_codes: a sequence of grpc.StatusCode values that
+                cause a request to be retried.
+
+        Raises:
+            ValueError: If max_workers is less than one or max_retries is
+                negative.
+        """
+        if max_workers < 1:
+            raise ValueError(
+                f"max_workers must be at least 1, but {max_workers} was given."
+            )
+
+        if max_retries is None:
+            max_retries = (
+                0 if has_retry_policy(client) else _DEFAULT_MAX_RETRIES
+            )
+
+        if max_retries < 0:
+            raise ValueError(
+                f"max_retries must not be negative, but {max_retries} was "
+                "given."
+            )
+
+        kwargs: Dict[str, str] = {"version": version} if version else {}
+        self._service: Any = client.get_service("GoogleAdsService", **kwargs)
+        self._raw_service: Optional[RawGoogleAdsService] = (
+            RawGoogleAdsService(self._service) if raw else None
+        )
+        self.max_workers: int = max_workers
+        self.max_retries: int = max_retries
+        self.initial_backoff: float = initial_backoff
+        self.max_backoff: float = max_backoff
+        self.retryable_status_codes: Tuple[grpc.StatusCode, ...] = tuple(
+            retryable_status_codes
+        )
+        self._throttle: Throttle = Throttle()
+
+    def is_retryable(self, exception: Exception) -> bool:
+        """Returns whether a request that raised an exception can be retried.
+
+        Args:
+            exception: the Exception raised by a request.
+        """
+        return is_retryable(exception, self.retryable_status_codes)
+
+    def get_backoff(self, retry: int) -> float:
+        """Returns the number of seconds to wait before a retry.
+
+        Args:
+            retry: an int of the retry number, starting at 1.
+        """
+        return get_backoff(retry, self.initial_backoff, self.max_backoff)
+
+    def _search(self, customer_id: str, query: str) -> List[Any]:
+        """Downloads every row of a single report."""
+        if self._raw_service is not None:
+            return list(
+                self._raw_service.search_stream(
+                    customer_id=customer_id, query=query
+                ).iter_rows()
+            )
+
+        stream: Iterable[Any] = self._service.search_stream(
+            customer_id=customer_id, query=query
+        )
+        return [row for batch in stream for row in batch.results]
+
+    def _run_request(
+        self, index: int, customer_id: str, query: str
+    ) -> ReportResult:
+        """Runs a single request, retrying it after retryable failures."""
+        attempts: int = 0
+
+        while True:
+            self._throttle.wait()
+            attempts += 1
+
+            try:
+                rows: List[Any] = self._search(customer_id, query)
+            except Exception as ex:
+                if attempts > self.max_retries or not self.is_retryable(ex):
+                    return ReportResult(
+                        index, customer_id, query, exception=ex, attempts=attempts
+                    )
+
+                self._throttle.pause(self.get_backoff(attempts))
+                continue
+
+            return ReportResult(
+                index, customer_id, query, rows=rows, attempts=attempts
+            )
+
+    def run_requests(
+        self, requests: Iterable[ReportRequestType]
+    ) -> Iterator[ReportResult]:
+        """Runs each (customer ID, query) pair and yields results as they finish.
+
+        At most max_workers requests are in flight, and requests are read
+        from the given iterable lazily, so it can be a generator over a very
+        large number of customers. If the caller stops iterating, requests
+        that haven't started yet are cancelled.
+
+        Args:
+            requests: an iterable of tuples of a str customer ID and a str
+                GAQL query.
+
+        Yields:
+            ReportResult instances in the order the reports finish. The index
+            of each result is the position of its request in the iterable.
+        """
+        pending_requests: Iterator[Tuple[int, ReportRequestType]] = iter(
+            enumerate(requests)
+        )
+        executor: futures.ThreadPoolExecutor = futures.ThreadPoolExecutor(
+            max_workers=self.max_workers
+        )
+        in_flight: Set[futures.Future] = set()
+
+        def submit(count: int) -> None:
+            for index, (customer_id, query) in itertools.islice(
+                pending_requests, count
+            ):
+                in_flight.add(
+                    executor.submit(
+                        self._run_request, index, customer_id, query
+                    )
+                )
+
+        try:
+            submit(self.max_workers)
+
+            while in_flight:
+                done, _ = futures.wait(
+                    in_flight, return_when=futures.FIRST_COMPLETED
+                )
+
+                for future in done:
+                    in_flight.remove(future)
+                    submit(1)
+                    yield future.result()
+        finally:
+            for future in in_flight:
+                future.cancel()
+
+            executor.shutdown(wait=False)
+
+    def run_requests_in_order(
+        self, requests: Iterable[ReportRequestType]
+    ) -> Iterator[ReportResult]:
+        """Runs each (customer ID, query) pair and yields results in order.
+
+        Like run_requests, but results are yielded in the order of the
+        requests. Results that finish before the ones of earlier requests
+        wait until those have been yielded, so at most twice as many requests
+        as workers are started ahead of the next result, and a slow request
+        can't cause the results of every later request to be held in memory.
+
+        Args:
+            requests: an iterable of tuples of a str customer ID and a str
+                GAQL query.
+
+        Yields:
+            ReportResult instances in the order of the requests.
+        """
+        pending_requests: Iterator[Tuple[int, ReportRequestType]] = iter(
+            enumerate(requests)
+        )
+        executor: futures.ThreadPoolExecutor = futures.ThreadPoolExecutor(
+            max_workers=self.max_workers
+        )
+        in_flight: Deque[futures.Future] = deque()
+        max_in_flight: int = 2 * self.max_workers
+
+        def submit() -> bool:
+            pending: Optional[Tuple[int, ReportRequestType]] = next(
+                pending_requests, None
+            )
+
+            if pending is None:
+                return False
+
+            index, (customer_id, query) = pending
+            in_flight.append(
+                executor.submit(self._run_request, index, customer_id, query)
+            )
+            return True
+
+        try:
+            while len(in_flight) < max_in_flight and submit():
+                pass
+
+            while in_flight:
+                result: ReportResult = in_flight.popleft().result()
+                submit()
+                yield result
+        finally:
+            for future in in_flight:
+                future.cancel()
+
+            executor.shutdown(wait=False)
+
+    def run(
+        self,
+        customer_ids: Iterable[str],
+        queries: Union[str, Iterable[str]],
+    ) -> Iterator[ReportResult]:
+        """Runs every query for every customer and yields results as they finish.
+
+        Args:
+            customer_ids: an iterable of str customer IDs.
+            queries: a str GAQL query or an iterable of str GAQL queries.
+
+        Yields:
+            ReportResult instances in the order the reports finish.
+        """
+        if isinstance(queries, str):
+            queries = [queries]
+
+        return self.run_requests(itertools.product(customer_ids, list(queries)))
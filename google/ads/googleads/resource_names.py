@@ -0,0 +1,383 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Builds and parses resource names in bulk.
+
+The generated service clients have *_path and parse_*_path static methods,
+which format a template and match an uncompiled regular expression on every
+call. This module reads the template of each resource name of an API version
+from the *_path methods of GoogleAdsServiceClient once, builds resource names
+with a printf-style format, and parses them with precompiled patterns:
+
+    template = resource_names.get_template("campaign")
+    template.build(customer_id="123", campaign_id="456")
+    template.parse("customers/123/campaigns/456")
+
+build_many and parse_many convert whole columns at a time, such as the
+resource names of the rows of a report. parse_many matches all of the names
+in a single pass of the pattern:
+
+    ids = resource_names.parse_many("campaign", names, as_int=True)
+    ids["customer_id"], ids["campaign_id"]  # arrays of int64 IDs
+"""
+
+from array import array
+from importlib import import_module
+import inspect
+import re
+import string
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from google.ads.googleads.client import _DEFAULT_VERSION, _VALID_API_VERSIONS
+
+_PATH_METHOD_SUFFIX = "_path"
+# The *_path methods of resources that don't belong to the Google Ads API.
+_COMMON_PATH_PREFIX = "common_"
+
+ColumnsType = Dict[str, Union[List[str], array]]
+
+# Maps each API version to the templates of its resource names, which are
+# read the first time the version is requested.
+_TEMPLATES: Dict[str, Dict[str, "ResourceNameTemplate"]] = {}
+
+
+class ResourceNameTemplate:
+    """Builds and parses the resource names of a resource type.
+
+    Resource names are parsed like the parse_*_path methods of the generated
+    clients, in which each ID matches the shortest non-empty text that's
+    followed by the next literal part of the template. Names that contain
+    line breaks don't match.
+    """
+
+    def __init__(self, name: str, template: str) -> None:
+        """Initializer for the ResourceNameTemplate class.
+
+        Args:
+            name: a str of the name of the resource type, such as "campaign".
+            template: a str of the template of its resource names, such as
+                "customers/{customer_id}/campaigns/{campaign_id}".
+
+        Raises:
+            ValueError: If the template has no fields, repeated fields, or
+                fields that aren't plain names.
+        """
+        literals: List[str] = []
+        fields: List[str] = []
+
+        for literal, field, format_spec, conversion in string.Formatter().parse(
+            template
+        ):
+            if field is not None and (
+                not field.isidentifier() or format_spec or conversion
+            ):
+                raise ValueError(
+                    f"The template {template!r} has an invalid field "
+                    f"{field!r}."
+                )
+
+            literals.append(literal)
+
+            if field is not None:
+                fields.append(field)
+
+        if not fields or len(set(fields)) != len(fields):
+            raise ValueError(
+                f"The template {template!r} has no fields or repeated fields."
+            )
+
+        if len(literals) == len(fields):
+            # The template ends with a field.
+            literals.append("")
+
+        self.name: str = name
+        self.template: str = template
+        self.fields: Tuple[str, ...] = tuple(fields)
+        self._field_set: frozenset = frozenset(fields)
+        # The template as a printf-style format, which is the fastest way to
+        # build a name from a tuple of values.
+        self._format: str = "%s".join(
+            literal.replace("%", "%%") for literal in literals
+        )
+        # Each ID matches the shortest non-empty text on a line that's
+        # followed by the next part of the template, like in the generated
+        # parsers.
+        pattern: str = (
+            "".join(
+                re.escape(literal) + f"(?P<{field}>.+?)"
+                for literal, field in zip(literals, fields)
+            )
+            + re.escape(literals[-1])
+        )
+        self._pattern: re.Pattern = re.compile(pattern + r"\Z")
+        # Matches every resource name in a string of names that are
+        # separated by line breaks, see parse_many.
+        self._lines_pattern: re.Pattern = re.compile(
+            f"^{pattern}$", re.MULTILINE
+        )
+
+    @classmethod
+    def from_path_method(
+        cls, name: str, path_method: Callable[..., str]
+    ) -> "ResourceNameTemplate":
+        """Creates a template from a *_path method of a generated client.
+
+        The template is the resource name the method returns when each of its
+        arguments is the placeholder of its field.
+
+        Args:
+            name: a str of the name of the resource type.
+            path_method: a *_path static method of a generated client, such as
+                OfflineUserDataJobServiceClient.offline_user_data_job_path.
+
+        Returns:
+            A ResourceNameTemplate of the method's resource names.
+        """
+        fields: List[str] = list(inspect.signature(path_method).parameters)
+        return cls(
+            name, path_method(**{field: f"{{{field}}}" for field in fields})
+        )
+
+    def __repr__(self) -> str:
+        return f"ResourceNameTemplate({self.name!r}, {self.template!r})"
+
+    def build(self, **fields: Any) -> str:
+        """Returns a resource name.
+
+        Args:
+            **fields: the value of each field of the template.
+
+        Returns:
+            A str of the resource name.
+
+        Raises:
+            TypeError: If fields are missing or unknown.
+        """
+        if fields.keys() != self._field_set:
+            raise TypeError(
+                f"The {self.name} resource name requires the fields "
+                f"{list(self.fields)}, but {sorted(fields)} were given."
+            )
+
+        return self._format % tuple(fields[field] for field in self.fields)
+
+    def build_many(self, columns: Mapping[str, Iterable[Any]]) -> List[str]:
+        """Returns the resource names of columns of field values.
+
+        Args:
+            columns: a mapping of each field of the template to an iterable,
+                such as a list or array, of its values. The resource names are
+                built from the values at each position, until the shortest
+                iterable is exhausted.
+
+        Returns:
+            A list of the str resource names.
+
+        Raises:
+            TypeError: If fields are missing or unknown.
+        """
+        if columns.keys() != self._field_set:
+            raise TypeError(
+                f"The {self.name} resource name requires the fields "
+                f"{list(self.fields)}, but {sorted(columns)} were given."
+            )
+
+        name_format: str = self._format
+        return [
+            name_format % values
+            for values in zip(*(columns[field] for field in self.fields))
+        ]
+
+    def parse(self, path: str) -> Dict[str, str]:
+        """Parses a resource name into the values of its fields.
+
+        Args:
+            path: a str of the resource name.
+
+        Returns:
+            A dict of the str value of each field, which is empty if the
+            resource name doesn't match the template.
+        """
+        match: Optional[re.Match] = self._pattern.match(path)
+        return match.groupdict() if match else {}
+
+    def parse_many(
+        self, paths: Iterable[str], as_int: bool = False
+    ) -> ColumnsType:
+        """Parses resource names into columns of the values of their fields.
+
+        Args:
+            paths: an iterable of str resource names.
+            as_int: a bool of whether the values are converted to int64
+                arrays, for resource names whose fields are all IDs. They're
+                lists of str by default.
+
+        Returns:
+            A dict of each field to a list or array of its value in each
+            resource name.
+
+        Raises:
+            ValueError: If a resource name doesn't match the template, or
+                as_int is True and a value isn't an integer.
+        """
+        if not isinstance(paths, list):
+            paths = list(paths)
+
+        names: str = "\n".join(paths)
+        rows: List[Any] = self._lines_pattern.findall(names)
+
+        # Each match is on a single line, so if there are as many matches as
+        # resource names, and as many lines, every resource name matched.
+        if len(rows) != len(paths) or names.count("\n") != len(paths) - 1:
+            for path in paths:
+                if not self._pattern.match(path):
+                    raise ValueError(
+                        f"{path!r} isn't a {self.name} resource name, whose "
+                        f"template is {self.template!r}."
+                    )
+
+        # findall returns tuples of the values, or the values themselves if
+        # there's a single field.
+        columns: List[Any] = (
+            [rows] if len(self.fields) == 1 else list(zip(*rows))
+        ) or [[] for _ in self.fields]
+
+        if as_int:
+            return {
+                field: array("q", map(int, column))
+                for field, column in zip(self.fields, columns)
+            }
+
+        return {
+            field: list(column) for field, column in zip(self.fields, columns)
+        }
+
+
+def get_templates(
+    version: str = _DEFAULT_VERSION,
+) -> Dict[str, ResourceNameTemplate]:
+    """Returns the templates of the resource names of an API version.
+
+    They're read from the *_path methods of GoogleAdsServiceClient, which
+    has one for each resource, the first time the version is requested.
+
+    Args:
+        version: a str of the API version, e.g. "v25".
+
+    Returns:
+        A dict of each str resource type name, such as "campaign", to its
+        ResourceNameTemplate. It's shared by all callers and must not be
+        modified.
+
+    Raises:
+        ValueError: If the version isn't supported.
+    """
+    templates: Optional[Dict[str, ResourceNameTemplate]] = _TEMPLATES.get(
+        version
+    )
+
+    if templates is not None:
+        return templates
+
+    if version not in _VALID_API_VERSIONS:
+        raise ValueError(
+            f"Specified Google Ads API version '{version}' does not exist."
+        )
+
+    service_client_class: type = import_module(
+        f"google.ads.googleads.{version}.services.services."
+        "google_ads_service.client"
+    ).GoogleAdsServiceClient
+    templates = {}
+
+    for attribute in dir(service_client_class):
+        if (
+            not attribute.endswith(_PATH_METHOD_SUFFIX)
+            or attribute.startswith(("parse_", _COMMON_PATH_PREFIX))
+        ):
+            continue
+
+        name: str = attribute[: -len(_PATH_METHOD_SUFFIX)]
+        templates[name] = ResourceNameTemplate.from_path_method(
+            name, getattr(service_client_class, attribute)
+        )
+
+    _TEMPLATES[version] = templates
+    return templates
+
+
+def get_template(
+    name: str, version: str = _DEFAULT_VERSION
+) -> ResourceNameTemplate:
+    """Returns the template of the resource names of a resource type.
+
+    Args:
+        name: a str of the name of the resource type, which is the name of
+            its *_path method without the suffix, e.g. "ad_group_ad".
+        version: a str of the API version, e.g. "v25".
+
+    Returns:
+        The ResourceNameTemplate of the resource type.
+
+    Raises:
+        ValueError: If the version isn't supported or the resource type
+            doesn't exist in it.
+    """
+    try:
+        return get_templates(version)[name]
+    except KeyError:
+        raise ValueError(
+            f"Specified resource '{name}' does not exist in Google Ads API "
+            f"{version}."
+        ) from None
+
+
+def build(name: str, version: str = _DEFAULT_VERSION, **fields: Any) -> str:
+    """Returns a resource name, see ResourceNameTemplate.build."""
+    return get_template(name, version).build(**fields)
+
+
+def parse(
+    name: str, path: str, version: str = _DEFAULT_VERSION
+) -> Dict[str, str]:
+    """Parses a resource name, see ResourceNameTemplate.parse."""
+    return get_template(name, version).parse(path)
+
+
+def build_many(
+    name: str,
+    columns: Mapping[str, Iterable[Any]],
+    version: str = _DEFAULT_VERSION,
+) -> List[str]:
+    """Returns resource names, see ResourceNameTemplate.build_many."""
+    return get_template(name, version).build_many(columns)
+
+
+def parse_many(
+    name: str,
+    paths: Iterable[str],
+    as_int: bool = False,
+    version: str = _DEFAULT_VERSION,
+) -> ColumnsType:
+    """Parses resource names, see ResourceNameTemplate.parse_many."""
+    return get_template(name, version).parse_many(paths, as_int=as_int)
@@ -0,0 +1,485 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Policies that control how failed requests are retried.
+
+When the client is configured with a "retry_policy", requests that fail with
+a retryable status are retried by the retry interceptor with an exponentially
+increasing, jittered delay. If a GoogleAdsFailure includes a QuotaError with a
+retry delay, the request isn't retried before that delay has passed, and it
+isn't retried at all if the delay is longer than the policy's max_backoff.
+
+Requests to methods that change data, such as Mutate methods, are only
+retried when they were rejected before being processed, i.e. with a
+RESOURCE_EXHAUSTED status, so that they aren't applied twice. Streams are only
+retried if they fail before their first response is received.
+
+Each policy has a RetryBudget that's shared by all of the requests it
+applies to. When many requests fail at once the budget runs out, and failed
+requests are raised instead of retried, which prevents retry storms.
+
+A policy can be set for the requests sent in a block of code, overriding
+the client's policy:
+
+    with use_retry_policy(RetryPolicy(max_attempts=10)):
+        googleads_service.search(customer_id=customer_id, query=query)
+"""
+
+import contextlib
+import contextvars
+import datetime
+import random
+import threading
+import time
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import grpc
+
+from google.ads.googleads.errors import GoogleAdsException
+
+RETRYABLE_STATUS_CODES: Tuple[grpc.StatusCode, ...] = (
+    grpc.StatusCode.RESOURCE_EXHAUSTED,
+    grpc.StatusCode.UNAVAILABLE,
+    grpc.StatusCode.INTERNAL,
+)
+# Statuses of requests that were rejected before they were processed, so
+# they can be retried even if they change data.
+_UNPROCESSED_STATUS_CODES: Tuple[grpc.StatusCode, ...] = (
+    grpc.StatusCode.RESOURCE_EXHAUSTED,
+)
+# Prefixes of the names of methods that don't change data.
+IDEMPOTENT_METHOD_PREFIXES: Tuple[str, ...] = (
+    "Search",
+    "Get",
+    "List",
+    "Generate",
+    "Suggest",
+)
+_DEFAULT_MAX_ATTEMPTS = 5
+_DEFAULT_INITIAL_BACKOFF = 1.0
+_DEFAULT_MAX_BACKOFF = 60.0
+_DEFAULT_BUDGET_MAX_TOKENS = 10.0
+_DEFAULT_BUDGET_TOKEN_RATIO = 0.1
+
+_retry_policy_override: contextvars.ContextVar = contextvars.ContextVar(
+    "retry_policy_override", default=None
+)
+
+
+def is_retryable(
+    exception: Exception,
+    status_codes: Sequence[grpc.StatusCode] = RETRYABLE_STATUS_CODES,
+) -> bool:
+    """Returns whether a request that raised an exception can be retried.
+
+    Args:
+        exception: the Exception raised by a request.
+        status_codes: a sequence of grpc.StatusCode values that are retryable.
+    """
+    return get_status_code(exception) in status_codes
+
+
+def get_status_code(exception: Exception) -> Optional[grpc.StatusCode]:
+    """Returns the status code of a failed request.
+
+    Args:
+        exception: the Exception raised by a request.
+
+    Returns:
+        The grpc.StatusCode of the request, or None if the exception isn't a
+        gRPC error.
+    """
+    error: Any = (
+        exception.error
+        if isinstance(exception, GoogleAdsException)
+        else exception
+    )
+
+    if not isinstance(error, grpc.RpcError) or not callable(
+        getattr(error, "code", None)
+    ):
+        return None
+
+    return error.code()
+
+
+def get_backoff(retry: int, initial_backoff: float, max_backoff: float) -> float:
+    """Returns the number of seconds to wait before a retry.
+
+    The delay grows exponentially with each retry and half of it is
+    randomized, so that requests that fail at the same time don't all retry
+    at the same time.
+
+    Args:
+        retry: an int of the retry number, starting at 1.
+        initial_backoff: a float of the delay before the first retry.
+        max_backoff: a float of the maximum delay.
+    """
+    delay: float = min(max_backoff, initial_backoff * 2 ** (retry - 1))
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+def get_quota_retry_delay(failure: Any) -> Optional[float]:
+    """Returns the retry delay of the QuotaErrors in a GoogleAdsFailure.
+
+    Args:
+        failure: a GoogleAdsFailure proto-plus or protobuf message.
+
+    Returns:
+        A float of the longest retry delay, in seconds, of the errors in the
+        failure, or None if none of them have one.
+    """
+    retry_delay: Optional[float] = None
+
+    for error in failure.errors:
+        details: Any = error.details
+        if not details.quota_error_details:
+            continue
+
+        # Durations are timedelta instances in proto-plus messages.
+        delay: Union[datetime.timedelta, Any] = (
+            details.quota_error_details.retry_delay
+        )
+        seconds: float = (
+            delay.total_seconds()
+            if isinstance(delay, datetime.timedelta)
+            else delay.seconds + delay.nanos / 1e9
+        )
+
+        if seconds and (retry_delay is None or seconds > retry_delay):
+            retry_delay = seconds
+
+    return retry_delay
+
+
+def is_idempotent(method: str) -> bool:
+    """Returns whether a method doesn't change data.
+
+    Args:
+        method: a str of the method name, e.g. "SearchStream".
+    """
+    return method.startswith(IDEMPOTENT_METHOD_PREFIXES)
+
+
+def has_retry_policy(client: Any) -> bool:
+    """Returns whether a client's requests are retried by its interceptor.
+
+    Runners that retry requests themselves, such as the ReportRunner, don't
+    retry the requests of such clients by default, since every retry of the
+    runner would be retried again by the interceptor.
+
+    Args:
+        client: a GoogleAdsClient instance.
+    """
+    return isinstance(getattr(client, "retry_policy", None), RetryPolicy)
+
+
+class Throttle:
+    """Pauses every worker of a runner after a retryable error.
+
+    Runners that send requests concurrently, such as the ReportRunner, pause
+    all of their workers when one of them is throttled, instead of only
+    retrying the request that failed.
+    """
+
+    def __init__(self) -> None:
+        self._lock: threading.Lock = threading.Lock()
+        self._resume_at: float = 0.0
+
+    def wait(self) -> None:
+        """Blocks until the current pause, if any, has ended."""
+        delay: float = self._resume_at - time.monotonic()
+
+        if delay > 0:
+            time.sleep(delay)
+
+    def pause(self, seconds: float) -> None:
+        """Pauses all workers for at least the given number of seconds."""
+        with self._lock:
+            self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+
+
+class RetryBudget:
+    """Limits retries when a large share of requests are failing.
+
+    Each failed request takes a token from the budget, and each successful
+    request returns a fraction of one. Requests are only retried while more
+    than half of the tokens are left, so retries stop when failures are
+    common and resume as requests start succeeding again.
+    """
+
+    def __init__(
+        self,
+        max_tokens: float = _DEFAULT_BUDGET_MAX_TOKENS,
+        token_ratio: float = _DEFAULT_BUDGET_TOKEN_RATIO,
+    ):
+        """Initializer for the RetryBudget class.
+
+        Args:
+            max_tokens: a float of the number of tokens in a full budget.
+            token_ratio: a float of the tokens returned by each successful
+                request.
+
+        Raises:
+            ValueError: If max_tokens or token_ratio isn't positive.
+        """
+        if max_tokens <= 0 or token_ratio <= 0:
+            raise ValueError(
+                "The max_tokens and token_ratio of a retry budget must be "
+                f"positive, but {max_tokens} and {token_ratio} were given."
+            )
+
+        self.max_tokens: float = max_tokens
+        self.token_ratio: float = token_ratio
+        self._tokens: float = max_tokens
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def tokens(self) -> float:
+        """The number of tokens that are left."""
+        return self._tokens
+
+    def record_success(self) -> None:
+        """Returns a fraction of a token for a successful request."""
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.token_ratio)
+
+    def record_failure(self) -> bool:
+        """Takes a token for a failed request.
+
+        Returns:
+            True if the request can be retried, or False if the budget has
+            run out.
+        """
+        with self._lock:
+            self._tokens = max(0.0, self._tokens - 1)
+            return self._tokens > self.max_tokens / 2
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Returns self serialized as a dict, without the unpicklable lock."""
+        state: Dict[str, Any] = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, d: Dict[str, Any]) -> None:
+        """Deserializes self with the given dictionary."""
+        self.__dict__.update(d)
+        self._lock = threading.Lock()
+
+
+class RetryPolicy:
+    """Controls which failed requests are retried and when."""
+
+    def __init__(
+        self,
+        max_attempts: int = _DEFAULT_MAX_ATTEMPTS,
+        initial_backoff: float = _DEFAULT_INITIAL_BACKOFF,
+        max_backoff: float = _DEFAULT_MAX_BACKOFF,
+        retryable_status_codes: Sequence[
+            grpc.StatusCode
+        ] = RETRYABLE_STATUS_CODES,
+        retry_non_idempotent: bool = False,
+        budget: Optional[RetryBudget] = None,
+    ):
+        """Initializer for the RetryPolicy class.
+
+        Args:
+            max_attempts: an int of the maximum number of times a request is
+                sent, including the first time. 1 disables retries.
+            initial_backoff: a float of the seconds to wait before the first
+                retry.
+            max_backoff: a float of the maximum seconds to wait before a
+                retry. Requests aren't retried if a QuotaError asks for a
+                longer delay.
+            retryable_status_codes: a sequence of the grpc.StatusCode values
+                of failures that are retried.
+            retry_non_idempotent: a bool of whether requests to methods that
+                change data are retried with any retryable status, rather
+                than only when they were rejected before being processed.
+            budget: an optional RetryBudget shared by the requests the policy
+                applies to. A new budget is created by default.
+
+        Raises:
+            ValueError: If max_attempts is less than one.
+        """
+        if max_attempts < 1:
+            raise ValueError(
+                f"max_attempts must be at least 1, but {max_attempts} was "
+                "given."
+            )
+
+        self.max_attempts: int = max_attempts
+        self.initial_backoff: float = initial_backoff
+        self.max_backoff: float = max_backoff
+        self.retryable_status_codes: Tuple[grpc.StatusCode, ...] = tuple(
+            retryable_status_codes
+        )
+        self.retry_non_idempotent: bool = retry_non_idempotent
+        self.budget: RetryBudget = budget if budget else RetryBudget()
+
+    @classmethod
+    def from_dict(cls, config: Dict[str, Any]) -> "RetryPolicy":
+        """Creates a policy from the "retry_policy" configuration.
+
+        Args:
+            config: a dict with any of the keys "max_attempts",
+                "initial_backoff", "max_backoff", "retryable_status_codes",
+                which is a list of status code names such as "UNAVAILABLE",
+                "retry_non_idempotent", "budget_max_tokens" and
+                "budget_token_ratio".
+
+        Returns:
+            A new RetryPolicy instance.
+
+        Raises:
+            ValueError: If the configuration has unknown keys or status codes.
+        """
+        config = dict(config)
+        budget_config: Dict[str, float] = {
+            key: float(config.pop(f"budget_{key}"))
+            for key in ("max_tokens", "token_ratio")
+            if f"budget_{key}" in config
+        }
+        kwargs: Dict[str, Any] = {}
+
+        for key, convert in (
+            ("max_attempts", int),
+            ("initial_backoff", float),
+            ("max_backoff", float),
+        ):
+            if key in config:
+                kwargs[key] = convert(config.pop(key))
+
+        if "retry_non_idempotent" in config:
+            value: Union[str, bool] = config.pop("retry_non_idempotent")
+            kwargs["retry_non_idempotent"] = (
+                value if isinstance(value, bool) else value.lower() == "true"
+            )
+
+        if "retryable_status_codes" in config:
+            names: Sequence[str] = config.pop("retryable_status_codes")
+            try:
+                kwargs["retryable_status_codes"] = tuple(
+                    grpc.StatusCode[name.upper()] for name in names
+                )
+            except KeyError as ex:
+                raise ValueError(
+                    f"Unknown status code {ex} in the retry_policy "
+                    "configuration."
+                ) from ex
+
+        if config:
+            raise ValueError(
+                "Unknown keys in the retry_policy configuration: "
+                f"{sorted(config)}."
+            )
+
+        return cls(budget=RetryBudget(**budget_config), **kwargs)
+
+    def get_retry_delay(
+        self,
+        exception: Exception,
+        attempt: int,
+        method: str,
+        failure: Any = None,
+    ) -> Optional[float]:
+        """Returns how long to wait before retrying a failed request.
+
+        Takes a token from the budget if the failure is retryable.
+
+        Args:
+            exception: the Exception raised by the failed attempt.
+            attempt: an int of the number of times the request has been sent.
+            method: a str of the method name, e.g. "MutateCampaigns".
+            failure: an optional GoogleAdsFailure of the failed attempt.
+
+        Returns:
+            A float of the seconds to wait before retrying the request, or
+            None if it shouldn't be retried.
+        """
+        status_code: Optional[grpc.StatusCode] = get_status_code(exception)
+
+        if status_code not in self.retryable_status_codes:
+            return None
+
+        if (
+            not self.retry_non_idempotent
+            and not is_idempotent(method)
+            and status_code not in _UNPROCESSED_STATUS_CODES
+        ):
+            return None
+
+        # Failures take from the budget even on the last attempt, since they
+        # show how many requests are failing.
+        if not self.budget.record_failure() or attempt >= self.max_attempts:
+            return None
+
+        delay: float = get_backoff(
+            attempt, self.initial_backoff, self.max_backoff
+        )
+        quota_delay: Optional[float] = (
+            get_quota_retry_delay(failure) if failure is not None else None
+        )
+
+        if quota_delay is not None:
+            if quota_delay > self.max_backoff:
+                return None
+
+            delay = max(delay, quota_delay)
+
+        return delay
+
+
+def get_retry_policy_override() -> Optional[RetryPolicy]:
+    """Returns the policy set with use_retry_policy, if there is one."""
+    return _retry_policy_override.get()
+
+
+@contextlib.contextmanager
+def use_retry_policy(policy: Optional[RetryPolicy]) -> Iterator[None]:
+    """Sets the retry policy of the requests sent within the context.
+
+    The policy applies to requests sent from the current thread, or the
+    current asyncio task, and overrides the client's policy.
+
+    Args:
+        policy: a RetryPolicy, or None to disable retries.
+    """
+    token: contextvars.Token = _retry_policy_override.set(
+        policy if policy is not None else RetryPolicy(max_attempts=1)
+    )
+
+    try:
+        yield
+    finally:
+        _retry_policy_override.reset(token)
+
+
+__all__ = [
+    "RETRYABLE_STATUS_CODES",
+    "RetryBudget",
+    "RetryPolicy",
+    "get_backoff",
+    "get_quota_retry_delay",
+    "is_idempotent",
+    "is_retryable",
+    "use_retry_policy",
+]
@@ -13,13 +13,32 @@
 # limitations under the License.
 """Common utilities for the Google Ads API client library."""
 
+import contextlib
 import functools
+import os
 import re
+import time
 
+from google.protobuf.descriptor import FieldDescriptor
 from google.protobuf.message import Message as ProtobufMessageType
 import proto
 
-from typing import Any, List, TypeVar, overload, Union
+from typing import (
+    Any,
+    IO,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    overload,
+    Union,
+)
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
 
 # This regex matches characters preceded by start of line or an underscore.
 _RE_FIND_CHARS_TO_UPPERCASE = re.compile(r"(?:_|^)([a-z])")
@@ -216,3 +235,134 @@ def proto_copy_from(destination: Union[PPM, PBPM], origin: Union[PPM, PBPM]) ->
             "Only protobuf message instances can be used for copying. "
             f"A {type(destination)} and a {type(origin)} were given."
         )
+
+
+def is_repeated_field(field: FieldDescriptor) -> bool:
+    """Returns whether a protobuf field is repeated.
+
+    Newer protobuf versions replace the "label" attribute of field
+    descriptors with an "is_repeated" attribute.
+
+    Args:
+        field: a protobuf FieldDescriptor.
+    """
+    if hasattr(field, "is_repeated"):
+        return field.is_repeated
+
+    return field.label == FieldDescriptor.LABEL_REPEATED
+
+
+def _read_varint(data: bytes, position: int) -> Tuple[int, int]:
+    """Reads a protobuf base 128 varint from the given position in data.
+
+    Args:
+        data: a bytes object of a serialized protobuf message.
+        position: the int index of the first byte of the varint.
+
+    Returns:
+        A tuple of the int value and the int position after the varint.
+
+    Raises:
+        ValueError: If data ends before the varint does.
+    """
+    result: int = 0
+    shift: int = 0
+
+    while True:
+        if position >= len(data):
+            raise ValueError("Truncated varint in serialized message.")
+
+        byte: int = data[position]
+        position += 1
+        result |= (byte & 0x7F) << shift
+
+        if not byte & 0x80:
+            return result, position
+
+        shift += 7
+
+
+def get_serialized_field(data: bytes, field_number: int) -> Optional[bytes]:
+    """Returns the raw value of a length-delimited field of a message.
+
+    Reads the top-level fields of a serialized protobuf message without
+    deserializing it, skipping over the values of every other field. This
+    makes it possible to read a single string, bytes or message field, for
+    example the next_page_token of a large SearchGoogleAdsResponse, without
+    parsing all of its rows.
+
+    Args:
+        data: a bytes object of a serialized protobuf message.
+        field_number: the int number of a string, bytes or message field.
+
+    Returns:
+        The bytes value of the last occurrence of the field, which is the
+        value protobuf uses for non-repeated fields, or None if the field is
+        not present.
+
+    Raises:
+        ValueError: If data is not a valid serialized message.
+    """
+    value: Optional[bytes] = None
+    position: int = 0
+    length: int = len(data)
+
+    while position < length:
+        tag, position = _read_varint(data, position)
+        wire_type: int = tag & 0x7
+
+        if wire_type == 0:
+            _, position = _read_varint(data, position)
+        elif wire_type == 1:
+            position += 8
+        elif wire_type == 2:
+            size, position = _read_varint(data, position)
+            if tag >> 3 == field_number:
+                value = data[position : position + size]
+            position += size
+        elif wire_type == 5:
+            position += 4
+        else:
+            raise ValueError(
+                f"Unsupported wire type {wire_type} in serialized message."
+            )
+
+    if position > length:
+        raise ValueError("Truncated field in serialized message.")
+
+    return value
+
+
+@contextlib.contextmanager
+def file_lock(file: IO[Any]) -> Iterator[None]:
+    """Holds an exclusive lock on an open file until the block exits.
+
+    The lock is advisory and shared by every process that locks the same
+    file with this function, which makes it possible to coordinate state,
+    such as a cache, that's stored in the file by several processes.
+
+    Args:
+        file: an open file object.
+    """
+    if os.name == "nt":
+        # msvcrt locks a region of the file, so the same first byte is always
+        # locked. It gives up after ten seconds, so it's retried until the
+        # lock is acquired.
+        file.seek(0)
+        while True:
+            try:
+                msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+                break
+            except OSError:
+                time.sleep(0.1)
+        try:
+            yield
+        finally:
+            file.seek(0)
+            msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(file.fileno(), fcntl.LOCK_UN)
@@ -0,0 +1,217 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the batch job runner."""
+
+import importlib
+import threading
+from unittest import mock, TestCase
+
+from google.ads.googleads import batch_job_runner
+from google.ads.googleads import client as Client
+from google.ads.googleads import mutate_batcher
+
+latest_version = Client._DEFAULT_VERSION
+
+_batch_job_service = importlib.import_module(
+    f"google.ads.googleads.{latest_version}.services.types.batch_job_service"
+)
+_google_ads_service = importlib.import_module(
+    f"google.ads.googleads.{latest_version}.services.types.google_ads_service"
+)
+
+
+class _Operation:
+    """A long-running operation that's done after a number of polls."""
+
+    def __init__(self, polls, exception=None):
+        self.polls = polls
+        self._exception = exception
+
+    def done(self):
+        self.polls -= 1
+        return self.polls < 0
+
+    def exception(self):
+        return self._exception
+
+
+class _BatchJobService:
+    """A BatchJobService that keeps the operations added to its jobs."""
+
+    def __init__(self, polls=0):
+        self._lock = threading.Lock()
+        self._polls = polls
+        self.jobs = {}
+        self.add_requests = []
+
+    def mutate_batch_job(self, request):
+        with self._lock:
+            resource_name = (
+                f"customers/{request['customer_id']}/batchJobs/"
+                f"{len(self.jobs)}"
+            )
+            self.jobs[resource_name] = []
+        return _batch_job_service.MutateBatchJobResponse(
+            result={"resource_name": resource_name}
+        )
+
+    def add_batch_job_operations(self, request):
+        operations = self.jobs[request["resource_name"]]
+        self.add_requests.append(request)
+        # Sequence tokens are the number of operations added so far.
+        if str(len(operations) or "") != request.get("sequence_token", ""):
+            raise ValueError("Invalid sequence token.")
+        operations.extend(request["mutate_operations"])
+        return _batch_job_service.AddBatchJobOperationsResponse(
+            total_operations=len(operations),
+            next_sequence_token=str(len(operations)),
+        )
+
+    def run_batch_job(self, resource_name):
+        return _Operation(self._polls)
+
+    def list_batch_job_results(self, request):
+        for index, _ in enumerate(self.jobs[request["resource_name"]]):
+            yield _batch_job_service.BatchJobResult(operation_index=index)
+
+
+def _get_operation(campaign_id):
+    return _google_ads_service.MutateOperation(
+        campaign_operation={"remove": f"customers/1/campaigns/{campaign_id}"}
+    )
+
+
+class BatchJobRunnerTest(TestCase):
+    def _create_runner(self, service=None, **kwargs):
+        client = mock.Mock()
+        service = service or _BatchJobService()
+        client.get_service.return_value = service
+        kwargs.setdefault("initial_poll_delay", 0)
+        return batch_job_runner.BatchJobRunner(client, **kwargs), service
+
+    def test_run(self):
+        runner, service = self._create_runner(max_operations=2)
+        operations = (_get_operation(i) for i in range(5))
+        results = list(runner.run("1", operations))
+
+        self.assertEqual([r.operation_index for r in results], list(range(5)))
+        self.assertEqual(
+            [len(r["mutate_operations"]) for r in service.add_requests],
+            [2, 2, 1],
+        )
+        self.assertEqual(
+            [r.get("sequence_token") for r in service.add_requests],
+            [None, "2", "4"],
+        )
+
+    def test_add_operations(self):
+        runner, service = self._create_runner(max_operations=3)
+        resource_name = runner.create_job("1")
+        upload = runner.add_operations(
+            resource_name, [_get_operation(i) for i in range(4)]
+        )
+
+        self.assertEqual(upload.total_operations, 4)
+        self.assertEqual(upload.sequence_token, "4")
+
+        upload = runner.add_operations(
+            resource_name, [_get_operation(4)], upload.sequence_token
+        )
+        self.assertEqual(upload.total_operations, 5)
+        self.assertEqual(len(service.jobs[resource_name]), 5)
+
+    def test_add_operations_max_request_bytes(self):
+        operation = _get_operation(1)
+        size = mutate_batcher.get_operation_size(operation)
+        runner, service = self._create_runner(max_request_bytes=size * 2)
+        runner.add_operations(runner.create_job("1"), [operation] * 3)
+
+        self.assertEqual(
+            [len(r["mutate_operations"]) for r in service.add_requests],
+            [2, 1],
+        )
+
+    @mock.patch("google.ads.googleads.batch_job_runner.time.sleep")
+    def test_wait_polls_with_backoff(self, mock_sleep):
+        runner, _ = self._create_runner(
+            initial_poll_delay=1, max_poll_delay=3
+        )
+        operation = _Operation(4)
+        with mock.patch.object(
+            runner, "get_poll_delay", side_effect=[1, 2, 3, 3]
+        ):
+            runner.wait(operation)
+
+        self.assertEqual(
+            [c.args[0] for c in mock_sleep.call_args_list], [1, 2, 3, 3]
+        )
+
+    @mock.patch("google.ads.googleads.batch_job_runner.time.sleep")
+    def test_wait_timeout(self, mock_sleep):
+        runner, _ = self._create_runner(timeout=0)
+        self.assertRaises(TimeoutError, runner.wait, _Operation(1))
+
+    def test_wait_raises_operation_exception(self):
+        runner, _ = self._create_runner()
+        error = RuntimeError("failed")
+        with self.assertRaises(RuntimeError) as context:
+            runner.wait(_Operation(0, error))
+        self.assertIs(context.exception, error)
+
+    def test_run_jobs(self):
+        runner, service = self._create_runner(max_workers=2)
+        jobs = list(
+            runner.run_jobs(
+                (
+                    customer_id,
+                    (_get_operation(i) for i in range(int(customer_id))),
+                )
+                for customer_id in ("1", "2", "3")
+            )
+        )
+        jobs.sort(key=lambda job: job.index)
+
+        self.assertTrue(all(job.succeeded for job in jobs))
+        self.assertEqual([job.customer_id for job in jobs], ["1", "2", "3"])
+        self.assertEqual([job.total_operations for job in jobs], [1, 2, 3])
+        self.assertEqual(len(list(jobs[2].iter_results())), 3)
+
+    def test_run_jobs_failure(self):
+        service = _BatchJobService()
+        error = RuntimeError("failed")
+        service.mutate_batch_job = mock.Mock(side_effect=error)
+        runner, _ = self._create_runner(service)
+        [job] = list(runner.run_jobs([("1", [_get_operation(1)])]))
+
+        self.assertFalse(job.succeeded)
+        self.assertIs(job.exception, error)
+        self.assertIsNone(job.resource_name)
+        self.assertEqual(list(job.iter_results()), [])
+
+    def test_version(self):
+        client = mock.Mock()
+        batch_job_runner.BatchJobRunner(client, version="v1")
+        client.get_service.assert_called_once_with(
+            "BatchJobService", version="v1"
+        )
+
+    def test_invalid_arguments(self):
+        for kwargs in (
+            {"max_operations": 0},
+            {"max_request_bytes": 0},
+            {"max_workers": 0},
+            {"page_size": 0},
+        ):
+            with self.subTest(kwargs=kwargs):
+                self.assertRaises(ValueError, self._create_runner, **kwargs)
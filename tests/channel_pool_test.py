@@ -0,0 +1,191 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the channel pool used by the Google Ads API client library."""
+
+import pickle
+from unittest import mock, TestCase
+
+import grpc
+
+from google.ads.googleads import channel_pool
+
+
+class ChannelPoolTest(TestCase):
+    def _create_pool(self, size=1, policy=channel_pool.ROUND_ROBIN):
+        pool = channel_pool.ChannelPool(size, policy)
+        factory = mock.Mock(side_effect=lambda: mock.Mock(spec=grpc.Channel))
+        return pool, factory
+
+    def test_get_channel_reuses_channel_for_key(self):
+        pool, factory = self._create_pool()
+        first = pool.get_channel("key", factory)
+        second = pool.get_channel("key", factory)
+        self.assertIsNot(first, second)
+        self.assertIs(first._channel, second._channel)
+        self.assertIsInstance(first, grpc.Channel)
+        factory.assert_called_once()
+        self.assertEqual(len(pool), 1)
+
+    def test_get_channel_different_keys(self):
+        pool, factory = self._create_pool()
+        first = pool.get_channel("key_1", factory)
+        second = pool.get_channel("key_2", factory)
+        self.assertIsNot(first._channel, second._channel)
+        self.assertEqual(factory.call_count, 2)
+
+    def test_get_channel_creates_subchannels(self):
+        pool, factory = self._create_pool(size=3)
+        pool.get_channel("key", factory)
+        self.assertEqual(factory.call_count, 3)
+
+    def test_invalid_size(self):
+        self.assertRaises(ValueError, channel_pool.ChannelPool, 0)
+
+    def test_invalid_policy(self):
+        self.assertRaises(
+            ValueError, channel_pool.ChannelPool, 1, "fastest_first"
+        )
+
+    def test_defaults_for_none(self):
+        pool = channel_pool.ChannelPool(None, None)
+        self.assertEqual(pool.size, 1)
+        self.assertEqual(pool.policy, channel_pool.ROUND_ROBIN)
+
+    def test_round_robin_unary_unary(self):
+        pool, factory = self._create_pool(size=2)
+        channel = pool.get_channel("key", factory)
+        callable_ = channel.unary_unary("/Service/Method")
+        subchannels = [s.channel for s in channel._channel._subchannels]
+
+        for _ in range(4):
+            callable_("request")
+
+        for subchannel in subchannels:
+            subchannel.unary_unary.assert_called_once_with("/Service/Method")
+            self.assertEqual(
+                subchannel.unary_unary.return_value.call_count, 2
+            )
+
+        self.assertEqual(channel.in_flight, [0, 0])
+
+    def test_least_in_flight_unary_stream(self):
+        pool, factory = self._create_pool(
+            size=2, policy=channel_pool.LEAST_IN_FLIGHT
+        )
+        channel = pool.get_channel("key", factory)
+        callable_ = channel.unary_stream("/Service/Method")
+        subchannels = [s.channel for s in channel._channel._subchannels]
+
+        first_call = callable_("request")
+        self.assertEqual(channel.in_flight, [1, 0])
+        callable_("request")
+        self.assertEqual(channel.in_flight, [1, 1])
+
+        # Completing the first stream releases its subchannel, so it's picked
+        # for the next request.
+        done_callback = first_call.add_done_callback.call_args[0][0]
+        done_callback(first_call)
+        self.assertEqual(channel.in_flight, [0, 1])
+        callable_("request")
+        self.assertEqual(channel.in_flight, [1, 1])
+
+        first_multicallable = subchannels[0].unary_stream.return_value
+        self.assertEqual(first_multicallable.call_count, 2)
+
+    def test_failed_call_releases_subchannel(self):
+        pool, factory = self._create_pool()
+        channel = pool.get_channel("key", factory)
+        subchannel = channel._channel._subchannels[0].channel
+        subchannel.unary_unary.return_value.side_effect = ValueError()
+        callable_ = channel.unary_unary("/Service/Method")
+
+        self.assertRaises(ValueError, callable_, "request")
+        self.assertEqual(channel.in_flight, [0])
+
+    def test_channel_closed_with_last_handle(self):
+        pool, factory = self._create_pool()
+        first = pool.get_channel("key", factory)
+        second = pool.get_channel("key", factory)
+        subchannel = first._channel._subchannels[0].channel
+
+        first.close()
+        # Closing a handle twice doesn't release the other handle.
+        first.close()
+        self.assertTrue(first.closed)
+        self.assertFalse(second.closed)
+        subchannel.close.assert_not_called()
+        self.assertEqual(len(pool), 1)
+
+        with second:
+            pass
+
+        subchannel.close.assert_called_once()
+        self.assertTrue(second.closed)
+        self.assertEqual(len(pool), 0)
+        self.assertIsNot(
+            pool.get_channel("key", factory)._channel, second._channel
+        )
+
+    def test_channel_closed_when_in_flight_requests_finish(self):
+        pool, factory = self._create_pool()
+        channel = pool.get_channel("key", factory)
+        subchannel = channel._channel._subchannels[0].channel
+        call = channel.unary_stream("/Service/Method")("request")
+
+        channel.close()
+        subchannel.close.assert_not_called()
+        self.assertEqual(len(pool), 0)
+
+        done_callback = call.add_done_callback.call_args[0][0]
+        done_callback(call)
+        subchannel.close.assert_called_once()
+
+    def test_collected_handle_is_closed(self):
+        pool, factory = self._create_pool()
+        channel = pool.get_channel("key", factory)
+        subchannel = channel._channel._subchannels[0].channel
+        del channel
+        subchannel.close.assert_called_once()
+        self.assertEqual(len(pool), 0)
+
+    def test_pool_close(self):
+        pool, factory = self._create_pool(size=2)
+        channel = pool.get_channel("key", factory)
+        pool.close()
+
+        for subchannel in channel._channel._subchannels:
+            subchannel.channel.close.assert_called_once()
+
+        self.assertTrue(channel.closed)
+        self.assertEqual(len(pool), 0)
+        self.assertIsNot(
+            pool.get_channel("key", factory)._channel, channel._channel
+        )
+        # Closing a handle of a channel that was closed by the pool doesn't
+        # close it again.
+        channel.close()
+
+        for subchannel in channel._channel._subchannels:
+            subchannel.channel.close.assert_called_once()
+
+    def test_pool_is_picklable(self):
+        pool, factory = self._create_pool(
+            size=2, policy=channel_pool.LEAST_IN_FLIGHT
+        )
+        # The handle is kept open so that the pool isn't empty when pickled.
+        channel = pool.get_channel("key", factory)  # noqa: F841
+        unpickled = pickle.loads(pickle.dumps(pool))
+        self.assertEqual(unpickled.size, 2)
+        self.assertEqual(unpickled.policy, channel_pool.LEAST_IN_FLIGHT)
+        self.assertEqual(len(unpickled), 0)
@@ -13,6 +13,7 @@
 # limitations under the License.
 """Tests for the Google Ads API client library."""
 
+import asyncio
 from importlib import import_module
 from inspect import getmembers
 from unittest import mock
@@ -20,6 +21,7 @@ import os
 import pickle
 from pyfakefs.fake_filesystem_unittest import TestCase as FileTestCase
 from unittest import TestCase
+import grpc
 import yaml
 
 from google.protobuf.message import Message as ProtobufMessageType
@@ -115,6 +117,14 @@ class GoogleAdsClientTest(TestCase):
                     "http_proxy": None,
                     "use_cloud_org_for_api_access": None,
                     "ads_assistant": None,
+                    "channel_pool_size": None,
+                    "channel_pool_policy": None,
+                    "structured_logging": False,
+                    "max_log_message_length": None,
+                    "enable_metrics": False,
+                    "retry_policy": None,
+                    "rate_limiter": None,
+                    "token_refresh": None,
                 },
             )
 
@@ -149,6 +159,14 @@ class GoogleAdsClientTest(TestCase):
                     "http_proxy": None,
                     "use_cloud_org_for_api_access": None,
                     "ads_assistant": None,
+                    "channel_pool_size": None,
+                    "channel_pool_policy": None,
+                    "structured_logging": False,
+                    "max_log_message_length": None,
+                    "enable_metrics": False,
+                    "retry_policy": None,
+                    "rate_limiter": None,
+                    "token_refresh": None,
                 },
             )
 
@@ -183,6 +201,14 @@ class GoogleAdsClientTest(TestCase):
                     "http_proxy": None,
                     "use_cloud_org_for_api_access": None,
                     "ads_assistant": None,
+                    "channel_pool_size": None,
+                    "channel_pool_policy": None,
+                    "structured_logging": False,
+                    "max_log_message_length": None,
+                    "enable_metrics": False,
+                    "retry_policy": None,
+                    "rate_limiter": None,
+                    "token_refresh": None,
                 },
             )
 
@@ -217,6 +243,14 @@ class GoogleAdsClientTest(TestCase):
                     "http_proxy": None,
                     "use_cloud_org_for_api_access": None,
                     "ads_assistant": None,
+                    "channel_pool_size": None,
+                    "channel_pool_policy": None,
+                    "structured_logging": False,
+                    "max_log_message_length": None,
+                    "enable_metrics": False,
+                    "retry_policy": None,
+                    "rate_limiter": None,
+                    "token_refresh": None,
                 },
             )
 
@@ -251,6 +285,14 @@ class GoogleAdsClientTest(TestCase):
                     "http_proxy": self.http_proxy,
                     "use_cloud_org_for_api_access": None,
                     "ads_assistant": None,
+                    "channel_pool_size": None,
+                    "channel_pool_policy": None,
+                    "structured_logging": False,
+                    "max_log_message_length": None,
+                    "enable_metrics": False,
+                    "retry_policy": None,
+                    "rate_limiter": None,
+                    "token_refresh": None,
                 },
             )
 
@@ -286,6 +328,14 @@ class GoogleAdsClientTest(TestCase):
                     "http_proxy": None,
                     "use_cloud_org_for_api_access": None,
                     "ads_assistant": None,
+                    "channel_pool_size": None,
+                    "channel_pool_policy": None,
+                    "structured_logging": False,
+                    "max_log_message_length": None,
+                    "enable_metrics": False,
+                    "retry_policy": None,
+                    "rate_limiter": None,
+                    "token_refresh": None,
                 },
             )
 
@@ -325,6 +375,14 @@ class GoogleAdsClientTest(TestCase):
                 http_proxy=None,
                 use_cloud_org_for_api_access=None,
                 ads_assistant=None,
+                channel_pool_size=None,
+                channel_pool_policy=None,
+                structured_logging=False,
+                max_log_message_length=None,
+                enable_metrics=False,
+                retry_policy=None,
+                rate_limiter=None,
+                token_refresh=None,
             )
 
     def test_load_from_env_versioned(self):
@@ -363,6 +421,14 @@ class GoogleAdsClientTest(TestCase):
                 http_proxy=None,
                 use_cloud_org_for_api_access=None,
                 ads_assistant=None,
+                channel_pool_size=None,
+                channel_pool_policy=None,
+                structured_logging=False,
+                max_log_message_length=None,
+                enable_metrics=False,
+                retry_policy=None,
+                rate_limiter=None,
+                token_refresh=None,
             )
 
     def test_load_from_dict(self):
@@ -400,6 +466,14 @@ class GoogleAdsClientTest(TestCase):
                 http_proxy=None,
                 use_cloud_org_for_api_access=None,
                 ads_assistant=None,
+                channel_pool_size=None,
+                channel_pool_policy=None,
+                structured_logging=False,
+                max_log_message_length=None,
+                enable_metrics=False,
+                retry_policy=None,
+                rate_limiter=None,
+                token_refresh=None,
             )
 
     def test_load_from_dict_versioned(self):
@@ -437,6 +511,14 @@ class GoogleAdsClientTest(TestCase):
                 http_proxy=None,
                 use_cloud_org_for_api_access=None,
                 ads_assistant=None,
+                channel_pool_size=None,
+                channel_pool_policy=None,
+                structured_logging=False,
+                max_log_message_length=None,
+                enable_metrics=False,
+                retry_policy=None,
+                rate_limiter=None,
+                token_refresh=None,
             )
 
     def test_load_from_dict_login_customer_id_explicit_none(self):
@@ -481,6 +563,14 @@ class GoogleAdsClientTest(TestCase):
                 http_proxy=None,
                 use_cloud_org_for_api_access=None,
                 ads_assistant=None,
+                channel_pool_size=None,
+                channel_pool_policy=None,
+                structured_logging=False,
+                max_log_message_length=None,
+                enable_metrics=False,
+                retry_policy=None,
+                rate_limiter=None,
+                token_refresh=None,
             )
 
     def test_load_from_string(self):
@@ -518,6 +608,14 @@ class GoogleAdsClientTest(TestCase):
                 http_proxy=None,
                 use_cloud_org_for_api_access=None,
                 ads_assistant=None,
+                channel_pool_size=None,
+                channel_pool_policy=None,
+                structured_logging=False,
+                max_log_message_length=None,
+                enable_metrics=False,
+                retry_policy=None,
+                rate_limiter=None,
+                token_refresh=None,
             )
 
     def test_load_from_string_versioned(self):
@@ -557,6 +655,14 @@ class GoogleAdsClientTest(TestCase):
                 http_proxy=None,
                 use_cloud_org_for_api_access=None,
                 ads_assistant=None,
+                channel_pool_size=None,
+                channel_pool_policy=None,
+                structured_logging=False,
+                max_log_message_length=None,
+                enable_metrics=False,
+                retry_policy=None,
+                rate_limiter=None,
+                token_refresh=None,
             )
 
     def test_get_service(self):
@@ -640,6 +746,221 @@ class GoogleAdsClientTest(TestCase):
                 options=Client._GRPC_CHANNEL_OPTIONS,
             )
 
+    def test_get_service_reuses_channel(self):
+        """Service clients from the same client share a pooled channel."""
+        client = self._create_test_client()
+        transport_create_channel_path = (
+            f"google.ads.googleads.{Client._DEFAULT_VERSION}.services.services."
+            "google_ads_service.transports.GoogleAdsServiceGrpcTransport."
+            "create_channel"
+        )
+
+        with mock.patch(transport_create_channel_path) as mock_create_channel:
+            first = client.get_service("GoogleAdsService")
+            second = client.get_service("GoogleAdsService")
+            mock_create_channel.assert_called_once()
+            self.assertIs(
+                first.transport.grpc_channel, second.transport.grpc_channel
+            )
+
+    def test_get_service_shares_channel_for_changed_headers(self):
+        """Changing the client's headers doesn't open new channels."""
+        client = self._create_test_client()
+        client.login_customer_id = "1111111111"
+        campaign_service = client.get_service("CampaignService")
+        client.login_customer_id = "2222222222"
+        ad_group_service = client.get_service("AdGroupService")
+
+        self.assertEqual(len(client._channel_pool), 1)
+        # The headers are added to the pooled channel by each service client.
+        self.assertEqual(
+            campaign_service.transport.grpc_channel._interceptor
+            .login_customer_id_meta,
+            ("login-customer-id", "1111111111"),
+        )
+        self.assertEqual(
+            ad_group_service.transport.grpc_channel._interceptor
+            .login_customer_id_meta,
+            ("login-customer-id", "2222222222"),
+        )
+
+    def test_closing_service_releases_channel(self):
+        """A pooled channel is closed with the last service client using it."""
+        client = self._create_test_client()
+        campaign_service = client.get_service("CampaignService")
+        ad_group_service = client.get_service("AdGroupService")
+
+        with campaign_service:
+            pass
+
+        self.assertEqual(len(client._channel_pool), 1)
+        ad_group_service.transport.close()
+        self.assertEqual(len(client._channel_pool), 0)
+        # Closed service clients aren't returned from the cache.
+        self.assertIsNot(
+            client.get_service("CampaignService"), campaign_service
+        )
+        self.assertEqual(len(client._channel_pool), 1)
+
+    def test_get_service_channel_pool_size(self):
+        """A subchannel is created for each slot in the channel pool."""
+        client = Client.GoogleAdsClient(
+            mock.Mock(), self.developer_token, channel_pool_size=2
+        )
+        transport_create_channel_path = (
+            f"google.ads.googleads.{Client._DEFAULT_VERSION}.services.services."
+            "google_ads_service.transports.GoogleAdsServiceGrpcTransport."
+            "create_channel"
+        )
+
+        with mock.patch(transport_create_channel_path) as mock_create_channel:
+            client.get_service("GoogleAdsService")
+            self.assertEqual(mock_create_channel.call_count, 2)
+            options = mock_create_channel.call_args[1]["options"]
+            self.assertIn(
+                Client.LOCAL_SUBCHANNEL_POOL_OPTION,
+                options,
+            )
+
+    def test_close(self):
+        """Closing the client closes its pooled channels."""
+        client = self._create_test_client()
+        service = client.get_service("GoogleAdsService")
+        self.assertEqual(len(client._channel_pool), 1)
+        client.close()
+        self.assertEqual(len(client._channel_pool), 0)
+        self.assertEqual(len(client._service_clients), 0)
+        self.assertIsNot(service, client.get_service("GoogleAdsService"))
+
+    def test_get_service_cached(self):
+        """The same service client is returned for the same arguments."""
+        client = self._create_test_client()
+        first = client.get_service("CampaignService")
+        self.assertIs(first, client.get_service("CampaignService"))
+        self.assertIsNot(
+            first, client.get_service("CampaignService", is_async=True)
+        )
+        self.assertIsNot(
+            first,
+            client.get_service(
+                "CampaignService",
+                interceptors=[
+                    mock.Mock(spec=grpc.UnaryUnaryClientInterceptor)
+                ],
+            ),
+        )
+
+    def test_get_async_service_cached_per_event_loop(self):
+        """Async service clients aren't shared between event loops."""
+        client = self._create_test_client()
+
+        async def get_service():
+            return client.get_service("CampaignService", is_async=True)
+
+        first_loop = asyncio.new_event_loop()
+        first = first_loop.run_until_complete(get_service())
+        self.assertIs(first, first_loop.run_until_complete(get_service()))
+        first_loop.close()
+
+        second_loop = asyncio.new_event_loop()
+        self.addCleanup(second_loop.close)
+        second = second_loop.run_until_complete(get_service())
+        self.assertIsNot(first, second)
+        # The service client of the closed loop is evicted.
+        self.assertEqual(len(client._service_clients), 1)
+
+    def test_get_service_not_cached_for_changed_settings(self):
+        """Service clients aren't reused after the client's headers change."""
+        client = self._create_test_client()
+        first = client.get_service("CampaignService")
+        client.login_customer_id = "1111111111"
+        second = client.get_service("CampaignService")
+
+        self.assertIsNot(first, second)
+        self.assertIs(second, client.get_service("CampaignService"))
+
+    def test_get_service_not_cached_for_changed_objects(self):
+        """Service clients aren't reused after the client's objects change."""
+        client = self._create_test_client()
+        changes = [
+            ("endpoint", "other-endpoint.com"),
+            ("credentials", mock.Mock()),
+            ("retry_policy", Client.RetryPolicy()),
+            ("rate_limiter", Client.AdaptiveRateLimiter()),
+            ("metrics", Client.MetricsRegistry()),
+        ]
+
+        for attr, value in changes:
+            with self.subTest(attr=attr):
+                first = client.get_service("CampaignService")
+                setattr(client, attr, value)
+                second = client.get_service("CampaignService")
+
+                self.assertIsNot(first, second)
+                self.assertIsNot(
+                    first.transport.grpc_channel._channel._channel,
+                    second.transport.grpc_channel._channel._channel,
+                )
+
+    def test_get_service_cache_is_bounded(self):
+        """The least recently used service client is evicted."""
+        client = self._create_test_client()
+
+        with mock.patch.object(Client, "_SERVICE_CLIENT_CACHE_SIZE", 2):
+            campaign_service = client.get_service("CampaignService")
+            ad_group_service = client.get_service("AdGroupService")
+            # Using the campaign service makes the ad group service the least
+            # recently used one.
+            client.get_service("CampaignService")
+            client.get_service("CustomerService")
+
+        self.assertEqual(len(client._service_clients), 2)
+        self.assertIs(client.get_service("CampaignService"), campaign_service)
+        self.assertIsNot(client.get_service("AdGroupService"), ad_group_service)
+
+    def test_get_async_service_not_cached_without_event_loop(self):
+        """Async service clients retrieved outside a loop aren't cached."""
+        client = self._create_test_client()
+        first = client.get_service("CampaignService", is_async=True)
+
+        self.assertIsNot(
+            first, client.get_service("CampaignService", is_async=True)
+        )
+        self.assertEqual(len(client._service_clients), 0)
+
+    def test_evict_service(self):
+        """Evicted service clients are recreated by get_service."""
+        client = self._create_test_client()
+        campaign_service = client.get_service("CampaignService")
+        ad_group_service = client.get_service("AdGroupService")
+
+        async def get_async_service():
+            return client.get_service("CampaignService", is_async=True)
+
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+        loop.run_until_complete(get_async_service())
+
+        client.evict_service("CampaignService", is_async=False)
+        self.assertEqual(len(client._service_clients), 2)
+        self.assertIsNot(
+            campaign_service, client.get_service("CampaignService")
+        )
+        self.assertIs(ad_group_service, client.get_service("AdGroupService"))
+
+        client.evict_service("CampaignService")
+        self.assertEqual(len(client._service_clients), 1)
+
+    def test_get_service_classes_cached(self):
+        """Service client and transport classes are resolved once."""
+        client = self._create_test_client()
+        client.get_service("CampaignService")
+        client.evict_service("CampaignService")
+
+        with mock.patch.object(Client, "import_module") as mock_import:
+            client.get_service("CampaignService")
+            mock_import.assert_not_called()
+
     def test_get_service_not_found(self):
         client = self._create_test_client()
         self.assertRaises(ValueError, client.get_service, "BadService")
@@ -712,6 +1033,42 @@ class GoogleAdsClientTest(TestCase):
         message = client.get_type("Campaign")
         self.assertIsInstance(message, ProtobufMessageType)
 
+    def test_get_type_returns_new_instances(self):
+        """Cached types still return a new message for every call."""
+        client = self._create_test_client(use_proto_plus=True)
+        first = client.get_type("Campaign")
+        first.name = "Test"
+        second = client.get_type("Campaign")
+        self.assertIsNot(first, second)
+        self.assertEqual(second.name, "")
+
+    def test_get_type_caches_class_lookup(self):
+        """The message class is only looked up the first time it's used."""
+        client = self._create_test_client(use_proto_plus=False)
+        # Clear the cache in case another test already requested the type.
+        Client._TYPE_CONSTRUCTORS.pop((latest_version, "AdGroup", False), None)
+
+        with mock.patch.object(
+            Client.GoogleAdsClient,
+            "_get_type_class",
+            wraps=Client.GoogleAdsClient._get_type_class,
+        ) as mock_get_type_class:
+            client.get_type("AdGroup")
+            message = client.get_type("AdGroup")
+            mock_get_type_class.assert_called_once_with(
+                "AdGroup", latest_version
+            )
+            self.assertIsInstance(message, ProtobufMessageType)
+
+    def test_get_type_index(self):
+        """The type index maps names to the package that exports them."""
+        index = Client.GoogleAdsClient._get_type_index(latest_version)
+        self.assertEqual(index["AdTextAsset"], "common")
+        self.assertEqual(index["CampaignStatusEnum"], "enums")
+        self.assertEqual(index["GoogleAdsFailure"], "errors")
+        self.assertEqual(index["Campaign"], "resources")
+        self.assertEqual(index["CampaignOperation"], "services.types")
+
     def test_init_no_logging_config(self):
         """Should call logging.config.dictConfig if logging config exists."""
         with (
@@ -801,6 +1158,60 @@ class GoogleAdsClientTest(TestCase):
         self.assertTrue(hasattr(enum, "PAUSED"))
         self.assertIsInstance(enum, ProtobufMessageType)
 
+    def test_client_dot_enums_cached(self):
+        """Enums are only resolved the first time they're accessed."""
+        client = self._create_test_client(use_proto_plus=True)
+        Client._ENUMS.pop(
+            (latest_version, "CampaignStatusEnum", True), None
+        )
+
+        with mock.patch.object(
+            Client.GoogleAdsClient,
+            "_get_type_class",
+            wraps=Client.GoogleAdsClient._get_type_class,
+        ) as mock_get_type_class:
+            enum = client.enums.CampaignStatusEnum
+            other_client = self._create_test_client(use_proto_plus=True)
+
+            self.assertIs(client.enums.CampaignStatusEnum, enum)
+            self.assertIs(other_client.enums.CampaignStatusEnum, enum)
+            mock_get_type_class.assert_called_once_with(
+                "CampaignStatusEnum", latest_version
+            )
+
+    def test_client_dot_enums_private_names(self):
+        """Private names raise AttributeError without being resolved."""
+        client = self._create_test_client()
+        self.assertRaises(
+            AttributeError, getattr, client.enums, "__deepcopy__"
+        )
+
+    def test_client_dot_enums_warm_up(self):
+        client = self._create_test_client(use_proto_plus=True)
+        client.enums.warm_up(["CampaignStatusEnum", "AdTypeEnum"])
+
+        self.assertIn("CampaignStatusEnum", vars(client.enums))
+        self.assertIn("AdTypeEnum", vars(client.enums))
+        self.assertRaises(
+            AttributeError, client.enums.warm_up, ["Campaign"]
+        )
+
+    def test_client_dot_enums_warm_up_all(self):
+        client = self._create_test_client(use_proto_plus=False)
+        client.enums.warm_up()
+
+        for name in dir(client.enums):
+            self.assertIn(name, vars(client.enums))
+
+    def test_client_dot_enums_pickle(self):
+        """Resolved enums aren't pickled with the client."""
+        client = Client.GoogleAdsClient({}, self.developer_token)
+        enum = client.enums.CampaignStatusEnum
+        enums = pickle.loads(pickle.dumps(client)).enums
+
+        self.assertNotIn("CampaignStatusEnum", vars(enums))
+        self.assertIs(enums.CampaignStatusEnum, enum)
+
     def test_client_copy_from_both_proto_plus(self):
         """client.copy_from works with two proto_plus proto messages."""
         client = self._create_test_client()
@@ -919,6 +1330,281 @@ class GoogleAdsClientTest(TestCase):
         except:
             self.fail("Exception occurred when pickling GoogleAdsClient")
 
+    def test_client_is_picklable_with_cached_services(self):
+        client = Client.GoogleAdsClient({}, self.developer_token)
+        transport_create_channel_path = (
+            f"google.ads.googleads.{Client._DEFAULT_VERSION}.services.services."
+            "google_ads_service.transports.GoogleAdsServiceGrpcTransport."
+            "create_channel"
+        )
+
+        with mock.patch(transport_create_channel_path):
+            client.get_service("GoogleAdsService")
+
+        unpickled = pickle.loads(pickle.dumps(client))
+        self.assertEqual(unpickled._service_clients, {})
+        self.assertEqual(len(client._service_clients), 1)
+
+    def test_get_service_with_metrics(self):
+        """Metrics are recorded by an interceptor when they're enabled."""
+        client = Client.GoogleAdsClient(
+            {}, self.developer_token, enable_metrics=True
+        )
+        self.assertIsInstance(client.metrics, Client.MetricsRegistry)
+        transport_create_channel_path = (
+            f"google.ads.googleads.{Client._DEFAULT_VERSION}.services.services."
+            "google_ads_service.transports.GoogleAdsServiceGrpcTransport."
+            "create_channel"
+        )
+
+        with (
+            mock.patch(transport_create_channel_path),
+            mock.patch(
+                "grpc.intercept_channel", wraps=grpc.intercept_channel
+            ) as mock_intercept_channel,
+        ):
+            client.get_service("GoogleAdsService")
+
+        # The first call is the pooled channel's, the service client and its
+        # transport intercept the channel again with their own interceptors.
+        interceptors = mock_intercept_channel.call_args_list[0][0][1:]
+        self.assertIsInstance(interceptors[0], Client.RetryInterceptor)
+        self.assertIs(interceptors[0].metrics, client.metrics)
+        self.assertIsInstance(interceptors[1], Client.MetricsInterceptor)
+        self.assertIs(interceptors[1].exporter, client.metrics)
+
+    def test_get_service_with_max_log_message_length(self):
+        """Logged messages are truncated when a maximum length is set."""
+        client = Client.GoogleAdsClient(
+            {}, self.developer_token, max_log_message_length=100
+        )
+        transport_path = (
+            f"google.ads.googleads.{Client._DEFAULT_VERSION}.services.services."
+            "google_ads_service.transports."
+        )
+
+        with (
+            mock.patch(
+                transport_path + "GoogleAdsServiceGrpcTransport.create_channel"
+            ),
+            mock.patch(
+                "grpc.intercept_channel", wraps=grpc.intercept_channel
+            ) as mock_intercept_channel,
+        ):
+            client.get_service("GoogleAdsService")
+
+        interceptors = mock_intercept_channel.call_args_list[0][0][1:]
+        logging_interceptor = interceptors[-2]
+        self.assertIsInstance(logging_interceptor, Client.LoggingInterceptor)
+        self.assertEqual(logging_interceptor.max_message_length, 100)
+
+        with mock.patch(
+            transport_path
+            + "GoogleAdsServiceGrpcAsyncIOTransport.create_channel",
+            return_value=mock.Mock(
+                spec=grpc.aio.Channel, _unary_unary_interceptors=[]
+            ),
+        ) as mock_create_channel:
+            client.get_service("GoogleAdsService", is_async=True)
+
+        logging_interceptors = [
+            interceptor
+            for interceptor in mock_create_channel.call_args[1][
+                "interceptors"
+            ]
+            if isinstance(interceptor, Client.LoggingInterceptor)
+        ]
+        self.assertEqual(len(logging_interceptors), 2)
+
+        for interceptor in logging_interceptors:
+            self.assertEqual(interceptor.max_message_length, 100)
+
+    def test_metrics_disabled_by_default(self):
+        client = Client.GoogleAdsClient({}, self.developer_token)
+        self.assertIsNone(client.metrics)
+
+    def test_client_with_token_refresh(self):
+        """The token is refreshed in the background when configured."""
+        credentials = mock.Mock()
+
+        with mock.patch.object(
+            Client.oauth2.CredentialManager, "start"
+        ) as mock_start:
+            client = Client.GoogleAdsClient(
+                credentials,
+                self.developer_token,
+                token_refresh={"refresh_margin": 600},
+            )
+
+        self.assertIs(client.credential_manager.credentials, credentials)
+        self.assertEqual(client.credential_manager.refresh_margin, 600)
+        mock_start.assert_called_once_with()
+
+    def test_close_stops_credential_manager(self):
+        """Closing the client stops the manager it created."""
+        credentials = mock.Mock(expiry=None, token="token")
+        client = Client.GoogleAdsClient(
+            credentials,
+            self.developer_token,
+            token_refresh={"refresh_margin": 600},
+        )
+        thread = client.credential_manager._thread
+        self.assertTrue(thread.is_alive())
+
+        client.close()
+        thread.join(timeout=5)
+        self.assertFalse(thread.is_alive())
+        self.assertFalse(client.credential_manager.running)
+
+    def test_close_keeps_given_credential_manager(self):
+        """A credential manager given to the client belongs to the caller."""
+        credential_manager = mock.Mock(spec=Client.oauth2.CredentialManager)
+        credential_manager.running = True
+        client = Client.GoogleAdsClient(
+            mock.Mock(), self.developer_token, token_refresh=credential_manager
+        )
+
+        client.close()
+        credential_manager.stop.assert_not_called()
+
+    def test_client_without_token_refresh(self):
+        client = Client.GoogleAdsClient({}, self.developer_token)
+        self.assertIsNone(client.credential_manager)
+
+    def test_load_from_dict_async(self):
+        """Credentials are loaded asynchronously and passed to the client."""
+        config = {
+            **self.default_config,
+            **{
+                "client_id": self.client_id,
+                "client_secret": self.client_secret,
+                "refresh_token": self.refresh_token,
+            },
+        }
+        mock_credentials_instance = mock.Mock()
+
+        with (
+            mock.patch.object(
+                Client.GoogleAdsClient, "__init__", return_value=None
+            ) as mock_client_init,
+            mock.patch.object(
+                Client.oauth2,
+                "get_credentials_async",
+                return_value=mock_credentials_instance,
+            ) as mock_get_credentials_async,
+            mock.patch.object(
+                Client.oauth2, "get_credentials"
+            ) as mock_get_credentials,
+        ):
+            asyncio.run(
+                Client.GoogleAdsClient.load_from_dict_async(
+                    config, version="v24"
+                )
+            )
+
+        mock_get_credentials_async.assert_called_once()
+        mock_get_credentials.assert_not_called()
+        mock_client_init.assert_called_once_with(
+            credentials=mock_credentials_instance,
+            developer_token=self.developer_token,
+            use_proto_plus=self.use_proto_plus,
+            endpoint=None,
+            login_customer_id=None,
+            logging_config=None,
+            linked_customer_id=None,
+            version="v24",
+            http_proxy=None,
+            use_cloud_org_for_api_access=None,
+            ads_assistant=None,
+            channel_pool_size=None,
+            channel_pool_policy=None,
+            structured_logging=False,
+            max_log_message_length=None,
+            enable_metrics=False,
+            retry_policy=None,
+            rate_limiter=None,
+            token_refresh=None,
+        )
+
+    def test_load_from_dict_async_with_token_refresh(self):
+        """The token is refreshed on a task of the running event loop."""
+        config = {
+            **self.default_config,
+            **{
+                "client_id": self.client_id,
+                "client_secret": self.client_secret,
+                "refresh_token": self.refresh_token,
+                "token_refresh": {"refresh_margin": 600},
+            },
+        }
+        mock_credentials_instance = mock.Mock()
+
+        async def load():
+            client = await Client.GoogleAdsClient.load_from_dict_async(config)
+            running = client.credential_manager.running
+            client.close()
+            self.assertFalse(client.credential_manager.running)
+            return client, running
+
+        with (
+            mock.patch.object(
+                Client.oauth2,
+                "get_credentials_async",
+                return_value=mock_credentials_instance,
+            ),
+            mock.patch.object(
+                Client.oauth2.CredentialManager, "start"
+            ) as mock_start,
+            mock.patch.object(
+                Client.oauth2.CredentialManager,
+                "get_refresh_delay",
+                return_value=600,
+            ),
+        ):
+            client, running = asyncio.run(load())
+
+        self.assertTrue(running)
+        self.assertIs(
+            client.credential_manager.credentials, mock_credentials_instance
+        )
+        self.assertEqual(client.credential_manager.refresh_margin, 600)
+        mock_start.assert_not_called()
+
+    def test_get_service_with_rate_limiter(self):
+        """Requests are paced by an interceptor when a limiter is set."""
+        client = Client.GoogleAdsClient(
+            {},
+            self.developer_token,
+            login_customer_id="123",
+            rate_limiter={"initial_rate": 2},
+        )
+        self.assertEqual(client.rate_limiter.initial_rate, 2)
+        transport_create_channel_path = (
+            f"google.ads.googleads.{Client._DEFAULT_VERSION}.services.services."
+            "google_ads_service.transports.GoogleAdsServiceGrpcTransport."
+            "create_channel"
+        )
+
+        with (
+            mock.patch(transport_create_channel_path),
+            mock.patch(
+                "grpc.intercept_channel", wraps=grpc.intercept_channel
+            ) as mock_intercept_channel,
+        ):
+            client.get_service("GoogleAdsService")
+
+        interceptors = mock_intercept_channel.call_args_list[0][0][1:]
+        self.assertIsInstance(interceptors[0], Client.RetryInterceptor)
+        self.assertIsInstance(interceptors[1], Client.RateLimitInterceptor)
+        self.assertIs(interceptors[1].rate_limiter, client.rate_limiter)
+        # The login customer ID of the bucket is read from the metadata added
+        # by the service client.
+        metadata_interceptor = mock_intercept_channel.call_args_list[1][0][1]
+        self.assertEqual(
+            metadata_interceptor.login_customer_id_meta,
+            ("login-customer-id", "123"),
+        )
+
     def test_http_proxy(self):
         """Client initialization sets http_proxy in GRPC config options"""
         test_proxy = "https://localhost:8080"
@@ -965,6 +1651,14 @@ class GoogleAdsClientTest(TestCase):
                 http_proxy=self.http_proxy,
                 use_cloud_org_for_api_access=None,
                 ads_assistant=None,
+                channel_pool_size=None,
+                channel_pool_policy=None,
+                structured_logging=False,
+                max_log_message_length=None,
+                enable_metrics=False,
+                retry_policy=None,
+                rate_limiter=None,
+                token_refresh=None,
             )
 
     def test_load_http_proxy_from_dict(self):
@@ -1003,6 +1697,14 @@ class GoogleAdsClientTest(TestCase):
                 http_proxy=self.http_proxy,
                 use_cloud_org_for_api_access=None,
                 ads_assistant=None,
+                channel_pool_size=None,
+                channel_pool_policy=None,
+                structured_logging=False,
+                max_log_message_length=None,
+                enable_metrics=False,
+                retry_policy=None,
+                rate_limiter=None,
+                token_refresh=None,
             )
 
     def test_load_http_proxy_from_string(self):
@@ -1041,6 +1743,14 @@ class GoogleAdsClientTest(TestCase):
                 http_proxy=self.http_proxy,
                 use_cloud_org_for_api_access=None,
                 ads_assistant=None,
+                channel_pool_size=None,
+                channel_pool_policy=None,
+                structured_logging=False,
+                max_log_message_length=None,
+                enable_metrics=False,
+                retry_policy=None,
+                rate_limiter=None,
+                token_refresh=None,
             )
 
     def test_client_info_package_not_found(self):
@@ -1116,6 +1826,14 @@ class GoogleAdsClientTestFs(FileTestCase):
                 http_proxy=self.http_proxy,
                 use_cloud_org_for_api_access=None,
                 ads_assistant=None,
+                channel_pool_size=None,
+                channel_pool_policy=None,
+                structured_logging=False,
+                max_log_message_length=None,
+                enable_metrics=False,
+                retry_policy=None,
+                rate_limiter=None,
+                token_refresh=None,
             )
 
     def test_load_from_storage(self):
@@ -1161,8 +1879,41 @@ class GoogleAdsClientTestFs(FileTestCase):
                 http_proxy=None,
                 use_cloud_org_for_api_access=None,
                 ads_assistant=None,
+                channel_pool_size=None,
+                channel_pool_policy=None,
+                structured_logging=False,
+                max_log_message_length=None,
+                enable_metrics=False,
+                retry_policy=None,
+                rate_limiter=None,
+                token_refresh=None,
             )
 
+    def test_load_from_storage_async(self):
+        config = {
+            **self.default_config,
+            **{
+                "client_id": self.client_id,
+                "client_secret": self.client_secret,
+                "refresh_token": self.refresh_token,
+            },
+        }
+        file_path = os.path.join(os.path.expanduser("~"), "google-ads.yaml")
+        self.fs.create_file(file_path, contents=yaml.safe_dump(config))
+        mock_credentials_instance = mock.Mock()
+
+        with mock.patch.object(
+            Client.oauth2,
+            "get_credentials_async",
+            return_value=mock_credentials_instance,
+        ):
+            client = asyncio.run(
+                Client.GoogleAdsClient.load_from_storage_async()
+            )
+
+        self.assertIs(client.credentials, mock_credentials_instance)
+        self.assertEqual(client.developer_token, self.developer_token)
+
     def test_load_from_storage_versioned(self):
         config = {
             **self.default_config,
@@ -1206,6 +1957,14 @@ class GoogleAdsClientTestFs(FileTestCase):
                 http_proxy=None,
                 use_cloud_org_for_api_access=None,
                 ads_assistant=None,
+                channel_pool_size=None,
+                channel_pool_policy=None,
+                structured_logging=False,
+                max_log_message_length=None,
+                enable_metrics=False,
+                retry_policy=None,
+                rate_limiter=None,
+                token_refresh=None,
             )
 
     def test_load_from_storage_login_cid_int(self):
@@ -1253,6 +2012,14 @@ class GoogleAdsClientTestFs(FileTestCase):
                 http_proxy=None,
                 use_cloud_org_for_api_access=None,
                 ads_assistant=None,
+                channel_pool_size=None,
+                channel_pool_policy=None,
+                structured_logging=False,
+                max_log_message_length=None,
+                enable_metrics=False,
+                retry_policy=None,
+                rate_limiter=None,
+                token_refresh=None,
             )
 
     def test_load_from_storage_custom_path(self):
@@ -1292,6 +2059,14 @@ class GoogleAdsClientTestFs(FileTestCase):
                 http_proxy=None,
                 use_cloud_org_for_api_access=None,
                 ads_assistant=None,
+                channel_pool_size=None,
+                channel_pool_policy=None,
+                structured_logging=False,
+                max_log_message_length=None,
+                enable_metrics=False,
+                retry_policy=None,
+                rate_limiter=None,
+                token_refresh=None,
             )
 
     def test_load_from_storage_file_not_found(self):
@@ -1358,4 +2133,12 @@ class GoogleAdsClientTestFs(FileTestCase):
                 http_proxy=None,
                 use_cloud_org_for_api_access=None,
                 ads_assistant=None,
+                channel_pool_size=None,
+                channel_pool_policy=None,
+                structured_logging=False,
+                max_log_message_length=None,
+                enable_metrics=False,
+                retry_policy=None,
+                rate_limiter=None,
+                token_refresh=None,
             )
@@ -705,6 +705,109 @@ class ConfigTest(FileTestCase):
                 "1.6.0",
             )
 
+    def test_load_from_env_channel_pool_size(self):
+        """Should convert the channel pool size from env to an int."""
+        environ = {
+            **self.default_env_var_config,
+            **{
+                "GOOGLE_ADS_CHANNEL_POOL_SIZE": "4",
+                "GOOGLE_ADS_CHANNEL_POOL_POLICY": "least_in_flight",
+            },
+        }
+
+        with mock.patch("os.environ", environ):
+            results = config.load_from_env()
+            self.assertEqual(results["channel_pool_size"], 4)
+            self.assertEqual(results["channel_pool_policy"], "least_in_flight")
+
+    def test_load_from_env_channel_pool_size_invalid(self):
+        """Should raise ValueError if the channel pool size isn't an int."""
+        environ = {
+            **self.default_env_var_config,
+            **{"GOOGLE_ADS_CHANNEL_POOL_SIZE": "four"},
+        }
+
+        with mock.patch("os.environ", environ):
+            self.assertRaises(ValueError, config.load_from_env)
+
+    def test_load_from_env_max_log_message_length(self):
+        """Should convert the maximum log message length from env to an int."""
+        environ = {
+            **self.default_env_var_config,
+            **{"GOOGLE_ADS_MAX_LOG_MESSAGE_LENGTH": "1000"},
+        }
+
+        with mock.patch("os.environ", environ):
+            results = config.load_from_env()
+            self.assertEqual(results["max_log_message_length"], 1000)
+
+    def test_load_from_env_structured_logging(self):
+        """Should convert structured_logging from env to a bool."""
+        environ = {
+            **self.default_env_var_config,
+            **{"GOOGLE_ADS_STRUCTURED_LOGGING": "False"},
+        }
+
+        with mock.patch("os.environ", environ):
+            results = config.load_from_env()
+            self.assertIs(results["structured_logging"], False)
+
+    def test_load_from_env_enable_metrics(self):
+        """Should convert enable_metrics from env to a bool."""
+        environ = {
+            **self.default_env_var_config,
+            **{"GOOGLE_ADS_ENABLE_METRICS": "True"},
+        }
+
+        with mock.patch("os.environ", environ):
+            results = config.load_from_env()
+            self.assertIs(results["enable_metrics"], True)
+
+    def test_load_from_env_retry_policy(self):
+        """Should parse the retry policy from env as JSON."""
+        environ = {
+            **self.default_env_var_config,
+            **{"GOOGLE_ADS_RETRY_POLICY": '{"max_attempts": 3}'},
+        }
+
+        with mock.patch("os.environ", environ):
+            results = config.load_from_env()
+            self.assertEqual(results["retry_policy"], {"max_attempts": 3})
+
+    def test_load_from_env_retry_policy_invalid_json(self):
+        """Should raise ValueError if the retry policy isn't valid JSON."""
+        environ = {
+            **self.default_env_var_config,
+            **{"GOOGLE_ADS_RETRY_POLICY": "max_attempts: 3"},
+        }
+
+        with mock.patch("os.environ", environ):
+            self.assertRaises(ValueError, config.load_from_env)
+
+    def test_load_from_env_rate_limiter(self):
+        """Should parse the rate limiter from env as JSON."""
+        environ = {
+            **self.default_env_var_config,
+            **{"GOOGLE_ADS_RATE_LIMITER": '{"initial_rate": 2}'},
+        }
+
+        with mock.patch("os.environ", environ):
+            results = config.load_from_env()
+            self.assertEqual(results["rate_limiter"], {"initial_rate": 2})
+
+    def test_load_from_env_token_refresh(self):
+        """Should parse the token refresh configuration from env as JSON."""
+        environ = {
+            **self.default_env_var_config,
+            **{"GOOGLE_ADS_TOKEN_REFRESH": '{"refresh_margin": 600}'},
+        }
+
+        with mock.patch("os.environ", environ):
+            results = config.load_from_env()
+            self.assertEqual(
+                results["token_refresh"], {"refresh_margin": 600}
+            )
+
     def test_load_from_yaml_file_ads_assistant(self):
         """Should load "ads_assistant" config from a yaml."""
         self._create_mock_yaml({"ads_assistant": "1.6.0"})
@@ -0,0 +1,394 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the Customer Match uploader."""
+
+from array import array
+import hashlib
+import importlib
+import os
+import tempfile
+import threading
+from unittest import mock, TestCase
+
+from google.protobuf import any_pb2
+
+from google.ads.googleads import client as Client
+from google.ads.googleads import customer_match
+
+latest_version = Client._DEFAULT_VERSION
+
+_errors = importlib.import_module(
+    f"google.ads.googleads.{latest_version}.errors.types.errors"
+)
+_offline_user_data_job_service = importlib.import_module(
+    f"google.ads.googleads.{latest_version}.services.types."
+    "offline_user_data_job_service"
+)
+_JOB_RESOURCE_NAME = "customers/1/offlineUserDataJobs/2"
+
+
+def _sha256(value):
+    return hashlib.sha256(value.encode()).hexdigest()
+
+
+class _Operation:
+    """A long-running operation that's done after a number of polls."""
+
+    def __init__(self, polls):
+        self.polls = polls
+
+    def done(self):
+        self.polls -= 1
+        return self.polls < 0
+
+    def exception(self):
+        return None
+
+
+class _OfflineUserDataJobService:
+    """An OfflineUserDataJobService that keeps the requests it receives."""
+
+    def __init__(self, failed_operation_indexes=(), exception=None):
+        self._lock = threading.Lock()
+        self._failed_operation_indexes = failed_operation_indexes
+        self._exception = exception
+        self.create_requests = []
+        self.add_requests = []
+        self.run_resource_names = []
+
+    def create_offline_user_data_job(self, request):
+        self.create_requests.append(
+            _offline_user_data_job_service.CreateOfflineUserDataJobRequest(
+                request
+            )
+        )
+        return _offline_user_data_job_service.CreateOfflineUserDataJobResponse(
+            resource_name=_JOB_RESOURCE_NAME
+        )
+
+    def add_offline_user_data_job_operations(self, request):
+        with self._lock:
+            self.add_requests.append(request)
+
+        if self._exception is not None:
+            raise self._exception
+
+        response_class = (
+            _offline_user_data_job_service.AddOfflineUserDataJobOperationsResponse
+        )
+        response = response_class()
+
+        if self._failed_operation_indexes:
+            failure = _errors.GoogleAdsFailure(
+                errors=[
+                    {
+                        "error_code": {"field_error": "REQUIRED"},
+                        "location": {
+                            "field_path_elements": [
+                                {"field_name": "operations", "index": index}
+                            ]
+                        },
+                    }
+                    for index in self._failed_operation_indexes
+                ]
+            )
+            response_pb = type(response).pb(response)
+            response_pb.partial_failure_error.code = 3
+            response_pb.partial_failure_error.details.append(
+                any_pb2.Any(
+                    type_url=(
+                        "type.googleapis.com/google.ads.googleads."
+                        f"{latest_version}.errors.GoogleAdsFailure"
+                    ),
+                    value=_errors.GoogleAdsFailure.serialize(failure),
+                )
+            )
+
+        return response
+
+    def run_offline_user_data_job(self, resource_name):
+        self.run_resource_names.append(resource_name)
+        return _Operation(1)
+
+
+def _get_records(count):
+    return ({"email": f"User{i}@Example.com "} for i in range(count))
+
+
+class NormalizationTest(TestCase):
+    def test_normalize_email(self):
+        self.assertEqual(
+            customer_match.normalize_email(" Dana @Example.com\t"),
+            "dana@example.com",
+        )
+
+    def test_normalize_phone_number(self):
+        self.assertEqual(
+            customer_match.normalize_phone_number("+1 (800) 555-0101"),
+            "+18005550101",
+        )
+
+    def test_normalize_name(self):
+        self.assertEqual(customer_match.normalize_name(" Alex "), "alex")
+
+    def test_hash_value(self):
+        self.assertEqual(
+            customer_match.hash_value("dana@example.com"),
+            _sha256("dana@example.com"),
+        )
+
+    def test_read_csv_records(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "members.csv")
+
+            with open(path, "w", newline="") as file:
+                file.write("email,phone\na@example.com,\n,+18005550101\n")
+
+            records = list(customer_match.read_csv_records(path))
+
+        self.assertEqual(
+            records,
+            [
+                {"email": "a@example.com", "phone": ""},
+                {"email": "", "phone": "+18005550101"},
+            ],
+        )
+
+
+class EncodeRecordsTest(TestCase):
+    def _decode(self, chunk):
+        record_indexes, serialized_request, request_bytes = chunk
+        request_class = (
+            _offline_user_data_job_service.AddOfflineUserDataJobOperationsRequest
+        )
+        request = request_class.deserialize(serialized_request)
+        return list(record_indexes), request, request_bytes
+
+    def test_encode_records(self):
+        records = [
+            {"email": " Dana@Example.com", "phone": "+1 800 5550101"},
+            {"email": "", "phone": ""},
+            {
+                "first_name": " Alex",
+                "last_name": "Quinn ",
+                "country_code": "us",
+                "postal_code": "94045",
+                "ignored": "value",
+            },
+            # An incomplete address is left out.
+            {"first_name": "Alex", "last_name": "Quinn"},
+        ]
+
+        chunks = customer_match._encode_records(
+            latest_version, 10, records, False, 100, 10000
+        )
+
+        self.assertEqual(len(chunks), 1)
+        record_indexes, request, request_bytes = self._decode(chunks[0])
+        self.assertEqual(record_indexes, [10, 12])
+        self.assertEqual(request_bytes, len(type(request).serialize(request)))
+
+        first, second = request.operations
+        self.assertEqual(
+            first.create.user_identifiers[0].hashed_email,
+            _sha256("dana@example.com"),
+        )
+        self.assertEqual(
+            first.create.user_identifiers[1].hashed_phone_number,
+            _sha256("+18005550101"),
+        )
+        address_info = second.create.user_identifiers[0].address_info
+        self.assertEqual(address_info.hashed_first_name, _sha256("alex"))
+        self.assertEqual(address_info.hashed_last_name, _sha256("quinn"))
+        self.assertEqual(address_info.country_code, "US")
+        self.assertEqual(address_info.postal_code, "94045")
+
+    def test_encode_records_remove(self):
+        chunks = customer_match._encode_records(
+            latest_version, 0, [{"email": "a@example.com"}], True, 100, 10000
+        )
+
+        _, request, _ = self._decode(chunks[0])
+        self.assertEqual(
+            request.operations[0].remove.user_identifiers[0].hashed_email,
+            _sha256("a@example.com"),
+        )
+
+    def test_encode_records_max_operations(self):
+        chunks = customer_match._encode_records(
+            latest_version, 0, list(_get_records(5)), False, 2, 10000
+        )
+
+        self.assertEqual(
+            [self._decode(chunk)[0] for chunk in chunks], [[0, 1], [2, 3], [4]]
+        )
+
+    def test_encode_records_max_bytes(self):
+        # Each operation takes 72 bytes: a 64 character hash in two nested
+        # messages, and the tag and length of the operation.
+        chunks = customer_match._encode_records(
+            latest_version, 0, list(_get_records(5)), False, 100, 150
+        )
+
+        self.assertEqual(
+            [self._decode(chunk)[0] for chunk in chunks], [[0, 1], [2, 3], [4]]
+        )
+        self.assertTrue(all(chunk[2] <= 150 for chunk in chunks))
+
+
+class CustomerMatchUploaderTest(TestCase):
+    def _create_uploader(self, service=None, **kwargs):
+        client = mock.Mock()
+        service = service or _OfflineUserDataJobService()
+        client.get_service.return_value = service
+        kwargs.setdefault("initial_poll_delay", 0)
+        kwargs.setdefault("max_processes", 0)
+        return customer_match.CustomerMatchUploader(client, **kwargs), service
+
+    def test_invalid_limits(self):
+        with self.assertRaises(ValueError):
+            self._create_uploader(max_operations=0)
+
+        with self.assertRaises(ValueError):
+            self._create_uploader(max_processes=-1)
+
+    def test_create_job(self):
+        uploader, service = self._create_uploader()
+
+        resource_name = uploader.create_job(
+            "1", "customers/1/userLists/3", ad_user_data_consent="GRANTED"
+        )
+
+        self.assertEqual(resource_name, _JOB_RESOURCE_NAME)
+        job = service.create_requests[0].job
+        self.assertEqual(job.type_.name, "CUSTOMER_MATCH_USER_LIST")
+        metadata = job.customer_match_user_list_metadata
+        self.assertEqual(metadata.user_list, "customers/1/userLists/3")
+        self.assertEqual(metadata.consent.ad_user_data.name, "GRANTED")
+        self.assertEqual(
+            metadata.consent.ad_personalization.name, "UNSPECIFIED"
+        )
+
+    def test_add_records(self):
+        uploader, service = self._create_uploader(
+            max_operations=3, batch_size=4
+        )
+
+        results = list(
+            uploader.add_records(_JOB_RESOURCE_NAME, _get_records(10))
+        )
+
+        # Requests don't span batches of records.
+        self.assertEqual(
+            [list(result.record_indexes) for result in results],
+            [[0, 1, 2], [3], [4, 5, 6], [7], [8, 9]],
+        )
+        self.assertEqual([result.index for result in results], list(range(5)))
+        self.assertTrue(all(result.succeeded for result in results))
+        request = service.add_requests[0]
+        self.assertEqual(request.resource_name, _JOB_RESOURCE_NAME)
+        self.assertTrue(request.enable_partial_failure)
+        self.assertEqual(
+            request.operations[0].create.user_identifiers[0].hashed_email,
+            _sha256("user0@example.com"),
+        )
+
+    def test_add_records_on_process_pool(self):
+        uploader, service = self._create_uploader(
+            max_operations=3, batch_size=4, max_processes=2
+        )
+
+        results = list(
+            uploader.add_records(_JOB_RESOURCE_NAME, _get_records(10))
+        )
+
+        self.assertEqual(
+            [list(result.record_indexes) for result in results],
+            [[0, 1, 2], [3], [4, 5, 6], [7], [8, 9]],
+        )
+        self.assertEqual(
+            sorted(len(request.operations) for request in service.add_requests),
+            [1, 1, 2, 3, 3],
+        )
+
+    def test_add_records_partial_failure(self):
+        uploader, _ = self._create_uploader(
+            _OfflineUserDataJobService(failed_operation_indexes=[1]),
+            max_operations=2,
+        )
+        records = [{"email": "a@example.com"}, {}, *_get_records(3)]
+
+        results = list(uploader.add_records("job", records))
+
+        self.assertTrue(results[0].has_partial_failure)
+        # The record without identifiers isn't sent, so the second operation
+        # is of the third record.
+        self.assertEqual(list(results[0].get_failed_record_indexes()), [2])
+        self.assertEqual(list(results[1].get_failed_record_indexes()), [4])
+
+    def test_add_records_exception(self):
+        error = RuntimeError("Failed.")
+        uploader, _ = self._create_uploader(
+            _OfflineUserDataJobService(exception=error)
+        )
+
+        (result,) = uploader.add_records("job", _get_records(2))
+
+        self.assertFalse(result.succeeded)
+        self.assertIs(result.exception, error)
+        self.assertEqual(result.get_failed_record_indexes(), array("q", [0, 1]))
+
+    def test_upload(self):
+        uploader, service = self._create_uploader(
+            _OfflineUserDataJobService(failed_operation_indexes=[0]),
+            max_operations=2,
+        )
+
+        upload = uploader.upload(
+            "1", "customers/1/userLists/3", _get_records(5)
+        )
+
+        self.assertEqual(upload.resource_name, _JOB_RESOURCE_NAME)
+        self.assertEqual(upload.request_count, 3)
+        self.assertEqual(upload.operation_count, 5)
+        self.assertEqual(upload.failed_record_indexes, array("q", [0, 2, 4]))
+        self.assertEqual(service.run_resource_names, [upload.resource_name])
+
+    def test_upload_exception(self):
+        error = RuntimeError("Failed.")
+        uploader, service = self._create_uploader(
+            _OfflineUserDataJobService(exception=error)
+        )
+
+        with self.assertRaises(RuntimeError):
+            uploader.upload("1", "customers/1/userLists/3", _get_records(2))
+
+        self.assertEqual(service.run_resource_names, [])
+
+    def test_run_job(self):
+        uploader, service = self._create_uploader()
+
+        with mock.patch("time.sleep") as mock_sleep:
+            operation = uploader.run_job("job")
+
+        self.assertTrue(operation.done())
+        self.assertEqual(mock_sleep.call_count, 1)
+        self.assertEqual(service.run_resource_names, ["job"])
+
+    def test_run_job_without_waiting(self):
+        uploader, _ = self._create_uploader()
+
+        operation = uploader.run_job("job", wait=False)
+
+        self.assertEqual(operation.polls, 1)
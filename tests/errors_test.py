@@ -13,6 +13,7 @@
 # limitations under the License.
 """Tests for the errors used by the Google Ads API client library."""
 
+import importlib
 import unittest
 from unittest import mock
 import grpc
@@ -94,5 +95,82 @@ class ErrorsTest(unittest.TestCase):
             mock_raise.assert_not_called()
 
 
+
+class GoogleAdsExceptionTest(unittest.TestCase):
+    def setUp(self):
+        error_protos = importlib.import_module(
+            f"google.ads.googleads.{latest_version}.errors.types.errors"
+        )
+        self.failure_class = error_protos.GoogleAdsFailure
+        self.failure = self.failure_class(
+            errors=[
+                {
+                    "error_code": {
+                        "quota_error": "RESOURCE_TEMPORARILY_EXHAUSTED"
+                    },
+                    "message": "Too many requests.",
+                },
+                {"message": "No error code."},
+                {"error_code": {"request_error": "INVALID_CUSTOMER_ID"}},
+            ]
+        )
+        self.serialized_failure = self.failure_class.serialize(self.failure)
+
+    def _create_exception(self, serialized_failure):
+        return errors.GoogleAdsException(
+            mock.Mock(),
+            mock.Mock(),
+            None,
+            "request-id",
+            serialized_failure=serialized_failure,
+            api_version=latest_version,
+        )
+
+    def test_failure_is_decoded_lazily(self):
+        exception = self._create_exception(self.serialized_failure)
+        self.assertIsNone(exception._failure)
+
+        self.assertEqual(exception.failure, self.failure)
+        self.assertIs(exception.failure, exception.failure)
+        self.assertEqual(exception.serialized_failure, self.serialized_failure)
+
+    def test_failure_decode_error(self):
+        exception = self._create_exception(self.serialized_failure + b"1234")
+
+        self.assertIsNone(exception.failure)
+
+    def test_get_error_codes(self):
+        exception = self._create_exception(self.serialized_failure)
+        expected = [
+            ("quota_error", "RESOURCE_TEMPORARILY_EXHAUSTED"),
+            ("request_error", "INVALID_CUSTOMER_ID"),
+        ]
+
+        self.assertEqual(exception.get_error_codes(), expected)
+        # The proto-plus failure isn't created to read the codes.
+        self.assertIsNone(exception._failure)
+
+        exception.failure
+        self.assertEqual(exception.get_error_codes(), expected)
+
+    def test_get_error_codes_of_failure(self):
+        exception = errors.GoogleAdsException(
+            mock.Mock(), mock.Mock(), self.failure, "request-id"
+        )
+
+        self.assertEqual(len(exception.get_error_codes()), 2)
+        self.assertEqual(exception.serialized_failure, self.serialized_failure)
+
+    def test_serialized_failure_requires_version(self):
+        with self.assertRaises(ValueError):
+            errors.GoogleAdsException(
+                mock.Mock(),
+                mock.Mock(),
+                None,
+                "request-id",
+                serialized_failure=self.serialized_failure,
+            )
+
+
 if __name__ == "__main__":
     unittest.main()
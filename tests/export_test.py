@@ -0,0 +1,200 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the columnar export of search results."""
+
+import csv
+import datetime
+from importlib import import_module
+import io
+import os
+import tempfile
+from unittest import mock, skipUnless, TestCase
+
+from google.ads.googleads import client
+from google.ads.googleads import export
+from google.ads.googleads import gaql
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+
+    _HAS_PYARROW = True
+except ImportError:
+    _HAS_PYARROW = False
+
+default_version = client._DEFAULT_VERSION
+
+google_ads_service = import_module(
+    f"google.ads.googleads.{default_version}."
+    "services.types.google_ads_service"
+)
+
+_QUERY = """
+    SELECT
+      campaign.name,
+      campaign.status,
+      campaign.network_settings,
+      ad_group_ad.ad.final_urls,
+      metrics.clicks,
+      segments.date
+    FROM ad_group_ad"""
+
+
+class ReportExporterTest(TestCase):
+    def _create_row(self, index):
+        row = google_ads_service.GoogleAdsRow()
+        row.campaign.name = f"Campaign {index}"
+        row.campaign.status = 2
+        row.campaign.network_settings.target_google_search = True
+        row.ad_group_ad.ad.final_urls.append("https://a")
+        row.metrics.clicks = index
+        row.segments.date = "2026-01-01"
+        return row
+
+    def _create_stream(self, *row_counts):
+        index = 0
+        stream = []
+        for row_count in row_counts:
+            rows = [self._create_row(index + i) for i in range(row_count)]
+            index += row_count
+            stream.append(
+                google_ads_service.SearchGoogleAdsStreamResponse(results=rows)
+            )
+        return stream
+
+    def test_invalid_max_batch_rows(self):
+        self.assertRaises(
+            ValueError, export.ReportExporter, _QUERY, default_version, None, 0
+        )
+
+    def test_column_names(self):
+        exporter = export.ReportExporter(_QUERY, default_version)
+        self.assertEqual(
+            exporter.column_names,
+            [
+                "campaign.name",
+                "campaign.status",
+                "campaign.network_settings",
+                "ad_group_ad.ad.final_urls",
+                "metrics.clicks",
+                "segments.date",
+            ],
+        )
+
+    def test_iter_batches(self):
+        exporter = export.ReportExporter(_QUERY, default_version)
+        batches = list(exporter.iter_batches(self._create_stream(2, 0, 1)))
+        self.assertEqual(len(batches), 2)
+        self.assertEqual(batches[0]["metrics.clicks"], [0, 1])
+        self.assertEqual(batches[0]["campaign.status"], ["ENABLED", "ENABLED"])
+        self.assertEqual(batches[1]["campaign.name"], ["Campaign 2"])
+        self.assertEqual(batches[1]["ad_group_ad.ad.final_urls"], [["https://a"]])
+
+    def test_iter_batches_splits_large_responses(self):
+        exporter = export.ReportExporter(
+            _QUERY, default_version, max_batch_rows=2
+        )
+        batches = list(exporter.iter_batches(self._create_stream(5)))
+        self.assertEqual(
+            [batch["metrics.clicks"] for batch in batches],
+            [[0, 1], [2, 3], [4]],
+        )
+
+    def test_iter_batches_rows(self):
+        exporter = export.ReportExporter(
+            _QUERY, default_version, max_batch_rows=2
+        )
+        rows = [self._create_row(i) for i in range(3)]
+        # Rows from a search pager may be protobuf or proto-plus messages.
+        rows[1] = type(rows[1]).pb(rows[1])
+        batches = list(exporter.iter_batches(rows))
+        self.assertEqual(
+            [batch["metrics.clicks"] for batch in batches], [[0, 1], [2]]
+        )
+
+    def test_write_csv(self):
+        exporter = export.ReportExporter(_QUERY, default_version)
+        file = io.StringIO()
+        row_count = exporter.write_csv(self._create_stream(2, 1), file)
+        self.assertEqual(row_count, 3)
+
+        rows = list(csv.reader(io.StringIO(file.getvalue())))
+        self.assertEqual(rows[0], exporter.column_names)
+        self.assertEqual(
+            rows[1],
+            [
+                "Campaign 0",
+                "ENABLED",
+                '{"target_google_search": true}',
+                '["https://a"]',
+                "0",
+                "2026-01-01",
+            ],
+        )
+        self.assertEqual(len(rows), 4)
+
+    def test_write_csv_custom_headers(self):
+        exporter = export.ReportExporter(
+            "SELECT campaign.name FROM campaign", default_version
+        )
+        file = io.StringIO()
+        exporter.write_csv(self._create_stream(1), file, headers=["Campaign"])
+        self.assertEqual(file.getvalue().splitlines(), ["Campaign", "Campaign 0"])
+
+    def test_write_csv_without_headers(self):
+        exporter = export.ReportExporter(
+            "SELECT campaign.name FROM campaign", default_version
+        )
+        file = io.StringIO()
+        exporter.write_csv(self._create_stream(1), file, write_headers=False)
+        self.assertEqual(file.getvalue().splitlines(), ["Campaign 0"])
+
+    def test_missing_pyarrow(self):
+        exporter = export.ReportExporter(_QUERY, default_version)
+        with mock.patch.dict("sys.modules", {"pyarrow": None}):
+            with self.assertRaisesRegex(ImportError, "google-ads\\[export\\]"):
+                exporter.get_arrow_schema()
+
+    @skipUnless(_HAS_PYARROW, "pyarrow is not installed")
+    def test_iter_record_batches(self):
+        exporter = export.ReportExporter(
+            _QUERY, default_version, {"segments.date": gaql.DATE}
+        )
+        batches = list(exporter.iter_record_batches(self._create_stream(2)))
+        self.assertEqual(len(batches), 1)
+        batch = batches[0]
+        self.assertEqual(batch.schema.field("metrics.clicks").type, pyarrow.int64())
+        self.assertEqual(
+            batch.column("segments.date").to_pylist(),
+            [datetime.date(2026, 1, 1)] * 2,
+        )
+        self.assertEqual(
+            batch.column("ad_group_ad.ad.final_urls").to_pylist(),
+            [["https://a"], ["https://a"]],
+        )
+
+    @skipUnless(_HAS_PYARROW, "pyarrow is not installed")
+    def test_write_parquet(self):
+        exporter = export.ReportExporter(_QUERY, default_version)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "report.parquet")
+            row_count = exporter.write_parquet(self._create_stream(2, 3), path)
+            table = pyarrow.parquet.read_table(path)
+
+        self.assertEqual(row_count, 5)
+        self.assertEqual(table.num_rows, 5)
+        self.assertEqual(
+            table.column("metrics.clicks").to_pylist(), [0, 1, 2, 3, 4]
+        )
@@ -0,0 +1,237 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the GAQL query result helpers."""
+
+from importlib import import_module
+from unittest import mock, TestCase
+
+from google.ads.googleads import client
+from google.ads.googleads import gaql
+
+default_version = client._DEFAULT_VERSION
+
+google_ads_service = import_module(
+    f"google.ads.googleads.{default_version}."
+    "services.types.google_ads_service"
+)
+google_ads_field = import_module(
+    f"google.ads.googleads.{default_version}.resources.types.google_ads_field"
+)
+
+_QUERY = """
+    SELECT
+      campaign.id,
+      campaign.status, -- The serving status.
+      ad_group_ad.ad.type,
+      ad_group_ad.ad.final_urls,
+      segments.date
+    FROM ad_group_ad
+    WHERE segments.date DURING LAST_7_DAYS"""
+
+
+class GaqlTest(TestCase):
+    def _create_row(self):
+        row = google_ads_service.GoogleAdsRow()
+        row.campaign.id = 123
+        row.campaign.status = 2
+        row.ad_group_ad.ad.type_ = 2
+        row.ad_group_ad.ad.final_urls.extend(["https://a", "https://b"])
+        row.segments.date = "2026-01-01"
+        return type(row).pb(row)
+
+    def test_parse_select_fields(self):
+        self.assertEqual(
+            gaql.parse_select_fields(_QUERY),
+            (
+                "campaign.id",
+                "campaign.status",
+                "ad_group_ad.ad.type",
+                "ad_group_ad.ad.final_urls",
+                "segments.date",
+            ),
+        )
+
+    def test_parse_select_fields_lowercase(self):
+        self.assertEqual(
+            gaql.parse_select_fields("select campaign.id from campaign"),
+            ("campaign.id",),
+        )
+
+    def test_parse_select_fields_invalid(self):
+        self.assertRaises(
+            ValueError, gaql.parse_select_fields, "campaign.id FROM campaign"
+        )
+
+    def test_compile_columns(self):
+        columns = gaql.compile_columns(_QUERY, default_version)
+        self.assertEqual(
+            [(column.name, column.data_type) for column in columns],
+            [
+                ("campaign.id", gaql.INT64),
+                ("campaign.status", gaql.ENUM),
+                ("ad_group_ad.ad.type", gaql.ENUM),
+                ("ad_group_ad.ad.final_urls", gaql.STRING),
+                ("segments.date", gaql.STRING),
+            ],
+        )
+        self.assertTrue(columns[3].is_repeated)
+
+    def test_compile_columns_data_types(self):
+        columns = gaql.compile_columns(
+            _QUERY,
+            default_version,
+            {"segments.date": gaql.DATE, "campaign.id": "UNSPECIFIED"},
+        )
+        self.assertEqual(columns[0].data_type, gaql.INT64)
+        self.assertEqual(columns[4].data_type, gaql.DATE)
+
+    def test_compile_columns_unknown_field(self):
+        self.assertRaises(
+            ValueError,
+            gaql.compile_columns,
+            "SELECT campaign.unknown_field FROM campaign",
+            default_version,
+        )
+
+    def test_compile_columns_subfield_of_scalar(self):
+        self.assertRaises(
+            ValueError,
+            gaql.compile_columns,
+            "SELECT campaign.id.value FROM campaign",
+            default_version,
+        )
+
+    def test_column_get(self):
+        row = self._create_row()
+        columns = gaql.compile_columns(_QUERY, default_version)
+        self.assertEqual(
+            [column.get(row) for column in columns],
+            [123, "ENABLED", "TEXT_AD", ["https://a", "https://b"], "2026-01-01"],
+        )
+
+    def test_column_get_values(self):
+        rows = [self._create_row(), self._create_row()]
+        columns = gaql.compile_columns(_QUERY, default_version)
+        self.assertEqual(columns[0].get_values(rows), [123, 123])
+        self.assertEqual(columns[1].get_values(rows), ["ENABLED", "ENABLED"])
+
+    def test_get_field_data_types(self):
+        mock_client = mock.Mock()
+        service = mock_client.get_service.return_value
+        service.search_google_ads_fields.return_value = [
+            google_ads_field.GoogleAdsField(
+                name="segments.date", data_type=gaql.DATE
+            ),
+            google_ads_field.GoogleAdsField.pb()(
+                name="campaign.id", data_type=8
+            ),
+        ]
+
+        data_types = gaql.get_field_data_types(
+            mock_client, ["segments.date", "campaign.id"], default_version
+        )
+
+        mock_client.get_service.assert_called_once_with(
+            "GoogleAdsFieldService", version=default_version
+        )
+        query = service.search_google_ads_fields.call_args[1]["query"]
+        self.assertIn("'segments.date', 'campaign.id'", query)
+        self.assertEqual(data_types["segments.date"], gaql.DATE)
+        self.assertEqual(data_types["campaign.id"], gaql.INT64)
+
+    def test_add_condition_without_where(self):
+        self.assertEqual(
+            gaql.add_condition(
+                "SELECT campaign.id FROM campaign ORDER BY campaign.id LIMIT 5",
+                "campaign.id = 1",
+            ),
+            "SELECT campaign.id FROM campaign WHERE campaign.id = 1 "
+            "ORDER BY campaign.id LIMIT 5",
+        )
+
+    def test_add_condition_with_where(self):
+        self.assertEqual(
+            gaql.add_condition(
+                "SELECT campaign.id FROM campaign WHERE campaign.id > 1",
+                "campaign.id < 5",
+            ),
+            "SELECT campaign.id FROM campaign WHERE campaign.id > 1 "
+            "AND campaign.id < 5",
+        )
+
+    def test_has_limit(self):
+        self.assertTrue(gaql.has_limit("SELECT a.b FROM c limit 10"))
+        self.assertFalse(gaql.has_limit("SELECT a.limit FROM c"))
+
+    def test_add_condition_with_keywords_in_literals(self):
+        """Comment markers and keywords in string literals are kept."""
+        self.assertEqual(
+            gaql.add_condition(
+                "SELECT campaign.id FROM campaign "
+                "WHERE campaign.name = 'Order by #1 limit -- x' # comment\n"
+                "ORDER BY campaign.id",
+                "campaign.id IN (1)",
+            ),
+            "SELECT campaign.id FROM campaign "
+            "WHERE campaign.name = 'Order by #1 limit -- x' "
+            "AND campaign.id IN (1) ORDER BY campaign.id",
+        )
+        self.assertEqual(
+            gaql.add_condition(
+                'SELECT campaign.id FROM campaign WHERE campaign.name LIKE '
+                '"%limit%"',
+                "campaign.id IN (1)",
+            ),
+            'SELECT campaign.id FROM campaign WHERE campaign.name LIKE '
+            '"%limit%" AND campaign.id IN (1)',
+        )
+
+    def test_add_condition_with_escaped_quotes(self):
+        self.assertEqual(
+            gaql.add_condition(
+                r"SELECT campaign.id FROM campaign "
+                r"WHERE campaign.name = 'it\'s where -- limit' LIMIT 5",
+                "campaign.id IN (1)",
+            ),
+            r"SELECT campaign.id FROM campaign "
+            r"WHERE campaign.name = 'it\'s where -- limit' "
+            r"AND campaign.id IN (1) LIMIT 5",
+        )
+
+    def test_add_condition_with_where_in_literal(self):
+        self.assertEqual(
+            gaql.add_condition(
+                "SELECT campaign.id FROM campaign ORDER BY 'where'",
+                "campaign.id IN (1)",
+            ),
+            "SELECT campaign.id FROM campaign WHERE campaign.id IN (1) "
+            "ORDER BY 'where'",
+        )
+
+    def test_has_limit_with_literals(self):
+        self.assertFalse(
+            gaql.has_limit(
+                "SELECT campaign.id FROM campaign "
+                "WHERE campaign.name = 'no limit'"
+            )
+        )
+        self.assertFalse(
+            gaql.has_limit("SELECT campaign.id FROM campaign -- LIMIT 5")
+        )
+        self.assertTrue(
+            gaql.has_limit(
+                "SELECT campaign.id FROM campaign "
+                "WHERE campaign.name = '#' LIMIT 5"
+            )
+        )
@@ -35,6 +35,8 @@ from google.ads.googleads.interceptors.exception_interceptor import (
 latest_version = Client._DEFAULT_VERSION
 
 _MOCK_FAILURE_VALUE = b"\n \n\x02\x08\x10\x12\x1aInvalid customer ID '123'."
+# A GoogleAdsFailure whose first error is truncated.
+_CORRUPT_FAILURE_VALUE = b"\n \n\x02\x08"
 
 
 class ExceptionInterceptorTest(TestCase):
@@ -68,6 +70,27 @@ class ExceptionInterceptorTest(TestCase):
             MockRpcErrorResponse(),
         )
 
+    def test_handle_grpc_failure_corrupt_failure(self):
+        """Raises as-is exceptions whose GoogleAdsFailure can't be decoded."""
+
+        class MockRpcErrorResponse(grpc.RpcError):
+            def code(self):
+                return grpc.StatusCode.INVALID_ARGUMENT
+
+            def trailing_metadata(self):
+                return ((interceptor._failure_key, _CORRUPT_FAILURE_VALUE),)
+
+            def exception(self):
+                return self
+
+        interceptor = self._create_test_interceptor()
+
+        self.assertRaises(
+            MockRpcErrorResponse,
+            interceptor._handle_grpc_failure,
+            MockRpcErrorResponse(),
+        )
+
     def test_handle_grpc_failure_retryable(self):
         """Raises retryable exceptions as-is."""
 
@@ -346,6 +369,32 @@ class ExceptionInterceptorTest(TestCase):
         message = next(result)
         self.assertIsInstance(message, ProtobufMessageType)
 
+    def test_intercept_unary_stream_bytes(self):
+        """__next__ returns bytes as-is for calls without a deserializer"""
+
+        class MockResponse:
+            def exception(self):
+                return None
+
+            def __next__(self):
+                return b"serialized"
+
+        mock_request = mock.Mock()
+        mock_client_call_details = mock.Mock()
+
+        def mock_continuation(client_call_details, request):
+            del client_call_details
+            del request
+            return MockResponse()
+
+        interceptor = self._create_test_interceptor(use_proto_plus=False)
+
+        result = interceptor.intercept_unary_stream(
+            mock_continuation, mock_client_call_details, mock_request
+        )
+
+        self.assertEqual(next(result), b"serialized")
+
 
 class AsyncExceptionInterceptorTest(IsolatedAsyncioTestCase):
     def _create_test_interceptor(self, **kwargs):
@@ -378,6 +427,27 @@ class AsyncExceptionInterceptorTest(IsolatedAsyncioTestCase):
                 error_response, error_response
             )
 
+    async def test_handle_grpc_failure_corrupt_failure(self):
+        """Raises as-is exceptions whose GoogleAdsFailure can't be decoded."""
+
+        class MockRpcErrorResponse(grpc.RpcError):
+            async def code(self):
+                return grpc.StatusCode.INVALID_ARGUMENT
+
+            async def trailing_metadata(self):
+                return ((interceptor._failure_key, _CORRUPT_FAILURE_VALUE),)
+
+            def exception(self):
+                return self
+
+        interceptor = self._create_test_interceptor()
+
+        with self.assertRaises(MockRpcErrorResponse):
+            error_response = MockRpcErrorResponse()
+            await interceptor._handle_grpc_failure_async(
+                error_response, error_response
+            )
+
     async def test_handle_grpc_failure_retryable(self):
         """Raises retryable exceptions as-is."""
 
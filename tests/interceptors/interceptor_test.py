@@ -94,6 +94,17 @@ class InterceptorTest(TestCase):
         result = interceptor._get_google_ads_failure(None)
         self.assertEqual(result, None)
 
+    def test_get_failure_metadata(self):
+        """Reads the failure and request ID without decoding the failure."""
+        interceptor = Interceptor(default_version)
+        mock_metadata = (
+            ("request-id", "123456"),
+            (interceptor._failure_key, _MOCK_FAILURE_VALUE),
+        )
+        result = interceptor._get_failure_metadata(mock_metadata)
+        self.assertEqual(result, (_MOCK_FAILURE_VALUE, "123456"))
+        self.assertEqual(interceptor._get_failure_metadata(None), (None, None))
+
     def test_init_no_error_proto_load(self):
         """Ensures that error proto modules are not loaded on init."""
         interceptor = Interceptor(default_version)
@@ -135,3 +146,20 @@ class InterceptorTest(TestCase):
         first_result = interceptor._get_error_from_response(response)
         second_result = interceptor._get_error_from_response(response)
         self.assertIsNot(first_result, second_result)
+
+    def test_get_error_from_response_decodes_failure_lazily(self):
+        """The failure of the exception is decoded when it's first read."""
+        interceptor = Interceptor(default_version)
+        response = mock.Mock()
+        response.code.return_value = grpc.StatusCode.INVALID_ARGUMENT
+        response.trailing_metadata.return_value = (
+            (interceptor._failure_key, _MOCK_FAILURE_VALUE),
+        )
+
+        result = interceptor._get_error_from_response(response)
+
+        self.assertIsNone(result._failure)
+        self.assertEqual(result.serialized_failure, _MOCK_FAILURE_VALUE)
+        self.assertEqual(
+            result.failure.errors[0].message, "Invalid customer ID '123'."
+        )
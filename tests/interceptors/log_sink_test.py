@@ -0,0 +1,116 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the structured log messages and bounded queue handler."""
+
+import json
+import logging
+import threading
+from unittest import TestCase
+
+from google.ads.googleads.interceptors import log_sink
+
+
+class _BlockingHandler(logging.Handler):
+    """Records handled messages, blocking until released."""
+
+    def __init__(self):
+        super().__init__()
+        self.released = threading.Event()
+        self.messages = []
+        self.threads = set()
+
+    def emit(self, record):
+        self.released.wait()
+        self.threads.add(threading.get_ident())
+        self.messages.append(self.format(record))
+
+
+def _create_record(msg):
+    return logging.LogRecord("test", logging.INFO, __file__, 1, msg, None, None)
+
+
+class StructuredLogMessageTest(TestCase):
+    def test_str_is_json(self):
+        message = log_sink.StructuredLogMessage(method="m", latency_ms=1.5)
+
+        self.assertEqual(
+            json.loads(str(message)), {"method": "m", "latency_ms": 1.5}
+        )
+        self.assertEqual(
+            _create_record(message).getMessage(), str(message)
+        )
+
+
+class BoundedQueueHandlerTest(TestCase):
+    def test_handles_records_on_background_thread(self):
+        target = _BlockingHandler()
+        target.released.set()
+        handler = log_sink.BoundedQueueHandler(target)
+
+        handler.handle(_create_record(log_sink.StructuredLogMessage(a=1)))
+        handler.close()
+
+        self.assertEqual(target.messages, ['{"a": 1}'])
+        self.assertNotIn(threading.get_ident(), target.threads)
+
+    def test_drop_policy(self):
+        target = _BlockingHandler()
+        handler = log_sink.BoundedQueueHandler(target, maxsize=1)
+
+        for index in range(5):
+            handler.handle(_create_record(str(index)))
+
+        # The first record may already be held by the background thread, so
+        # either three or four records were dropped.
+        self.assertIn(handler.dropped_records, (3, 4))
+        target.released.set()
+        handler.close()
+        self.assertEqual(
+            len(target.messages) + handler.dropped_records, 5
+        )
+
+    def test_block_policy_with_timeout(self):
+        target = _BlockingHandler()
+        handler = log_sink.BoundedQueueHandler(
+            target, maxsize=1, policy=log_sink.BLOCK, block_timeout=0.01
+        )
+
+        for index in range(3):
+            handler.handle(_create_record(str(index)))
+
+        self.assertGreaterEqual(handler.dropped_records, 1)
+        target.released.set()
+        handler.close()
+
+    def test_block_policy_waits_for_space(self):
+        target = _BlockingHandler()
+        handler = log_sink.BoundedQueueHandler(
+            target, maxsize=1, policy=log_sink.BLOCK
+        )
+        threading.Timer(0.05, target.released.set).start()
+
+        for index in range(5):
+            handler.handle(_create_record(str(index)))
+
+        handler.close()
+        self.assertEqual(handler.dropped_records, 0)
+        self.assertEqual(target.messages, ["0", "1", "2", "3", "4"])
+
+    def test_invalid_policy(self):
+        with self.assertRaises(ValueError):
+            log_sink.BoundedQueueHandler(logging.NullHandler(), policy="x")
+
+    def test_invalid_maxsize(self):
+        with self.assertRaises(ValueError):
+            log_sink.BoundedQueueHandler(logging.NullHandler(), maxsize=0)
@@ -25,9 +25,11 @@ from google.ads.googleads import client as Client
 from google.ads.googleads.interceptors import LoggingInterceptor
 from google.ads.googleads.interceptors.helpers import (
     mask_message,
+    mask_message_text,
     _mask_message_fields,
     _copy_message,
 )
+import google.ads.googleads.interceptors.helpers as helpers_module
 import google.ads.googleads.interceptors.logging_interceptor as interceptor_module
 from google.ads.googleads import util
 
@@ -523,6 +525,176 @@ class LoggingInterceptorTest(TestCase):
                 )
             )
 
+    def test_successful_request_at_info_skips_serialization(self):
+        """Metadata and messages aren't serialized or masked at INFO level.
+
+        Only the summary line is logged for a successful request at INFO
+        level, so the expensive values of the full log line are skipped.
+        """
+        mock_client_call_details = self._get_mock_client_call_details()
+        mock_continuation_fn = self._get_mock_continuation_fn()
+        mock_request = self._get_mock_request()
+        logger = mock.Mock()
+        logger.isEnabledFor.side_effect = lambda level: level >= logging.INFO
+        interceptor = self._create_test_interceptor(logger=logger)
+
+        with (
+            mock.patch.object(interceptor_module, "mask_message") as mock_mask,
+            mock.patch.object(
+                interceptor, "parse_metadata_to_json"
+            ) as mock_parse,
+        ):
+            interceptor.intercept_unary_unary(
+                mock_continuation_fn, mock_client_call_details, mock_request
+            )
+
+            logger.info.assert_called_once()
+            logger.debug.assert_not_called()
+            mock_mask.assert_not_called()
+            mock_parse.assert_not_called()
+
+    def test_failed_request_at_warning_skips_serialization(self):
+        """Metadata and messages aren't serialized or masked at WARNING level.
+
+        Only the summary line is logged for a failed request at WARNING
+        level, so the expensive values of the full log line are skipped.
+        """
+        mock_client_call_details = self._get_mock_client_call_details()
+        mock_continuation_fn = self._get_mock_continuation_fn(fail=True)
+        mock_request = self._get_mock_request()
+        logger = mock.Mock()
+        logger.isEnabledFor.side_effect = (
+            lambda level: level >= logging.WARNING
+        )
+        interceptor = self._create_test_interceptor(logger=logger)
+
+        with (
+            mock.patch.object(interceptor_module, "mask_message") as mock_mask,
+            mock.patch.object(
+                interceptor, "parse_metadata_to_json"
+            ) as mock_parse,
+            mock.patch.object(
+                interceptor, "_parse_exception_to_str"
+            ) as mock_parse_exception,
+        ):
+            interceptor.intercept_unary_unary(
+                mock_continuation_fn, mock_client_call_details, mock_request
+            )
+
+            logger.warning.assert_called_once()
+            logger.info.assert_not_called()
+            mock_mask.assert_not_called()
+            mock_parse.assert_not_called()
+            mock_parse_exception.assert_not_called()
+
+    def test_subclass_log_methods_receive_computed_values(self):
+        """Overridden logging methods receive JSON strs and masked requests."""
+
+        class CustomLoggingInterceptor(LoggingInterceptor):
+            def log_successful_request(self, *args):
+                self.logged_args = args
+
+        mock_client_call_details = self._get_mock_client_call_details()
+        mock_continuation_fn = self._get_mock_continuation_fn()
+        mock_request = self._get_mock_request()
+        interceptor = CustomLoggingInterceptor(
+            mock.Mock(), default_version, self._MOCK_ENDPOINT
+        )
+        interceptor.intercept_unary_unary(
+            mock_continuation_fn, mock_client_call_details, mock_request
+        )
+
+        _, _, metadata_json, _, _, trailing_metadata_json, _ = (
+            interceptor.logged_args
+        )
+        self.assertEqual(
+            metadata_json,
+            interceptor.parse_metadata_to_json(self._MOCK_INITIAL_METADATA),
+        )
+        self.assertEqual(
+            trailing_metadata_json,
+            interceptor.parse_metadata_to_json(self._MOCK_TRAILING_METADATA),
+        )
+
+    def test_structured_successful_request(self):
+        """A StructuredLogMessage is logged at INFO level on success."""
+        mock_client_call_details = self._get_mock_client_call_details()
+        mock_continuation_fn = self._get_mock_continuation_fn()
+        request = google_ads_service.SearchGoogleAdsRequest(
+            customer_id=self._MOCK_CUSTOMER_ID, query="SELECT campaign.id"
+        )
+        logger = mock.Mock()
+        interceptor = LoggingInterceptor(
+            logger, default_version, self._MOCK_ENDPOINT, structured=True
+        )
+
+        interceptor.intercept_unary_unary(
+            mock_continuation_fn, mock_client_call_details, request
+        )
+
+        logger.debug.assert_not_called()
+        logger.info.assert_not_called()
+        logger.log.assert_called_once()
+        level, message = logger.log.call_args.args
+        self.assertEqual(level, logging.INFO)
+        self.assertIsInstance(message, interceptor_module.StructuredLogMessage)
+        self.assertEqual(message["method"], self._MOCK_METHOD)
+        self.assertEqual(message["customer_id"], self._MOCK_CUSTOMER_ID)
+        self.assertEqual(message["request_id"], self._MOCK_REQUEST_ID)
+        self.assertEqual(message["status"], "OK")
+        self.assertFalse(message["is_fault"])
+        self.assertGreaterEqual(message["latency_ms"], 0)
+        self.assertEqual(
+            message["request_bytes"],
+            google_ads_service.SearchGoogleAdsRequest.pb(request).ByteSize(),
+        )
+        self.assertEqual(message["response_bytes"], 0)
+        json.loads(str(message))
+
+    def test_structured_failed_request(self):
+        """A StructuredLogMessage is logged at WARNING level on failure."""
+        mock_client_call_details = self._get_mock_client_call_details()
+        mock_continuation_fn = self._get_mock_continuation_fn(fail=True)
+        mock_request = self._get_mock_request()
+        logger = mock.Mock()
+        interceptor = LoggingInterceptor(
+            logger, default_version, self._MOCK_ENDPOINT, structured=True
+        )
+
+        interceptor.intercept_unary_unary(
+            mock_continuation_fn, mock_client_call_details, mock_request
+        )
+
+        logger.warning.assert_not_called()
+        level, message = logger.log.call_args.args
+        self.assertEqual(level, logging.WARNING)
+        self.assertTrue(message["is_fault"])
+        self.assertEqual(message["fault_message"], self._MOCK_ERROR_MESSAGE)
+        self.assertEqual(message["request_id"], self._MOCK_REQUEST_ID)
+
+    def test_structured_request_level_disabled(self):
+        """Nothing is built or logged if the level is disabled."""
+        mock_client_call_details = self._get_mock_client_call_details()
+        mock_continuation_fn = self._get_mock_continuation_fn()
+        mock_request = self._get_mock_request()
+        logger = mock.Mock()
+        logger.isEnabledFor.side_effect = (
+            lambda level: level >= logging.WARNING
+        )
+        interceptor = LoggingInterceptor(
+            logger, default_version, self._MOCK_ENDPOINT, structured=True
+        )
+
+        with mock.patch.object(
+            interceptor, "_get_structured_message"
+        ) as mock_get_message:
+            interceptor.intercept_unary_unary(
+                mock_continuation_fn, mock_client_call_details, mock_request
+            )
+
+        mock_get_message.assert_not_called()
+        logger.log.assert_not_called()
+
     def test_get_initial_metadata(self):
         """_Returns a tuple of metadata from client_call_details."""
         with mock.patch("logging.config.dictConfig"):
@@ -818,6 +990,76 @@ class LoggingInterceptorTest(TestCase):
             copy.results[0].customer_user_access.email_address, "REDACTED"
         )
 
+    def test_mask_message_text_search_response(self):
+        """Masks a SearchGoogleAdsResponse without changing or copying it."""
+        response = google_ads_service.SearchGoogleAdsResponse(
+            next_page_token="token"
+        )
+        for index in range(3):
+            row = google_ads_service.GoogleAdsRow()
+            row.campaign.id = index
+            if index == 1:
+                row.customer_user_access.email_address = "test@test.com"
+                row.change_event.user_email = "test@test.com"
+            response.results.append(row)
+
+        for message in (response, util.convert_proto_plus_to_protobuf(response)):
+            text = mask_message_text(message, "REDACTED")
+            self.assertEqual(text, str(mask_message(message, "REDACTED")))
+            self.assertNotIn("test@test.com", text)
+            self.assertEqual(
+                message.results[1].customer_user_access.email_address,
+                "test@test.com",
+            )
+
+    def test_mask_message_text_request(self):
+        """Masks a request message that has sensitive fields itself."""
+        request = customer_user_access_service.MutateCustomerUserAccessRequest(
+            customer_id="123",
+            operation=customer_user_access_service.CustomerUserAccessOperation(
+                update=customer_user_access.CustomerUserAccess(
+                    email_address="test@test.com",
+                )
+            ),
+        )
+        text = mask_message_text(request, "REDACTED")
+        self.assertEqual(text, str(mask_message(request, "REDACTED")))
+        self.assertNotIn("test@test.com", text)
+
+    def test_mask_message_text_serialized_message(self):
+        """Serialized responses of raw requests are logged by size only."""
+        row = google_ads_service.GoogleAdsRow()
+        row.customer_user_access.email_address = "test@test.com"
+        response = google_ads_service.SearchGoogleAdsResponse(results=[row])
+        serialized = type(response).serialize(response)
+
+        text = mask_message_text(serialized, "REDACTED")
+        self.assertEqual(text, f"<{len(serialized)} bytes>")
+        self.assertNotIn("test@test.com", text)
+
+    def test_mask_message_text_max_length(self):
+        """Only masks and converts the logged prefix of a message."""
+        response = google_ads_service.SearchGoogleAdsStreamResponse()
+        for index in range(1000):
+            row = google_ads_service.GoogleAdsRow()
+            row.customer_user_access.email_address = f"{index}@test.com"
+            response.results.append(row)
+
+        with mock.patch(
+            "google.ads.googleads.interceptors.helpers._mask_field_paths",
+            wraps=helpers_module._mask_field_paths,
+        ) as mock_mask:
+            text = mask_message_text(response, "REDACTED", max_length=200)
+
+        self.assertTrue(text.endswith("... (truncated)"))
+        self.assertEqual(len(text), 200 + len("... (truncated)"))
+        self.assertNotIn("@test.com", text)
+        self.assertLess(mock_mask.call_count, 10)
+
+    def test_mask_message_text_not_a_message(self):
+        """Converts objects that aren't messages with str."""
+        self.assertEqual(mask_message_text(123, "REDACTED"), "123")
+
     def test_mask_search_change_event(self):
         """Masks ChangeEvent messages found on a SearchStream response."""
         response = google_ads_service.SearchGoogleAdsStreamResponse()
@@ -1149,6 +1391,41 @@ class AsyncLoggingInterceptorTest(IsolatedAsyncioTestCase):
                 )
             )
 
+    async def test_subclass_log_methods_receive_computed_values(self):
+        """Overridden logging methods receive JSON strs and masked requests."""
+
+        class CustomLoggingInterceptor(
+            interceptor_module._AsyncLoggingInterceptor
+        ):
+            def log_successful_request_async(self, *args):
+                self.logged_args = args
+
+        mock_client_call_details = self._get_mock_client_call_details()
+        mock_continuation_fn = self._get_mock_continuation_fn()
+        request = google_ads_service.SearchGoogleAdsRequest(
+            customer_id=self._MOCK_CUSTOMER_ID
+        )
+        interceptor = CustomLoggingInterceptor(
+            mock.Mock(), default_version, self._MOCK_ENDPOINT
+        )
+        await interceptor.intercept_unary_unary(
+            mock_continuation_fn, mock_client_call_details, request
+        )
+        await asyncio.sleep(0)
+
+        _, _, metadata_json, _, logged_request, trailing_metadata_json, _, _ = (
+            interceptor.logged_args
+        )
+        self.assertEqual(
+            metadata_json,
+            interceptor.parse_metadata_to_json(self._MOCK_INITIAL_METADATA),
+        )
+        self.assertEqual(logged_request, request)
+        self.assertEqual(
+            trailing_metadata_json,
+            interceptor.parse_metadata_to_json(self._MOCK_TRAILING_METADATA),
+        )
+
     async def test_intercept_unary_stream_successful_request(self):
         mock_client_call_details = self._get_mock_client_call_details()
         mock_request = self._get_mock_request()
@@ -0,0 +1,246 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the metrics interceptor."""
+
+from unittest import mock, IsolatedAsyncioTestCase, TestCase
+
+import grpc
+
+from google.ads.googleads.interceptors import MetricsInterceptor
+from google.ads.googleads.interceptors.metrics import MetricsRegistry
+from google.ads.googleads.interceptors.metrics_interceptor import (
+    AsyncUnaryStreamMetricsInterceptor,
+    AsyncUnaryUnaryMetricsInterceptor,
+)
+from google.ads.googleads.v25.services.types import google_ads_service
+
+_METHOD = "/google.ads.googleads.v25.services.GoogleAdsService/SearchStream"
+
+
+class _RpcError(grpc.RpcError):
+    def code(self):
+        return grpc.StatusCode.UNAVAILABLE
+
+
+def _create_call_details():
+    return MetricsInterceptor.get_client_call_details_instance(
+        _METHOD, None, []
+    )
+
+
+def _create_request():
+    return google_ads_service.SearchGoogleAdsStreamRequest(
+        customer_id="123", query="SELECT campaign.id FROM campaign"
+    )
+
+
+def _create_response(row_count):
+    return google_ads_service.SearchGoogleAdsStreamResponse(
+        results=[{"campaign": {"id": index}} for index in range(row_count)]
+    )
+
+
+class _UnaryOutcome:
+    """A completed unary response, like grpc._interceptor._UnaryOutcome."""
+
+    def __init__(self, result=None, exception=None):
+        self._result = result
+        self._exception = exception
+
+    def result(self):
+        return self._result
+
+    def exception(self):
+        return self._exception
+
+    def add_done_callback(self, fn):
+        fn(self)
+
+
+class MetricsInterceptorTest(TestCase):
+    def setUp(self):
+        self.registry = MetricsRegistry()
+        self.interceptor = MetricsInterceptor(self.registry)
+
+    def _get_metrics(self):
+        (method_metrics,) = self.registry.snapshot()
+        return method_metrics
+
+    def test_intercept_unary_unary(self):
+        request = _create_request()
+        response = _create_response(2)
+        continuation = mock.Mock(return_value=_UnaryOutcome(response))
+
+        self.interceptor.intercept_unary_unary(
+            continuation, _create_call_details(), request
+        )
+
+        method_metrics = self._get_metrics()
+        self.assertEqual(method_metrics.service, "GoogleAdsService")
+        self.assertEqual(method_metrics.method, "SearchStream")
+        self.assertEqual(method_metrics.customer_id, "123")
+        self.assertEqual(method_metrics.status_counts, {"OK": 1})
+        self.assertEqual(method_metrics.request_bytes, request._pb.ByteSize())
+        self.assertEqual(
+            method_metrics.response_bytes, response._pb.ByteSize()
+        )
+
+    def test_intercept_unary_unary_failure(self):
+        continuation = mock.Mock(
+            return_value=_UnaryOutcome(exception=_RpcError())
+        )
+
+        self.interceptor.intercept_unary_unary(
+            continuation, _create_call_details(), _create_request()
+        )
+
+        self.assertEqual(
+            self._get_metrics().status_counts, {"UNAVAILABLE": 1}
+        )
+
+    def test_intercept_unary_unary_raised_failure(self):
+        continuation = mock.Mock(side_effect=_RpcError())
+
+        with self.assertRaises(_RpcError):
+            self.interceptor.intercept_unary_unary(
+                continuation, _create_call_details(), _create_request()
+            )
+
+        self.assertEqual(
+            self._get_metrics().status_counts, {"UNAVAILABLE": 1}
+        )
+
+    def test_intercept_unary_stream(self):
+        responses = [_create_response(3), _create_response(2)]
+        continuation = mock.Mock(return_value=iter(responses))
+
+        stream = self.interceptor.intercept_unary_stream(
+            continuation, _create_call_details(), _create_request()
+        )
+        next(stream)
+        # The stream isn't recorded until it has been read to the end.
+        self.assertEqual(self.registry.snapshot(), [])
+
+        self.assertEqual(len(list(stream)), 1)
+
+        method_metrics = self._get_metrics()
+        self.assertEqual(method_metrics.rows, 5)
+        self.assertEqual(method_metrics.status_counts, {"OK": 1})
+        self.assertEqual(
+            method_metrics.response_bytes,
+            sum(response._pb.ByteSize() for response in responses),
+        )
+
+    def test_intercept_unary_stream_failure(self):
+        def stream():
+            yield _create_response(1)
+            raise _RpcError()
+
+        continuation = mock.Mock(return_value=stream())
+        response = self.interceptor.intercept_unary_stream(
+            continuation, _create_call_details(), _create_request()
+        )
+
+        with self.assertRaises(_RpcError):
+            list(response)
+
+        method_metrics = self._get_metrics()
+        self.assertEqual(method_metrics.rows, 1)
+        self.assertEqual(method_metrics.status_counts, {"UNAVAILABLE": 1})
+
+    def test_measure_sizes_disabled(self):
+        interceptor = MetricsInterceptor(self.registry, measure_sizes=False)
+        continuation = mock.Mock(
+            return_value=_UnaryOutcome(_create_response(1))
+        )
+
+        interceptor.intercept_unary_unary(
+            continuation, _create_call_details(), _create_request()
+        )
+
+        self.assertEqual(self._get_metrics().request_bytes, 0)
+        self.assertEqual(self._get_metrics().response_bytes, 0)
+
+
+class _AsyncCall:
+    """An awaitable unary call or async stream of responses."""
+
+    def __init__(self, responses=(), exception=None):
+        self._responses = list(responses)
+        self._exception = exception
+
+    def __await__(self):
+        if self._exception:
+            raise self._exception
+        return self._responses[0]
+        yield
+
+    async def __aiter__(self):
+        for response in self._responses:
+            yield response
+        if self._exception:
+            raise self._exception
+
+
+class AsyncMetricsInterceptorTest(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.registry = MetricsRegistry()
+
+    async def test_intercept_unary_unary(self):
+        interceptor = AsyncUnaryUnaryMetricsInterceptor(self.registry)
+
+        async def continuation(client_call_details, request):
+            return _AsyncCall([_create_response(0)])
+
+        call = await interceptor.intercept_unary_unary(
+            continuation, _create_call_details(), _create_request()
+        )
+        self.assertIsInstance(call, grpc.aio.UnaryUnaryCall)
+        await call
+
+        (method_metrics,) = self.registry.snapshot()
+        self.assertEqual(method_metrics.status_counts, {"OK": 1})
+
+    async def test_intercept_unary_unary_failure(self):
+        interceptor = AsyncUnaryUnaryMetricsInterceptor(self.registry)
+
+        async def continuation(client_call_details, request):
+            return _AsyncCall(exception=_RpcError())
+
+        call = await interceptor.intercept_unary_unary(
+            continuation, _create_call_details(), _create_request()
+        )
+
+        with self.assertRaises(_RpcError):
+            await call
+
+        (method_metrics,) = self.registry.snapshot()
+        self.assertEqual(method_metrics.status_counts, {"UNAVAILABLE": 1})
+
+    async def test_intercept_unary_stream(self):
+        interceptor = AsyncUnaryStreamMetricsInterceptor(self.registry)
+
+        async def continuation(client_call_details, request):
+            return _AsyncCall([_create_response(3), _create_response(4)])
+
+        call = await interceptor.intercept_unary_stream(
+            continuation, _create_call_details(), _create_request()
+        )
+        self.assertIsInstance(call, grpc.aio.UnaryStreamCall)
+        responses = [response async for response in call]
+
+        self.assertEqual(len(responses), 2)
+        (method_metrics,) = self.registry.snapshot()
+        self.assertEqual(method_metrics.rows, 7)
+        self.assertEqual(method_metrics.status_counts, {"OK": 1})
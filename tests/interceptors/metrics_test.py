@@ -0,0 +1,173 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the request metrics registry and exporters."""
+
+import pickle
+from unittest import mock, TestCase
+
+from google.ads.googleads.interceptors import metrics
+
+
+def _create_sample(**kwargs):
+    fields = dict(
+        service="GoogleAdsService",
+        method="Search",
+        customer_id="123",
+        status="OK",
+        latency=0.2,
+        request_bytes=10,
+        response_bytes=100,
+    )
+    fields.update(kwargs)
+    return metrics.RequestSample(**fields)
+
+
+class HistogramTest(TestCase):
+    def test_observe(self):
+        histogram = metrics.Histogram((1, 2))
+
+        for value in (0.5, 1, 1.5, 3):
+            histogram.observe(value)
+
+        self.assertEqual(histogram.bucket_counts, [2, 1, 1])
+        self.assertEqual(histogram.cumulative_counts(), [2, 3, 4])
+        self.assertEqual(histogram.count, 4)
+        self.assertEqual(histogram.mean, 1.5)
+
+    def test_mean_without_values(self):
+        self.assertIsNone(metrics.Histogram().mean)
+
+
+class MetricsRegistryTest(TestCase):
+    def test_record(self):
+        registry = metrics.MetricsRegistry()
+        registry.record(_create_sample())
+        registry.record(_create_sample(status="INTERNAL", response_bytes=None))
+        registry.record(_create_sample(customer_id="456", rows=5))
+
+        first, second = registry.snapshot()
+
+        self.assertEqual(first.customer_id, "123")
+        self.assertEqual(first.request_count, 2)
+        self.assertEqual(first.status_counts, {"OK": 1, "INTERNAL": 1})
+        self.assertEqual(first.request_bytes, 20)
+        self.assertEqual(first.response_bytes, 100)
+        self.assertAlmostEqual(first.latency.sum, 0.4)
+        self.assertEqual(second.customer_id, "456")
+        self.assertEqual(second.rows, 5)
+
+    def test_snapshot_is_a_copy(self):
+        registry = metrics.MetricsRegistry()
+        registry.record(_create_sample())
+        snapshot = registry.snapshot()
+        registry.record(_create_sample())
+
+        self.assertEqual(snapshot[0].request_count, 1)
+        self.assertEqual(registry.snapshot()[0].request_count, 2)
+
+    def test_record_retry(self):
+        registry = metrics.MetricsRegistry()
+        registry.record_retry("GoogleAdsService", "Search", "123")
+
+        self.assertEqual(registry.snapshot()[0].retries, 1)
+
+    def test_passes_measurements_to_exporters(self):
+        exporter = mock.Mock(spec=metrics.MetricsExporter)
+        failing_exporter = mock.Mock(spec=metrics.MetricsExporter)
+        failing_exporter.record.side_effect = RuntimeError
+        registry = metrics.MetricsRegistry([failing_exporter])
+        registry.add_exporter(exporter)
+        sample = _create_sample()
+
+        registry.record(sample)
+        registry.record_retry("GoogleAdsService", "Search", "123")
+
+        exporter.record.assert_called_once_with(sample)
+        exporter.record_retry.assert_called_once_with(
+            "GoogleAdsService", "Search", "123"
+        )
+        self.assertEqual(registry.snapshot()[0].request_count, 1)
+
+    def test_reset(self):
+        registry = metrics.MetricsRegistry()
+        registry.record(_create_sample())
+        registry.reset()
+
+        self.assertEqual(registry.snapshot(), [])
+
+    def test_pickle(self):
+        registry = metrics.MetricsRegistry()
+        registry.record(_create_sample())
+
+        unpickled = pickle.loads(pickle.dumps(registry))
+        unpickled.record(_create_sample())
+
+        self.assertEqual(unpickled.snapshot()[0].request_count, 2)
+
+    def test_to_prometheus_text(self):
+        registry = metrics.MetricsRegistry(latency_buckets=(0.1, 1))
+        registry.record(_create_sample(customer_id=None))
+
+        text = registry.to_prometheus_text()
+        labels = 'service="GoogleAdsService",method="Search",customer_id=""'
+
+        self.assertIn(
+            "# TYPE google_ads_request_latency_seconds histogram", text
+        )
+        self.assertIn(
+            f'google_ads_request_latency_seconds_bucket{{{labels},le="0.1"}} 0',
+            text,
+        )
+        self.assertIn(
+            f'google_ads_request_latency_seconds_bucket{{{labels},le="1.0"}} 1',
+            text,
+        )
+        self.assertIn(
+            f'google_ads_request_latency_seconds_bucket{{{labels},le="+Inf"}} 1',
+            text,
+        )
+        self.assertIn(
+            f'google_ads_requests_total{{{labels},status="OK"}} 1', text
+        )
+        self.assertIn(f"google_ads_response_bytes_total{{{labels}}} 100", text)
+        self.assertTrue(text.endswith("\n"))
+
+
+class OpenTelemetryExporterTest(TestCase):
+    def test_record(self):
+        meter = mock.Mock()
+        meter.create_counter.side_effect = lambda *args, **kwargs: mock.Mock()
+        exporter = metrics.OpenTelemetryExporter(meter)
+
+        exporter.record(_create_sample(rows=3))
+        exporter.record_retry("GoogleAdsService", "Search", None)
+
+        attributes = {
+            "service": "GoogleAdsService",
+            "method": "Search",
+            "customer_id": "123",
+        }
+        exporter._latency.record.assert_called_once_with(
+            0.2, dict(attributes, status="OK")
+        )
+        exporter._request_bytes.add.assert_called_once_with(10, attributes)
+        exporter._rows.add.assert_called_once_with(3, attributes)
+        exporter._retries.add.assert_called_once_with(
+            1, {"service": "GoogleAdsService", "method": "Search"}
+        )
+
+    def test_missing_dependency(self):
+        with mock.patch.dict("sys.modules", {"opentelemetry": None}):
+            with self.assertRaises(ImportError):
+                metrics.OpenTelemetryExporter()
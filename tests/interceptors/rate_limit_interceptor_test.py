@@ -0,0 +1,244 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the rate limit interceptor."""
+
+import asyncio
+import threading
+from unittest import mock, IsolatedAsyncioTestCase, TestCase
+
+import grpc
+
+from google.ads.googleads.interceptors import (
+    AsyncUnaryStreamRateLimitInterceptor,
+    AsyncUnaryUnaryRateLimitInterceptor,
+    RateLimitInterceptor,
+)
+from google.ads.googleads.interceptors import rate_limit_interceptor
+from google.ads.googleads.rate_limiter import (
+    AdaptiveRateLimiter,
+    FileLockBackend,
+    InMemoryBackend,
+    get_bucket_key,
+)
+from google.ads.googleads.v25.services.types import google_ads_service
+
+_METHOD = "/google.ads.googleads.v25.services.GoogleAdsService/Search"
+_KEY = get_bucket_key("abc123", "456", "123")
+
+
+class _RpcError(grpc.RpcError):
+    def __init__(self, code):
+        self._code = code
+
+    def code(self):
+        return self._code
+
+
+class _UnaryOutcome:
+    """A completed unary response, like grpc._interceptor._UnaryOutcome."""
+
+    def __init__(self, result=None, exception=None):
+        self._result = result
+        self._exception = exception
+
+    def result(self):
+        return self._result
+
+    def exception(self):
+        return self._exception
+
+    def cancelled(self):
+        return False
+
+    def add_done_callback(self, fn):
+        fn(self)
+
+
+def _create_call_details(metadata=None):
+    return RateLimitInterceptor.get_client_call_details_instance(
+        _METHOD, None, metadata or []
+    )
+
+
+def _create_request():
+    return google_ads_service.SearchGoogleAdsRequest(customer_id="123")
+
+
+@mock.patch.object(rate_limit_interceptor.time, "sleep")
+class RateLimitInterceptorTest(TestCase):
+    def setUp(self):
+        self.limiter = mock.Mock(spec=AdaptiveRateLimiter)
+        self.limiter.acquire.return_value = 0.0
+        self.interceptor = RateLimitInterceptor(self.limiter, "abc123", "456")
+
+    def test_intercept_unary_unary(self, mock_sleep):
+        continuation = mock.Mock(return_value=_UnaryOutcome())
+
+        self.interceptor.intercept_unary_unary(
+            continuation, _create_call_details(), _create_request()
+        )
+
+        self.limiter.acquire.assert_called_once_with(_KEY)
+        self.limiter.record.assert_called_once_with(_KEY, None)
+        mock_sleep.assert_not_called()
+
+    def test_bucket_key_from_metadata(self, mock_sleep):
+        continuation = mock.Mock(return_value=_UnaryOutcome())
+        metadata = [("developer-token", "def456"), ("login-customer-id", "789")]
+
+        self.interceptor.intercept_unary_unary(
+            continuation, _create_call_details(metadata), _create_request()
+        )
+
+        self.limiter.acquire.assert_called_once_with(
+            get_bucket_key("def456", "789", "123")
+        )
+
+    def test_waits_for_turn(self, mock_sleep):
+        self.limiter.acquire.return_value = 0.25
+        continuation = mock.Mock(return_value=_UnaryOutcome())
+
+        self.interceptor.intercept_unary_stream(
+            continuation, _create_call_details(), _create_request()
+        )
+
+        mock_sleep.assert_called_once_with(0.25)
+        continuation.assert_called_once()
+
+    def test_records_failed_response(self, mock_sleep):
+        error = _RpcError(grpc.StatusCode.RESOURCE_EXHAUSTED)
+        continuation = mock.Mock(return_value=_UnaryOutcome(exception=error))
+
+        self.interceptor.intercept_unary_unary(
+            continuation, _create_call_details(), _create_request()
+        )
+
+        self.limiter.record.assert_called_once_with(_KEY, error)
+
+    def test_records_raised_exception(self, mock_sleep):
+        error = _RpcError(grpc.StatusCode.RESOURCE_EXHAUSTED)
+        continuation = mock.Mock(side_effect=error)
+
+        with self.assertRaises(_RpcError):
+            self.interceptor.intercept_unary_unary(
+                continuation, _create_call_details(), _create_request()
+            )
+
+        self.limiter.record.assert_called_once_with(_KEY, error)
+
+    def test_adapts_rate(self, mock_sleep):
+        limiter = AdaptiveRateLimiter(initial_rate=4)
+        interceptor = RateLimitInterceptor(limiter, "abc123", "456")
+        continuation = mock.Mock(
+            return_value=_UnaryOutcome(
+                exception=_RpcError(grpc.StatusCode.RESOURCE_EXHAUSTED)
+            )
+        )
+
+        interceptor.intercept_unary_unary(
+            continuation, _create_call_details(), _create_request()
+        )
+
+        self.assertEqual(limiter.get_rate(_KEY), 2)
+
+
+class _AsyncCall:
+    """A completed async call."""
+
+    def __init__(self, code):
+        self._code = code
+
+    async def code(self):
+        return self._code
+
+    def cancelled(self):
+        return False
+
+    def add_done_callback(self, callback):
+        callback(self)
+
+
+@mock.patch.object(rate_limit_interceptor.asyncio, "sleep")
+class AsyncRateLimitInterceptorTest(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.limiter = mock.Mock(spec=AdaptiveRateLimiter)
+        self.limiter.backend = InMemoryBackend()
+        self.limiter.acquire.return_value = 0.5
+
+    async def test_intercept_unary_unary(self, mock_sleep):
+        interceptor = AsyncUnaryUnaryRateLimitInterceptor(
+            self.limiter, "abc123", "456"
+        )
+        call = _AsyncCall(grpc.StatusCode.OK)
+
+        async def continuation(client_call_details, request):
+            return call
+
+        result = await interceptor.intercept_unary_unary(
+            continuation, _create_call_details(), _create_request()
+        )
+
+        self.assertIs(result, call)
+        mock_sleep.assert_called_once_with(0.5)
+        await asyncio.gather(*interceptor._pending_tasks)
+        self.limiter.record_status.assert_called_once_with(
+            _KEY, grpc.StatusCode.OK
+        )
+
+    async def test_intercept_unary_stream(self, mock_sleep):
+        interceptor = AsyncUnaryStreamRateLimitInterceptor(
+            self.limiter, "abc123", "456"
+        )
+
+        async def continuation(client_call_details, request):
+            return _AsyncCall(grpc.StatusCode.RESOURCE_EXHAUSTED)
+
+        await interceptor.intercept_unary_stream(
+            continuation, _create_call_details(), _create_request()
+        )
+        await asyncio.gather(*interceptor._pending_tasks)
+
+        self.limiter.record_status.assert_called_once_with(
+            _KEY, grpc.StatusCode.RESOURCE_EXHAUSTED
+        )
+
+    async def test_blocking_backend_called_in_executor(self, mock_sleep):
+        """File locks are taken off the event loop's thread."""
+        self.limiter.backend = FileLockBackend("unused.json")
+        loop_thread = threading.current_thread()
+        threads = []
+
+        def acquire(key):
+            threads.append(threading.current_thread())
+            return 0.0
+
+        def record_status(key, status_code):
+            threads.append(threading.current_thread())
+
+        self.limiter.acquire.side_effect = acquire
+        self.limiter.record_status.side_effect = record_status
+        interceptor = AsyncUnaryUnaryRateLimitInterceptor(
+            self.limiter, "abc123", "456"
+        )
+
+        async def continuation(client_call_details, request):
+            return _AsyncCall(grpc.StatusCode.OK)
+
+        await interceptor.intercept_unary_unary(
+            continuation, _create_call_details(), _create_request()
+        )
+        await asyncio.gather(*interceptor._pending_tasks)
+
+        self.assertEqual(len(threads), 2)
+        self.assertNotIn(loop_thread, threads)
@@ -0,0 +1,316 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the retry interceptor."""
+
+from unittest import mock, IsolatedAsyncioTestCase, TestCase
+
+import grpc
+
+from google.ads.googleads.interceptors import (
+    AsyncUnaryStreamRetryInterceptor,
+    AsyncUnaryUnaryRetryInterceptor,
+    RetryInterceptor,
+)
+from google.ads.googleads.interceptors import retry_interceptor
+from google.ads.googleads.retry import RetryPolicy, use_retry_policy
+from google.ads.googleads.v25.errors.types import errors
+from google.ads.googleads.v25.services.types import google_ads_service
+
+_VERSION = "v25"
+_SERVICE = "google.ads.googleads.v25.services.GoogleAdsService"
+_FAILURE_KEY = "google.ads.googleads.v25.errors.googleadsfailure-bin"
+
+
+class _RpcError(grpc.RpcError):
+    def __init__(self, code=grpc.StatusCode.UNAVAILABLE, metadata=()):
+        self._code = code
+        self._metadata = metadata
+
+    def code(self):
+        return self._code
+
+    def trailing_metadata(self):
+        return self._metadata
+
+
+class _UnaryOutcome:
+    """A completed unary response, like grpc._interceptor._UnaryOutcome."""
+
+    def __init__(self, result=None, exception=None):
+        self._result = result
+        self._exception = exception
+
+    def result(self):
+        return self._result
+
+    def exception(self):
+        return self._exception
+
+
+def _create_call_details(method="Search", timeout=None):
+    return RetryInterceptor.get_client_call_details_instance(
+        f"/{_SERVICE}/{method}", timeout, []
+    )
+
+
+def _create_request():
+    return google_ads_service.SearchGoogleAdsRequest(customer_id="123")
+
+
+def _create_response():
+    return google_ads_service.SearchGoogleAdsResponse(next_page_token="a")
+
+
+@mock.patch.object(retry_interceptor.time, "sleep")
+class RetryInterceptorTest(TestCase):
+    def setUp(self):
+        self.policy = RetryPolicy(max_attempts=3)
+        self.interceptor = RetryInterceptor(_VERSION, self.policy)
+
+    def test_retries_failed_response(self, mock_sleep):
+        response = _UnaryOutcome(_create_response())
+        continuation = mock.Mock(
+            side_effect=[_UnaryOutcome(exception=_RpcError()), response]
+        )
+
+        result = self.interceptor.intercept_unary_unary(
+            continuation, _create_call_details(), _create_request()
+        )
+
+        self.assertIs(result, response)
+        self.assertEqual(continuation.call_count, 2)
+        mock_sleep.assert_called_once()
+
+    def test_retries_raised_exception(self, mock_sleep):
+        continuation = mock.Mock(side_effect=_RpcError())
+
+        with self.assertRaises(_RpcError):
+            self.interceptor.intercept_unary_unary(
+                continuation, _create_call_details(), _create_request()
+            )
+
+        self.assertEqual(continuation.call_count, 3)
+        self.assertEqual(mock_sleep.call_count, 2)
+
+    def test_does_not_retry_non_retryable_status(self, mock_sleep):
+        response = _UnaryOutcome(
+            exception=_RpcError(grpc.StatusCode.INVALID_ARGUMENT)
+        )
+        continuation = mock.Mock(return_value=response)
+
+        result = self.interceptor.intercept_unary_unary(
+            continuation, _create_call_details(), _create_request()
+        )
+
+        self.assertIs(result, response)
+        continuation.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    def test_does_not_retry_mutate_when_unavailable(self, mock_sleep):
+        continuation = mock.Mock(
+            return_value=_UnaryOutcome(exception=_RpcError())
+        )
+
+        self.interceptor.intercept_unary_unary(
+            continuation, _create_call_details("Mutate"), _create_request()
+        )
+
+        continuation.assert_called_once()
+
+    def test_waits_for_quota_retry_delay(self, mock_sleep):
+        failure = errors.GoogleAdsFailure(
+            errors=[
+                {
+                    "details": {
+                        "quota_error_details": {"retry_delay": {"seconds": 7}}
+                    }
+                }
+            ]
+        )
+        error = _RpcError(
+            grpc.StatusCode.RESOURCE_EXHAUSTED,
+            ((_FAILURE_KEY, type(failure).serialize(failure)),),
+        )
+        continuation = mock.Mock(
+            side_effect=[
+                _UnaryOutcome(exception=error),
+                _UnaryOutcome(_create_response()),
+            ]
+        )
+
+        self.interceptor.intercept_unary_unary(
+            continuation, _create_call_details(), _create_request()
+        )
+
+        mock_sleep.assert_called_once_with(7)
+
+    def test_does_not_retry_past_deadline(self, mock_sleep):
+        self.interceptor.retry_policy = RetryPolicy(initial_backoff=10)
+        continuation = mock.Mock(
+            return_value=_UnaryOutcome(exception=_RpcError())
+        )
+
+        self.interceptor.intercept_unary_unary(
+            continuation, _create_call_details(timeout=1), _create_request()
+        )
+
+        continuation.assert_called_once()
+        self.assertLessEqual(continuation.call_args[0][0].timeout, 1)
+
+    def test_does_not_retry_without_policy(self, mock_sleep):
+        interceptor = RetryInterceptor(_VERSION)
+        continuation = mock.Mock(
+            return_value=_UnaryOutcome(exception=_RpcError())
+        )
+
+        interceptor.intercept_unary_unary(
+            continuation, _create_call_details(), _create_request()
+        )
+
+        continuation.assert_called_once()
+
+    def test_use_retry_policy(self, mock_sleep):
+        continuation = mock.Mock(
+            return_value=_UnaryOutcome(exception=_RpcError())
+        )
+
+        with use_retry_policy(None):
+            self.interceptor.intercept_unary_unary(
+                continuation, _create_call_details(), _create_request()
+            )
+
+        continuation.assert_called_once()
+
+    def test_records_retries(self, mock_sleep):
+        metrics = mock.Mock()
+        interceptor = RetryInterceptor(_VERSION, self.policy, metrics)
+        continuation = mock.Mock(
+            side_effect=[
+                _UnaryOutcome(exception=_RpcError()),
+                _UnaryOutcome(_create_response()),
+            ]
+        )
+
+        interceptor.intercept_unary_unary(
+            continuation, _create_call_details(), _create_request()
+        )
+
+        metrics.record_retry.assert_called_once_with(
+            "GoogleAdsService", "Search", "123"
+        )
+
+    def test_intercept_unary_stream(self, mock_sleep):
+        def failed_stream():
+            raise _RpcError()
+            yield
+
+        responses = [_create_response(), _create_response()]
+        continuation = mock.Mock(
+            side_effect=[failed_stream(), iter(responses)]
+        )
+
+        stream = self.interceptor.intercept_unary_stream(
+            continuation, _create_call_details("SearchStream"), _create_request()
+        )
+
+        self.assertEqual(list(stream), responses)
+        self.assertEqual(continuation.call_count, 2)
+
+    def test_intercept_unary_stream_after_first_message(self, mock_sleep):
+        def stream():
+            yield _create_response()
+            raise _RpcError()
+
+        continuation = mock.Mock(return_value=stream())
+
+        response = self.interceptor.intercept_unary_stream(
+            continuation, _create_call_details("SearchStream"), _create_request()
+        )
+
+        with self.assertRaises(_RpcError):
+            list(response)
+
+        continuation.assert_called_once()
+
+
+class _AsyncCall:
+    """An awaitable unary call or async stream of responses."""
+
+    def __init__(self, responses=(), exception=None):
+        self._responses = list(responses)
+        self._exception = exception
+
+    def __await__(self):
+        if self._exception:
+            raise self._exception
+        return self._responses[0]
+        yield
+
+    async def read(self):
+        if self._responses:
+            return self._responses.pop(0)
+        if self._exception:
+            raise self._exception
+        return grpc.aio.EOF
+
+
+@mock.patch.object(retry_interceptor.asyncio, "sleep")
+class AsyncRetryInterceptorTest(IsolatedAsyncioTestCase):
+    async def test_intercept_unary_unary(self, mock_sleep):
+        interceptor = AsyncUnaryUnaryRetryInterceptor(_VERSION, RetryPolicy())
+        response = _create_response()
+        calls = [_AsyncCall(exception=_RpcError()), _AsyncCall([response])]
+
+        async def continuation(client_call_details, request):
+            return calls.pop(0)
+
+        call = await interceptor.intercept_unary_unary(
+            continuation, _create_call_details(), _create_request()
+        )
+
+        self.assertEqual(await call, response)
+        mock_sleep.assert_called_once()
+
+    async def test_intercept_unary_unary_failure(self, mock_sleep):
+        interceptor = AsyncUnaryUnaryRetryInterceptor(
+            _VERSION, RetryPolicy(max_attempts=2)
+        )
+
+        async def continuation(client_call_details, request):
+            return _AsyncCall(exception=_RpcError())
+
+        call = await interceptor.intercept_unary_unary(
+            continuation, _create_call_details(), _create_request()
+        )
+
+        with self.assertRaises(_RpcError):
+            await call
+
+        mock_sleep.assert_called_once()
+
+    async def test_intercept_unary_stream(self, mock_sleep):
+        interceptor = AsyncUnaryStreamRetryInterceptor(_VERSION, RetryPolicy())
+        responses = [_create_response(), _create_response()]
+        calls = [_AsyncCall(exception=_RpcError()), _AsyncCall(responses)]
+
+        async def continuation(client_call_details, request):
+            return calls.pop(0)
+
+        call = await interceptor.intercept_unary_stream(
+            continuation, _create_call_details("SearchStream"), _create_request()
+        )
+
+        self.assertIsInstance(call, grpc.aio.UnaryStreamCall)
+        self.assertEqual([response async for response in call], responses)
+        mock_sleep.assert_called_once()
@@ -0,0 +1,128 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for lazy importing of API version packages."""
+
+import os
+import subprocess
+import sys
+import tempfile
+from unittest import mock, TestCase
+
+from google.ads.googleads import client as Client
+from google.ads.googleads import lazy_imports
+
+latest_version = Client._DEFAULT_VERSION
+
+_INIT_SOURCE = """
+from google.ads.googleads.v1 import gapic_version as package_version
+from . import enums
+from .types.campaign import (
+    Campaign,
+)
+from .types.ad_group import AdGroup, AdGroupOther as Other
+
+__all__ = (
+    "AdGroup",
+    "Campaign",
+)
+"""
+
+# Creates a client in a new interpreter, retrieves an enum and prints the
+# names of the imported resource modules.
+_SUBPROCESS_SOURCE = f"""
+from unittest import mock
+import sys
+from google.ads.googleads.client import GoogleAdsClient
+client = GoogleAdsClient(mock.Mock(), "token", version="{latest_version}")
+client.enums.CampaignStatusEnum.PAUSED
+print(
+    len(
+        [
+            name
+            for name in sys.modules
+            if name.startswith("google.ads.googleads.{latest_version}.resources.")
+        ]
+    )
+)
+"""
+
+
+class LazyImportsTest(TestCase):
+    def _build_index(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".py", delete=False) as f:
+            f.write(_INIT_SOURCE)
+
+        self.addCleanup(os.remove, f.name)
+        return lazy_imports.build_index(f.name)
+
+    def _count_imported_resources(self, lazy):
+        env = dict(os.environ)
+        env[lazy_imports.ENV_VARIABLE] = "true" if lazy else "false"
+        output = subprocess.check_output(
+            [sys.executable, "-c", _SUBPROCESS_SOURCE], env=env
+        )
+        return int(output.decode().strip().splitlines()[-1])
+
+    def test_build_index(self):
+        index, all_names = self._build_index()
+        self.assertEqual(
+            index,
+            {
+                "enums": ("enums", None),
+                "types": ("types", None),
+                "Campaign": ("types.campaign", "Campaign"),
+                "AdGroup": ("types.ad_group", "AdGroup"),
+                "Other": ("types.ad_group", "AdGroupOther"),
+            },
+        )
+        self.assertEqual(all_names, ("AdGroup", "Campaign"))
+
+    def test_enable_and_disable(self):
+        self.addCleanup(lazy_imports.disable)
+        lazy_imports.disable()
+        self.assertFalse(lazy_imports.is_enabled())
+        lazy_imports.enable()
+        lazy_imports.enable()
+        self.assertTrue(lazy_imports.is_enabled())
+        self.assertEqual(sys.meta_path.count(lazy_imports._finder), 1)
+        lazy_imports.disable()
+        self.assertFalse(lazy_imports.is_enabled())
+
+    def test_enable_from_env(self):
+        self.addCleanup(lazy_imports.disable)
+        lazy_imports.disable()
+
+        with mock.patch.dict(os.environ, {lazy_imports.ENV_VARIABLE: "false"}):
+            lazy_imports.enable_from_env()
+            self.assertFalse(lazy_imports.is_enabled())
+
+        with mock.patch.dict(os.environ, {lazy_imports.ENV_VARIABLE: "True"}):
+            lazy_imports.enable_from_env()
+            self.assertTrue(lazy_imports.is_enabled())
+
+    def test_finder_ignores_other_modules(self):
+        self.assertIsNone(
+            lazy_imports._finder.find_spec("google.ads.googleads.client", None)
+        )
+        self.assertIsNone(
+            lazy_imports._finder.find_spec(
+                f"google.ads.googleads.{latest_version}.resources.types."
+                "campaign",
+                None,
+            )
+        )
+
+    def test_lazy_import_skips_unused_modules(self):
+        self.assertEqual(self._count_imported_resources(lazy=True), 0)
+        self.assertGreater(self._count_imported_resources(lazy=False), 0)
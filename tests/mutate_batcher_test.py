@@ -0,0 +1,322 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the mutate batcher."""
+
+import importlib
+import threading
+import time
+from unittest import mock, TestCase
+
+import grpc
+
+from google.ads.googleads import client as Client
+from google.ads.googleads import mutate_batcher
+from google.ads.googleads.retry import RetryPolicy
+
+latest_version = Client._DEFAULT_VERSION
+
+_campaign_service = importlib.import_module(
+    f"google.ads.googleads.{latest_version}.services.types.campaign_service"
+)
+
+
+class _RpcError(grpc.RpcError):
+    def __init__(self, code):
+        self._code = code
+
+    def code(self):
+        return self._code
+
+
+class _CampaignService:
+    def __init__(self, mutate_campaigns):
+        self._mutate_campaigns = mutate_campaigns
+
+    def get_campaign(self):
+        pass
+
+    def mutate_campaigns(self, request):
+        return self._mutate_campaigns(request)
+
+
+def _get_operation(campaign_id):
+    return _campaign_service.CampaignOperation(
+        remove=f"customers/1/campaigns/{campaign_id}"
+    )
+
+
+def _get_response(request):
+    return _campaign_service.MutateCampaignsResponse(
+        results=[{"resource_name": op.remove} for op in request["operations"]]
+    )
+
+
+class ChunkOperationsTest(TestCase):
+    def test_max_operations(self):
+        operations = [_get_operation(i) for i in range(5)]
+        chunks = list(
+            mutate_batcher.chunk_operations(operations, max_operations=2)
+        )
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 2, 1])
+        self.assertEqual(
+            [op for chunk in chunks for op in chunk], operations
+        )
+
+    def test_max_request_bytes(self):
+        operations = [_get_operation(i) for i in range(5)]
+        size = mutate_batcher.get_operation_size(operations[0])
+        chunks = list(
+            mutate_batcher.chunk_operations(
+                iter(operations), max_request_bytes=size * 2 + 1
+            )
+        )
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 2, 1])
+
+    def test_oversized_operation(self):
+        operations = [_get_operation(i) for i in range(2)]
+        chunks = list(
+            mutate_batcher.chunk_operations(operations, max_request_bytes=1)
+        )
+        self.assertEqual([len(chunk) for chunk in chunks], [1, 1])
+
+    def test_get_operation_size(self):
+        operation = _get_operation(1)
+        request = _campaign_service.MutateCampaignsRequest(
+            operations=[operation, operation]
+        )
+        self.assertEqual(
+            mutate_batcher.get_operation_size(operation) * 2,
+            _campaign_service.MutateCampaignsRequest.pb(request).ByteSize(),
+        )
+        self.assertEqual(
+            mutate_batcher.get_operation_size(
+                _campaign_service.CampaignOperation.pb(operation)
+            ),
+            mutate_batcher.get_operation_size(operation),
+        )
+
+
+class MutateBatcherTest(TestCase):
+    def _create_batcher(self, mutate_campaigns, **kwargs):
+        client = mock.Mock()
+        client.get_service.return_value = _CampaignService(mutate_campaigns)
+        kwargs.setdefault("initial_backoff", 0)
+        return (
+            mutate_batcher.MutateBatcher(client, "CampaignService", **kwargs),
+            client,
+        )
+
+    def test_mutate(self):
+        requests = []
+        lock = threading.Lock()
+
+        def mutate_campaigns(request):
+            with lock:
+                requests.append(request)
+            return _get_response(request)
+
+        batcher, client = self._create_batcher(
+            mutate_campaigns, max_operations=3
+        )
+        operations = (_get_operation(i) for i in range(8))
+        results = list(
+            batcher.mutate("1", operations, partial_failure=True)
+        )
+
+        self.assertEqual([r.index for r in results], [0, 1, 2])
+        self.assertEqual([r.start for r in results], [0, 3, 6])
+        self.assertEqual(
+            [
+                result.resource_name
+                for r in results
+                for result in r.response.results
+            ],
+            [f"customers/1/campaigns/{i}" for i in range(8)],
+        )
+        self.assertTrue(all(r.succeeded for r in results))
+        self.assertFalse(results[0].has_partial_failure)
+        self.assertEqual(len(requests), 3)
+        self.assertTrue(
+            all(
+                r["customer_id"] == "1" and r["partial_failure"]
+                for r in requests
+            )
+        )
+        self.assertEqual(batcher.method_name, "mutate_campaigns")
+        client.get_service.assert_called_once_with("CampaignService")
+
+    def test_mutate_yields_results_in_order(self):
+        def mutate_campaigns(request):
+            # The first request completes last.
+            if request["operations"][0].remove.endswith("/0"):
+                time.sleep(0.05)
+            return _get_response(request)
+
+        batcher, _ = self._create_batcher(
+            mutate_campaigns, max_operations=1, max_workers=4
+        )
+        results = list(
+            batcher.mutate("1", [_get_operation(i) for i in range(6)])
+        )
+        self.assertEqual([r.index for r in results], list(range(6)))
+
+    def test_mutate_google_ads_service(self):
+        requests = []
+
+        class _GoogleAdsService:
+            def mutate(self, request):
+                requests.append(request)
+
+        client = mock.Mock()
+        client.get_service.return_value = _GoogleAdsService()
+        batcher = mutate_batcher.MutateBatcher(client, "GoogleAdsService")
+        list(batcher.mutate("1", [_get_operation(1)]))
+
+        self.assertEqual(batcher.method_name, "mutate")
+        self.assertIn("mutate_operations", requests[0])
+
+    def test_method_name(self):
+        class _Service:
+            def mutate_a(self):
+                pass
+
+            def mutate_b(self):
+                pass
+
+        client = mock.Mock()
+        client.get_service.return_value = _Service()
+
+        self.assertRaises(
+            ValueError, mutate_batcher.MutateBatcher, client, "Service"
+        )
+        batcher = mutate_batcher.MutateBatcher(
+            client, "Service", method_name="mutate_b"
+        )
+        self.assertEqual(batcher.method_name, "mutate_b")
+
+    def test_version(self):
+        client = mock.Mock()
+        client.get_service.return_value = _CampaignService(None)
+        mutate_batcher.MutateBatcher(
+            client, "CampaignService", version="v1"
+        )
+        client.get_service.assert_called_once_with(
+            "CampaignService", version="v1"
+        )
+
+    def test_retries_resource_exhausted(self):
+        calls = []
+
+        def mutate_campaigns(request):
+            calls.append(request)
+            if len(calls) < 3:
+                raise _RpcError(grpc.StatusCode.RESOURCE_EXHAUSTED)
+            return _get_response(request)
+
+        batcher, _ = self._create_batcher(mutate_campaigns)
+        [result] = list(batcher.mutate("1", [_get_operation(1)]))
+
+        self.assertTrue(result.succeeded)
+        self.assertEqual(result.attempts, 3)
+        self.assertEqual(batcher.stats.retries, 2)
+
+    def test_does_not_retry_unavailable(self):
+        """Mutates that may have been processed aren't retried."""
+        error = _RpcError(grpc.StatusCode.UNAVAILABLE)
+
+        def mutate_campaigns(request):
+            raise error
+
+        batcher, _ = self._create_batcher(mutate_campaigns)
+        [result] = list(batcher.mutate("1", [_get_operation(1)]))
+
+        self.assertFalse(result.succeeded)
+        self.assertIs(result.exception, error)
+        self.assertEqual(result.attempts, 1)
+        self.assertIsNone(result.get_partial_failure())
+
+    def test_gives_up_after_max_retries(self):
+        def mutate_campaigns(request):
+            raise _RpcError(grpc.StatusCode.RESOURCE_EXHAUSTED)
+
+        batcher, _ = self._create_batcher(mutate_campaigns, max_retries=2)
+        [result] = list(batcher.mutate("1", [_get_operation(1)]))
+
+        self.assertFalse(result.succeeded)
+        self.assertEqual(result.attempts, 3)
+
+    def test_stats(self):
+        def mutate_campaigns(request):
+            if request["operations"][0].remove.endswith("/0"):
+                raise _RpcError(grpc.StatusCode.INVALID_ARGUMENT)
+            return _get_response(request)
+
+        batcher, _ = self._create_batcher(mutate_campaigns, max_operations=2)
+        operations = [_get_operation(i) for i in range(5)]
+        list(batcher.mutate("1", operations))
+        stats = batcher.stats
+
+        self.assertEqual(stats.requests, 3)
+        self.assertEqual(stats.failed_requests, 1)
+        self.assertEqual(stats.operations, 5)
+        self.assertEqual(stats.failed_operations, 2)
+        self.assertEqual(
+            stats.request_bytes,
+            sum(mutate_batcher.get_operation_size(op) for op in operations),
+        )
+        self.assertGreater(stats.elapsed, 0)
+        self.assertGreater(stats.operations_per_second, 0)
+
+        batcher.reset_stats()
+        self.assertEqual(batcher.stats.requests, 0)
+
+    def test_stop_iterating(self):
+        calls = []
+
+        def mutate_campaigns(request):
+            calls.append(request)
+            return _get_response(request)
+
+        batcher, _ = self._create_batcher(
+            mutate_campaigns, max_operations=1, max_workers=1
+        )
+        results = batcher.mutate("1", (_get_operation(i) for i in range(100)))
+        next(results)
+        results.close()
+
+        self.assertLess(len(calls), 100)
+
+    def test_no_retries_with_client_retry_policy(self):
+        """Requests retried by the client's interceptor aren't retried again."""
+        batcher, _ = self._create_batcher(None)
+        self.assertEqual(
+            batcher.max_retries, mutate_batcher._DEFAULT_MAX_RETRIES
+        )
+
+        client = mock.Mock(retry_policy=RetryPolicy())
+        client.get_service.return_value = _CampaignService(None)
+        batcher = mutate_batcher.MutateBatcher(client, "CampaignService")
+        self.assertEqual(batcher.max_retries, 0)
+
+    def test_invalid_arguments(self):
+        for kwargs in (
+            {"max_operations": 0},
+            {"max_request_bytes": 0},
+            {"max_workers": 0},
+            {"max_retries": -1},
+        ):
+            with self.subTest(kwargs=kwargs):
+                self.assertRaises(
+                    ValueError, self._create_batcher, None, **kwargs
+                )
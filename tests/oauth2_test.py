@@ -13,9 +13,17 @@
 # limitations under the License.
 """Tests for the OAuth2 helper module."""
 
+import asyncio
+import datetime
+import os
+import pickle
+import tempfile
+import threading
 from unittest import mock
 from unittest import TestCase
 
+from google.oauth2.credentials import Credentials
+
 from google.ads.googleads import oauth2
 
 
@@ -197,4 +205,395 @@ class OAuth2Tests(TestCase):
             oauth2, "get_application_default_credentials", return_value=None
         ) as mock_initializer:
             oauth2.get_credentials(mock_config)
-            mock_initializer.assert_called_once()
\ No newline at end of file
+            mock_initializer.assert_called_once()
+
+    def test_get_credentials_with_token_cache(self):
+        mock_config = {
+            "client_id": self.client_id,
+            "client_secret": self.client_secret,
+            "refresh_token": self.refresh_token,
+            "token_refresh": {"cache_path": "/path/to/cache"},
+        }
+
+        with mock.patch.object(
+            oauth2, "get_installed_app_credentials", return_value=None
+        ) as mock_initializer:
+            oauth2.get_credentials(mock_config)
+            mock_initializer.assert_called_once_with(
+                self.client_id,
+                self.client_secret,
+                self.refresh_token,
+                http_proxy=None,
+                token_cache_path="/path/to/cache",
+            )
+
+    def test_get_credentials_without_refresh(self):
+        mock_config = {
+            "client_id": self.client_id,
+            "client_secret": self.client_secret,
+            "refresh_token": self.refresh_token,
+        }
+
+        with mock.patch.object(
+            oauth2.InstalledAppCredentials, "refresh"
+        ) as mock_refresh:
+            credentials = oauth2.get_credentials(mock_config, refresh=False)
+
+        self.assertEqual(credentials.refresh_token, self.refresh_token)
+        mock_refresh.assert_not_called()
+
+    def test_get_credentials_async(self):
+        mock_config = {
+            "client_id": self.client_id,
+            "client_secret": self.client_secret,
+            "refresh_token": self.refresh_token,
+            "http_proxy": "https://localhost:8000",
+        }
+
+        with mock.patch.object(
+            oauth2, "get_installed_app_credentials", return_value=None
+        ) as mock_initializer, mock.patch.object(
+            oauth2, "refresh_async"
+        ) as mock_refresh_async:
+            credentials = asyncio.run(
+                oauth2.get_credentials_async(mock_config)
+            )
+
+        self.assertIsNone(credentials)
+        mock_initializer.assert_called_once_with(
+            self.client_id,
+            self.client_secret,
+            self.refresh_token,
+            http_proxy="https://localhost:8000",
+            refresh=False,
+        )
+        mock_refresh_async.assert_called_once_with(
+            None, http_proxy="https://localhost:8000", token_cache_path=None
+        )
+
+
+def _create_credentials(refresh_token="refresh", lifetime=3600):
+    """Returns credentials whose refresh sets a numbered token."""
+    credentials = Credentials(
+        None,
+        client_id="client_id",
+        client_secret="client_secret",
+        refresh_token=refresh_token,
+        token_uri=oauth2._DEFAULT_TOKEN_URI,
+    )
+    refreshes = []
+
+    def refresh(request):
+        refreshes.append(request)
+        credentials.token = f"token-{len(refreshes)}"
+        credentials.expiry = datetime.datetime.utcnow().replace(
+            microsecond=0
+        ) + datetime.timedelta(seconds=lifetime)
+
+    credentials.refresh = refresh
+    return credentials, refreshes
+
+
+class TokenCacheTest(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "tokens.json")
+        self.request = mock.Mock()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_refresh_shares_token(self):
+        cache = oauth2.TokenCache(self.path)
+        credentials, refreshes = _create_credentials()
+        other_credentials, other_refreshes = _create_credentials()
+
+        cache.refresh(credentials, self.request)
+        oauth2.TokenCache(self.path).refresh(other_credentials, self.request)
+
+        self.assertEqual(len(refreshes), 1)
+        self.assertEqual(other_refreshes, [])
+        self.assertEqual(other_credentials.token, "token-1")
+        self.assertEqual(other_credentials.expiry, credentials.expiry)
+        self.assertEqual(os.stat(self.path).st_mode & 0o777, 0o600)
+
+        with open(self.path) as file:
+            contents = file.read()
+        self.assertNotIn("refresh", contents.replace("token-1", ""))
+
+    def test_refresh_expiring_token(self):
+        """A cached token that expires within the margin isn't used."""
+        cache = oauth2.TokenCache(self.path)
+        credentials, _ = _create_credentials(lifetime=60)
+        other_credentials, other_refreshes = _create_credentials()
+
+        cache.refresh(credentials, self.request)
+        cache.refresh(other_credentials, self.request, refresh_margin=120)
+
+        self.assertEqual(len(other_refreshes), 1)
+
+    def test_refresh_different_credentials(self):
+        cache = oauth2.TokenCache(self.path)
+        credentials, _ = _create_credentials()
+        other_credentials, other_refreshes = _create_credentials("other")
+
+        cache.refresh(credentials, self.request)
+        cache.refresh(other_credentials, self.request)
+
+        self.assertEqual(len(other_refreshes), 1)
+
+    def test_refresh_corrupt_file(self):
+        with open(self.path, "w") as file:
+            file.write("{")
+
+        credentials, refreshes = _create_credentials()
+        oauth2.TokenCache(self.path).refresh(credentials, self.request)
+
+        self.assertEqual(len(refreshes), 1)
+
+    def test_refresh_unsupported_credentials(self):
+        credentials = mock.Mock()
+        oauth2.TokenCache(self.path).refresh(credentials, self.request)
+
+        credentials.refresh.assert_called_once_with(self.request)
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_get_cache_key(self):
+        credentials, _ = _create_credentials()
+        other_credentials, _ = _create_credentials("other")
+        key = oauth2.get_cache_key(credentials)
+
+        self.assertEqual(key, oauth2.get_cache_key(_create_credentials()[0]))
+        self.assertNotEqual(key, oauth2.get_cache_key(other_credentials))
+        self.assertNotIn("refresh", key)
+        self.assertIsNone(oauth2.get_cache_key(mock.Mock()))
+
+    def test_get_installed_app_credentials_with_token_cache(self):
+        credentials, _ = _create_credentials()
+        oauth2.TokenCache(self.path).refresh(credentials, self.request)
+
+        with mock.patch.object(Credentials, "refresh") as mock_refresh:
+            result = oauth2.get_installed_app_credentials(
+                "client_id",
+                "client_secret",
+                "refresh",
+                token_cache_path=self.path,
+            )
+
+        mock_refresh.assert_not_called()
+        self.assertEqual(result.token, "token-1")
+
+
+class RefreshAsyncTest(TestCase):
+    def test_refresh_async(self):
+        credentials, refreshes = _create_credentials()
+
+        with mock.patch.object(oauth2, "Request") as mock_request_class:
+            asyncio.run(oauth2.refresh_async(credentials))
+
+        self.assertEqual(refreshes, [mock_request_class.return_value])
+        self.assertEqual(credentials.token, "token-1")
+
+    def test_refresh_async_shares_refresh(self):
+        """Concurrent refreshes of the same credentials send one request."""
+        credentials, refreshes = _create_credentials()
+        other_credentials, other_refreshes = _create_credentials()
+        started = threading.Event()
+        release = threading.Event()
+        refresh = credentials.refresh
+
+        def blocking_refresh(request):
+            started.set()
+            release.wait(5)
+            refresh(request)
+
+        credentials.refresh = blocking_refresh
+
+        async def run():
+            first = asyncio.ensure_future(oauth2.refresh_async(credentials))
+            # Waits for the first refresh to start in the executor.
+            await asyncio.get_running_loop().run_in_executor(
+                None, started.wait, 5
+            )
+            second = asyncio.ensure_future(
+                oauth2.refresh_async(other_credentials)
+            )
+            await asyncio.sleep(0)
+            release.set()
+            await asyncio.gather(first, second)
+
+        asyncio.run(run())
+        self.assertEqual(len(refreshes), 1)
+        self.assertEqual(other_refreshes, [])
+        self.assertEqual(other_credentials.token, "token-1")
+        self.assertEqual(other_credentials.expiry, credentials.expiry)
+        self.assertEqual(oauth2._PENDING_REFRESHES, {})
+
+    def test_refresh_async_different_credentials(self):
+        credentials, refreshes = _create_credentials()
+        other_credentials, other_refreshes = _create_credentials("other")
+
+        async def run():
+            await asyncio.gather(
+                oauth2.refresh_async(credentials),
+                oauth2.refresh_async(other_credentials),
+            )
+
+        asyncio.run(run())
+        self.assertEqual(len(refreshes), 1)
+        self.assertEqual(len(other_refreshes), 1)
+
+
+class CredentialManagerTest(TestCase):
+    def test_get_refresh_delay(self):
+        credentials, _ = _create_credentials(lifetime=1000)
+        credentials.refresh(None)
+        manager = oauth2.CredentialManager(credentials, refresh_margin=300)
+
+        self.assertAlmostEqual(manager.get_refresh_delay(), 700, delta=2)
+
+        credentials.expiry = datetime.datetime.utcnow()
+        self.assertEqual(
+            manager.get_refresh_delay(), oauth2._MIN_REFRESH_DELAY
+        )
+
+    def test_get_refresh_delay_without_token(self):
+        credentials, _ = _create_credentials()
+        manager = oauth2.CredentialManager(credentials)
+        self.assertEqual(manager.get_refresh_delay(), 0)
+
+    def test_refresh(self):
+        credentials, refreshes = _create_credentials()
+        manager = oauth2.CredentialManager(credentials)
+
+        with mock.patch.object(oauth2, "Request") as mock_request_class:
+            manager.refresh()
+
+        self.assertEqual(refreshes, [mock_request_class.return_value])
+        self.assertEqual(credentials.token, "token-1")
+
+    def test_refresh_with_cache(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "tokens.json")
+            credentials, refreshes = _create_credentials()
+            other_credentials, other_refreshes = _create_credentials()
+
+            oauth2.CredentialManager(credentials, cache_path=path).refresh()
+            oauth2.CredentialManager(
+                other_credentials, cache_path=path
+            ).refresh()
+
+        self.assertEqual(len(refreshes), 1)
+        self.assertEqual(other_refreshes, [])
+        self.assertEqual(other_credentials.token, "token-1")
+
+    def test_start(self):
+        credentials, refreshes = _create_credentials()
+        manager = oauth2.CredentialManager(credentials)
+        refreshed = threading.Event()
+
+        with mock.patch.object(
+            manager, "refresh", side_effect=refreshed.set
+        ), mock.patch.object(manager, "get_refresh_delay", return_value=0):
+            manager.start()
+            self.assertTrue(manager.running)
+            self.assertRaises(RuntimeError, manager.start)
+            self.assertTrue(refreshed.wait(5))
+            manager.stop()
+
+        self.assertFalse(manager.running)
+
+    def test_start_retries_failures(self):
+        credentials, _ = _create_credentials()
+        manager = oauth2.CredentialManager(credentials)
+        attempts = []
+        refreshed = threading.Event()
+
+        def refresh():
+            attempts.append(None)
+            if len(attempts) < 2:
+                raise RuntimeError("failed")
+            refreshed.set()
+
+        with mock.patch.object(
+            manager, "refresh", side_effect=refresh
+        ), mock.patch.object(
+            manager, "get_refresh_delay", return_value=0
+        ), mock.patch.object(
+            oauth2, "get_backoff", return_value=0
+        ) as mock_get_backoff:
+            manager.start()
+            self.assertTrue(refreshed.wait(5))
+            manager.stop()
+
+        self.assertGreaterEqual(len(attempts), 2)
+        mock_get_backoff.assert_any_call(
+            1, oauth2._INITIAL_RETRY_DELAY, oauth2._MAX_RETRY_DELAY
+        )
+
+    def test_start_async(self):
+        credentials, _ = _create_credentials()
+        manager = oauth2.CredentialManager(credentials)
+
+        async def run():
+            refreshed = asyncio.Event()
+            loop = asyncio.get_running_loop()
+
+            with mock.patch.object(
+                manager,
+                "refresh",
+                side_effect=lambda: loop.call_soon_threadsafe(refreshed.set),
+            ), mock.patch.object(
+                manager, "get_refresh_delay", return_value=0
+            ):
+                task = manager.start_async()
+                self.assertTrue(manager.running)
+                await asyncio.wait_for(refreshed.wait(), 5)
+                manager.stop()
+
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(run())
+        self.assertFalse(manager.running)
+
+    def test_from_dict(self):
+        credentials, _ = _create_credentials()
+        manager = oauth2.CredentialManager.from_dict(
+            credentials,
+            {"refresh_margin": "600", "cache_path": "/path/to/cache"},
+            http_proxy="https://localhost:8000",
+        )
+
+        self.assertEqual(manager.refresh_margin, 600)
+        self.assertEqual(manager.token_cache.path, "/path/to/cache")
+        self.assertEqual(manager.http_proxy, "https://localhost:8000")
+
+    def test_from_dict_invalid(self):
+        credentials, _ = _create_credentials()
+
+        for config in (
+            {"unknown": 1},
+            {"refresh_margin": "soon"},
+            {"refresh_margin": -1},
+        ):
+            with self.subTest(config=config):
+                self.assertRaises(
+                    ValueError,
+                    oauth2.CredentialManager.from_dict,
+                    credentials,
+                    config,
+                )
+
+    def test_pickle(self):
+        credentials = Credentials("token")
+        manager = oauth2.CredentialManager(credentials)
+
+        # The token doesn't expire, so it isn't refreshed.
+        manager.start()
+        unpickled = pickle.loads(pickle.dumps(manager))
+        manager.stop()
+
+        self.assertTrue(unpickled.running)
+        unpickled.stop()
+        self.assertEqual(unpickled.credentials.token, "token")
@@ -0,0 +1,305 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the resumable and prefetching search pagers."""
+
+import asyncio
+import os
+import tempfile
+import threading
+from unittest import mock, TestCase
+
+import grpc
+
+from google.ads.googleads import pagers
+
+
+class _RpcError(grpc.RpcError):
+    def __init__(self, code):
+        self._code = code
+
+    def code(self):
+        return self._code
+
+
+class _Page:
+    def __init__(self, results, next_page_token=""):
+        self.results = results
+        self.next_page_token = next_page_token
+
+
+class _Pager:
+    def __init__(self, page):
+        self.pages = iter([page])
+
+
+# Three pages of results keyed by the page token that requests them.
+_PAGES = {
+    "": _Page(["a", "b"], "token-1"),
+    "token-1": _Page(["c", "d"], "token-2"),
+    "token-2": _Page(["e"]),
+}
+
+
+def _create_service(errors=None):
+    """Returns a mock GoogleAdsService that serves _PAGES.
+
+    Args:
+        errors: an optional dict of page tokens to lists of exceptions that
+            are raised, in order, before the page is returned.
+    """
+    errors = errors or {}
+    service = mock.Mock()
+
+    def search(request):
+        page_errors = errors.get(request["page_token"])
+        if page_errors:
+            raise page_errors.pop(0)
+        return _Pager(_PAGES[request["page_token"]])
+
+    service.search.side_effect = search
+    return service
+
+
+class CheckpointTest(TestCase):
+    def test_save_and_load(self):
+        checkpoint = pagers.Checkpoint("123", "query", "token", 5, 105)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "checkpoint.json")
+            checkpoint.save(path)
+
+            self.assertEqual(pagers.Checkpoint.load(path), checkpoint)
+            self.assertFalse(os.path.exists(f"{path}.tmp"))
+
+    def test_load_missing_file(self):
+        self.assertIsNone(pagers.Checkpoint.load("/nonexistent/checkpoint"))
+
+
+class CheckpointedSearchPagerTest(TestCase):
+    def test_iter(self):
+        service = _create_service()
+        pager = pagers.CheckpointedSearchPager(service, "123", "query")
+
+        self.assertEqual(list(pager), ["a", "b", "c", "d", "e"])
+        self.assertTrue(pager.checkpoint.completed)
+        self.assertEqual(pager.checkpoint.rows_consumed, 5)
+        self.assertEqual(service.search.call_count, 3)
+
+    def test_pages(self):
+        pager = pagers.CheckpointedSearchPager(
+            _create_service(), "123", "query"
+        )
+
+        self.assertEqual(
+            [page.results for page in pager.pages],
+            [["a", "b"], ["c", "d"], ["e"]],
+        )
+        self.assertEqual(pager.checkpoint.rows_consumed, 5)
+
+    def test_resume_from_saved_checkpoint(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "checkpoint.json")
+            pager = pagers.CheckpointedSearchPager(
+                _create_service(), "123", "query", checkpoint_path=path
+            )
+            rows = iter(pager)
+            # Reads "a", "b" and "c"; only "a" and "b" are consumed since
+            # "c" may not have been processed yet.
+            self.assertEqual([next(rows) for _ in range(3)], ["a", "b", "c"])
+            rows.close()
+
+            checkpoint = pagers.Checkpoint.load(path)
+            self.assertEqual(checkpoint.page_token, "token-1")
+            self.assertEqual(checkpoint.page_row_offset, 0)
+            self.assertEqual(checkpoint.rows_consumed, 2)
+
+            service = _create_service()
+            resumed = pagers.CheckpointedSearchPager(
+                service, checkpoint_path=path
+            )
+
+            self.assertEqual(list(resumed), ["c", "d", "e"])
+            self.assertEqual(resumed.checkpoint.rows_consumed, 5)
+            self.assertTrue(pagers.Checkpoint.load(path).completed)
+            # The first page isn't requested again.
+            self.assertEqual(service.search.call_count, 2)
+
+    def test_resume_within_page(self):
+        checkpoint = pagers.Checkpoint("123", "query", "token-1", 1, 3)
+        pager = pagers.CheckpointedSearchPager(
+            _create_service(), checkpoint=checkpoint
+        )
+
+        self.assertEqual(list(pager), ["d", "e"])
+        self.assertEqual(checkpoint.rows_consumed, 5)
+
+    @mock.patch("time.sleep")
+    def test_retries_transient_page_failure(self, mock_sleep):
+        errors = {"token-1": [_RpcError(grpc.StatusCode.UNAVAILABLE)]}
+        service = _create_service(errors)
+        pager = pagers.CheckpointedSearchPager(
+            service, "123", "query", initial_backoff=0
+        )
+
+        self.assertEqual(list(pager), ["a", "b", "c", "d", "e"])
+        self.assertEqual(service.search.call_count, 4)
+        mock_sleep.assert_called_once()
+
+    @mock.patch("time.sleep")
+    def test_does_not_retry_other_failures(self, mock_sleep):
+        error = _RpcError(grpc.StatusCode.INVALID_ARGUMENT)
+        pager = pagers.CheckpointedSearchPager(
+            _create_service({"token-1": [error]}), "123", "query"
+        )
+        rows = []
+
+        with self.assertRaises(_RpcError):
+            for row in pager:
+                rows.append(row)
+
+        self.assertEqual(rows, ["a", "b"])
+        self.assertEqual(pager.checkpoint.page_token, "token-1")
+        self.assertEqual(pager.checkpoint.rows_consumed, 2)
+        mock_sleep.assert_not_called()
+
+    @mock.patch("time.sleep")
+    def test_gives_up_after_max_retries(self, mock_sleep):
+        errors = {
+            "": [_RpcError(grpc.StatusCode.UNAVAILABLE) for _ in range(3)]
+        }
+        pager = pagers.CheckpointedSearchPager(
+            _create_service(errors), "123", "query", max_retries=2
+        )
+
+        with self.assertRaises(_RpcError):
+            list(pager)
+
+        self.assertEqual(mock_sleep.call_count, 2)
+
+    def test_requires_customer_id_and_query(self):
+        with self.assertRaises(ValueError):
+            pagers.CheckpointedSearchPager(_create_service(), "123")
+
+    def test_rejects_mismatched_checkpoint(self):
+        checkpoint = pagers.Checkpoint("123", "query")
+
+        with self.assertRaises(ValueError):
+            pagers.CheckpointedSearchPager(
+                _create_service(), "456", "query", checkpoint=checkpoint
+            )
+
+
+class _FakeSyncPager:
+    """Records which pages were requested, like a generated SearchPager."""
+
+    def __init__(self, page_count, error_at=None):
+        self.requested = []
+        self._page_count = page_count
+        self._error_at = error_at
+
+    @property
+    def pages(self):
+        for index in range(self._page_count):
+            if index == self._error_at:
+                raise _RpcError(grpc.StatusCode.INTERNAL)
+            self.requested.append(index)
+            yield _Page([f"{index}-a", f"{index}-b"])
+
+
+class _FakeAsyncPager(_FakeSyncPager):
+    @property
+    async def pages(self):
+        for page in super().pages:
+            await asyncio.sleep(0)
+            yield page
+
+
+class PrefetchingSearchPagerTest(TestCase):
+    def test_iter(self):
+        pager = pagers.PrefetchingSearchPager(_FakeSyncPager(3), depth=2)
+
+        self.assertEqual(
+            list(pager), ["0-a", "0-b", "1-a", "1-b", "2-a", "2-b"]
+        )
+
+    def test_prefetches_while_processing(self):
+        fake_pager = _FakeSyncPager(5)
+        pages = pagers.PrefetchingSearchPager(fake_pager, depth=2).pages
+
+        next(pages)
+        # Waits for the background thread to fill the two prefetch slots.
+        for _ in range(100):
+            if len(fake_pager.requested) == 3:
+                break
+            threading.Event().wait(0.01)
+
+        self.assertEqual(fake_pager.requested, [0, 1, 2])
+        # The thread doesn't get further ahead than the depth.
+        threading.Event().wait(0.05)
+        self.assertEqual(fake_pager.requested, [0, 1, 2])
+        pages.close()
+
+    def test_raises_page_error(self):
+        pager = pagers.PrefetchingSearchPager(_FakeSyncPager(3, error_at=1))
+        rows = []
+
+        with self.assertRaises(_RpcError):
+            for row in pager:
+                rows.append(row)
+
+        self.assertEqual(rows, ["0-a", "0-b"])
+
+    def test_invalid_depth(self):
+        with self.assertRaises(ValueError):
+            pagers.PrefetchingSearchPager(_FakeSyncPager(1), depth=0)
+
+
+class PrefetchingSearchAsyncPagerTest(TestCase):
+    def test_aiter(self):
+        async def collect():
+            pager = pagers.PrefetchingSearchAsyncPager(
+                _FakeAsyncPager(3), depth=2
+            )
+            return [row async for row in pager]
+
+        self.assertEqual(
+            asyncio.run(collect()),
+            ["0-a", "0-b", "1-a", "1-b", "2-a", "2-b"],
+        )
+
+    def test_prefetches_while_processing(self):
+        fake_pager = _FakeAsyncPager(5)
+
+        async def consume_first_page():
+            pages = pagers.PrefetchingSearchAsyncPager(
+                fake_pager, depth=1
+            ).pages
+            await pages.__anext__()
+            for _ in range(10):
+                await asyncio.sleep(0)
+            await pages.aclose()
+
+        asyncio.run(consume_first_page())
+
+        self.assertEqual(fake_pager.requested, [0, 1])
+
+    def test_raises_page_error(self):
+        async def collect():
+            pager = pagers.PrefetchingSearchAsyncPager(
+                _FakeAsyncPager(3, error_at=1)
+            )
+            return [row async for row in pager]
+
+        with self.assertRaises(_RpcError):
+            asyncio.run(collect())
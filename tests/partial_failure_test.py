@@ -0,0 +1,203 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the partial failure decoder."""
+
+import importlib
+import unittest
+
+from google.protobuf import any_pb2
+
+from google.ads.googleads import client as Client
+from google.ads.googleads import partial_failure
+
+latest_version = Client._DEFAULT_VERSION
+
+_errors = importlib.import_module(
+    f"google.ads.googleads.{latest_version}.errors.types.errors"
+)
+_ad_group_service = importlib.import_module(
+    f"google.ads.googleads.{latest_version}.services.types.ad_group_service"
+)
+_google_ads_service = importlib.import_module(
+    f"google.ads.googleads.{latest_version}.services.types.google_ads_service"
+)
+
+
+def _get_error(error_code, operation_index=None):
+    """Returns a GoogleAdsError dict located at an operation index."""
+    error = {"error_code": error_code, "message": "Error."}
+
+    if operation_index is not None:
+        error["location"] = {
+            "field_path_elements": [
+                {"field_name": "operations", "index": operation_index},
+                {"field_name": "create"},
+            ]
+        }
+
+    return error
+
+
+def _set_partial_failure(response, errors):
+    """Sets a partial failure of the given errors on a response."""
+    failure = _errors.GoogleAdsFailure(errors=errors)
+    detail = any_pb2.Any(
+        type_url=(
+            "type.googleapis.com/google.ads.googleads."
+            f"{latest_version}.errors.GoogleAdsFailure"
+        ),
+        value=_errors.GoogleAdsFailure.serialize(failure),
+    )
+    response_pb = type(response).pb(response)
+    response_pb.partial_failure_error.code = 3
+    response_pb.partial_failure_error.details.append(detail)
+
+
+class DecodePartialFailureTest(unittest.TestCase):
+
+    def setUp(self):
+        self.response = _ad_group_service.MutateAdGroupsResponse(
+            results=[
+                {"resource_name": "customers/1/adGroups/2"},
+                {},
+                {},
+                {"resource_name": "customers/1/adGroups/3"},
+            ]
+        )
+        _set_partial_failure(
+            self.response,
+            [
+                _get_error({"range_error": "TOO_LOW"}, 2),
+                _get_error({"field_error": "REQUIRED"}, 1),
+                _get_error({"range_error": "TOO_HIGH"}, 1),
+                _get_error({"range_error": "TOO_LOW"}, 1),
+                _get_error({"request_error": "UNKNOWN"}),
+            ],
+        )
+
+    def test_decode_partial_failure(self):
+        result = partial_failure.decode_partial_failure(self.response)
+
+        self.assertEqual(result.operation_count, 4)
+        self.assertEqual(result.error_count, 5)
+        self.assertEqual(
+            result.error_codes,
+            [
+                ("range_error", "TOO_LOW"),
+                ("field_error", "REQUIRED"),
+                ("range_error", "TOO_HIGH"),
+                ("request_error", "UNKNOWN"),
+            ],
+        )
+        self.assertEqual(list(result.error_code_table), [-1, 1, 0, -1])
+        self.assertEqual(
+            list(result.error_operation_indexes),
+            [2, 1, 1, 1, partial_failure.NO_OPERATION],
+        )
+        self.assertEqual(list(result.error_code_ids), [0, 1, 2, 0, 3])
+        self.assertEqual(result.failed_operation_indexes, [1, 2])
+        self.assertEqual(
+            result.succeeded_resource_names,
+            ["customers/1/adGroups/2", "customers/1/adGroups/3"],
+        )
+
+    def test_get_error_code(self):
+        result = partial_failure.decode_partial_failure(self.response)
+
+        self.assertIsNone(result.get_error_code(0))
+        self.assertEqual(result.get_error_code(1), ("field_error", "REQUIRED"))
+        self.assertEqual(result.get_error_code(2), ("range_error", "TOO_LOW"))
+        self.assertFalse(result.is_failed(3))
+        self.assertTrue(result.is_failed(2))
+
+    def test_get_error_codes(self):
+        result = partial_failure.decode_partial_failure(self.response)
+
+        self.assertEqual(
+            result.get_error_codes(1),
+            [
+                ("field_error", "REQUIRED"),
+                ("range_error", "TOO_HIGH"),
+                ("range_error", "TOO_LOW"),
+            ],
+        )
+        self.assertEqual(result.get_error_codes(0), [])
+        self.assertEqual(
+            result.get_error_codes(partial_failure.NO_OPERATION),
+            [("request_error", "UNKNOWN")],
+        )
+
+    def test_decode_partial_failure_protobuf(self):
+        response_pb = type(self.response).pb(self.response)
+        result = partial_failure.decode_partial_failure(response_pb)
+
+        self.assertEqual(result.failed_operation_indexes, [1, 2])
+
+    def test_decode_partial_failure_without_failures(self):
+        response = _ad_group_service.MutateAdGroupsResponse(
+            results=[{"resource_name": "customers/1/adGroups/2"}]
+        )
+        result = partial_failure.decode_partial_failure(response)
+
+        self.assertEqual(result.operation_count, 1)
+        self.assertEqual(result.error_count, 0)
+        self.assertEqual(result.failed_operation_indexes, [])
+        self.assertEqual(
+            result.succeeded_resource_names, ["customers/1/adGroups/2"]
+        )
+
+    def test_decode_partial_failure_without_results(self):
+        """Operations are counted from the errors when results are empty."""
+        response = _ad_group_service.MutateAdGroupsResponse()
+        _set_partial_failure(
+            response, [_get_error({"range_error": "TOO_LOW"}, 3)]
+        )
+        result = partial_failure.decode_partial_failure(response)
+
+        self.assertEqual(result.operation_count, 4)
+        self.assertEqual(result.failed_operation_indexes, [3])
+        self.assertEqual(result.succeeded_resource_names, [])
+
+    def test_decode_partial_failure_mutate_operation_responses(self):
+        response = _google_ads_service.MutateGoogleAdsResponse(
+            mutate_operation_responses=[
+                {"ad_group_result": {"resource_name": "customers/1/adGroups/2"}},
+                {},
+                {"campaign_result": {"resource_name": "customers/1/campaigns/3"}},
+            ]
+        )
+        _set_partial_failure(
+            response, [_get_error({"field_error": "REQUIRED"}, 1)]
+        )
+        result = partial_failure.decode_partial_failure(response)
+
+        self.assertEqual(
+            result.resource_names,
+            ["customers/1/adGroups/2", "", "customers/1/campaigns/3"],
+        )
+        self.assertEqual(
+            result.succeeded_resource_names,
+            ["customers/1/adGroups/2", "customers/1/campaigns/3"],
+        )
+        self.assertEqual(result.failed_operation_indexes, [1])
+
+    def test_decode_partial_failure_ignores_other_details(self):
+        response = _ad_group_service.MutateAdGroupsResponse(results=[{}])
+        response_pb = type(response).pb(response)
+        response_pb.partial_failure_error.details.append(
+            any_pb2.Any(type_url="type.googleapis.com/google.rpc.DebugInfo")
+        )
+        result = partial_failure.decode_partial_failure(response)
+
+        self.assertEqual(result.error_count, 0)
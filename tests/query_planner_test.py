@@ -0,0 +1,208 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for splitting report queries into shards."""
+
+import datetime
+import threading
+from unittest import mock, TestCase
+
+import grpc
+
+from google.ads.googleads import query_planner
+
+_QUERY = (
+    "SELECT campaign.id, segments.date FROM campaign "
+    "WHERE segments.date BETWEEN '2026-01-01' AND '2026-01-10' "
+    "ORDER BY segments.date"
+)
+
+
+class _Batch:
+    def __init__(self, rows):
+        self.results = rows
+
+
+class _RpcError(grpc.RpcError):
+    def code(self):
+        return grpc.StatusCode.INVALID_ARGUMENT
+
+
+class QueryPlannerTest(TestCase):
+    def _create_planner(self, search_stream=None, **kwargs):
+        client = mock.Mock()
+        client.get_service.return_value.search_stream.side_effect = (
+            search_stream
+        )
+        kwargs.setdefault("initial_backoff", 0)
+        return query_planner.QueryPlanner(client, **kwargs)
+
+    def test_split_date_range(self):
+        self.assertEqual(
+            query_planner.split_date_range(
+                datetime.date(2026, 1, 30), datetime.date(2026, 2, 3), 2
+            ),
+            [
+                (datetime.date(2026, 1, 30), datetime.date(2026, 1, 31)),
+                (datetime.date(2026, 2, 1), datetime.date(2026, 2, 2)),
+                (datetime.date(2026, 2, 3), datetime.date(2026, 2, 3)),
+            ],
+        )
+
+    def test_split_date_range_invalid(self):
+        date = datetime.date(2026, 1, 1)
+        self.assertRaises(
+            ValueError,
+            query_planner.split_date_range,
+            date,
+            date - datetime.timedelta(days=1),
+            1,
+        )
+        self.assertRaises(
+            ValueError, query_planner.split_date_range, date, date, 0
+        )
+
+    def test_split_by_date_replaces_range(self):
+        planner = self._create_planner()
+        self.assertEqual(
+            planner.split_by_date(_QUERY, days_per_shard=5),
+            [
+                "SELECT campaign.id, segments.date FROM campaign "
+                "WHERE segments.date BETWEEN '2026-01-01' AND '2026-01-05' "
+                "ORDER BY segments.date",
+                "SELECT campaign.id, segments.date FROM campaign "
+                "WHERE segments.date BETWEEN '2026-01-06' AND '2026-01-10' "
+                "ORDER BY segments.date",
+            ],
+        )
+
+    def test_split_by_date_adds_range(self):
+        planner = self._create_planner()
+        self.assertEqual(
+            planner.split_by_date(
+                "SELECT campaign.id FROM campaign",
+                datetime.date(2026, 1, 1),
+                "2026-01-02",
+                days_per_shard=1,
+            ),
+            [
+                "SELECT campaign.id FROM campaign WHERE "
+                "segments.date BETWEEN '2026-01-01' AND '2026-01-01'",
+                "SELECT campaign.id FROM campaign WHERE "
+                "segments.date BETWEEN '2026-01-02' AND '2026-01-02'",
+            ],
+        )
+
+    def test_split_by_date_ignores_comments_and_literals(self):
+        planner = self._create_planner()
+        query = (
+            "SELECT campaign.id FROM campaign "
+            "-- segments.date BETWEEN '2025-01-01' AND '2025-12-31'\n"
+            "WHERE campaign.name = 'segments.date BETWEEN \"2025-01-01\" "
+            "AND \"2025-12-31\"' "
+            "AND segments.date BETWEEN '2026-01-01' AND '2026-01-02'"
+        )
+        self.assertEqual(
+            planner.split_by_date(query, days_per_shard=1),
+            [
+                query.replace("'2026-01-02'", "'2026-01-01'"),
+                query.replace("'2026-01-01'", "'2026-01-02'"),
+            ],
+        )
+
+    def test_split_by_date_without_range(self):
+        planner = self._create_planner()
+        self.assertRaises(
+            ValueError,
+            planner.split_by_date,
+            "SELECT campaign.id FROM campaign",
+        )
+
+    def test_split_with_limit(self):
+        planner = self._create_planner()
+        self.assertRaises(
+            ValueError, planner.split_by_date, f"{_QUERY} LIMIT 10"
+        )
+        self.assertRaises(
+            ValueError,
+            planner.split_by_campaign_ids,
+            "SELECT campaign.id FROM campaign LIMIT 10",
+            [1],
+        )
+
+    def test_split_by_campaign_ids(self):
+        planner = self._create_planner()
+        self.assertEqual(
+            planner.split_by_campaign_ids(
+                "SELECT campaign.id FROM campaign", [1, 2, 3], 2
+            ),
+            [
+                "SELECT campaign.id FROM campaign WHERE campaign.id IN (1, 2)",
+                "SELECT campaign.id FROM campaign WHERE campaign.id IN (3)",
+            ],
+        )
+
+    def test_get_campaign_ids(self):
+        def search_stream(customer_id, query):
+            rows = [mock.Mock(), mock.Mock()]
+            rows[0].campaign.id = 5
+            rows[1].campaign.id = 2
+            return [_Batch(rows)]
+
+        planner = self._create_planner(search_stream)
+        self.assertEqual(planner.get_campaign_ids("123"), [2, 5])
+
+    def test_run_yields_in_shard_order(self):
+        release_first = threading.Event()
+
+        def search_stream(customer_id, query):
+            if query == "q0":
+                # The first shard finishes last.
+                release_first.wait(5)
+            else:
+                release_first.set()
+            return [_Batch([query])]
+
+        planner = self._create_planner(search_stream, max_workers=3)
+        results = list(planner.run("123", ["q0", "q1", "q2"]))
+
+        self.assertEqual([result.index for result in results], [0, 1, 2])
+        self.assertEqual(
+            list(planner.iter_rows("123", ["q0", "q1", "q2"])),
+            ["q0", "q1", "q2"],
+        )
+
+    def test_iter_rows_raises_for_failed_shard(self):
+        def search_stream(customer_id, query):
+            if query == "q1":
+                raise _RpcError()
+            return [_Batch([query])]
+
+        planner = self._create_planner(search_stream, max_workers=1)
+        queries = ["q0", "q1", "q2", "q3", "q4"]
+        rows = []
+
+        with self.assertRaises(query_planner.ShardFailedError) as context:
+            for row in planner.iter_rows("123", queries):
+                rows.append(row)
+
+        self.assertEqual(rows, ["q0"])
+        self.assertEqual(context.exception.result.query, "q1")
+        self.assertEqual(
+            context.exception.pending_queries, ["q1", "q2", "q3", "q4"]
+        )
+        # Shards after the ones that were already started aren't run.
+        self.assertNotIn(
+            mock.call(customer_id="123", query="q4"),
+            planner.runner._service.search_stream.call_args_list,
+        )
@@ -0,0 +1,207 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the adaptive rate limiter."""
+
+import os
+import pickle
+import tempfile
+from unittest import mock, TestCase
+
+import grpc
+
+from google.ads.googleads import rate_limiter
+from google.ads.googleads.errors import GoogleAdsException
+from google.ads.googleads.v25.errors.types import errors
+
+_KEY = rate_limiter.get_bucket_key("abc123", "1", "2")
+
+
+class _RpcError(grpc.RpcError):
+    def __init__(self, code):
+        self._code = code
+
+    def code(self):
+        return self._code
+
+
+class _FakeClockBackend(rate_limiter.InMemoryBackend):
+    def __init__(self):
+        super().__init__()
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+
+class RateLimiterHelpersTest(TestCase):
+    def test_get_bucket_key(self):
+        self.assertNotIn("abc123", _KEY)
+        self.assertTrue(_KEY.endswith(":1:2"))
+        self.assertNotEqual(
+            _KEY, rate_limiter.get_bucket_key("abc123", "1", "3")
+        )
+
+    def test_is_throttled(self):
+        self.assertFalse(rate_limiter.is_throttled(None))
+        self.assertTrue(
+            rate_limiter.is_throttled(
+                _RpcError(grpc.StatusCode.RESOURCE_EXHAUSTED)
+            )
+        )
+        self.assertFalse(
+            rate_limiter.is_throttled(_RpcError(grpc.StatusCode.UNAVAILABLE))
+        )
+
+    def test_is_throttled_quota_error(self):
+        failure = errors.GoogleAdsFailure(
+            errors=[
+                {
+                    "error_code": {
+                        "quota_error": "RESOURCE_TEMPORARILY_EXHAUSTED"
+                    }
+                }
+            ]
+        )
+        exception = GoogleAdsException(
+            _RpcError(grpc.StatusCode.INVALID_ARGUMENT), None, failure, None
+        )
+
+        self.assertTrue(rate_limiter.is_throttled(exception))
+
+
+class AdaptiveRateLimiterTest(TestCase):
+    def setUp(self):
+        self.backend = _FakeClockBackend()
+        self.limiter = rate_limiter.AdaptiveRateLimiter(
+            initial_rate=2, min_rate=1, max_rate=4, burst=2, backend=self.backend
+        )
+
+    def test_acquire(self):
+        self.assertEqual(self.limiter.acquire(_KEY), 0)
+        self.assertEqual(self.limiter.acquire(_KEY), 0)
+        # The burst is used up, so requests are reserved half a second apart.
+        self.assertEqual(self.limiter.acquire(_KEY), 0.5)
+        self.assertEqual(self.limiter.acquire(_KEY), 1.0)
+
+        self.backend.now += 10
+
+        self.assertEqual(self.limiter.acquire(_KEY), 0)
+
+    def test_buckets_are_separate(self):
+        other_key = rate_limiter.get_bucket_key("abc123", "1", "3")
+
+        for _ in range(3):
+            self.limiter.acquire(_KEY)
+
+        self.assertEqual(self.limiter.acquire(other_key), 0)
+
+    def test_record_throttle(self):
+        self.limiter.record_throttle(_KEY)
+
+        self.assertEqual(self.limiter.get_rate(_KEY), 1)
+        # The burst is used up after a request is throttled.
+        self.assertEqual(self.limiter.acquire(_KEY), 1)
+
+    def test_record_throttle_once_per_interval(self):
+        self.limiter.record_throttle(_KEY)
+        self.limiter.record(_KEY, _RpcError(grpc.StatusCode.RESOURCE_EXHAUSTED))
+        self.backend.now += 0.5
+
+        self.assertEqual(self.limiter.get_rate(_KEY), 1)
+
+    def test_record_success(self):
+        self.limiter.record(_KEY, None)
+        self.assertEqual(self.limiter.get_rate(_KEY), 2.5)
+
+        for _ in range(10):
+            self.limiter.record_status(_KEY, grpc.StatusCode.OK)
+
+        self.assertEqual(self.limiter.get_rate(_KEY), 4)
+
+    def test_record_other_failures(self):
+        self.limiter.record(_KEY, _RpcError(grpc.StatusCode.UNAVAILABLE))
+        self.limiter.record_status(_KEY, grpc.StatusCode.INTERNAL)
+
+        self.assertEqual(self.limiter.get_rate(_KEY), 2)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            rate_limiter.AdaptiveRateLimiter(min_rate=0)
+
+        with self.assertRaises(ValueError):
+            rate_limiter.AdaptiveRateLimiter(min_rate=5, max_rate=1)
+
+        with self.assertRaises(ValueError):
+            rate_limiter.AdaptiveRateLimiter(multiplicative_decrease=1)
+
+    def test_from_dict(self):
+        limiter = rate_limiter.AdaptiveRateLimiter.from_dict(
+            {"initial_rate": "3", "lock_file_path": "~/limits.json"}
+        )
+
+        self.assertEqual(limiter.initial_rate, 3)
+        self.assertIsInstance(limiter.backend, rate_limiter.FileLockBackend)
+        self.assertEqual(
+            limiter.backend.path, os.path.expanduser("~/limits.json")
+        )
+
+        with self.assertRaises(ValueError):
+            rate_limiter.AdaptiveRateLimiter.from_dict({"rate": 3})
+
+    def test_pickle(self):
+        limiter = pickle.loads(pickle.dumps(rate_limiter.AdaptiveRateLimiter()))
+        limiter.acquire(_KEY)
+
+
+class FileLockBackendTest(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "limits.json")
+
+    def _create_limiter(self):
+        return rate_limiter.AdaptiveRateLimiter(
+            initial_rate=1,
+            burst=1,
+            backend=rate_limiter.FileLockBackend(self.path),
+        )
+
+    @mock.patch.object(rate_limiter.time, "time", return_value=1000.0)
+    def test_buckets_are_shared(self, _):
+        self.assertEqual(self._create_limiter().acquire(_KEY), 0)
+        # Another limiter with the same file, e.g. in another process, waits
+        # for the request that was reserved by the first one.
+        self.assertEqual(self._create_limiter().acquire(_KEY), 1)
+
+    def test_expired_buckets_are_removed(self):
+        limiter = self._create_limiter()
+        other_key = rate_limiter.get_bucket_key("abc123", "1", "3")
+
+        with mock.patch.object(rate_limiter.time, "time", return_value=0.0):
+            limiter.acquire(other_key)
+
+        with mock.patch.object(rate_limiter.time, "time", return_value=1e4):
+            limiter.acquire(_KEY)
+
+        with open(self.path) as file:
+            contents = file.read()
+
+        self.assertIn(_KEY, contents)
+        self.assertNotIn(other_key, contents)
+
+    def test_corrupt_file(self):
+        with open(self.path, "w") as file:
+            file.write("{")
+
+        self.assertEqual(self._create_limiter().acquire(_KEY), 0)
@@ -0,0 +1,180 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for raw protobuf access to GoogleAdsService search results."""
+
+from concurrent import futures
+from importlib import import_module
+from unittest import mock, TestCase
+
+import grpc
+
+from google.ads.googleads import client as Client
+from google.ads.googleads import raw_search
+
+default_version = Client._DEFAULT_VERSION
+
+google_ads_service = import_module(
+    f"google.ads.googleads.{default_version}."
+    "services.types.google_ads_service"
+)
+transport_module = import_module(
+    f"google.ads.googleads.{default_version}.services.services."
+    "google_ads_service.transports.grpc"
+)
+
+SearchRequest = google_ads_service.SearchGoogleAdsRequest.pb()
+SearchResponse = google_ads_service.SearchGoogleAdsResponse.pb()
+SearchStreamResponse = google_ads_service.SearchGoogleAdsStreamResponse.pb()
+
+_QUERY = "SELECT campaign.name, campaign.status FROM campaign"
+
+
+class _GoogleAdsServiceServicer:
+    """Serves Search and SearchStream requests from an in-process server."""
+
+    def __init__(self):
+        self.requests = []
+        self.metadata = []
+
+    def search(self, request_bytes, context):
+        request = SearchRequest.FromString(request_bytes)
+        self.requests.append(request)
+        self.metadata.append(dict(context.invocation_metadata()))
+        response = SearchResponse()
+        row = response.results.add()
+        row.campaign.name = f"Page {request.page_token or '0'}"
+        row.campaign.status = 2
+
+        if not request.page_token:
+            response.next_page_token = "1"
+
+        return response.SerializeToString()
+
+    def search_stream(self, request_bytes, context):
+        for index in range(2):
+            response = SearchStreamResponse()
+            row = response.results.add()
+            row.campaign.name = f"Batch {index}"
+            row.campaign.status = 3
+            yield response.SerializeToString()
+
+
+class RawGoogleAdsServiceTest(TestCase):
+    def setUp(self):
+        self.servicer = _GoogleAdsServiceServicer()
+        handler = grpc.method_handlers_generic_handler(
+            f"google.ads.googleads.{default_version}.services."
+            "GoogleAdsService",
+            {
+                "Search": grpc.unary_unary_rpc_method_handler(
+                    self.servicer.search
+                ),
+                "SearchStream": grpc.unary_stream_rpc_method_handler(
+                    self.servicer.search_stream
+                ),
+            },
+        )
+        self.server = grpc.server(futures.ThreadPoolExecutor(max_workers=2))
+        self.server.add_generic_rpc_handlers((handler,))
+        port = self.server.add_insecure_port("localhost:0")
+        self.server.start()
+        self.addCleanup(self.server.stop, None)
+
+        client = Client.GoogleAdsClient(
+            None, "developer-token", use_proto_plus=True
+        )
+        self.addCleanup(client.close)
+
+        with mock.patch.object(
+            transport_module.GoogleAdsServiceGrpcTransport,
+            "create_channel",
+            return_value=grpc.insecure_channel(f"localhost:{port}"),
+        ):
+            self.service = client.get_service(
+                "GoogleAdsService", version=default_version
+            )
+
+        self.raw_service = raw_search.RawGoogleAdsService(self.service)
+
+    def test_version(self):
+        self.assertEqual(self.raw_service.version, default_version)
+
+    def test_search_stream(self):
+        results = self.raw_service.search_stream(
+            customer_id="123", query=_QUERY
+        )
+        responses = list(results)
+        self.assertEqual(len(responses), 2)
+        self.assertIsInstance(responses[0], SearchStreamResponse)
+        self.assertEqual(
+            [column.name for column in results.columns],
+            ["campaign.name", "campaign.status"],
+        )
+
+    def test_search_stream_as_bytes(self):
+        results = self.raw_service.search_stream(
+            customer_id="123", query=_QUERY, as_bytes=True
+        )
+        self.assertEqual(
+            list(results.iter_values()),
+            [("Batch 0", "PAUSED"), ("Batch 1", "PAUSED")],
+        )
+
+    def test_search_stream_rows(self):
+        results = self.raw_service.search_stream(
+            {"customer_id": "123", "query": _QUERY}, as_bytes=True
+        )
+        rows = list(results.iter_rows())
+        self.assertEqual([row.campaign.name for row in rows], ["Batch 0", "Batch 1"])
+
+    def test_search_follows_page_tokens(self):
+        results = self.raw_service.search(customer_id="123", query=_QUERY)
+        self.assertEqual(
+            list(results.iter_values()),
+            [("Page 0", "ENABLED"), ("Page 1", "ENABLED")],
+        )
+        self.assertEqual(
+            [request.page_token for request in self.servicer.requests],
+            ["", "1"],
+        )
+
+    def test_search_as_bytes(self):
+        request = google_ads_service.SearchGoogleAdsRequest(
+            customer_id="123", query=_QUERY
+        )
+        results = self.raw_service.search(request, as_bytes=True)
+        pages = list(results)
+        self.assertEqual(len(pages), 2)
+        self.assertIsInstance(pages[0], bytes)
+
+    def test_search_metadata(self):
+        list(self.raw_service.search(customer_id="123", query=_QUERY))
+        metadata = self.servicer.metadata[0]
+        self.assertEqual(metadata["developer-token"], "developer-token")
+        self.assertEqual(metadata["x-goog-request-params"], "customer_id=123")
+        self.assertIn("gccl/", metadata["x-goog-api-client"])
+
+    def test_missing_query(self):
+        self.assertRaises(
+            ValueError, self.raw_service.search_stream, customer_id="123"
+        )
+
+    def test_async_service_client(self):
+        service_client = mock.Mock()
+        service_client.transport._logged_channel = mock.Mock(
+            spec=grpc.aio.Channel
+        )
+        self.assertRaises(
+            TypeError, raw_search.RawGoogleAdsService, service_client
+        )
@@ -0,0 +1,242 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the concurrent report runner."""
+
+import threading
+import time
+from unittest import mock, TestCase
+
+import grpc
+
+from google.ads.googleads import report_runner
+from google.ads.googleads.errors import GoogleAdsException
+from google.ads.googleads.retry import RetryPolicy
+
+
+class _RpcError(grpc.RpcError):
+    def __init__(self, code):
+        self._code = code
+
+    def code(self):
+        return self._code
+
+
+class _Batch:
+    def __init__(self, rows):
+        self.results = rows
+
+
+class ReportRunnerTest(TestCase):
+    def _create_runner(self, search_stream, **kwargs):
+        client = mock.Mock()
+        client.get_service.return_value.search_stream.side_effect = (
+            search_stream
+        )
+        kwargs.setdefault("initial_backoff", 0)
+        return report_runner.ReportRunner(client, **kwargs), client
+
+    def test_run(self):
+        def search_stream(customer_id, query):
+            return [_Batch([f"{customer_id}:{query}"]), _Batch(["last"])]
+
+        runner, client = self._create_runner(search_stream)
+        results = list(runner.run(["1", "2"], ["q1", "q2"]))
+
+        self.assertEqual(len(results), 4)
+        self.assertTrue(all(result.succeeded for result in results))
+        by_index = sorted(results, key=lambda result: result.index)
+        self.assertEqual(
+            [(r.customer_id, r.query) for r in by_index],
+            [("1", "q1"), ("1", "q2"), ("2", "q1"), ("2", "q2")],
+        )
+        self.assertEqual(by_index[1].rows, ["1:q2", "last"])
+        client.get_service.assert_called_once_with("GoogleAdsService")
+
+    def test_run_requests_in_order(self):
+        """Only a bounded number of requests start ahead of a slow one."""
+        release_first = threading.Event()
+        started = []
+        lock = threading.Lock()
+
+        def search_stream(customer_id, query):
+            with lock:
+                started.append(query)
+
+            if query == "q0":
+                release_first.wait(5)
+
+            return [_Batch([query])]
+
+        runner, _ = self._create_runner(search_stream, max_workers=2)
+        requests = [("123", f"q{index}") for index in range(10)]
+        results = []
+        thread = threading.Thread(
+            target=lambda: results.extend(
+                runner.run_requests_in_order(requests)
+            )
+        )
+        thread.start()
+
+        for _ in range(100):
+            if len(started) >= 4:
+                break
+            time.sleep(0.01)
+
+        # The other results wait for the first one, so no more requests are
+        # started than twice the number of workers.
+        time.sleep(0.1)
+        self.assertEqual(len(started), 4)
+        release_first.set()
+        thread.join(5)
+
+        self.assertEqual([result.index for result in results], list(range(10)))
+        self.assertEqual(
+            [result.rows for result in results],
+            [[f"q{index}"] for index in range(10)],
+        )
+
+    def test_run_single_query(self):
+        runner, _ = self._create_runner(lambda customer_id, query: [])
+        results = list(runner.run(["1", "2"], "query"))
+        self.assertEqual(sorted(r.customer_id for r in results), ["1", "2"])
+
+    def test_version(self):
+        client = mock.Mock()
+        report_runner.ReportRunner(client, version="v1")
+        client.get_service.assert_called_once_with(
+            "GoogleAdsService", version="v1"
+        )
+
+    def test_retries_resource_exhausted(self):
+        calls = []
+
+        def search_stream(customer_id, query):
+            calls.append(customer_id)
+            if len(calls) < 3:
+                raise _RpcError(grpc.StatusCode.RESOURCE_EXHAUSTED)
+            return [_Batch(["row"])]
+
+        runner, _ = self._create_runner(search_stream)
+        [result] = list(runner.run(["1"], "query"))
+
+        self.assertTrue(result.succeeded)
+        self.assertEqual(result.attempts, 3)
+        self.assertEqual(result.rows, ["row"])
+
+    def test_gives_up_after_max_retries(self):
+        error = _RpcError(grpc.StatusCode.UNAVAILABLE)
+
+        def search_stream(customer_id, query):
+            raise error
+
+        runner, _ = self._create_runner(search_stream, max_retries=2)
+        [result] = list(runner.run(["1"], "query"))
+
+        self.assertFalse(result.succeeded)
+        self.assertIs(result.exception, error)
+        self.assertEqual(result.attempts, 3)
+
+    def test_does_not_retry_other_errors(self):
+        error = GoogleAdsException(
+            _RpcError(grpc.StatusCode.INVALID_ARGUMENT), None, None, "id"
+        )
+
+        def search_stream(customer_id, query):
+            raise error
+
+        runner, _ = self._create_runner(search_stream)
+        [result] = list(runner.run(["1"], "query"))
+
+        self.assertIs(result.exception, error)
+        self.assertEqual(result.attempts, 1)
+
+    def test_is_retryable(self):
+        runner, _ = self._create_runner(None)
+        self.assertTrue(
+            runner.is_retryable(
+                GoogleAdsException(
+                    _RpcError(grpc.StatusCode.RESOURCE_EXHAUSTED),
+                    None,
+                    None,
+                    "id",
+                )
+            )
+        )
+        self.assertFalse(runner.is_retryable(ValueError()))
+
+    def test_bounded_concurrency(self):
+        lock = threading.Lock()
+        active = [0]
+        peak = [0]
+
+        def search_stream(customer_id, query):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            threading.Event().wait(0.01)
+            with lock:
+                active[0] -= 1
+            return []
+
+        runner, _ = self._create_runner(search_stream, max_workers=3)
+        results = list(runner.run([str(i) for i in range(12)], "query"))
+
+        self.assertEqual(len(results), 12)
+        self.assertLessEqual(peak[0], 3)
+
+    def test_requests_are_read_lazily(self):
+        consumed = []
+
+        def requests():
+            for i in range(100):
+                consumed.append(i)
+                yield (str(i), "query")
+
+        runner, _ = self._create_runner(
+            lambda customer_id, query: [], max_workers=2
+        )
+        results = runner.run_requests(requests())
+        next(results)
+        results.close()
+
+        self.assertLess(len(consumed), 100)
+
+    def test_get_backoff(self):
+        runner, _ = self._create_runner(
+            None, initial_backoff=1, max_backoff=4
+        )
+        self.assertTrue(0.5 <= runner.get_backoff(1) <= 1)
+        self.assertTrue(2 <= runner.get_backoff(3) <= 4)
+        self.assertTrue(2 <= runner.get_backoff(10) <= 4)
+
+    def test_no_retries_with_client_retry_policy(self):
+        """Requests retried by the client's interceptor aren't retried again."""
+        client = mock.Mock(retry_policy=RetryPolicy())
+        self.assertEqual(report_runner.ReportRunner(client).max_retries, 0)
+        self.assertEqual(
+            report_runner.ReportRunner(client, max_retries=2).max_retries, 2
+        )
+        self.assertEqual(
+            report_runner.ReportRunner(mock.Mock()).max_retries,
+            report_runner._DEFAULT_MAX_RETRIES,
+        )
+
+    def test_invalid_arguments(self):
+        client = mock.Mock()
+        self.assertRaises(
+            ValueError, report_runner.ReportRunner, client, max_workers=0
+        )
+        self.assertRaises(
+            ValueError, report_runner.ReportRunner, client, max_retries=-1
+        )
@@ -0,0 +1,222 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the resource_names module."""
+
+from array import array
+from unittest import TestCase
+
+from google.ads.googleads import resource_names
+from google.ads.googleads.client import _DEFAULT_VERSION
+from google.ads.googleads.v25.services.services.google_ads_service.client import (
+    GoogleAdsServiceClient,
+)
+
+
+class ResourceNameTemplateTest(TestCase):
+    def test_get_templates(self):
+        templates = resource_names.get_templates()
+
+        self.assertIs(
+            templates, resource_names.get_templates(_DEFAULT_VERSION)
+        )
+        self.assertEqual(
+            templates["ad_group_ad"].template,
+            "customers/{customer_id}/adGroupAds/{ad_group_id}~{ad_id}",
+        )
+        self.assertEqual(
+            templates["ad_group_ad"].fields,
+            ("customer_id", "ad_group_id", "ad_id"),
+        )
+        self.assertNotIn("common_project", templates)
+
+    def test_get_template_invalid(self):
+        with self.assertRaises(ValueError):
+            resource_names.get_template("not_a_resource")
+
+        with self.assertRaises(ValueError):
+            resource_names.get_template("campaign", version="v1")
+
+    def test_build(self):
+        template = resource_names.get_template("ad_group_ad")
+
+        self.assertEqual(
+            template.build(customer_id="1", ad_group_id=2, ad_id="3"),
+            "customers/1/adGroupAds/2~3",
+        )
+        self.assertEqual(
+            resource_names.build("campaign", customer_id=1, campaign_id=2),
+            "customers/1/campaigns/2",
+        )
+
+    def test_build_invalid_fields(self):
+        template = resource_names.get_template("campaign")
+
+        with self.assertRaises(TypeError):
+            template.build(customer_id="1")
+
+        with self.assertRaises(TypeError):
+            template.build(customer_id="1", campaign_id="2", ad_id="3")
+
+    def test_parse_matches_generated_parsers(self):
+        """Every template parses like the generated parse_*_path methods."""
+        values = ["1", "12", "1~2", "a/b", "1/campaigns/2", "~"]
+
+        for name, template in resource_names.get_templates().items():
+            generated_parse = getattr(
+                GoogleAdsServiceClient, f"parse_{name}_path"
+            )
+            paths = [
+                template.build(**{field: value for field in template.fields})
+                for value in values
+            ] + [
+                "",
+                "customers/",
+                "customers/1/",
+                template.build(**{field: "1" for field in template.fields})
+                + "/",
+            ]
+
+            for path in paths:
+                with self.subTest(name=name, path=path):
+                    self.assertEqual(
+                        template.parse(path), generated_parse(path)
+                    )
+
+    def test_parse_with_suffix(self):
+        template = resource_names.get_template("hotel_performance_view")
+
+        self.assertEqual(
+            template.parse("customers/1/hotelPerformanceView"),
+            {"customer_id": "1"},
+        )
+        self.assertEqual(template.parse("customers//hotelPerformanceView"), {})
+        self.assertEqual(template.parse("customers/1/hotelPerformance"), {})
+
+    def test_parse_adjacent_fields(self):
+        template = resource_names.ResourceNameTemplate(
+            "test", "items/{first_id}{second_id}"
+        )
+
+        self.assertEqual(
+            template.parse("items/123"), {"first_id": "1", "second_id": "23"}
+        )
+        self.assertEqual(template.parse("items/1"), {})
+
+    def test_parse_line_break(self):
+        template = resource_names.get_template("campaign")
+
+        self.assertEqual(template.parse("customers/1/campaigns/2\n"), {})
+
+    def test_invalid_template(self):
+        with self.assertRaises(ValueError):
+            resource_names.ResourceNameTemplate("test", "customers")
+
+        with self.assertRaises(ValueError):
+            resource_names.ResourceNameTemplate("test", "customers/{id:>5}")
+
+        with self.assertRaises(ValueError):
+            resource_names.ResourceNameTemplate("test", "items/{id}~{id}")
+
+    def test_from_path_method(self):
+        template = resource_names.ResourceNameTemplate.from_path_method(
+            "campaign", GoogleAdsServiceClient.campaign_path
+        )
+
+        self.assertEqual(
+            template.template, "customers/{customer_id}/campaigns/{campaign_id}"
+        )
+
+    def test_build_many(self):
+        self.assertEqual(
+            resource_names.build_many(
+                "ad_group_ad",
+                {
+                    "customer_id": array("q", [1, 1]),
+                    "ad_group_id": ["2", "3"],
+                    "ad_id": (4, 5),
+                },
+            ),
+            ["customers/1/adGroupAds/2~4", "customers/1/adGroupAds/3~5"],
+        )
+
+    def test_build_many_invalid_fields(self):
+        with self.assertRaises(TypeError):
+            resource_names.build_many("campaign", {"customer_id": [1]})
+
+    def test_parse_many(self):
+        paths = ["customers/1/adGroupAds/2~4", "customers/1/adGroupAds/3~5"]
+
+        self.assertEqual(
+            resource_names.parse_many("ad_group_ad", paths),
+            {
+                "customer_id": ["1", "1"],
+                "ad_group_id": ["2", "3"],
+                "ad_id": ["4", "5"],
+            },
+        )
+
+    def test_parse_many_as_int(self):
+        columns = resource_names.parse_many(
+            "campaign",
+            iter(["customers/1/campaigns/2", "customers/1/campaigns/3"]),
+            as_int=True,
+        )
+
+        self.assertEqual(columns["customer_id"], array("q", [1, 1]))
+        self.assertEqual(columns["campaign_id"], array("q", [2, 3]))
+
+    def test_parse_many_round_trip(self):
+        columns = {
+            "customer_id": array("q", range(100)),
+            "campaign_id": array("q", range(100, 200)),
+        }
+        paths = resource_names.build_many("campaign", columns)
+
+        self.assertEqual(
+            resource_names.parse_many("campaign", paths, as_int=True), columns
+        )
+
+    def test_parse_many_invalid(self):
+        with self.assertRaisesRegex(ValueError, "customers/1/adGroups/2"):
+            resource_names.parse_many(
+                "campaign",
+                ["customers/1/campaigns/2", "customers/1/adGroups/2"],
+            )
+
+        with self.assertRaises(ValueError):
+            resource_names.parse_many(
+                "campaign", ["customers/1/campaigns/a"], as_int=True
+            )
+
+    def test_parse_many_line_break(self):
+        """Names that span lines don't match, even if each line would."""
+        with self.assertRaises(ValueError):
+            resource_names.parse_many(
+                "campaign",
+                ["customers/1/campaigns/2\ncustomers/1/campaigns/3", "x"],
+            )
+
+    def test_parse_many_single_field(self):
+        self.assertEqual(
+            resource_names.parse_many(
+                "customer", ["customers/1", "customers/2"], as_int=True
+            ),
+            {"customer_id": array("q", [1, 2])},
+        )
+
+    def test_parse_many_empty(self):
+        self.assertEqual(
+            resource_names.parse_many("campaign", [], as_int=True),
+            {"customer_id": array("q"), "campaign_id": array("q")},
+        )
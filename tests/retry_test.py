@@ -0,0 +1,193 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the retry policies."""
+
+import pickle
+from unittest import mock, TestCase
+
+import grpc
+
+from google.ads.googleads import retry
+from google.ads.googleads.v25.errors.types import errors
+
+
+class _RpcError(grpc.RpcError):
+    def __init__(self, code):
+        self._code = code
+
+    def code(self):
+        return self._code
+
+
+def _create_failure(*retry_delays):
+    return errors.GoogleAdsFailure(
+        errors=[
+            {"details": {"quota_error_details": {"retry_delay": delay}}}
+            for delay in retry_delays
+        ]
+    )
+
+
+_RESOURCE_EXHAUSTED = _RpcError(grpc.StatusCode.RESOURCE_EXHAUSTED)
+_UNAVAILABLE = _RpcError(grpc.StatusCode.UNAVAILABLE)
+
+
+class RetryHelpersTest(TestCase):
+    def test_get_quota_retry_delay(self):
+        failure = _create_failure(
+            {"seconds": 2}, {"seconds": 3, "nanos": 500000000}
+        )
+
+        self.assertEqual(retry.get_quota_retry_delay(failure), 3.5)
+        self.assertEqual(
+            retry.get_quota_retry_delay(type(failure).pb(failure)), 3.5
+        )
+
+    def test_get_quota_retry_delay_without_quota_errors(self):
+        failure = errors.GoogleAdsFailure(errors=[{"message": "error"}])
+
+        self.assertIsNone(retry.get_quota_retry_delay(failure))
+
+    def test_is_idempotent(self):
+        self.assertTrue(retry.is_idempotent("SearchStream"))
+        self.assertTrue(retry.is_idempotent("GenerateKeywordIdeas"))
+        self.assertFalse(retry.is_idempotent("MutateCampaigns"))
+
+    @mock.patch("time.sleep")
+    def test_throttle(self, mock_sleep):
+        throttle = retry.Throttle()
+        throttle.wait()
+        mock_sleep.assert_not_called()
+        throttle.pause(10)
+        throttle.wait()
+        self.assertGreater(mock_sleep.call_args[0][0], 9)
+
+
+class RetryBudgetTest(TestCase):
+    def test_runs_out_and_recovers(self):
+        budget = retry.RetryBudget(max_tokens=4, token_ratio=1)
+
+        self.assertTrue(budget.record_failure())
+        self.assertFalse(budget.record_failure())
+
+        budget.record_success()
+        budget.record_success()
+
+        self.assertTrue(budget.record_failure())
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            retry.RetryBudget(max_tokens=0)
+
+    def test_pickle(self):
+        budget = pickle.loads(pickle.dumps(retry.RetryBudget()))
+        budget.record_success()
+
+
+class RetryPolicyTest(TestCase):
+    @mock.patch.object(retry.random, "uniform", return_value=0)
+    def test_get_retry_delay(self, _):
+        policy = retry.RetryPolicy(initial_backoff=2, max_backoff=10)
+
+        self.assertEqual(policy.get_retry_delay(_UNAVAILABLE, 1, "Search"), 1)
+        self.assertEqual(policy.get_retry_delay(_UNAVAILABLE, 3, "Search"), 4)
+
+    def test_does_not_retry_other_statuses(self):
+        policy = retry.RetryPolicy()
+        error = _RpcError(grpc.StatusCode.INVALID_ARGUMENT)
+
+        self.assertIsNone(policy.get_retry_delay(error, 1, "Search"))
+        self.assertIsNone(policy.get_retry_delay(ValueError(), 1, "Search"))
+
+    def test_does_not_retry_after_max_attempts(self):
+        policy = retry.RetryPolicy(max_attempts=2)
+
+        self.assertIsNotNone(policy.get_retry_delay(_UNAVAILABLE, 1, "Search"))
+        self.assertIsNone(policy.get_retry_delay(_UNAVAILABLE, 2, "Search"))
+
+    def test_non_idempotent_methods(self):
+        policy = retry.RetryPolicy()
+
+        self.assertIsNone(
+            policy.get_retry_delay(_UNAVAILABLE, 1, "MutateCampaigns")
+        )
+        self.assertIsNotNone(
+            policy.get_retry_delay(_RESOURCE_EXHAUSTED, 1, "MutateCampaigns")
+        )
+        self.assertIsNotNone(
+            retry.RetryPolicy(retry_non_idempotent=True).get_retry_delay(
+                _UNAVAILABLE, 1, "MutateCampaigns"
+            )
+        )
+
+    def test_waits_for_quota_retry_delay(self):
+        policy = retry.RetryPolicy(initial_backoff=0.1, max_backoff=60)
+        failure = _create_failure({"seconds": 30})
+
+        self.assertEqual(
+            policy.get_retry_delay(_RESOURCE_EXHAUSTED, 1, "Search", failure),
+            30,
+        )
+
+    def test_does_not_retry_long_quota_retry_delay(self):
+        policy = retry.RetryPolicy(max_backoff=60)
+        failure = _create_failure({"seconds": 3600})
+
+        self.assertIsNone(
+            policy.get_retry_delay(_RESOURCE_EXHAUSTED, 1, "Search", failure)
+        )
+
+    def test_does_not_retry_when_budget_runs_out(self):
+        policy = retry.RetryPolicy(budget=retry.RetryBudget(max_tokens=2))
+
+        self.assertIsNone(policy.get_retry_delay(_UNAVAILABLE, 1, "Search"))
+
+    def test_from_dict(self):
+        policy = retry.RetryPolicy.from_dict(
+            {
+                "max_attempts": "3",
+                "initial_backoff": 0.5,
+                "retryable_status_codes": ["unavailable"],
+                "retry_non_idempotent": "True",
+                "budget_max_tokens": 20,
+            }
+        )
+
+        self.assertEqual(policy.max_attempts, 3)
+        self.assertEqual(policy.initial_backoff, 0.5)
+        self.assertEqual(
+            policy.retryable_status_codes, (grpc.StatusCode.UNAVAILABLE,)
+        )
+        self.assertTrue(policy.retry_non_idempotent)
+        self.assertEqual(policy.budget.max_tokens, 20)
+
+    def test_from_dict_invalid(self):
+        with self.assertRaises(ValueError):
+            retry.RetryPolicy.from_dict({"max_retries": 3})
+
+        with self.assertRaises(ValueError):
+            retry.RetryPolicy.from_dict({"retryable_status_codes": ["SLOW"]})
+
+    def test_use_retry_policy(self):
+        policy = retry.RetryPolicy()
+
+        with retry.use_retry_policy(policy):
+            self.assertIs(retry.get_retry_policy_override(), policy)
+
+            with retry.use_retry_policy(None):
+                self.assertEqual(
+                    retry.get_retry_policy_override().max_attempts, 1
+                )
+
+        self.assertIsNone(retry.get_retry_policy_override())
@@ -54,6 +54,13 @@ class ConvertStringTest(TestCase):
         self.assertEqual(result, expected)
 
 
+class IsRepeatedFieldTest(TestCase):
+    def test_is_repeated_field(self):
+        fields = ClickConversion.pb().DESCRIPTOR.fields_by_name
+        self.assertTrue(util.is_repeated_field(fields["custom_variables"]))
+        self.assertFalse(util.is_repeated_field(fields["gclid"]))
+
+
 class SetNestedMessageFieldTest(TestCase):
     def test_set_nested_message_field(self):
         val = "test value"
@@ -210,3 +217,25 @@ class ProtoCopyFromTest(TestCase):
         origin = {"name": "Test"}
 
         self.assertRaises(ValueError, util.proto_copy_from, destination, origin)
+
+    def test_get_serialized_field(self):
+        """Reads a length-delimited field without deserializing the message"""
+        message = ClickConversion.pb()(
+            gclid="abc", conversion_value=1.5, conversion_action="action"
+        )
+        data = message.SerializeToString()
+        gclid_number = message.DESCRIPTOR.fields_by_name["gclid"].number
+        action_number = message.DESCRIPTOR.fields_by_name[
+            "conversion_action"
+        ].number
+
+        self.assertEqual(util.get_serialized_field(data, gclid_number), b"abc")
+        self.assertEqual(
+            util.get_serialized_field(data, action_number), b"action"
+        )
+        self.assertIsNone(util.get_serialized_field(b"", gclid_number))
+
+    def test_get_serialized_field_truncated(self):
+        """ValueError is raised if the message is truncated"""
+        data = ClickConversion.pb()(gclid="abc").SerializeToString()
+        self.assertRaises(ValueError, util.get_serialized_field, data[:-1], 1)